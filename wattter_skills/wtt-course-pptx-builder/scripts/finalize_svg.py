@@ -34,18 +34,26 @@ Processing options:
 """
 
 import os
+import re
 import sys
 import shutil
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree as ET
 
 # Import finalize helpers from the internal package.
 sys.path.insert(0, str(Path(__file__).parent))
 from svg_finalize.align_embed_images import (
-    align_and_embed_images_in_svg,
-    count_office_vector_refs_in_svg,
+    SVG_NS,
+    XLINK_NS,
+    align_and_embed_images_in_tree,
+    count_office_vector_refs_in_tree,
+    prune_embed_cache,
 )
-from svg_finalize.embed_icons import process_svg_file as embed_icons_in_file
+from svg_finalize.embed_icons import embed_icons_in_content
+from svg_finalize.flatten_tspan import flatten_text_with_tspans
+from svg_finalize.svg_rect_to_path import convert_rounded_rects
 
 
 def safe_print(text: str) -> None:
@@ -67,46 +75,90 @@ def safe_print(text: str) -> None:
         print(text)
 
 
-def process_flatten_text(svg_file: Path, verbose: bool = False) -> bool:
-    """Flatten text in a single SVG file (in-place modification)"""
-    try:
-        from svg_finalize.flatten_tspan import flatten_text_with_tspans
-        from xml.etree import ElementTree as ET
-
-        tree = ET.parse(str(svg_file))
-        changed = flatten_text_with_tspans(tree)
-
-        if changed:
-            tree.write(str(svg_file), encoding='unicode', xml_declaration=False)
-            if verbose:
-                safe_print(f"   [OK] {svg_file.name}: text flattened")
-        return changed
-    except Exception as e:
-        if verbose:
-            safe_print(f"   [ERROR] {svg_file.name}: {e}")
-        return False
+_XML_DECLARATION_RE = re.compile(r'\s*(<\?xml[^?]*\?>)')
 
 
-def process_rounded_rect(svg_file: Path, verbose: bool = False) -> int:
-    """Convert rounded rectangles in a single SVG file (in-place modification)"""
+def finalize_svg_file(
+    src: Path,
+    dst: Path,
+    icons_dir: Path,
+    options: dict[str, bool],
+    compress: bool = False,
+    max_dimension: int | None = None,
+    image_cache_dir: Path | None = None,
+    sidecar_media: bool = False,
+) -> dict:
+    """Run every enabled finalize step on one SVG and write it once.
+
+    Icons are expanded on the source text (a regex splice, no parse); the
+    remaining steps share one parsed tree, which is serialized only if one
+    of them changed it. Untouched files keep their original bytes.
+    Module-level so it can run in a process pool.
+
+    Returns per-step counters for the summary, plus ``image_cache_keys``:
+    the encoded-image cache entries this file uses.
+    """
+    stats = {
+        'icons': 0, 'images': 0, 'image_errors': 0, 'office_vectors': 0,
+        'flattened': 0, 'rounded': 0,
+    }
+    used_cache_keys: set[str] = set()
+    stats['image_cache_keys'] = used_cache_keys
+    content = src.read_text(encoding='utf-8')
+
+    if options.get('embed_icons'):
+        content, stats['icons'] = embed_icons_in_content(content, icons_dir, src.name)
+
+    tree_steps = ('align_images', 'flatten_text', 'fix_rounded')
+    if not any(options.get(step) for step in tree_steps):
+        dst.write_text(content, encoding='utf-8')
+        return stats
+
+    ET.register_namespace('', SVG_NS)
+    ET.register_namespace('xlink', XLINK_NS)
     try:
-        from svg_finalize.svg_rect_to_path import process_svg
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        if options.get('align_images'):
+            stats['image_errors'] += 1
+        dst.write_text(content, encoding='utf-8')
+        return stats
 
-        with open(svg_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    if options.get('align_images'):
+        # Relative hrefs resolve against svg_final/, exactly as when each
+        # step re-read the copied file from there.
+        svg_dir = dst.parent.resolve()
+        stats['office_vectors'] = count_office_vector_refs_in_tree(root, svg_dir)
+        stats['images'], stats['image_errors'] = align_and_embed_images_in_tree(
+            root, svg_dir,
+            compress=compress, max_dimension=max_dimension, svg_name=src.name,
+            cache_dir=image_cache_dir, used_cache_keys=used_cache_keys,
+            sidecar_media=sidecar_media,
+        )
 
-        processed, count = process_svg(content, verbose=False)
+    if options.get('flatten_text'):
+        try:
+            if flatten_text_with_tspans(ET.ElementTree(root)):
+                stats['flattened'] = 1
+        except Exception:
+            pass
 
-        if count > 0:
-            with open(svg_file, 'w', encoding='utf-8') as f:
-                f.write(processed)
-            if verbose:
-                safe_print(f"   [OK] {svg_file.name}: {count} rounded rectangle(s)")
-        return count
-    except Exception as e:
-        if verbose:
-            safe_print(f"   [ERROR] {svg_file.name}: {e}")
-        return 0
+    if options.get('fix_rounded'):
+        try:
+            stats['rounded'] = convert_rounded_rects(root)
+        except Exception:
+            pass
+
+    if stats['images'] or stats['flattened'] or stats['rounded']:
+        content_out = ET.tostring(root, encoding='unicode')
+        # Same declaration rule as the former per-step writers: the image
+        # and text steps dropped it, the rounded-rect step kept it.
+        declaration = _XML_DECLARATION_RE.match(content)
+        if declaration and not (stats['images'] or stats['flattened']):
+            content_out = declaration.group(1) + '\n' + content_out
+        content = content_out
+    dst.write_text(content, encoding='utf-8')
+    return stats
 
 
 def finalize_project(
@@ -116,6 +168,9 @@ def finalize_project(
     quiet: bool = False,
     compress: bool = False,
     max_dimension: int | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
+    sidecar_media: bool = False,
 ) -> bool:
     """
     Finalize SVG files in the project
@@ -127,9 +182,15 @@ def finalize_project(
         quiet: Quiet mode, reduce output
         compress: Compress images before embedding
         max_dimension: Downscale images exceeding this dimension
+        workers: Process-pool size; None picks min(cpu, files, 8), <=1 is sequential
+        use_cache: Reuse cropped / compressed image encodings from
+            <project>/.cache/embed_images
+        sidecar_media: Write images to svg_final/media/<sha256>.<ext> and
+            reference them instead of Base64-inlining
     """
     svg_output = project_dir / 'svg_output'
     svg_final = project_dir / 'svg_final'
+    image_cache_dir = project_dir / '.cache' / 'embed_images' if use_cache else None
     icons_dir = Path(__file__).parent.parent / 'templates' / 'icons'
 
     # Check if svg_output exists
@@ -152,97 +213,103 @@ def finalize_project(
         safe_print("[PREVIEW] Preview mode, no operations will be performed")
         return True
 
-    # Step 1: Copy directory
+    # Step 1: Copy everything except the top-level SVGs, which the per-file
+    # pipeline below writes exactly once.
     if svg_final.exists():
         shutil.rmtree(svg_final)
-    shutil.copytree(svg_output, svg_final)
 
+    def _ignore_top_level_svgs(directory: str, names: list[str]) -> set[str]:
+        if Path(directory) != svg_output:
+            return set()
+        return {name for name in names if name.endswith('.svg')}
+
+    shutil.copytree(svg_output, svg_final, ignore=_ignore_top_level_svgs)
+
+    # Step 2: Run every enabled step per file (parse once, write once),
+    # spread across a process pool.
+    if workers is None:
+        workers = min(os.cpu_count() or 2, len(svg_files), 8)
+    steps = [
+        label for key, label in (
+            ('embed_icons', 'embed-icons'),
+            ('align_images', 'align-images'),
+            ('flatten_text', 'flatten-text'),
+            ('fix_rounded', 'fix-rounded'),
+        ) if options.get(key)
+    ]
     if not quiet:
         print()
-
-    # Step 2: Embed icons
-    if options.get('embed_icons'):
-        if not quiet:
-            safe_print("[1/4] Embedding icons...")
-        icons_count = 0
-        for svg_file in svg_final.glob('*.svg'):
-            count = embed_icons_in_file(svg_file, icons_dir, dry_run=False, verbose=False)
-            icons_count += count
-        if not quiet:
-            if icons_count > 0:
-                safe_print(f"      {icons_count} icon(s) embedded")
-            else:
-                safe_print("      No icons")
-
-    # Step 3: Align (slice/meet) and Base64-embed all <image> in one pass.
-    # Replaces the former crop-images / fix-aspect / embed-images trio: the
-    # spatial transform (slice → crop, meet → fit-box) and the asset embed
-    # are mutually exclusive branches per image, sequenced together so each
-    # SVG is only parsed and serialized once and each bitmap is only read
-    # from disk once.
-    if options.get('align_images'):
-        if not quiet:
-            safe_print("[2/4] Aligning + embedding images...")
-        img_count = 0
-        img_errors = 0
-        office_vector_count = 0
-        for svg_file in svg_final.glob('*.svg'):
-            office_vector_count += count_office_vector_refs_in_svg(svg_file)
-            count, errs = align_and_embed_images_in_svg(
-                svg_file,
-                dry_run=False,
-                verbose=False,
-                compress=compress,
-                max_dimension=max_dimension,
+        mode = f'parallel x{workers}' if workers > 1 else 'sequential'
+        safe_print(f"[..] Processing ({mode}): {', '.join(steps) or 'copy only'}")
+
+    jobs = [(src, svg_final / src.name) for src in sorted(svg_files)]
+    if workers <= 1 or len(jobs) <= 2:
+        results = [
+            finalize_svg_file(
+                src, dst, icons_dir, options, compress, max_dimension,
+                image_cache_dir, sidecar_media,
             )
-            img_count += count
-            img_errors += errs
-        if not quiet:
-            if img_count > 0:
-                msg = f"      {img_count} image(s) aligned + embedded"
-                if img_errors:
-                    msg += f"  ({img_errors} error(s))"
-                safe_print(msg)
-                if office_vector_count:
-                    safe_print(
-                        f"      {office_vector_count} Office vector(s) left external "
-                        "for native PPTX passthrough"
-                    )
-            elif office_vector_count:
+            for src, dst in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    finalize_svg_file, src, dst, icons_dir, options,
+                    compress, max_dimension, image_cache_dir, sidecar_media,
+                )
+                for src, dst in jobs
+            ]
+            results = [future.result() for future in futures]
+
+    used_cache_keys = set().union(*(r.pop('image_cache_keys') for r in results))
+    totals = {key: sum(r[key] for r in results) for key in results[0]}
+
+    # Every SVG was processed, so entries no slide used are stale.
+    if image_cache_dir is not None and options.get('align_images'):
+        prune_embed_cache(image_cache_dir, used_cache_keys)
+
+    if options.get('embed_icons') and not quiet:
+        safe_print("[1/4] Embedding icons...")
+        if totals['icons'] > 0:
+            safe_print(f"      {totals['icons']} icon(s) embedded")
+        else:
+            safe_print("      No icons")
+
+    if options.get('align_images') and not quiet:
+        safe_print("[2/4] Aligning + embedding images...")
+        office_vector_count = totals['office_vectors']
+        if totals['images'] > 0:
+            msg = f"      {totals['images']} image(s) aligned + embedded"
+            if totals['image_errors']:
+                msg += f"  ({totals['image_errors']} error(s))"
+            safe_print(msg)
+            if office_vector_count:
                 safe_print(
                     f"      {office_vector_count} Office vector(s) left external "
                     "for native PPTX passthrough"
                 )
-            else:
-                safe_print("      No images")
-
-    # Step 4: Flatten text
-    if options.get('flatten_text'):
-        if not quiet:
-            safe_print("[3/4] Flattening text...")
-        flatten_count = 0
-        for svg_file in svg_final.glob('*.svg'):
-            if process_flatten_text(svg_file, verbose=False):
-                flatten_count += 1
-        if not quiet:
-            if flatten_count > 0:
-                safe_print(f"      {flatten_count} file(s) processed")
-            else:
-                safe_print("      No processing needed")
-
-    # Step 5: Convert rounded rects to Path
-    if options.get('fix_rounded'):
-        if not quiet:
-            safe_print("[4/4] Converting rounded rects to Path...")
-        rounded_count = 0
-        for svg_file in svg_final.glob('*.svg'):
-            count = process_rounded_rect(svg_file, verbose=False)
-            rounded_count += count
-        if not quiet:
-            if rounded_count > 0:
-                safe_print(f"      {rounded_count} rounded rectangle(s) converted")
-            else:
-                safe_print("      No rounded rectangles")
+        elif office_vector_count:
+            safe_print(
+                f"      {office_vector_count} Office vector(s) left external "
+                "for native PPTX passthrough"
+            )
+        else:
+            safe_print("      No images")
+
+    if options.get('flatten_text') and not quiet:
+        safe_print("[3/4] Flattening text...")
+        if totals['flattened'] > 0:
+            safe_print(f"      {totals['flattened']} file(s) processed")
+        else:
+            safe_print("      No processing needed")
+
+    if options.get('fix_rounded') and not quiet:
+        safe_print("[4/4] Converting rounded rects to Path...")
+        if totals['rounded'] > 0:
+            safe_print(f"      {totals['rounded']} rounded rectangle(s) converted")
+        else:
+            safe_print("      No rounded rectangles")
 
     # Done
     if not quiet:
@@ -299,6 +366,14 @@ Aliases (still accepted):
                         help='Compress images before embedding (JPEG quality=85, PNG optimize)')
     parser.add_argument('--max-dimension', type=int, default=None,
                         help='Downscale images exceeding this dimension on either axis (e.g., 2560)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parallel workers (default: min(cpu, files, 8); 1 = sequential)')
+    parser.add_argument('--sidecar-media', action='store_true',
+                        help='Write images once to svg_final/media/<sha256>.<ext> and reference '
+                             'them instead of Base64-inlining (native export reads them directly)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-encode cropped / compressed images instead of reusing '
+                             '<project>/.cache/embed_images')
 
     args = parser.parse_args()
 
@@ -330,7 +405,10 @@ Aliases (still accepted):
 
     success = finalize_project(args.project_dir, options, args.dry_run, args.quiet,
                                compress=args.compress,
-                               max_dimension=args.max_dimension)
+                               max_dimension=args.max_dimension,
+                               workers=args.workers,
+                               use_cache=not args.no_cache,
+                               sidecar_media=args.sidecar_media)
     sys.exit(0 if success else 1)
 
 
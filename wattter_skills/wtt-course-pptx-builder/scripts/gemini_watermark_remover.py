@@ -8,10 +8,12 @@ Uses a reverse blending algorithm to restore original pixels.
 Usage:
     python3 scripts/gemini_watermark_remover.py <image_path>
     python3 scripts/gemini_watermark_remover.py <image_path> -o output_path.png
+    python3 scripts/gemini_watermark_remover.py <image_dir> [-o output_dir] [--workers N]
 
 Examples:
     python3 scripts/gemini_watermark_remover.py projects/demo/images/bg_01.png
     python3 scripts/gemini_watermark_remover.py image.jpg -o image_clean.jpg
+    python3 scripts/gemini_watermark_remover.py projects/demo/images -o projects/demo/images_clean
 
 Dependencies:
     pip install Pillow numpy
@@ -20,10 +22,14 @@ Notes:
     - Supports PNG, JPG, JPEG formats
     - Automatically detects watermark size (48px or 96px)
     - Output file defaults to adding an _unwatermarked suffix
+    - A directory input processes every image in it across a process pool
 """
 
+import os
 import sys
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -47,6 +53,9 @@ SCRIPT_DIR = Path(__file__).parent
 BG_48_PATH = SCRIPT_DIR / "assets" / "bg_48.png"
 BG_96_PATH = SCRIPT_DIR / "assets" / "bg_96.png"
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+OUTPUT_SUFFIX = "_unwatermarked"
+
 
 def detect_watermark_config(width: int, height: int) -> dict[str, int]:
     """
@@ -108,10 +117,33 @@ def calculate_alpha_map(bg_image: Image.Image) -> np.ndarray:
     return max_channel / 255.0
 
 
+@functools.lru_cache(maxsize=None)
+def load_alpha_map(logo_size: int) -> np.ndarray:
+    """
+    Load the alpha map for a watermark size, once per process
+
+    Args:
+        logo_size: Watermark size (48 or 96)
+
+    Returns:
+        Alpha map array (range 0-1)
+    """
+    bg_path = BG_96_PATH if logo_size == LARGE_LOGO_SIZE else BG_48_PATH
+    if not bg_path.exists():
+        raise FileNotFoundError(f"Watermark background image not found: {bg_path}")
+    with Image.open(bg_path) as bg_image:
+        alpha_map = calculate_alpha_map(bg_image)
+    alpha_map.setflags(write=False)
+    return alpha_map
+
+
 def remove_watermark(image: Image.Image, alpha_map: np.ndarray, position: dict) -> Image.Image:
     """
     Remove watermark using a reverse blending algorithm
 
+    The blend is inverted over the whole logo box at once; pixels whose alpha
+    is below ALPHA_THRESHOLD are left untouched.
+
     Args:
         image: Original image
         alpha_map: Alpha map array
@@ -120,24 +152,32 @@ def remove_watermark(image: Image.Image, alpha_map: np.ndarray, position: dict)
     Returns:
         Image with watermark removed
     """
-    img_array = np.array(image.convert("RGBA"), dtype=np.float32)
+    img_array = np.array(image.convert("RGBA"))
     x, y, w, h = position["x"], position["y"], position["width"], position["height"]
 
-    for row in range(h):
-        for col in range(w):
-            alpha = alpha_map[row, col]
-            if alpha < ALPHA_THRESHOLD:
-                continue
-            alpha = min(alpha, MAX_ALPHA)
-            one_minus_alpha = 1.0 - alpha
+    # Clip the logo box to the image so tiny images do not index out of range.
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, img_array.shape[1]), min(y + h, img_array.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return Image.fromarray(img_array)
+
+    alpha = alpha_map[y0 - y:y1 - y, x0 - x:x1 - x]
+    mask = alpha >= ALPHA_THRESHOLD
+    alpha = np.minimum(alpha, MAX_ALPHA)[..., None]
 
-            img_y, img_x = y + row, x + col
-            for c in range(3):
-                watermarked = img_array[img_y, img_x, c]
-                original = (watermarked - alpha * LOGO_VALUE) / one_minus_alpha
-                img_array[img_y, img_x, c] = np.clip(original, 0, 255)
+    region = img_array[y0:y1, x0:x1, :3]
+    watermarked = region.astype(np.float32)
+    original = np.clip((watermarked - alpha * LOGO_VALUE) / (1.0 - alpha), 0, 255)
+    region[mask] = original[mask].astype(np.uint8)
 
-    return Image.fromarray(img_array.astype(np.uint8))
+    return Image.fromarray(img_array)
+
+
+def default_output_path(input_path: Path, output_dir: Path | None = None) -> Path:
+    """Return ``<stem>_unwatermarked<suffix>``, next to the input or in *output_dir*."""
+    suffix = input_path.suffix or ".png"
+    parent = output_dir if output_dir is not None else input_path.parent
+    return parent / f"{input_path.stem}{OUTPUT_SUFFIX}{suffix}"
 
 
 def process_image(input_path: Path, output_path: Path | None = None, verbose: bool = True) -> Path:
@@ -163,21 +203,16 @@ def process_image(input_path: Path, output_path: Path | None = None, verbose: bo
         print(f"  Watermark size: {config['logo_size']} x {config['logo_size']}")
         print(f"  Watermark position: ({position['x']}, {position['y']})")
 
-    bg_path = BG_96_PATH if config["logo_size"] == 96 else BG_48_PATH
-
-    if not bg_path.exists():
-        print(f"Error: Watermark background image not found: {bg_path}")
+    try:
+        alpha_map = load_alpha_map(config["logo_size"])
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
-    bg_image = Image.open(bg_path)
-    alpha_map = calculate_alpha_map(bg_image)
-
     result = remove_watermark(image, alpha_map, position)
 
     if output_path is None:
-        stem = input_path.stem
-        suffix = input_path.suffix or ".png"
-        output_path = input_path.parent / f"{stem}_unwatermarked{suffix}"
+        output_path = default_output_path(input_path)
 
     if output_path.suffix.lower() in (".jpg", ".jpeg"):
         result = result.convert("RGB")
@@ -186,6 +221,84 @@ def process_image(input_path: Path, output_path: Path | None = None, verbose: bo
     return output_path
 
 
+def _process_image_job(input_path: Path, output_path: Path) -> tuple[Path, Path | None, str]:
+    """Worker for batch mode; returns (input, output or None, error message)."""
+    try:
+        return input_path, process_image(input_path, output_path, verbose=False), ""
+    except (OSError, ValueError) as e:
+        return input_path, None, str(e)
+
+
+def collect_images(input_dir: Path) -> list[Path]:
+    """List images directly inside *input_dir*, skipping earlier outputs."""
+    return sorted(
+        path for path in input_dir.iterdir()
+        if path.is_file()
+        and path.suffix.lower() in IMAGE_EXTENSIONS
+        and not path.stem.endswith(OUTPUT_SUFFIX)
+    )
+
+
+def process_directory(
+    input_dir: Path,
+    output_dir: Path | None = None,
+    workers: int | None = None,
+    verbose: bool = True,
+) -> tuple[int, int]:
+    """
+    Remove watermarks from every image in a directory
+
+    Args:
+        input_dir: Directory of images (not recursive)
+        output_dir: Output directory; defaults to writing next to the inputs
+        workers: Parallel workers (default: min(cpu, images, 8); 1 = sequential)
+        verbose: Whether to output per-image results
+
+    Returns:
+        (succeeded, failed) counts
+    """
+    images = collect_images(input_dir)
+    if not images:
+        if verbose:
+            print(f"  No images found in {input_dir}")
+        return 0, 0
+
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Fail once up front instead of once per worker.
+    for logo_size in (SMALL_LOGO_SIZE, LARGE_LOGO_SIZE):
+        try:
+            load_alpha_map(logo_size)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    if workers is None:
+        workers = min(os.cpu_count() or 2, len(images), 8)
+    jobs = [(path, default_output_path(path, output_dir)) for path in images]
+
+    if verbose:
+        mode = f"parallel x{workers}" if workers > 1 else "sequential"
+        print(f"  Images: {len(images)} ({mode})")
+
+    if workers <= 1 or len(jobs) <= 2:
+        results = [_process_image_job(src, dst) for src, dst in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_process_image_job, src, dst) for src, dst in jobs]
+            results = [future.result() for future in futures]
+
+    failed = 0
+    for src, dst, error in results:
+        if dst is None:
+            failed += 1
+            print(f"  [ERROR] {src.name}: {error}")
+        elif verbose:
+            print(f"  [OK] {src.name} -> {dst.name}")
+    return len(results) - failed, failed
+
+
 def main() -> None:
     """Run the CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -195,16 +308,22 @@ def main() -> None:
 Examples:
     %(prog)s projects/demo/images/bg_01.png
     %(prog)s image.jpg -o image_clean.jpg
+    %(prog)s projects/demo/images -o projects/demo/images_clean --workers 4
 
 Notes:
     - Automatically detects watermark size (96px for large images, 48px for small)
     - Supports PNG, JPG, JPEG formats
     - Output file defaults to adding an _unwatermarked suffix
+    - A directory input processes every image in it (not recursive)
 '''
     )
 
-    parser.add_argument('input', type=Path, help='Input image path')
-    parser.add_argument('-o', '--output', type=Path, default=None, help='Output image path')
+    parser.add_argument('input', type=Path, help='Input image path or directory')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='Output image path (output directory for a directory input)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parallel workers for a directory input '
+                             '(default: min(cpu, images, 8); 1 = sequential)')
     parser.add_argument('-q', '--quiet', action='store_true', help='Quiet mode')
 
     args = parser.parse_args()
@@ -217,7 +336,18 @@ Notes:
     if verbose:
         print("PPT Master - Gemini Watermark Remover")
         print("=" * 40)
-        print(f"  Input file: {args.input}")
+        print(f"  Input {'directory' if args.input.is_dir() else 'file'}: {args.input}")
+
+    if args.input.is_dir():
+        succeeded, failed = process_directory(
+            args.input, args.output, workers=args.workers, verbose=verbose,
+        )
+        if verbose:
+            print()
+            print(f"[Done] {succeeded} image(s) cleaned" + (f", {failed} failed" if failed else ""))
+        if failed:
+            sys.exit(1)
+        return
 
     output = process_image(args.input, args.output, verbose=verbose)
 
@@ -182,9 +182,13 @@ def retry_delay(attempt: int, rate_limited: bool) -> int:
     return 5
 
 
-def download_image(url: str, path: str, headers: dict = None, timeout: int = 180) -> str:
-    """Download an image URL and save it to disk."""
-    response = requests.get(url, headers=headers or {}, timeout=timeout)
+def download_image(url: str, path: str, headers: dict = None, timeout: int = 180,
+                   session: requests.Session = None) -> str:
+    """Download an image URL and save it to disk.
+
+    Pass a pooled ``session`` to reuse connections across many downloads.
+    """
+    response = (session or requests).get(url, headers=headers or {}, timeout=timeout)
     response.raise_for_status()
     return save_image_bytes(
         response.content,
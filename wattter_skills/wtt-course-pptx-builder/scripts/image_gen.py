@@ -43,13 +43,13 @@ Usage:
   python3 image_gen.py --list-backends
 """
 
+import collections
 import concurrent.futures
 import json
 import os
 import sys
 import argparse
 import tempfile
-import threading
 import time
 from pathlib import Path
 
@@ -341,6 +341,9 @@ def _resolve_backend() -> tuple[object, str]:
 
 
 DEFAULT_MANIFEST_CONCURRENCY = 3
+RATE_LIMIT_COOLDOWN = 10.0  # seconds without new requests after a rate-limit
+MANIFEST_COMPACT_EVERY = 10  # journal entries folded into the manifest at once
+MANIFEST_COMPACT_INTERVAL = 15.0  # seconds between manifest compactions
 
 STATUS_PENDING = "Pending"
 STATUS_GENERATED = "Generated"
@@ -425,6 +428,89 @@ def save_manifest(path: str, data: dict) -> None:
         raise
 
 
+class _AimdLimiter:
+    """Additive-increase / multiplicative-decrease cap on in-flight requests.
+
+    The cap starts at (and never exceeds) the configured concurrency. A
+    rate-limit error halves it and pauses new submissions for a cooldown;
+    every `limit` consecutive successes raise it by one. Rate-limit errors
+    from requests submitted before the last decrease are the same burst and
+    do not shrink the cap again.
+    """
+
+    def __init__(self, ceiling: int, cooldown: float = RATE_LIMIT_COOLDOWN) -> None:
+        self.ceiling = max(1, ceiling)
+        self.limit = self.ceiling
+        self.cooldown = cooldown
+        self.resume_at = 0.0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+
+    def on_success(self) -> None:
+        self._successes += 1
+        if self.limit < self.ceiling and self._successes >= self.limit:
+            self.limit += 1
+            self._successes = 0
+            print(f"  ↗ concurrency → {self.limit}")
+
+    def on_rate_limit(self, submitted_at: float) -> None:
+        self._successes = 0
+        now = time.monotonic()
+        self.resume_at = max(self.resume_at, now + self.cooldown)
+        if submitted_at < self._last_decrease:
+            return
+        self._last_decrease = now
+        if self.limit == 1:
+            return  # already at the floor: nothing to report
+        new_limit = max(1, self.limit // 2)
+        print(
+            f"\n  ⚠ Rate-limit hit — concurrency {self.limit} → {new_limit}, "
+            f"pausing new requests for {self.cooldown:.0f}s\n"
+        )
+        self.limit = new_limit
+
+
+def _journal_path(manifest_path: str) -> Path:
+    """Append-only status journal kept next to the manifest during a run."""
+    target = Path(manifest_path)
+    return target.with_name(target.stem + ".journal.jsonl")
+
+
+def _apply_journal(manifest: dict, manifest_path: str) -> int:
+    """Fold a leftover journal (from an interrupted run) into the manifest.
+
+    Later lines win; unknown filenames and a torn final line are ignored.
+    Returns the number of entries applied.
+    """
+    journal = _journal_path(manifest_path)
+    if not journal.exists():
+        return 0
+    by_name = {item["filename"]: item for item in manifest["items"]}
+    applied = 0
+    for line in journal.read_text(encoding="utf-8").splitlines():
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        item = by_name.get(entry.get("filename")) if isinstance(entry, dict) else None
+        if item is None or entry.get("status") not in VALID_STATUSES:
+            continue
+        item["status"] = entry["status"]
+        if entry.get("last_error"):
+            item["last_error"] = entry["last_error"]
+        else:
+            item.pop("last_error", None)
+        applied += 1
+    return applied
+
+
+def _compact_journal(manifest: dict, manifest_path: str, journal) -> None:
+    """Write the full manifest once and truncate the journal it supersedes."""
+    save_manifest(manifest_path, manifest)
+    journal.seek(0)
+    journal.truncate()
+
+
 def _run_manifest(manifest: dict, manifest_path: str, backend_module, *,
                   initial_concurrency: int,
                   image_size: str,
@@ -433,19 +519,29 @@ def _run_manifest(manifest: dict, manifest_path: str, backend_module, *,
     """Run Pending/Failed items through the backend with adaptive concurrency.
 
     Strategy:
-      - Start at `initial_concurrency` workers per batch.
-      - On any rate-limit error in a batch, halve concurrency (min 1) and
-        requeue the rate-limited items.
+      - Items stream through a worker pool: a new request starts as soon as
+        one finishes, so one slow request never gates the others.
+      - In-flight requests are capped by an AIMD limiter starting at
+        `initial_concurrency`: a rate-limit error halves the cap, requeues
+        the item and pauses new submissions; sustained success grows the cap
+        back, one step at a time, up to `initial_concurrency`.
       - Per-item failures are recorded as `status: Failed` + `last_error`
         and not retried within this run.
-      - Status is written back to the manifest file after each completion;
-        a Ctrl-C in the middle still preserves done items.
+      - Each completion is appended to `<manifest>.journal.jsonl`; the
+        journal is compacted into the manifest every
+        MANIFEST_COMPACT_EVERY completions / MANIFEST_COMPACT_INTERVAL
+        seconds and when the run ends, even on Ctrl-C. A journal left by a
+        killed run is replayed on the next start.
       - `Needs-Manual` items are skipped (user processes them externally).
 
     Returns (ok_count, failed_count, skipped_count).
     """
     from image_backends.backend_common import is_rate_limit_error
 
+    if _apply_journal(manifest, manifest_path):
+        save_manifest(manifest_path, manifest)
+    _journal_path(manifest_path).unlink(missing_ok=True)
+
     items = manifest["items"]
     pending_idx = [
         i for i, it in enumerate(items) if it["status"] in RETRYABLE_STATUSES
@@ -465,11 +561,11 @@ def _run_manifest(manifest: dict, manifest_path: str, backend_module, *,
         f"{skipped} already done. concurrency={initial_concurrency}\n"
     )
 
-    queue: list[int] = list(pending_idx)
+    queue: collections.deque[int] = collections.deque(pending_idx)
     ok_count = 0
     fail_count = 0
-    current = max(1, initial_concurrency)
-    state_lock = threading.Lock()
+    limiter = _AimdLimiter(initial_concurrency)
+    in_flight: dict[concurrent.futures.Future, float] = {}
 
     def _one(idx: int):
         item = items[idx]
@@ -486,49 +582,68 @@ def _run_manifest(manifest: dict, manifest_path: str, backend_module, *,
         except Exception as exc:  # noqa: BLE001 — backend raises arbitrary types
             return idx, None, exc
 
-    while queue:
-        batch_size = min(current, len(queue))
-        batch_idx = queue[:batch_size]
-        queue = queue[batch_size:]
-
-        print(
-            f"--- Batch of {batch_size} (concurrency={current}, "
-            f"remaining_after={len(queue)}) ---"
-        )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=limiter.ceiling)
+    journal = open(_journal_path(manifest_path), "w", encoding="utf-8")
+    uncompacted = 0
+    last_compact = time.monotonic()
+    try:
+        while queue or in_flight:
+            now = time.monotonic()
+            while queue and len(in_flight) < limiter.limit and now >= limiter.resume_at:
+                idx = queue.popleft()
+                in_flight[executor.submit(_one, idx)] = now
+
+            timeout = None
+            if queue and len(in_flight) < limiter.limit:
+                timeout = max(0.0, limiter.resume_at - now)
+            if not in_flight:
+                time.sleep(timeout or 0)
+                continue
+            done, _ = concurrent.futures.wait(
+                in_flight, timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
 
-        rate_limited = False
-        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as ex:
-            futures = [ex.submit(_one, i) for i in batch_idx]
-            for fut in concurrent.futures.as_completed(futures):
+            for fut in done:
+                submitted_at = in_flight.pop(fut)
                 idx, saved_path, exc = fut.result()
                 item = items[idx]
-                with state_lock:
-                    if exc is None:
-                        item["status"] = STATUS_GENERATED
-                        item.pop("last_error", None)
-                        ok_count += 1
-                        print(f"  [OK]   {item['filename']}")
-                    elif is_rate_limit_error(exc):
-                        rate_limited = True
-                        queue.append(idx)
-                        print(f"  [RATE] {item['filename']} — requeued")
-                    else:
-                        item["status"] = STATUS_FAILED
-                        item["last_error"] = str(exc)[:500]
-                        fail_count += 1
-                        print(f"  [FAIL] {item['filename']}: {exc}")
-                    save_manifest(manifest_path, manifest)
-
-        if rate_limited and current > 1:
-            new_current = max(1, current // 2)
-            print(
-                f"\n  ⚠ Rate-limit hit — concurrency {current} → {new_current}, "
-                "pausing 10s before next batch\n"
-            )
-            current = new_current
-            time.sleep(10)
-        elif queue:
-            time.sleep(2)
+                if exc is None:
+                    item["status"] = STATUS_GENERATED
+                    item.pop("last_error", None)
+                    ok_count += 1
+                    limiter.on_success()
+                    print(f"  [OK]   {item['filename']}")
+                elif is_rate_limit_error(exc):
+                    queue.append(idx)
+                    print(f"  [RATE] {item['filename']} — requeued")
+                    limiter.on_rate_limit(submitted_at)
+                    continue
+                else:
+                    item["status"] = STATUS_FAILED
+                    item["last_error"] = str(exc)[:500]
+                    fail_count += 1
+                    print(f"  [FAIL] {item['filename']}: {exc}")
+                journal.write(json.dumps({
+                    "filename": item["filename"],
+                    "status": item["status"],
+                    "last_error": item.get("last_error"),
+                }, ensure_ascii=False) + "\n")
+                journal.flush()
+                uncompacted += 1
+
+            if uncompacted and (
+                uncompacted >= MANIFEST_COMPACT_EVERY
+                or time.monotonic() - last_compact >= MANIFEST_COMPACT_INTERVAL
+            ):
+                _compact_journal(manifest, manifest_path, journal)
+                uncompacted = 0
+                last_compact = time.monotonic()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        _compact_journal(manifest, manifest_path, journal)
+        journal.close()
+        _journal_path(manifest_path).unlink(missing_ok=True)
 
     print(
         f"\n[Manifest] Done: {ok_count} ok / {fail_count} failed "
@@ -667,7 +782,8 @@ def main() -> None:
         "--manifest", default=None, metavar="IMAGE_PROMPTS_JSON",
         help=(
             "Path to image_prompts.json. Runs every Pending/Failed item in "
-            "parallel; writes status back to the manifest as each completes."
+            "parallel; journals status as each completes and folds it into "
+            "the manifest periodically."
         ),
     )
     parser.add_argument(
@@ -675,7 +791,8 @@ def main() -> None:
         help=(
             "Max concurrent requests in --manifest mode. Defaults to "
             f"IMAGE_CONCURRENCY env or {DEFAULT_MANIFEST_CONCURRENCY}. "
-            "Auto-halves on rate-limit; 1 is the serial fallback."
+            "Halves on rate-limit and recovers on success; 1 is the serial "
+            "fallback."
         ),
     )
     parser.add_argument(
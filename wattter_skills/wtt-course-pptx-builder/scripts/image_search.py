@@ -39,10 +39,12 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import importlib
 import json
 import os
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -55,13 +57,18 @@ if str(_SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS_DIR))
 
 from config import load_prefixed_env_file  # noqa: E402
-from image_backends.backend_common import download_image  # noqa: E402
+from image_backends.backend_common import (  # noqa: E402
+    detect_image_extension,
+    download_image,
+    save_image_bytes,
+)
 from image_sources.provider_common import (  # noqa: E402
     AssetCandidate,
     ImageSearchRequest,
     USER_AGENT,
     build_attribution_text,
     ensure_json_parent,
+    get_http_session,
     score_candidate,
 )
 
@@ -85,6 +92,13 @@ ALL_PROVIDERS: tuple[str, ...] = ZERO_CONFIG_PROVIDERS + KEYED_PROVIDERS
 
 ORIENTATION_CHOICES = ("any", "landscape", "portrait", "square")
 
+# Providers are queried in parallel; one that has not answered within this
+# many seconds is dropped from the current stage.
+DEFAULT_PROVIDER_DEADLINE = 45.0
+
+# Parallel downloads when filling the candidate pool.
+CANDIDATE_DOWNLOAD_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # .env loading
@@ -93,7 +107,7 @@ ORIENTATION_CHOICES = ("any", "landscape", "portrait", "square")
 
 def _load_search_env_file() -> None:
     """Load image-search keys from the shared PPT Master .env locations."""
-    load_prefixed_env_file(("PEXELS_", "PIXABAY_"))
+    load_prefixed_env_file(("PEXELS_", "PIXABAY_", "IMAGE_SEARCH_"))
 
 
 # ---------------------------------------------------------------------------
@@ -117,12 +131,18 @@ def _try_provider(
     name: str,
     request: ImageSearchRequest,
     license_tier_filter: str,
+    deadline: Optional[float] = None,
 ) -> Optional[list[AssetCandidate]]:
     """Run one provider; print and swallow recoverable errors, return None
     so the dispatcher can try the next provider."""
     try:
         module = _load_provider(name)
-        return module.search(request, license_tier_filter=license_tier_filter)
+        kwargs = {}
+        if deadline is not None:
+            # Bound each HTTP call so a stalled provider thread does not
+            # outlive its deadline by much.
+            kwargs["timeout"] = max(1, min(int(deadline), module.DEFAULT_TIMEOUT))
+        return module.search(request, license_tier_filter=license_tier_filter, **kwargs)
     except RuntimeError as exc:
         if _is_keyed_provider_unconfigured(name, exc):
             print(
@@ -137,6 +157,44 @@ def _try_provider(
         return None
 
 
+def _search_providers(
+    providers: list[str],
+    request: ImageSearchRequest,
+    license_tier_filter: str,
+    deadline: float,
+) -> list[Optional[list[AssetCandidate]]]:
+    """Query every provider at once; results come back in ``providers`` order.
+
+    A provider still running after ``deadline`` seconds counts as having
+    returned nothing, so one slow API cannot hold up the search.
+    """
+    if len(providers) <= 1:
+        return [
+            _try_provider(name, request, license_tier_filter, deadline)
+            for name in providers
+        ]
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(providers))
+    futures = [
+        executor.submit(_try_provider, name, request, license_tier_filter, deadline)
+        for name in providers
+    ]
+    done, _ = concurrent.futures.wait(futures, timeout=deadline)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results: list[Optional[list[AssetCandidate]]] = []
+    for name, future in zip(providers, futures):
+        if future in done:
+            results.append(future.result())
+        else:
+            print(
+                f"  [{name}] skipped: no answer within {deadline:g}s",
+                file=sys.stderr,
+            )
+            results.append(None)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Post-download quality validation
 # ---------------------------------------------------------------------------
@@ -170,55 +228,98 @@ def _validate_downloaded_quality(path: Path) -> bool:
         return True  # unreadable image; let downstream handle it
 
 
+def _download_candidate(
+    candidate: AssetCandidate, path: Path,
+) -> Optional[tuple[Path, Optional[str]]]:
+    """Download one candidate; ``(saved path, content type)`` or None if it
+    fails or is too small.
+
+    The bytes are kept as served: the file takes their real extension when
+    it can be detected (``path``'s otherwise), and the response content type
+    is returned so the winner can be written out without re-encoding.
+    """
+    try:
+        response = get_http_session().get(
+            candidate.download_url, headers={"User-Agent": USER_AGENT}, timeout=180,
+        )
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type")
+        real_ext = detect_image_extension(response.content, content_type)
+        if real_ext:
+            path = path.with_suffix(real_ext)
+        save_image_bytes(response.content, str(path), content_type=content_type)
+    except (requests.RequestException, OSError, RuntimeError, ValueError):
+        return None
+    if not _validate_downloaded_quality(path):
+        path.unlink(missing_ok=True)
+        return None
+    return path, content_type
+
+
 def _save_candidates_pool(
     ranked: list[tuple[float, str, AssetCandidate]],
     output_dir: Path,
     stem: str,
     selected_filename: str,
     max_candidates: int = 8,
-) -> None:
+) -> list[tuple[str, AssetCandidate, Path]]:
     """Download top-N candidates into ``candidates/<stem>/`` and write
-    a ``candidates.json`` manifest for manual review."""
+    a ``candidates.json`` manifest for manual review.
+
+    Candidates are fetched in parallel windows of the still-missing count;
+    ranks and ``candidate_NN`` names follow score order among the successful
+    downloads, exactly as a one-by-one pass would assign them. Returns
+    ``(provider, candidate, path, content type)`` for every saved file, best
+    first.
+    """
     cand_dir = output_dir / "candidates" / stem
     cand_dir.mkdir(parents=True, exist_ok=True)
 
     pool: list[dict] = []
-    idx = 0
-    for score, provider_name, candidate in ranked:
-        if idx >= max_candidates:
-            break
-        suffix = Path(candidate.download_url.split("?")[0]).suffix or ".jpg"
-        cand_filename = f"candidate_{idx + 1:02d}{suffix}"
-        cand_path = cand_dir / cand_filename
-        try:
-            download_image(
-                candidate.download_url,
-                str(cand_path),
-                headers={"User-Agent": USER_AGENT},
-            )
-            if not _validate_downloaded_quality(cand_path):
-                cand_path.unlink(missing_ok=True)
-                continue
-        except (requests.RequestException, OSError, RuntimeError, ValueError):
-            continue
-        idx += 1
-        actual_dim = _measure_actual_image(cand_path)
-        pool.append({
-            "rank": idx,
-            "score": round(score, 2),
-            "filename": cand_filename,
-            "provider": provider_name,
-            "title": candidate.title,
-            "author": candidate.author,
-            "source_page_url": candidate.source_page_url,
-            "download_url": candidate.download_url,
-            "license_name": candidate.license_name,
-            "license_url": candidate.license_url,
-            "license_tier": candidate.license_tier,
-            "attribution_required": candidate.license_tier == "attribution-required",
-            "width": actual_dim[0] if actual_dim else candidate.width,
-            "height": actual_dim[1] if actual_dim else candidate.height,
-        })
+    saved: list[tuple[str, AssetCandidate, Path, Optional[str]]] = []
+    pos = 0
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(CANDIDATE_DOWNLOAD_WORKERS, max(1, max_candidates)),
+    ) as executor:
+        while len(pool) < max_candidates and pos < len(ranked):
+            window = ranked[pos:pos + max_candidates - len(pool)]
+            staged: list[Path] = []
+            for offset, (_score, _provider, candidate) in enumerate(window):
+                suffix = Path(candidate.download_url.split("?")[0]).suffix or ".jpg"
+                staged.append(cand_dir / f".pending_{pos + offset:03d}{suffix}")
+            pos += len(window)
+            downloads = list(executor.map(
+                _download_candidate,
+                [candidate for _score, _provider, candidate in window],
+                staged,
+            ))
+
+            for (score, provider_name, candidate), download in zip(window, downloads):
+                if download is None:
+                    continue
+                staged_path, content_type = download
+                idx = len(pool) + 1
+                cand_filename = f"candidate_{idx:02d}{staged_path.suffix}"
+                cand_path = cand_dir / cand_filename
+                os.replace(staged_path, cand_path)
+                saved.append((provider_name, candidate, cand_path, content_type))
+                actual_dim = _measure_actual_image(cand_path)
+                pool.append({
+                    "rank": idx,
+                    "score": round(score, 2),
+                    "filename": cand_filename,
+                    "provider": provider_name,
+                    "title": candidate.title,
+                    "author": candidate.author,
+                    "source_page_url": candidate.source_page_url,
+                    "download_url": candidate.download_url,
+                    "license_name": candidate.license_name,
+                    "license_url": candidate.license_url,
+                    "license_tier": candidate.license_tier,
+                    "attribution_required": candidate.license_tier == "attribution-required",
+                    "width": actual_dim[0] if actual_dim else candidate.width,
+                    "height": actual_dim[1] if actual_dim else candidate.height,
+                })
 
     if pool:
         meta = {
@@ -233,6 +334,7 @@ def _save_candidates_pool(
             encoding="utf-8",
         )
         print(f"  candidates: {cand_dir}/ ({len(pool)} saved)", file=sys.stderr)
+    return saved
 
 
 def search_and_download(
@@ -243,11 +345,17 @@ def search_and_download(
     strict_no_attribution: bool,
     save_candidates: bool = True,
     max_candidates: int = 8,
+    provider_deadline: float = DEFAULT_PROVIDER_DEADLINE,
 ) -> tuple[Optional[AssetCandidate], Optional[str], Optional[str]]:
     """Find a candidate AND successfully download it.
 
+    Providers are queried in parallel (each bounded by
+    ``provider_deadline`` seconds) and their results merged in
+    ``providers`` order, so ranking ties resolve as in a serial pass.
+
     When ``save_candidates`` is True (default), the top-N candidates are
-    also saved to ``candidates/<stem>/`` for manual review.
+    also saved to ``candidates/<stem>/`` for manual review, and the winner
+    is copied from there instead of being downloaded a second time.
 
     Returns ``(candidate, provider_name, stage)`` for the successfully
     downloaded image, or ``(None, None, None)`` if every combination
@@ -259,9 +367,14 @@ def search_and_download(
 
     for stage in license_filters:
         ranked: list[tuple[float, str, AssetCandidate]] = []
-        for provider_name in providers:
-            print(f"  -> trying {provider_name} ({stage}) ...", file=sys.stderr)
-            candidates = _try_provider(provider_name, request, stage)
+        print(f"  -> trying {', '.join(providers)} ({stage}) ...", file=sys.stderr)
+        started = time.monotonic()
+        results = _search_providers(providers, request, stage, provider_deadline)
+        print(
+            f"    searched in {time.monotonic() - started:.1f}s",
+            file=sys.stderr,
+        )
+        for provider_name, candidates in zip(providers, results):
             if not candidates:
                 continue
 
@@ -284,10 +397,27 @@ def search_and_download(
         # --- Save candidate pool (before picking the winner) ---
         if save_candidates and sorted_ranked:
             stem = Path(output_path).stem
-            _save_candidates_pool(
+            saved = _save_candidates_pool(
                 sorted_ranked, output_path.parent, stem, output_path.name,
                 max_candidates=max_candidates,
             )
+            # The pool's first entry is the best downloadable candidate —
+            # the same one the loop below would pick — so reuse its bytes,
+            # written as-is when the output extension matches their format.
+            if saved:
+                provider_name, candidate, cand_path, content_type = saved[0]
+                try:
+                    save_image_bytes(
+                        cand_path.read_bytes(), str(output_path), content_type=content_type,
+                    )
+                    if _validate_downloaded_quality(output_path):
+                        return candidate, provider_name, stage
+                    output_path.unlink(missing_ok=True)
+                except (OSError, RuntimeError, ValueError) as exc:
+                    print(
+                        f"    copy from candidate pool failed: {exc}",
+                        file=sys.stderr,
+                    )
 
         # --- Pick the best downloadable candidate ---
         for _score, provider_name, candidate in sorted_ranked:
@@ -299,6 +429,7 @@ def search_and_download(
                     candidate.download_url,
                     str(output_path),
                     headers={"User-Agent": USER_AGENT},
+                    session=get_http_session(),
                 )
                 if not _validate_downloaded_quality(output_path):
                     output_path.unlink(missing_ok=True)
@@ -617,6 +748,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=8,
         help="Max number of candidates to save (default: 8).",
     )
+    parser.add_argument(
+        "--provider-deadline",
+        type=float,
+        default=DEFAULT_PROVIDER_DEADLINE,
+        help=(
+            "Seconds to wait for each provider; providers are queried in "
+            f"parallel (default: {DEFAULT_PROVIDER_DEADLINE:.0f})."
+        ),
+    )
+    parser.add_argument(
+        "--no-search-cache",
+        action="store_true",
+        help=(
+            "Bypass the shared provider response cache "
+            "(~/.ppt-master/cache/image_search.sqlite) for this run."
+        ),
+    )
     parser.add_argument(
         "--promote",
         default=None,
@@ -659,6 +807,9 @@ def main(argv: Optional[list[str]] = None) -> int:
         )
 
     # --- Search mode ---
+    if args.no_search_cache:
+        os.environ["IMAGE_SEARCH_CACHE"] = "off"
+
     request = ImageSearchRequest(
         query=args.query,
         purpose=args.purpose,
@@ -682,6 +833,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         strict_no_attribution=args.strict_no_attribution,
         save_candidates=not args.no_candidates,
         max_candidates=args.max_candidates,
+        provider_deadline=args.provider_deadline,
     )
 
     if candidate is None:
@@ -8,6 +8,7 @@ This module is the single home for everything that all four providers
 - Query simplification for keyword-based image APIs
 - Candidate scoring
 - Attribution text builder
+- Shared pooled HTTP session and on-disk response cache
 - Small helpers (orientation, json path, etc.)
 
 Provider-specific code (API URLs, payload shape, parse_results) lives in
@@ -23,11 +24,20 @@ if __name__ == "__main__" and any(arg in {"-h", "--help", "help"} for arg in sys
     print("This is an internal helper module used by image_search.py and the four web image providers.")
     raise SystemExit(0)
 
+import hashlib
+import json
+import os
 import re
+import sqlite3
+import threading
+import time
+import zlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+import requests
+
 
 # ---------------------------------------------------------------------------
 # Project-wide constants
@@ -459,6 +469,205 @@ def build_attribution_text(filename: str, candidate: AssetCandidate) -> str:
     return " — ".join(parts)
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP session
+# ---------------------------------------------------------------------------
+#
+# Providers and candidate downloads run concurrently; one pooled session
+# keeps TCP/TLS connections to each API host alive across queries, query
+# progressions and downloads instead of reconnecting per request.
+
+HTTP_POOL_SIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+        return _session
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+#
+# Search responses are cached in one SQLite file shared by every project, so
+# re-running a deck (and the query progression fallbacks inside each
+# provider) does not spend API quota on identical requests. The key is the
+# provider + endpoint + request params (query normalized, API keys
+# dropped), which covers query, orientation and license stage. Raw JSON is
+# cached rather than parsed candidates, so license classification and
+# scoring changes apply to cached results too.
+#
+# Environment:
+#   IMAGE_SEARCH_CACHE      path of the SQLite file, or "off" to disable
+#                           (default: ~/.ppt-master/cache/image_search.sqlite)
+#   IMAGE_SEARCH_CACHE_TTL  entry lifetime in seconds (default: 7 days)
+
+DEFAULT_SEARCH_CACHE_PATH = Path.home() / ".ppt-master" / "cache" / "image_search.sqlite"
+DEFAULT_SEARCH_CACHE_TTL = 7 * 24 * 3600
+SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Request params that carry credentials; never part of a cache key.
+_SECRET_PARAMS = frozenset({"key", "api_key", "apikey", "access_token"})
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def _search_cache_path() -> Optional[Path]:
+    value = os.environ.get("IMAGE_SEARCH_CACHE", "").strip()
+    if value.lower() in {"off", "0", "false", "no"}:
+        return None
+    return Path(value).expanduser() if value else DEFAULT_SEARCH_CACHE_PATH
+
+
+def _search_cache_ttl() -> float:
+    value = os.environ.get("IMAGE_SEARCH_CACHE_TTL", "").strip()
+    try:
+        return float(value) if value else DEFAULT_SEARCH_CACHE_TTL
+    except ValueError:
+        return DEFAULT_SEARCH_CACHE_TTL
+
+
+def _normalize_param(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def response_cache_key(provider: str, url: str, params: dict[str, Any]) -> str:
+    """Stable key for one provider request; credentials are excluded."""
+    material = {
+        "provider": provider,
+        "url": url,
+        "params": {
+            name: _normalize_param(value)
+            for name, value in params.items()
+            if name.lower() not in _SECRET_PARAMS
+        },
+    }
+    blob = json.dumps(material, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _open_cache(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_CACHE_SCHEMA)
+    return conn
+
+
+def _cache_lookup(path: Path, key: str, ttl: float) -> Optional[dict]:
+    try:
+        conn = _open_cache(path)
+        try:
+            row = conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or time.time() - row[1] > ttl:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError, ValueError, zlib.error):
+        return None
+
+
+def _cache_store(path: Path, key: str, provider: str, payload: dict, ttl: float) -> None:
+    blob = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    now = time.time()
+    try:
+        conn = _open_cache(path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, provider, payload, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, provider, blob, len(blob), now, now),
+                )
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - ttl,))
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()[0]
+                if total > SEARCH_CACHE_MAX_BYTES:
+                    # Evict least recently used entries down to 3/4 of the cap.
+                    excess = total - SEARCH_CACHE_MAX_BYTES * 3 // 4
+                    victims: list[str] = []
+                    for victim, size in conn.execute(
+                        "SELECT key, size FROM responses ORDER BY accessed_at"
+                    ):
+                        if excess <= 0:
+                            break
+                        victims.append(victim)
+                        excess -= size
+                    conn.executemany(
+                        "DELETE FROM responses WHERE key = ?",
+                        [(victim,) for victim in victims],
+                    )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def fetch_json(
+    provider: str,
+    url: str,
+    *,
+    params: dict[str, Any],
+    headers: dict[str, str],
+    timeout: int,
+) -> dict:
+    """GET a provider's JSON search endpoint through the response cache.
+
+    Only successful JSON object responses are cached; HTTP errors raise
+    ``requests.HTTPError`` as before. Cache failures never fail a search.
+    """
+    cache_path = _search_cache_path()
+    ttl = _search_cache_ttl()
+    key = response_cache_key(provider, url, params)
+    if cache_path is not None:
+        cached = _cache_lookup(cache_path, key, ttl)
+        if cached is not None:
+            return cached
+
+    response = get_http_session().get(url, params=params, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    payload = response.json()
+    if cache_path is not None and isinstance(payload, dict):
+        _cache_store(cache_path, key, provider, payload, ttl)
+    return payload
+
+
 # ---------------------------------------------------------------------------
 # Small helpers
 # ---------------------------------------------------------------------------
@@ -14,14 +14,13 @@ if __name__ == "__main__" and any(arg in {"-h", "--help", "help"} for arg in sys
     print(__doc__)
     raise SystemExit(0)
 
-import requests
-
 from image_sources.provider_common import (
     AssetCandidate,
     ImageSearchRequest,
     USER_AGENT,
     build_query_progression,
     classify_license,
+    fetch_json,
     normalize_license_name,
 )
 
@@ -105,14 +104,14 @@ def search(
         if orientation in _ASPECT_MAP:
             params["aspect_ratio"] = _ASPECT_MAP[orientation]
 
-        response = requests.get(
+        payload = fetch_json(
+            "openverse",
             API_URL,
             params=params,
             headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
             timeout=timeout,
         )
-        response.raise_for_status()
-        candidates = parse_results(response.json())
+        candidates = parse_results(payload)
         if candidates:
             return candidates
 
@@ -17,14 +17,13 @@ if __name__ == "__main__" and any(arg in {"-h", "--help", "help"} for arg in sys
 
 import os
 
-import requests
-
 from image_sources.provider_common import (
     AssetCandidate,
     ImageSearchRequest,
     LICENSE_TIER_NO_ATTRIBUTION,
     USER_AGENT,
     build_query_progression,
+    fetch_json,
     normalize_license_name,
 )
 
@@ -106,7 +105,8 @@ def search(
         if orientation in _ORIENTATION_MAP:
             params["orientation"] = _ORIENTATION_MAP[orientation]
 
-        response = requests.get(
+        payload = fetch_json(
+            "pexels",
             API_URL,
             params=params,
             headers={
@@ -116,8 +116,7 @@ def search(
             },
             timeout=timeout,
         )
-        response.raise_for_status()
-        candidates = parse_results(response.json())
+        candidates = parse_results(payload)
         if candidates:
             return candidates
 
@@ -21,14 +21,13 @@ if __name__ == "__main__" and any(arg in {"-h", "--help", "help"} for arg in sys
 import html
 import re
 
-import requests
-
 from image_sources.provider_common import (
     AssetCandidate,
     ImageSearchRequest,
     USER_AGENT,
     build_query_progression,
     classify_license,
+    fetch_json,
     normalize_license_name,
     normalize_orientation,
 )
@@ -175,14 +174,14 @@ def search(
             ),
         }
 
-        response = requests.get(
+        payload = fetch_json(
+            "wikimedia",
             API_URL,
             params=params,
             headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
             timeout=timeout,
         )
-        response.raise_for_status()
-        all_candidates = parse_results(response.json())
+        all_candidates = parse_results(payload)
 
         if license_tier_filter == "no-attribution-only":
             all_candidates = [
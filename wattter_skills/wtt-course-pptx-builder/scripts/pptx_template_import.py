@@ -22,6 +22,7 @@ import argparse
 import json
 from pathlib import Path
 
+from pptx_to_svg.media_store import default_media_store_dir
 from template_import.manifest import build_manifest
 
 
@@ -69,6 +70,28 @@ def parse_args() -> argparse.Namespace:
             "SVGs in svg/, the round-trip view used by svg_to_pptx."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Slide-rendering processes for SVG export (default: min(CPU count, slides, 8); 1 = sequential)",
+    )
+    parser.add_argument(
+        "--no-media-store",
+        action="store_true",
+        help=(
+            "Write assets directly instead of copying them from the shared "
+            "media store ($PPTX_MEDIA_STORE, default ~/.ppt-master/cache/pptx_media)"
+        ),
+    )
+    parser.add_argument(
+        "--media-hardlink",
+        action="store_true",
+        help=(
+            "Allow assets to be hardlinks into the media store when the filesystem "
+            "cannot reflink. Hardlinked files must be replaced, never edited in place."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -94,11 +117,17 @@ def main() -> int:
         print("Error: --skip-manifest and --manifest-only cannot be used together")
         return 1
 
+    media_store_dir = None if args.no_media_store else default_media_store_dir()
     manifest = None
     manifest_path = output_dir / "manifest.json"
     if not args.skip_manifest:
         try:
-            manifest = build_manifest(pptx_path, output_dir)
+            manifest = build_manifest(
+                pptx_path,
+                output_dir,
+                media_store_dir=media_store_dir,
+                media_hardlink=args.media_hardlink,
+            )
         except (RuntimeError, OSError, ValueError) as exc:
             print(f"Error: failed to extract PPTX metadata: {exc}")
             return 1
@@ -130,6 +159,9 @@ def main() -> int:
         keep_hidden=False,
         inheritance_mode=args.inheritance_mode,
         asset_name_map=manifest.get("assets", {}).get("assetMap", {}) if manifest else {},
+        workers=args.workers,
+        media_store_dir=media_store_dir,
+        media_hardlink=args.media_hardlink,
     )
     result = convert_pptx_to_svg(pptx_path, output_dir, options)
     total_bytes = sum(len(art.svg.encode("utf-8")) for art in result.slides)
@@ -5,6 +5,8 @@ Usage:
     python3 pptx_to_svg.py <pptx_file> [-o <output_dir>] [--embed-images]
                                        [--media-subdir <name>] [--keep-hidden]
                                        [--inheritance-mode {both,layered,flat}]
+                                       [--workers N] [--no-media-store]
+                                       [--media-hardlink]
 
 Output structure (default --inheritance-mode both):
     <output_dir>/
@@ -32,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from pptx_to_svg import convert_pptx_to_svg
 from pptx_to_svg.converter import ConvertOptions
+from pptx_to_svg.media_store import default_media_store_dir
 
 
 def parse_args() -> argparse.Namespace:
@@ -70,6 +73,28 @@ def parse_args() -> argparse.Namespace:
             "self-contained slides under svg/ for backward compatibility."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Slide-rendering processes (default: min(CPU count, slides, 8); 1 = sequential)",
+    )
+    parser.add_argument(
+        "--no-media-store",
+        action="store_true",
+        help=(
+            "Write media directly instead of copying it from the shared "
+            "media store ($PPTX_MEDIA_STORE, default ~/.ppt-master/cache/pptx_media)"
+        ),
+    )
+    parser.add_argument(
+        "--media-hardlink",
+        action="store_true",
+        help=(
+            "Allow media to be hardlinks into the media store when the filesystem "
+            "cannot reflink. Hardlinked files must be replaced, never edited in place."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -94,6 +119,9 @@ def main() -> int:
         embed_images=args.embed_images,
         keep_hidden=args.keep_hidden,
         inheritance_mode=args.inheritance_mode,
+        workers=args.workers,
+        media_store_dir=None if args.no_media_store else default_media_store_dir(),
+        media_hardlink=args.media_hardlink,
     )
 
     result = convert_pptx_to_svg(pptx_path, output_dir, options)
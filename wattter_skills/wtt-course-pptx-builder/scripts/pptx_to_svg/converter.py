@@ -14,14 +14,21 @@ loads the package and reports basic per-slide structure to verify wiring.
 from __future__ import annotations
 
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
 
 from .color_resolver import ColorPalette
 from .emu_units import NS
-from .ooxml_loader import OoxmlPackage, PartRef, SlideRef
-from .slide_to_svg import assemble_part_solo, assemble_slide
+from .media_store import MediaStore, media_digest, same_media, write_media
+from .ooxml_loader import OoxmlPackage, PartLoadError, PartRef, SlideRef
+from .shape_walker import PlaceholderTables, ShapeNode
+from .slide_to_svg import assemble_part_solo, assemble_slide, walk_slide_shapes
+
+SLIDE_CHUNKS_PER_WORKER = 4
 
 
 def _extract_theme_info(
@@ -85,6 +92,14 @@ class ConvertOptions:
         - "flat": inline inherited shapes into every slide. Used by
           svg_to_pptx round-trip and any caller that wants self-contained
           slides (preview pages, screenshot pipelines).
+    workers: slide-rendering processes. None picks min(cpu_count, slides, 8);
+        1 (or a deck of two slides or fewer) renders in-process.
+    media_store_dir: content-addressed media store shared across conversions
+        (see media_store.py); media files are reflinked or copied from it into
+        media_subdir. None (the default) writes media directly; the CLIs pass
+        media_store.default_media_store_dir().
+    media_hardlink: let media files be hardlinks to the store when no reflink
+        is possible. Hardlinked assets must be replaced, never edited in place.
     """
 
     media_subdir: str = "assets"
@@ -92,6 +107,9 @@ class ConvertOptions:
     keep_hidden: bool = False
     inheritance_mode: str = "both"
     asset_name_map: dict[str, str] = field(default_factory=dict)
+    workers: int | None = None
+    media_store_dir: Path | None = None
+    media_hardlink: bool = False
 
 
 @dataclass
@@ -170,53 +188,35 @@ def convert_pptx_to_svg(
 
     with OoxmlPackage(pptx_path) as pkg:
         result.canvas_px = pkg.slide_size_px
+        renderer = _DeckRenderer(pkg, options)
 
         # Default theme summary is kept for compatibility; conversion itself
         # resolves palette/fonts per slide master.
-        first_slide = pkg.get_slide(1)
-        default_master = first_slide.master if first_slide else None
-        default_theme = pkg.resolve_theme(default_master)
-        palette = ColorPalette(default_master, default_theme)
-        if default_theme is not None:
-            result.theme_colors, result.theme_fonts = _extract_theme_info(default_theme, palette)
+        default_style = renderer.master_style(renderer.default_master)
+        if default_style.theme is not None:
+            result.theme_colors = dict(default_style.colors)
+            result.theme_fonts = dict(default_style.fonts)
 
         for master in pkg.iter_all_masters():
-            theme = pkg.resolve_theme(master) or default_theme
-            pal = ColorPalette(master, theme)
-            colors, fonts = _extract_theme_info(theme, pal) if theme is not None else ({}, {})
+            style = renderer.master_style(master)
             result.master_themes[master.path] = {
-                "themePath": theme.path if theme is not None else None,
-                "colors": colors,
-                "fonts": fonts,
+                "themePath": style.theme.path if style.theme is not None else None,
+                "colors": dict(style.colors),
+                "fonts": dict(style.fonts),
             }
 
         # Per-slide conversion. The primary view is layered when emitted
         # (template designers care most about that one); the flat view is
-        # rendered alongside when needed.
-        primary_mode = "layered" if emit_layered else "flat"
-        for slide in pkg.iter_slides():
-            slide_theme = pkg.resolve_theme(slide.master) or default_theme
-            slide_palette = ColorPalette(slide.master, slide_theme)
-            _colors, slide_fonts = _extract_theme_info(slide_theme, slide_palette) if slide_theme is not None else ({}, result.theme_fonts)
-            artifact = _convert_slide(
-                pkg, slide, slide_palette, options, slide_fonts,
-                inheritance_mode=primary_mode,
-            )
-            result.slides.append(artifact)
-        if emit_layered and emit_flat:
-            for slide in pkg.iter_slides():
-                slide_theme = pkg.resolve_theme(slide.master) or default_theme
-                slide_palette = ColorPalette(slide.master, slide_theme)
-                _colors, slide_fonts = _extract_theme_info(slide_theme, slide_palette) if slide_theme is not None else ({}, result.theme_fonts)
-                artifact = _convert_slide(
-                    pkg, slide, slide_palette, options, slide_fonts,
-                    inheritance_mode="flat",
-                )
-                result.flat_slides.append(artifact)
+        # rendered alongside from the same shape tree when needed.
+        rendered = _render_slides(pptx_path, pkg, renderer, emit_layered, emit_flat)
+        for primary, flat in filter(None, rendered):
+            result.slides.append(primary)
+            if flat is not None:
+                result.flat_slides.append(flat)
 
         # Layered mode: also render each master / layout once.
         if emit_layered:
-            _convert_inheritance_parts(pkg, default_theme, options, result)
+            _convert_inheritance_parts(pkg, renderer, options, result)
 
     if output_dir is not None:
         _write_artifacts(output_dir, result, options)
@@ -224,6 +224,149 @@ def convert_pptx_to_svg(
     return result
 
 
+@dataclass
+class _MasterStyle:
+    """Theme, palette and theme summary resolved once per slide master."""
+
+    theme: PartRef | None
+    palette: ColorPalette
+    colors: dict[str, str]
+    fonts: dict[str, str]
+
+
+class _DeckRenderer:
+    """Render state shared by every slide of one open package.
+
+    Palette and theme fonts depend only on the slide master, placeholder
+    inheritance tables on the layout/master pair, and master / layout shape
+    trees on the part, so all are resolved once here instead of once per
+    slide and per view.
+    """
+
+    def __init__(self, pkg: OoxmlPackage, options: ConvertOptions) -> None:
+        self.pkg = pkg
+        self.options = options
+        first_slide = pkg.get_slide(1)
+        self.default_master = first_slide.master if first_slide else None
+        self.default_theme = pkg.resolve_theme(self.default_master)
+        self._styles: dict[str | None, _MasterStyle] = {}
+        self._part_nodes: dict[str, list[ShapeNode]] = {}
+        self._placeholder_tables: dict[tuple[str | None, str | None], PlaceholderTables] = {}
+
+    def master_style(self, master: PartRef | None) -> _MasterStyle:
+        key = master.path if master is not None else None
+        style = self._styles.get(key)
+        if style is None:
+            theme = self.pkg.resolve_theme(master) or self.default_theme
+            palette = ColorPalette(master, theme)
+            colors, fonts = _extract_theme_info(theme, palette) if theme is not None else ({}, {})
+            style = self._styles[key] = _MasterStyle(theme, palette, colors, fonts)
+        return style
+
+    def theme_fonts(self, style: _MasterStyle) -> dict[str, str]:
+        """Fonts for rendering: the master's own, else the deck default's."""
+        if style.theme is not None:
+            return style.fonts
+        default_style = self.master_style(self.default_master)
+        return default_style.fonts if default_style.theme is not None else {}
+
+    def render_slide(
+        self,
+        slide: SlideRef,
+        emit_layered: bool,
+        emit_flat: bool,
+    ) -> tuple[SlideArtifact, SlideArtifact | None] | None:
+        """Render the primary view, plus the flat view in ``"both"`` mode.
+
+        Returns None for a slide whose XML is malformed: it is reported and
+        skipped so the rest of the deck still converts.
+        """
+        style = self.master_style(slide.master)
+        fonts = self.theme_fonts(style)
+        try:
+            nodes = walk_slide_shapes(slide, self._placeholder_tables)
+        except PartLoadError as exc:
+            print(f"Warning: skipping slide {slide.index}: {exc}", file=sys.stderr)
+            return None
+        primary = _convert_slide(
+            self.pkg, slide, style.palette, self.options, fonts,
+            inheritance_mode="layered" if emit_layered else "flat",
+            nodes=nodes, part_nodes=self._part_nodes,
+        )
+        flat = None
+        if emit_layered and emit_flat:
+            flat = _convert_slide(
+                self.pkg, slide, style.palette, self.options, fonts,
+                inheritance_mode="flat",
+                nodes=nodes, part_nodes=self._part_nodes,
+            )
+        return primary, flat
+
+
+_worker_renderer: _DeckRenderer | None = None
+
+
+def _init_slide_worker(pptx_path: Path, options: ConvertOptions) -> None:
+    global _worker_renderer
+    pkg = OoxmlPackage(pptx_path)
+    pkg.open()
+    _worker_renderer = _DeckRenderer(pkg, options)
+
+
+def _render_slide_chunk(
+    positions: list[int],
+    emit_layered: bool,
+    emit_flat: bool,
+) -> list[tuple[SlideArtifact, SlideArtifact | None] | None]:
+    assert _worker_renderer is not None
+    slides = list(_worker_renderer.pkg.iter_slides())
+    return [
+        _worker_renderer.render_slide(slides[pos], emit_layered, emit_flat)
+        for pos in positions
+    ]
+
+
+def _render_slides(
+    pptx_path: Path,
+    pkg: OoxmlPackage,
+    renderer: _DeckRenderer,
+    emit_layered: bool,
+    emit_flat: bool,
+) -> list[tuple[SlideArtifact, SlideArtifact | None] | None]:
+    """Render every slide in deck order, across a process pool when it pays.
+
+    Skipped (malformed) slides are None entries.
+
+    Each worker opens its own package (a zip handle inherited across fork
+    would share one file offset) and keeps its own master-style cache.
+    """
+    slides = list(pkg.iter_slides())
+    workers = renderer.options.workers
+    if workers is None:
+        workers = min(os.cpu_count() or 2, len(slides), 8)
+    if workers <= 1 or len(slides) <= 2:
+        return [renderer.render_slide(slide, emit_layered, emit_flat) for slide in slides]
+
+    # Several chunks per worker keep the pool busy when slide cost is uneven.
+    chunk = max(1, -(-len(slides) // (workers * SLIDE_CHUNKS_PER_WORKER)))
+    chunks = [list(range(start, min(start + chunk, len(slides))))
+              for start in range(0, len(slides), chunk)]
+    rendered: list[tuple[SlideArtifact, SlideArtifact | None] | None] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_slide_worker,
+        initargs=(pptx_path, renderer.options),
+    ) as pool:
+        for part in pool.map(
+            _render_slide_chunk,
+            chunks,
+            [emit_layered] * len(chunks),
+            [emit_flat] * len(chunks),
+        ):
+            rendered.extend(part)
+    return rendered
+
+
 def _convert_slide(
     pkg: OoxmlPackage,
     slide: SlideRef,
@@ -232,6 +375,8 @@ def _convert_slide(
     theme_fonts: dict[str, str] | None = None,
     *,
     inheritance_mode: str | None = None,
+    nodes: list[ShapeNode] | None = None,
+    part_nodes: dict[str, list[ShapeNode]] | None = None,
 ) -> SlideArtifact:
     """Convert a single slide via the full shape pipeline.
 
@@ -239,7 +384,8 @@ def _convert_slide(
     orchestrator can render the same slide twice (once layered, once flat)
     when the user asked for ``"both"``. Pass ``"flat"`` or ``"layered"``;
     ``None`` falls back to ``options.inheritance_mode`` (used by direct
-    callers that want a single mode).
+    callers that want a single mode). ``nodes`` / ``part_nodes`` pass
+    pre-walked shape trees through to ``assemble_slide``.
     """
     mode = inheritance_mode or options.inheritance_mode
     if mode == "both":
@@ -252,6 +398,8 @@ def _convert_slide(
         keep_hidden=options.keep_hidden,
         inheritance_mode=mode,
         asset_name_map=options.asset_name_map,
+        nodes=nodes,
+        part_nodes=part_nodes,
     )
     return SlideArtifact(
         index=slide.index,
@@ -264,7 +412,7 @@ def _convert_slide(
 
 def _convert_inheritance_parts(
     pkg: OoxmlPackage,
-    default_theme: PartRef | None,
+    renderer: _DeckRenderer,
     options: ConvertOptions,
     result: ConvertResult,
 ) -> None:
@@ -291,21 +439,17 @@ def _convert_inheritance_parts(
         layouts_with_parent.append((layout, parent_master))
 
     for seq, part in enumerate(seen_masters.values(), start=1):
-        theme = pkg.resolve_theme(part) or default_theme
-        palette = ColorPalette(part, theme)
-        _colors, fonts = _extract_theme_info(theme, palette) if theme is not None else ({}, result.theme_fonts)
+        style = renderer.master_style(part)
         result.masters.append(_render_part(
-            pkg, part, palette, options, fonts,
-            role="master", seq=seq, theme_part=theme,
+            pkg, part, style.palette, options, renderer.theme_fonts(style),
+            role="master", seq=seq, theme_part=style.theme,
         ))
     for seq, (layout, parent_master) in enumerate(layouts_with_parent, start=1):
-        theme = pkg.resolve_theme(parent_master) or default_theme
-        palette = ColorPalette(parent_master, theme)
-        _colors, fonts = _extract_theme_info(theme, palette) if theme is not None else ({}, result.theme_fonts)
+        style = renderer.master_style(parent_master)
         result.layouts.append(_render_part(
-            pkg, layout, palette, options, fonts,
+            pkg, layout, style.palette, options, renderer.theme_fonts(style),
             role="layout", seq=seq, parent_master=parent_master,
-            theme_part=theme,
+            theme_part=style.theme,
         ))
 
 
@@ -359,6 +503,11 @@ def _write_artifacts(output_dir: Path, result: ConvertResult,
     svg_dir = output_dir / "svg"
     svg_dir.mkdir(exist_ok=True)
     media_dir = output_dir / options.media_subdir
+    store = (
+        MediaStore(options.media_store_dir, hardlink=options.media_hardlink)
+        if options.media_store_dir
+        else None
+    )
     media_written: set[str] = set()
 
     def _write_media(media: dict[str, bytes]) -> None:
@@ -367,11 +516,12 @@ def _write_artifacts(output_dir: Path, result: ConvertResult,
                 continue
             media_dir.mkdir(parents=True, exist_ok=True)
             target = media_dir / filename
+            digest = media_digest(blob)
             if target.exists():
-                if target.read_bytes() != blob:
+                if not same_media(target, len(blob), digest, store):
                     raise RuntimeError(f"Asset filename collision with different bytes: {filename}")
             else:
-                target.write_bytes(blob)
+                write_media(target, blob, store, digest)
             media_written.add(filename)
 
     # Layered mode: write masters and layouts first so they sort ahead of slides.
@@ -402,6 +552,9 @@ def _write_artifacts(output_dir: Path, result: ConvertResult,
             target.write_text(art.svg, encoding="utf-8")
             _write_media(art.media_files)
 
+    if store is not None:
+        store.prune()
+
 
 def _write_inheritance_json(svg_dir: Path, result: ConvertResult) -> None:
     """Record which layout/master each slide consumes (layered mode only)."""
@@ -0,0 +1,296 @@
+"""Content-addressed store for media extracted from PPTX packages.
+
+Template import and ``pptx_to_svg`` runs on the same build machine keep
+extracting the same logos, backgrounds and photos. Each blob is kept once,
+named ``<sha256><ext>``, in a store shared by every conversion; an output
+``media_subdir`` then receives a reflink (copy-on-write clone) of the stored
+blob, so the output owns its bytes and editing an asset in place never
+reaches the store or another project. Where the output cannot be reflinked
+from the store (no clone support, another filesystem), going through the
+store would only add a copy, so the media is written directly instead.
+
+Hardlinks are opt-in (``MediaStore(hardlink=True)``): they save the copy on
+filesystems without reflinks, but a hardlinked output shares its inode with
+the store and with every other output linked to it, so it must be replaced
+(write a new file and rename it over), never edited in place. Re-running
+into an existing output recognises hardlinks to the stored blob without
+reading them.
+
+Blobs are named by their hash and only ever renamed into place whole, so a
+stored blob of the expected size is reused without re-reading it, and a
+stream is hashed before anything is written. After each conversion the
+store is trimmed back to ``max_bytes`` by evicting the least recently used
+blobs.
+
+The store is a cache. Failing to read or write it never fails a conversion;
+the media is written directly into the output instead. Library callers get
+no store unless they pass a directory; the CLIs use ``default_media_store_dir``.
+
+Environment:
+    PPTX_MEDIA_STORE         directory of the store, or "off" to disable
+                             (default: ~/.ppt-master/cache/pptx_media)
+    PPTX_MEDIA_STORE_MAX_MB  size cap of the store in MiB (default: 1024)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import IO
+
+DEFAULT_MEDIA_STORE_DIR = Path.home() / ".ppt-master" / "cache" / "pptx_media"
+DEFAULT_MEDIA_STORE_MAX_BYTES = 1024 * 1024 * 1024
+
+_COPY_CHUNK = 1024 * 1024
+# linux/fs.h FICLONE: clone a whole file on btrfs / XFS / overlayfs-on-those.
+_FICLONE = 0x40049409
+
+
+def default_media_store_dir() -> Path | None:
+    """Store directory from ``PPTX_MEDIA_STORE``; ``None`` when disabled."""
+    value = os.environ.get("PPTX_MEDIA_STORE", "").strip()
+    if value.lower() in {"off", "0", "false", "no"}:
+        return None
+    return Path(value).expanduser() if value else DEFAULT_MEDIA_STORE_DIR
+
+
+def default_media_store_max_bytes() -> int:
+    """Size cap from ``PPTX_MEDIA_STORE_MAX_MB``, else the 1 GiB default."""
+    value = os.environ.get("PPTX_MEDIA_STORE_MAX_MB", "").strip()
+    try:
+        return max(0, int(float(value) * 1024 * 1024)) if value else DEFAULT_MEDIA_STORE_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MEDIA_STORE_MAX_BYTES
+
+
+def media_digest(blob: bytes) -> str:
+    return hashlib.sha256(blob).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file on disk, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_COPY_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaStore:
+    """Hash-named blobs under ``root``, cloned or copied into output directories.
+
+    ``hardlink`` lets outputs share the stored inode when no reflink is
+    possible; ``max_bytes`` caps the store (``None`` reads the environment).
+    """
+
+    def __init__(self, root: Path, *, hardlink: bool = False,
+                 max_bytes: int | None = None) -> None:
+        self.root = root
+        self.hardlink = hardlink
+        self.max_bytes = default_media_store_max_bytes() if max_bytes is None else max_bytes
+        self._shares_into: dict[Path, bool] = {}
+
+    def blob_path(self, digest: str, suffix: str) -> Path:
+        return self.root / f"{digest}{suffix.lower()}"
+
+    def shares_into(self, directory: Path) -> bool:
+        """Whether a stored blob can reach ``directory`` without copying its bytes.
+
+        Probed once per directory: a reflink, or a hardlink when opted in.
+        Otherwise going through the store would only add a copy, so callers
+        write the media directly instead.
+        """
+        if directory not in self._shares_into:
+            self._shares_into[directory] = self._probe_sharing(directory)
+        return self._shares_into[directory]
+
+    def _probe_sharing(self, directory: Path) -> bool:
+        probe = self.root / f".probe.{os.getpid()}.tmp"
+        clone = directory / f".media-store-probe.{os.getpid()}.tmp"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            probe.write_bytes(b"probe")
+            if _reflink(probe, clone):
+                return True
+            if self.hardlink:
+                os.link(probe, clone)
+                return True
+        except OSError:
+            pass
+        finally:
+            _unlink_quietly(clone)
+            _unlink_quietly(probe)
+        return False
+
+    def put_bytes(self, blob: bytes, suffix: str, digest: str | None = None) -> Path:
+        """Store ``blob`` unless it is already there; return its path."""
+        path = self.blob_path(digest or media_digest(blob), suffix)
+        if _is_stored(path, len(blob)):
+            return path
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = _tmp_sibling(path)
+        try:
+            with open(tmp_path, "xb") as fh:
+                fh.write(blob)
+            os.replace(tmp_path, path)
+        except OSError:
+            _unlink_quietly(tmp_path)
+            raise
+        return path
+
+    def put_stream(self, src: IO[bytes], suffix: str) -> Path:
+        """Store the seekable stream ``src`` unless it is already there; return its path.
+
+        The stream is hashed first, so a blob that is already stored costs a
+        read and nothing is written; only a new blob is read again into the store.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in iter(lambda: src.read(_COPY_CHUNK), b""):
+            digest.update(chunk)
+            size += len(chunk)
+        path = self.blob_path(digest.hexdigest(), suffix)
+        if _is_stored(path, size):
+            return path
+        src.seek(0)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = _tmp_sibling(path)
+        try:
+            with open(tmp_path, "xb") as fh:
+                shutil.copyfileobj(src, fh, _COPY_CHUNK)
+            os.replace(tmp_path, path)
+        except OSError:
+            _unlink_quietly(tmp_path)
+            raise
+        return path
+
+    def link(self, blob_path: Path, target: Path) -> None:
+        """Create ``target`` from a stored blob, hardlinking only when opted in."""
+        link_or_copy(blob_path, target, hardlink=self.hardlink)
+
+    def prune(self) -> None:
+        """Evict least recently used blobs until the store fits ``max_bytes``."""
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry.stat().st_size, Path(entry.path))
+                for entry in os.scandir(self.root)
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _unlink_quietly(path)
+            total -= size
+
+
+def link_or_copy(source: Path, target: Path, *, hardlink: bool = False) -> None:
+    """Make ``target`` a reflink of ``source``, else a hardlink (if allowed), else a copy."""
+    if _reflink(source, target):
+        return
+    if hardlink:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
+
+def write_media(target: Path, blob: bytes, store: MediaStore | None,
+                digest: str | None = None) -> None:
+    """Create ``target`` with ``blob``, through ``store`` when that saves a copy."""
+    if store is not None and store.shares_into(target.parent):
+        try:
+            store.link(store.put_bytes(blob, target.suffix, digest), target)
+            return
+        except OSError:
+            _unlink_quietly(target)
+    target.write_bytes(blob)
+
+
+def copy_media_stream(src: IO[bytes], target: Path, store: MediaStore | None) -> None:
+    """Create ``target`` from the stream ``src``, through ``store`` when that saves a copy.
+
+    Without a store, for a stream that cannot be rewound, or when the store
+    fails, the stream is copied straight into ``target``.
+    """
+    if store is not None and src.seekable() and store.shares_into(target.parent):
+        try:
+            store.link(store.put_stream(src, target.suffix), target)
+            return
+        except OSError:
+            _unlink_quietly(target)
+            src.seek(0)
+    with open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
+def same_media(target: Path, blob_size: int, digest: str,
+               store: MediaStore | None) -> bool:
+    """Whether the existing ``target`` holds the blob with ``digest``.
+
+    With a hardlinking store, a target that is a link to the stored blob is
+    accepted from its inode; a size mismatch rejects without reading;
+    otherwise the file is hashed.
+    """
+    stat = target.stat()
+    if stat.st_size != blob_size:
+        return False
+    if store is not None and store.hardlink:
+        try:
+            if os.path.samestat(stat, store.blob_path(digest, target.suffix).stat()):
+                return True
+        except OSError:
+            pass
+    return file_digest(target) == digest
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    created = False
+    try:
+        with open(source, "rb") as src, open(target, "xb") as dst:
+            created = True
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+    except OSError:
+        # No clone support here (or another filesystem): let the caller
+        # hardlink or copy instead.
+        if created:
+            _unlink_quietly(target)
+    return False
+
+
+def _is_stored(path: Path, size: int) -> bool:
+    """Whether the blob named ``path`` is stored whole.
+
+    The name is the content hash and blobs are only ever renamed into place,
+    so a matching size is trusted without re-reading the blob. A reused blob
+    is touched so that ``prune`` evicts it last.
+    """
+    try:
+        if path.stat().st_size != size:
+            return False
+        os.utime(path)
+    except OSError:
+        return False
+    return True
+
+
+def _tmp_sibling(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
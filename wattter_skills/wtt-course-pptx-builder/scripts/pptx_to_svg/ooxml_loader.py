@@ -8,10 +8,11 @@ accessible for downstream shape conversion.
 from __future__ import annotations
 
 import posixpath
+import shutil
 import zipfile
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
-from typing import Iterator
+from typing import IO, Callable, Iterator
 from xml.etree import ElementTree as ET
 
 from .emu_units import NS, emu_attr_to_px
@@ -24,6 +25,7 @@ from .emu_units import NS, emu_attr_to_px
 REL_NS = NS["rel"]
 PACKAGE_REL = "_rels/.rels"
 PRESENTATION_REL_PREFIX = "ppt/_rels/presentation.xml.rels"
+_MEDIA_COPY_CHUNK = 1024 * 1024
 
 
 def _normalize_part_path(target: str, base: str | None = None) -> str:
@@ -51,12 +53,10 @@ def _rels_path_for(part_path: str) -> str:
     return f"{parent}/_rels/{name}.rels"
 
 
-def _parse_rels(zf: zipfile.ZipFile, rels_path: str) -> dict[str, dict[str, str]]:
+def _parse_rels_bytes(data: bytes, rels_path: str) -> dict[str, dict[str, str]]:
     """Parse a .rels file. Returns {rId: {'type': ..., 'target': absolute_part_path}}."""
-    if rels_path not in zf.namelist():
-        return {}
     try:
-        root = ET.fromstring(zf.read(rels_path))
+        root = ET.fromstring(data)
     except ET.ParseError:
         return {}
 
@@ -77,26 +77,44 @@ def _parse_rels(zf: zipfile.ZipFile, rels_path: str) -> dict[str, dict[str, str]
     return rels
 
 
-def _load_xml(zf: zipfile.ZipFile, part_path: str) -> ET.Element | None:
-    if part_path not in zf.namelist():
-        return None
-    try:
-        return ET.fromstring(zf.read(part_path))
-    except ET.ParseError:
-        return None
-
-
 # ---------------------------------------------------------------------------
 # Data classes for navigable parts
 # ---------------------------------------------------------------------------
 
-@dataclass
+class PartLoadError(RuntimeError):
+    """A lazily loaded part turned out to be malformed or missing."""
+
+
 class PartRef:
-    """A loaded XML part with its rels resolved."""
+    """An XML part with its rels resolved.
+
+    ``xml`` may be deferred: the package then parses the part on first access
+    and keeps the root, so a caller that touches only some slides never pays
+    for parsing the rest.
+    """
 
-    path: str
-    xml: ET.Element
-    rels: dict[str, dict[str, str]] = field(default_factory=dict)
+    def __init__(
+        self,
+        path: str,
+        xml: ET.Element | None = None,
+        rels: dict[str, dict[str, str]] | None = None,
+        *,
+        load_xml: Callable[[str], ET.Element] | None = None,
+    ) -> None:
+        if xml is None and load_xml is None:
+            raise ValueError("PartRef needs xml or a load_xml callback")
+        self.path = path
+        self.rels = rels if rels is not None else {}
+        self._xml = xml
+        self._load_xml = load_xml
+
+    @property
+    def xml(self) -> ET.Element:
+        if self._xml is None:
+            assert self._load_xml is not None
+            self._xml = self._load_xml(self.path)
+            self._load_xml = None
+        return self._xml
 
     def resolve_rel(self, rid: str) -> str | None:
         """Resolve an rId to an absolute part path. Returns None if missing."""
@@ -107,6 +125,9 @@ class PartRef:
             return None
         return info.get("target")
 
+    def __repr__(self) -> str:
+        return f"PartRef(path={self.path!r})"
+
 
 @dataclass
 class SlideRef:
@@ -147,6 +168,7 @@ class OoxmlPackage:
     def __init__(self, pptx_path: Path) -> None:
         self.path = pptx_path
         self.zip: zipfile.ZipFile | None = None
+        self._entries: dict[str, zipfile.ZipInfo] = {}
         self.presentation: PartRef | None = None
         self.slide_size_px: tuple[float, float] = (1280.0, 720.0)
         self.slide_size_emu: tuple[int, int] = (12192000, 6858000)
@@ -168,6 +190,11 @@ class OoxmlPackage:
         if self.zip is not None:
             return
         self.zip = zipfile.ZipFile(self.path, "r")
+        # Index members once; ``name in zip.namelist()`` rebuilds and scans
+        # the whole name list on every lookup.
+        self._entries = {
+            info.filename: info for info in self.zip.infolist() if not info.is_dir()
+        }
         self._load_presentation()
         self._load_slides()
 
@@ -178,20 +205,73 @@ class OoxmlPackage:
 
     # ------------------- low-level helpers -------------------
 
-    def _load_part(self, part_path: str) -> PartRef | None:
+    def has_part(self, part_path: str) -> bool:
+        return part_path in self._entries
+
+    def _read_rels(self, rels_path: str) -> dict[str, dict[str, str]]:
         assert self.zip is not None
-        xml = _load_xml(self.zip, part_path)
+        info = self._entries.get(rels_path)
+        if info is None:
+            return {}
+        return _parse_rels_bytes(self.zip.read(info), rels_path)
+
+    def _read_xml(self, part_path: str) -> ET.Element | None:
+        assert self.zip is not None
+        info = self._entries.get(part_path)
+        if info is None:
+            return None
+        try:
+            return ET.fromstring(self.zip.read(info))
+        except ET.ParseError:
+            return None
+
+    def _read_xml_strict(self, part_path: str) -> ET.Element:
+        xml = self._read_xml(part_path)
+        if xml is None:
+            raise PartLoadError(f"Malformed or missing XML part: {part_path}")
+        return xml
+
+    def _load_part(self, part_path: str, *, lazy: bool = False) -> PartRef | None:
+        """Load a part and its rels; ``lazy`` defers parsing the part XML."""
+        if lazy:
+            if not self.has_part(part_path):
+                return None
+            return PartRef(
+                part_path, rels=self._read_rels(_rels_path_for(part_path)),
+                load_xml=self._read_xml_strict,
+            )
+        xml = self._read_xml(part_path)
         if xml is None:
             return None
-        rels = _parse_rels(self.zip, _rels_path_for(part_path))
-        return PartRef(path=part_path, xml=xml, rels=rels)
+        return PartRef(part_path, xml=xml, rels=self._read_rels(_rels_path_for(part_path)))
 
     def read_media(self, part_path: str) -> bytes | None:
         """Return raw bytes of an embedded media part (e.g. ppt/media/image1.png)."""
         assert self.zip is not None
-        if part_path not in self.zip.namelist():
+        info = self._entries.get(part_path)
+        if info is None:
+            return None
+        return self.zip.read(info)
+
+    def open_media(self, part_path: str) -> IO[bytes] | None:
+        """Open a media part for streaming reads, or None when it is missing."""
+        assert self.zip is not None
+        info = self._entries.get(part_path)
+        if info is None:
             return None
-        return self.zip.read(part_path)
+        return self.zip.open(info)
+
+    def copy_media(self, part_path: str, destination: Path) -> bool:
+        """Stream a media part to ``destination`` without holding it in memory.
+
+        Returns False when the part is missing.
+        """
+        src = self.open_media(part_path)
+        if src is None:
+            return False
+        with src, open(destination, "wb") as dst:
+            shutil.copyfileobj(src, dst, _MEDIA_COPY_CHUNK)
+        return True
 
     def media_filename(self, part_path: str) -> str:
         """Last segment of the media path, e.g. 'image1.png'."""
@@ -202,7 +282,7 @@ class OoxmlPackage:
     def _load_presentation(self) -> None:
         assert self.zip is not None
         # /_rels/.rels -> presentation.xml
-        package_rels = _parse_rels(self.zip, PACKAGE_REL)
+        package_rels = self._read_rels(PACKAGE_REL)
         pres_path = None
         for info in package_rels.values():
             if info.get("type") == REL_TYPES["presentation"]:
@@ -238,7 +318,9 @@ class OoxmlPackage:
             slide_path = self.presentation.resolve_rel(rid)
             if not slide_path:
                 continue
-            slide_part = self._load_part(slide_path)
+            # Slide XML is parsed on first use; layouts / masters / themes are
+            # few and shared, so they load eagerly below.
+            slide_part = self._load_part(slide_path, lazy=True)
             if slide_part is None:
                 continue
             layout = self._resolve_layout(slide_part)
@@ -360,26 +360,48 @@ def _append_master_tx_styles(
             table.setdefault(key, []).append(style)
 
 
+PlaceholderTables = tuple[
+    dict[tuple[str | None, str | None], Xfrm],
+    dict[tuple[str | None, str | None], list[ET.Element]],
+]
+
+
+def build_placeholder_tables(
+    layout_xml: ET.Element | None,
+    master_xml: ET.Element | None,
+) -> PlaceholderTables:
+    """Inherited placeholder geometry and list styles for one layout/master pair.
+
+    Depends only on the pair, so callers walking many slides that share a
+    layout can build it once and pass it to ``walk_sp_tree``.
+    """
+    return (
+        _build_placeholder_xfrm_table(layout_xml, master_xml),
+        _build_placeholder_lst_style_table(layout_xml, master_xml),
+    )
+
+
 def walk_sp_tree(
     slide_xml: ET.Element,
     *,
     layout_xml: ET.Element | None = None,
     master_xml: ET.Element | None = None,
+    placeholder_tables: PlaceholderTables | None = None,
 ) -> list[ShapeNode]:
     """Top-level entry: return shape nodes for a slide / layout / master XML.
 
     When ``slide_xml`` is a regular slide, pass its ``layout_xml`` and
     ``master_xml`` so placeholders can inherit geometry and text list styles
-    from the layout/master. Layout and master walks pass neither — their own
-    placeholders are the source of truth.
+    from the layout/master, or pass ``placeholder_tables`` already built for
+    that pair. Layout and master walks pass neither — their own placeholders
+    are the source of truth.
     """
     sp_tree = slide_xml.find("p:cSld/p:spTree", NS)
     if sp_tree is None:
         return []
-    placeholder_xfrms = _build_placeholder_xfrm_table(layout_xml, master_xml)
-    placeholder_lst_styles = _build_placeholder_lst_style_table(
-        layout_xml, master_xml,
-    )
+    if placeholder_tables is None:
+        placeholder_tables = build_placeholder_tables(layout_xml, master_xml)
+    placeholder_xfrms, placeholder_lst_styles = placeholder_tables
     return _walk_container(
         sp_tree, parent_group_xfrm=None,
         placeholder_xfrms=placeholder_xfrms or None,
@@ -36,7 +36,7 @@ from .pic_to_svg import convert_blip_fill, convert_picture
 from .prstgeom_to_svg import GeomResult, convert_prst_geom
 from .shape_walker import (
     CONNECTOR, GRAPHIC, GROUP, PICTURE, SHAPE,
-    ShapeNode, get_background, walk_sp_tree,
+    PlaceholderTables, ShapeNode, build_placeholder_tables, get_background, walk_sp_tree,
 )
 from .tbl_to_svg import convert_tbl
 from .txbody_to_svg import (
@@ -94,6 +94,8 @@ def assemble_slide(
     keep_hidden: bool = False,
     inheritance_mode: str = "flat",
     asset_name_map: dict[str, str] | None = None,
+    nodes: list[ShapeNode] | None = None,
+    part_nodes: dict[str, list[ShapeNode]] | None = None,
 ) -> tuple[str, dict[str, bytes]]:
     """Convert one slide to a complete SVG string + media files map.
 
@@ -105,6 +107,11 @@ def assemble_slide(
           only its own shapes. Callers (e.g. /create-template's PPTX import)
           render master/layout once each as separate SVGs and record the
           inheritance graph in inheritance.json.
+
+    Shape trees are read-only to the converters, so callers rendering the
+    same deck repeatedly may share them: ``nodes`` is the slide's own tree
+    from ``walk_slide_shapes`` (walked here when omitted), and ``part_nodes``
+    caches master/layout trees by part path for flat mode.
     """
     ctx = AssemblyContext(
         palette=palette,
@@ -136,19 +143,14 @@ def assemble_slide(
     if inheritance_mode == "flat":
         # Inherited layout/master shapes render behind slide-local shapes. Skip
         # placeholders; they define editable regions, not visible background.
-        body_parts.extend(_emit_inherited_shapes(slide, ctx))
+        body_parts.extend(_emit_inherited_shapes(slide, ctx, part_nodes))
     elif inheritance_mode != "layered":
         raise ValueError(
             f"inheritance_mode must be 'flat' or 'layered', got {inheritance_mode!r}"
         )
 
-    # Walk shapes — placeholders without their own xfrm inherit geometry from
-    # layout, then master.
-    nodes = walk_sp_tree(
-        slide.part.xml,
-        layout_xml=slide.layout.xml if slide.layout else None,
-        master_xml=slide.master.xml if slide.master else None,
-    )
+    if nodes is None:
+        nodes = walk_slide_shapes(slide)
     for node in nodes:
         chunk = _convert_node(node, ctx, top_level=True)
         if chunk:
@@ -833,17 +835,51 @@ def _theme_background_fill(
     return fills[bg_fill_index]
 
 
-def _emit_inherited_shapes(slide: SlideRef, ctx: AssemblyContext) -> list[str]:
+def walk_slide_shapes(
+    slide: SlideRef,
+    placeholder_cache: dict[tuple[str | None, str | None], PlaceholderTables] | None = None,
+) -> list[ShapeNode]:
+    """Shape tree of a slide's own spTree.
+
+    Placeholders without their own xfrm inherit geometry from layout, then
+    master. ``placeholder_cache`` keeps the inherited placeholder tables by
+    (layout, master) path so slides sharing a layout build them once.
+    """
+    layout_xml = slide.layout.xml if slide.layout else None
+    master_xml = slide.master.xml if slide.master else None
+    if placeholder_cache is None:
+        return walk_sp_tree(slide.part.xml, layout_xml=layout_xml, master_xml=master_xml)
+    key = (
+        slide.layout.path if slide.layout else None,
+        slide.master.path if slide.master else None,
+    )
+    tables = placeholder_cache.get(key)
+    if tables is None:
+        tables = placeholder_cache[key] = build_placeholder_tables(layout_xml, master_xml)
+    return walk_sp_tree(slide.part.xml, placeholder_tables=tables)
+
+
+def _emit_inherited_shapes(
+    slide: SlideRef,
+    ctx: AssemblyContext,
+    part_nodes: dict[str, list[ShapeNode]] | None = None,
+) -> list[str]:
     parts: list[str] = []
     for prefix, part in (("master-", slide.master), ("layout-", slide.layout)):
         if part is None:
             continue
+        if part_nodes is None:
+            nodes = walk_sp_tree(part.xml)
+        else:
+            nodes = part_nodes.get(part.path)
+            if nodes is None:
+                nodes = part_nodes[part.path] = walk_sp_tree(part.xml)
         original_part = ctx.slide_part
         original_prefix = ctx.group_id_prefix
         ctx.slide_part = part
         ctx.group_id_prefix = prefix
         try:
-            for node in walk_sp_tree(part.xml):
+            for node in nodes:
                 if _is_placeholder_node(node):
                     continue
                 chunk = _convert_node(node, ctx, top_level=True)
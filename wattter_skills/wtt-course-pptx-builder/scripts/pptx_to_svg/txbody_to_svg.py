@@ -22,9 +22,17 @@ back to paragraph/list defaults, endParaRPr, or spec-default values.
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from text_metrics import MeasuredText, is_cjk as _is_cjk, measure, text_width  # noqa: E402
+
 from .color_resolver import ColorPalette, find_color_elem, resolve_color
 from .emu_units import (
     NS, Xfrm, fmt_num, emu_to_px, hundredths_pt_to_px,
@@ -791,51 +799,32 @@ def _collect_text_defs(paragraphs: list[TextParagraph]) -> list[str]:
 # Word-wrap / text measurement
 # ---------------------------------------------------------------------------
 
-def _is_cjk(ch: str) -> bool:
-    """Check if a character is CJK (Chinese/Japanese/Korean) or full-width."""
-    cp = ord(ch)
-    return (0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF or
-            0x2E80 <= cp <= 0x2EFF or 0x3000 <= cp <= 0x303F or
-            0xFF00 <= cp <= 0xFFEF or 0xF900 <= cp <= 0xFAFF or
-            0x20000 <= cp <= 0x2A6DF)
+_BREAK_AFTER = frozenset("-—、，。！？：；")
 
 
-def _char_width(ch: str, font_size: float, bold: bool) -> float:
-    """Estimate a single character's rendered width in pixels.
-
-    Mirrors svg_to_pptx/drawingml_utils.estimate_text_width so wrapping breaks
-    align with the same heuristic used to estimate text-box sizes elsewhere.
-    """
-    if _is_cjk(ch):
-        w = font_size  # CJK is approximately 1em per glyph
-    elif ch == ' ':
-        w = font_size * 0.3
-    elif ch in 'mMwWOQ%':
-        w = font_size * 0.75
-    elif ch in 'iIlj!|':
-        w = font_size * 0.3
-    elif ch.isdigit():
-        # digits are tabular (uniform ~0.55em) in most UI fonts, including
-        # '1' — classing it with 'il|' under-sizes the width and makes
-        # renderers that ignore wrap="none" (LibreOffice) wrap the line
-        w = font_size * 0.55
-    else:
-        w = font_size * 0.55
-    # Bold Latin generally expands a little. CJK glyphs keep their em advance
-    # in common PPT fonts; applying the bold multiplier causes short Chinese
-    # titles such as "少年强国说" to wrap even though PowerPoint keeps them on
-    # one line.
-    if bold and not _is_cjk(ch):
-        w *= 1.05
-    return w
+def _measure_run(text: str, run: TextRun) -> MeasuredText:
+    """Per-character widths of ``text`` in ``run``'s font (see text_metrics)."""
+    return measure(text, run.font_size_px, run.font_family, run.bold)
 
 
 def _estimate_run_width(text: str, run: TextRun) -> float:
-    return sum(_char_width(c, run.font_size_px, run.bold) for c in text) * 1.05
+    return text_width(text, run.font_size_px, run.font_family, run.bold) * 1.05
+
+
+def _break_indices(text: str) -> list[int]:
+    """Indices i such that a line may end before text[i].
+
+    Breaks are allowed after whitespace, after CJK characters, and after
+    hyphens / CJK punctuation.
+    """
+    return [
+        i + 1 for i, ch in enumerate(text)
+        if ch.isspace() or ch in _BREAK_AFTER or _is_cjk(ch)
+    ]
 
 
 def _find_break_point(
-    text: str, start: int, max_width: float, run: TextRun,
+    measured: MeasuredText, breaks: list[int], start: int, max_width: float,
 ) -> tuple[int, float]:
     """Find the longest prefix of text[start:] that fits in max_width.
 
@@ -843,24 +832,14 @@ def _find_break_point(
     CJK characters, or after hyphens. If even the first character doesn't fit,
     returns (start, 0.0) — the caller should flush the current line first.
     """
-    cur_w = 0.0
-    last_break = start
-    last_break_w = 0.0
-
-    for i in range(start, len(text)):
-        ch = text[i]
-        ch_w = _char_width(ch, run.font_size_px, run.bold)
-        if cur_w + ch_w > max_width:
-            if last_break > start:
-                return last_break, last_break_w
-            return start, 0.0
-        cur_w += ch_w
-        # Update last_break point
-        if ch.isspace() or _is_cjk(ch) or ch in "-—、，。！？：；":
-            last_break = i + 1
-            last_break_w = cur_w
-    # Whole rest fits
-    return len(text), cur_w
+    end = measured.fit(start, max_width)
+    if end == len(measured.text):
+        # Whole rest fits
+        return end, measured.width(start, end)
+    pos = bisect_right(breaks, end) - 1
+    if pos >= 0 and breaks[pos] > start:
+        return breaks[pos], measured.width(start, breaks[pos])
+    return start, 0.0
 
 
 def _wrap_paragraph_into_lines(
@@ -896,9 +875,10 @@ def _wrap_paragraph_into_lines(
         if not run.text:
             continue
         text = run.text
+        measured = _measure_run(text, run)
+        breaks = _break_indices(text)
         i = 0
         while i < len(text):
-            remaining = text[i:]
             avail = max_width - cur_w
             if avail <= 0 and lines[-1]:
                 # Line is full; start a new one
@@ -906,21 +886,20 @@ def _wrap_paragraph_into_lines(
                 cur_w = 0.0
                 avail = max_width
 
-            end, used = _find_break_point(remaining, 0, avail, run)
-            if end == 0:
+            end, used = _find_break_point(measured, breaks, i, avail)
+            if end == i:
                 # Nothing fits even from a fresh line — force one char to avoid
                 # an infinite loop.
                 if lines[-1]:
                     lines.append([])
                     cur_w = 0.0
                     continue
-                end = 1
-                used = _char_width(remaining[0], run.font_size_px, run.bold)
+                end = i + 1
+                used = measured.width(i, end)
 
-            chunk = remaining[:end]
-            lines[-1].append(_copy_run(run, text=chunk))
+            lines[-1].append(_copy_run(run, text=text[i:end]))
             cur_w += used
-            i += end
+            i = end
 
             if i < len(text):
                 # More to render — wrap to next line
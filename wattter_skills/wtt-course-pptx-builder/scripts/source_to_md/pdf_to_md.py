@@ -9,7 +9,10 @@ import argparse
 import hashlib
 import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import Counter
 
@@ -26,6 +29,7 @@ FONT_H3_SIZE = 14
 HEADER_FOOTER_SAMPLE_LIMIT = 40
 HEADER_FOOTER_EDGE_SAMPLE_SIZE = 20
 CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+PAGE_CHUNKS_PER_WORKER = 4
 
 
 def analyze_font_sizes(doc: fitz.Document) -> dict[str, float]:
@@ -38,18 +42,27 @@ def analyze_font_sizes(doc: fitz.Document) -> dict[str, float]:
         A size mapping containing body and inferred heading sizes.
     """
     size_counter = Counter()
-
     for page in doc:
-        blocks = page.get_text("dict")["blocks"]
-        for block in blocks:
-            if block["type"] == 0:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        size = round(span["size"], 1)
-                        text = span["text"].strip()
-                        if text:
-                            size_counter[size] += len(text)
+        size_counter.update(_font_size_counter(page.get_text("dict")["blocks"]))
+    return _size_map_from_counter(size_counter)
 
+
+def _font_size_counter(blocks: list[dict]) -> Counter:
+    """Count characters per rounded font size in one page's text blocks."""
+    size_counter = Counter()
+    for block in blocks:
+        if block["type"] == 0:
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    size = round(span["size"], 1)
+                    text = span["text"].strip()
+                    if text:
+                        size_counter[size] += len(text)
+    return size_counter
+
+
+def _size_map_from_counter(size_counter: Counter) -> dict[str, float]:
+    """Infer body and heading sizes from a document-wide size counter."""
     if not size_counter:
         return {
             "body": FONT_BODY_SIZE,
@@ -217,41 +230,63 @@ def detect_headers_footers(doc: fitz.Document, threshold_ratio: float = 0.6) ->
 
     headers = []
     footers = []
+    pages_to_scan = header_footer_sample_pages(len(doc))
+    for i in pages_to_scan:
+        page_headers, page_footers = _page_edge_texts(doc[i])
+        headers.extend(page_headers)
+        footers.extend(page_footers)
+
+    return _noise_texts_from_edges(headers, footers, len(pages_to_scan), threshold_ratio)
 
+
+def header_footer_sample_pages(page_count: int) -> list[int]:
+    """Return the 0-based page indexes scanned for repeated headers/footers."""
     # Sample first 20 and last 20 pages (avoid processing too slowly)
-    pages_to_scan = list(range(len(doc)))
-    if len(doc) > HEADER_FOOTER_SAMPLE_LIMIT:
+    pages_to_scan = list(range(page_count))
+    if page_count > HEADER_FOOTER_SAMPLE_LIMIT:
         pages_to_scan = (
             pages_to_scan[:HEADER_FOOTER_EDGE_SAMPLE_SIZE]
             + pages_to_scan[-HEADER_FOOTER_EDGE_SAMPLE_SIZE:]
         )
+    return pages_to_scan
 
-    for i in pages_to_scan:
-        page = doc[i]
-        rect = page.rect
-        h = rect.height
-
-        # Define top and bottom regions (15% each)
-        top_rect = fitz.Rect(0, 0, rect.width, h * 0.15)
-        bottom_rect = fitz.Rect(0, h * 0.85, rect.width, h)
-
-        # Extract text blocks
-        blocks = page.get_text("blocks")
-        for b in blocks:
-            b_rect = fitz.Rect(b[:4])
-            text = b[4].strip()
-            if not text:
-                continue
 
-            # Simple spatial determination
-            if b_rect.intersects(top_rect):
-                headers.append(text)
-            elif b_rect.intersects(bottom_rect):
-                footers.append(text)
+def _page_edge_texts(page: fitz.Page) -> tuple[list[str], list[str]]:
+    """Return the text blocks in a page's top and bottom 15% bands."""
+    headers = []
+    footers = []
+    rect = page.rect
+    h = rect.height
+
+    # Define top and bottom regions (15% each)
+    top_rect = fitz.Rect(0, 0, rect.width, h * 0.15)
+    bottom_rect = fitz.Rect(0, h * 0.85, rect.width, h)
+
+    # Extract text blocks
+    blocks = page.get_text("blocks")
+    for b in blocks:
+        b_rect = fitz.Rect(b[:4])
+        text = b[4].strip()
+        if not text:
+            continue
 
+        # Simple spatial determination
+        if b_rect.intersects(top_rect):
+            headers.append(text)
+        elif b_rect.intersects(bottom_rect):
+            footers.append(text)
+    return headers, footers
+
+
+def _noise_texts_from_edges(
+    headers: list[str],
+    footers: list[str],
+    total_scanned: int,
+    threshold_ratio: float,
+) -> set[str]:
+    """Return edge texts repeated on more than ``threshold_ratio`` of pages."""
     # Count frequencies
     noise_texts = set()
-    total_scanned = len(pages_to_scan)
 
     for collection in [headers, footers]:
         counter = Counter(collection)
@@ -358,6 +393,21 @@ def should_keep_image(
     Returns:
         Whether the image should be kept in the Markdown output.
     """
+    if not _image_passes_size_filters(block):
+        return False
+
+    # Deduplicate: skip images with identical content (e.g. repeated backgrounds)
+    if seen_hashes is not None:
+        img_hash = hashlib.md5(block.get("image", b"")).hexdigest()
+        if img_hash in seen_hashes:
+            return False
+        seen_hashes.add(img_hash)
+
+    return _image_passes_shape_filters(block, page_rect)
+
+
+def _image_passes_size_filters(block: dict[str, object]) -> bool:
+    """Pixel size and payload checks applied before deduplication."""
     w, h = block.get("width", 0), block.get("height", 0)
 
     # Pixel dimension filter
@@ -372,13 +422,14 @@ def should_keep_image(
     image_data = block.get("image", b"")
     if len(image_data) < MIN_IMAGE_BYTES:
         return False
+    return True
 
-    # Deduplicate: skip images with identical content (e.g. repeated backgrounds)
-    if seen_hashes is not None:
-        img_hash = hashlib.md5(image_data).hexdigest()
-        if img_hash in seen_hashes:
-            return False
-        seen_hashes.add(img_hash)
+
+def _image_passes_shape_filters(block: dict[str, object], page_rect: fitz.Rect) -> bool:
+    """Render size, aspect and information-density checks."""
+    w, h = block.get("width", 0), block.get("height", 0)
+    area = w * h
+    image_data = block.get("image", b"")
 
     # Check render size relative to page
     bbox = block.get("bbox", (0, 0, 0, 0))
@@ -447,10 +498,16 @@ def _is_background_drawing(drawing: dict[str, object]) -> bool:
     return _is_white(drawing.get("fill")) and drawing.get("color") is None
 
 
-def find_figure_caption_rects(page: fitz.Page) -> list[fitz.Rect]:
-    """Return text-line rectangles that look like figure captions."""
+def find_figure_caption_rects(page: fitz.Page, blocks: list[dict] | None = None) -> list[fitz.Rect]:
+    """Return text-line rectangles that look like figure captions.
+
+    ``blocks`` is the page's ``get_text("dict")`` block list when the caller
+    already has it.
+    """
     caption_rects = []
-    for block in page.get_text("dict")["blocks"]:
+    if blocks is None:
+        blocks = page.get_text("dict")["blocks"]
+    for block in blocks:
         if block.get("type") != 0:
             continue
         for line in block["lines"]:
@@ -525,7 +582,11 @@ def _find_captioned_vector_figures(
     return figure_rects
 
 
-def detect_vector_figure_rects(page: fitz.Page, tab_rects: list[fitz.Rect]) -> list[fitz.Rect]:
+def detect_vector_figure_rects(
+    page: fitz.Page,
+    tab_rects: list[fitz.Rect],
+    blocks: list[dict] | None = None,
+) -> list[fitz.Rect]:
     """Detect large vector drawing regions that should be rasterized as figures.
 
     Some academic PDFs store charts and diagrams as vector drawing commands,
@@ -534,7 +595,7 @@ def detect_vector_figure_rects(page: fitz.Page, tab_rects: list[fitz.Rect]) -> l
     """
     candidates = []
     page_rect = page.rect
-    caption_rects = find_figure_caption_rects(page)
+    caption_rects = find_figure_caption_rects(page, blocks)
     drawing_rects = []
     background_rects = []
 
@@ -651,12 +712,248 @@ def should_merge_lines(current: dict, next_line: dict) -> bool:
     return True
 
 
+def _scan_page(
+    page: fitz.Page,
+    page_num: int,
+    images: str,
+    render_vector_figures: bool,
+    vector_figure_dpi: int,
+    stage_dir: str | None,
+    edge_pages: frozenset[int],
+) -> dict[str, object]:
+    """Extract everything one page contributes, reading ``get_text("dict")`` once.
+
+    The result only holds plain data so it can come back from a worker
+    process: the page's font-size histogram, its header/footer candidates
+    (sampled pages only), log messages, and raw elements in extraction order.
+    Images and rendered figures are written to ``stage_dir`` under temporary
+    names; deduplication and final naming need document order and happen in
+    the caller.
+    """
+    blocks = page.get_text("dict")["blocks"]
+    result = {
+        "sizes": _font_size_counter(blocks),
+        "edges": _page_edge_texts(page) if page_num - 1 in edge_pages else None,
+        "messages": [],
+        "elements": [],
+    }
+    messages = result["messages"]
+    elements = result["elements"]
+
+    try:
+        tabs = page.find_tables()
+    except Exception:
+        tabs = []
+
+    tab_rects = [fitz.Rect(t.bbox) for t in tabs]
+
+    for tab in tabs:
+        elements.append({
+            "y0": tab.bbox[1],
+            "type": 2,
+            "content": tab.to_markdown()
+        })
+        messages.append(f"  [OK] Found table: P{page_num}")
+
+    if render_vector_figures:
+        for index, figure_rect in enumerate(detect_vector_figure_rects(page, tab_rects, blocks)):
+            figure = {"y0": figure_rect.y0, "type": 3, "path": None, "error": None}
+            if stage_dir:
+                staged = os.path.join(stage_dir, f"p{page_num}_figure_{index}.png")
+                try:
+                    scale = vector_figure_dpi / 72
+                    pix = page.get_pixmap(
+                        matrix=fitz.Matrix(scale, scale),
+                        clip=figure_rect,
+                        alpha=False,
+                    )
+                    pix.save(staged)
+                    figure["path"] = staged
+                except Exception as e:
+                    figure["error"] = str(e)
+            elements.append(figure)
+            messages.append(
+                f"  [OK] Found vector figure region: P{page_num} {tuple(round(v, 1) for v in figure_rect)}"
+            )
+
+    for index, block in enumerate(blocks):
+        block_rect = fitz.Rect(block["bbox"])
+
+        # Check if this is table content
+        is_in_table = False
+        for tab_rect in tab_rects:
+            intersect = block_rect & tab_rect
+            if intersect.get_area() > 0.6 * block_rect.get_area():
+                is_in_table = True
+                break
+
+        if is_in_table:
+            continue
+
+        if block["type"] == 0:
+            elements.append({
+                "type": 0,
+                "full_text": "".join([span["text"] for line in block["lines"] for span in line["spans"]]).strip(),
+                "lines": [
+                    (
+                        line["bbox"][1],
+                        [(span["text"], span["size"], span["flags"], span.get("font", ""))
+                         for span in line["spans"]],
+                    )
+                    for line in block["lines"]
+                ],
+            })
+
+        elif block["type"] == 1 and images != "none":
+            image_data = block.get("image", b"")
+            image = {
+                "y0": block["bbox"][1],
+                "type": 1,
+                "width": block.get("width", 0),
+                "height": block.get("height", 0),
+                "nbytes": len(image_data),
+                "ext": block["ext"],
+                "hash": None,
+                "path": None,
+            }
+            if images == "all":
+                keep = True
+            else:
+                image["size_ok"] = _image_passes_size_filters(block)
+                if image["size_ok"]:
+                    image["hash"] = hashlib.md5(image_data).hexdigest()
+                    image["shape_ok"] = _image_passes_shape_filters(block, page.rect)
+                keep = image["size_ok"] and image["shape_ok"]
+            if keep and stage_dir:
+                staged = os.path.join(stage_dir, f"p{page_num}_{index}.{block['ext']}")
+                with open(staged, "wb") as f:
+                    f.write(image_data)
+                image["path"] = staged
+            elements.append(image)
+
+    return result
+
+
+def _scan_pages(pdf_path: str, start: int, stop: int, options: dict[str, object]) -> list[dict[str, object]]:
+    """Worker: scan pages ``start``..``stop - 1`` of one PDF."""
+    with fitz.open(pdf_path) as doc:
+        return [
+            _scan_page(doc[i], i + 1, **options)
+            for i in range(start, stop)
+        ]
+
+
+def _scan_document(
+    doc: fitz.Document,
+    pdf_path: str,
+    options: dict[str, object],
+    workers: int | None,
+) -> list[dict[str, object]]:
+    """Scan every page, in page order, optionally across a process pool."""
+    page_count = len(doc)
+    if workers is None:
+        workers = min(os.cpu_count() or 2, page_count, 8)
+    if workers <= 1 or page_count <= 2:
+        return [_scan_page(page, page_num, **options) for page_num, page in enumerate(doc, 1)]
+
+    # Several chunks per worker keep the pool busy when page cost is uneven.
+    chunk = max(1, -(-page_count // (workers * PAGE_CHUNKS_PER_WORKER)))
+    starts = list(range(0, page_count, chunk))
+    scanned = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for pages in pool.map(
+            _scan_pages,
+            [pdf_path] * len(starts),
+            starts,
+            [min(start + chunk, page_count) for start in starts],
+            [options] * len(starts),
+        ):
+            scanned.extend(pages)
+    return scanned
+
+
+def _text_line_elements(
+    block: dict[str, object],
+    size_map: dict[str, float],
+    noise_texts: set[str],
+) -> list[dict[str, object]]:
+    """Turn a scanned text block into line elements."""
+    # Check if this is noise text to be filtered (whole block match)
+    if block["full_text"] in noise_texts:
+        return []
+
+    elements = []
+    for line_y0, spans in block["lines"]:
+        line_text = ""
+        line_size = 0
+        line_flags = 0
+        span_count = 0
+        is_code_line = False
+
+        formatted_spans = []
+        for span_text, span_size, span_flags, font_name in spans:
+            span_text = CONTROL_CHARS_RE.sub('', span_text)
+            if not span_text.strip():
+                if span_text:
+                    formatted_spans.append(span_text)
+                continue
+
+            line_size = max(line_size, span_size)
+            line_flags |= span_flags
+            span_count += 1
+
+            heading_level = get_heading_level(span_size, size_map, span_text, span_flags)
+
+            # Detect code font
+            if is_monospace_font(font_name):
+                is_code_line = True
+                formatted_spans.append(span_text)  # No formatting for code
+            elif heading_level > 0:
+                formatted_spans.append(span_text.strip())
+            else:
+                formatted_spans.append(format_span_text(span_text, span_flags))
+
+        line_text = ''.join(formatted_spans).strip()
+        if not line_text:
+            continue
+
+        # Secondary check: line-level noise match (sometimes blocks are split)
+        if line_text in noise_texts:
+            continue
+
+        line_text = merge_adjacent_formatting(line_text)
+
+        heading_level = get_heading_level(line_size, size_map, line_text, line_flags)
+
+        is_list, list_type, list_content = detect_list_item(line_text)
+
+        if heading_level > 0:
+            prefix = '#' * heading_level + ' '
+            clean_line = re.sub(r'\*+([^*]+)\*+', r'\1', line_text)
+            final_text = prefix + clean_line
+        elif is_list:
+            final_text = list_content
+        else:
+            final_text = line_text
+
+        elements.append({
+            "y0": line_y0,
+            "type": 0,
+            "content": final_text,
+            "is_heading": heading_level > 0,
+            "is_list": is_list,
+            "is_code": is_code_line
+        })
+    return elements
+
+
 def extract_pdf_to_markdown(
     pdf_path: str,
     output_path: str = None,
     images: str = "filtered",
     render_vector_figures: bool = False,
     vector_figure_dpi: int = VECTOR_FIGURE_DPI,
+    workers: int | None = None,
 ) -> str:
     """Extract text, images, and tables from a PDF and convert to Markdown.
 
@@ -669,6 +966,8 @@ def extract_pdf_to_markdown(
             "none"     = skip all images.
         render_vector_figures: Rasterize large vector drawing regions as PNGs.
         vector_figure_dpi: DPI used for rendered vector figure PNGs.
+        workers: Processes used to scan pages (default: CPU count, max 8;
+            1 scans in-process).
     """
     try:
         doc = fitz.open(pdf_path)
@@ -676,169 +975,117 @@ def extract_pdf_to_markdown(
         print(f"[ERROR] Failed to open PDF file: {e}")
         return ""
 
-    if len(doc) >= 200:
-        print(f"[HINT] {len(doc)} pages — for very large PDFs, consider splitting "
-              f"the source by chapter beforehand (e.g. with pdftk / qpdf / PyPDF2) "
-              f"and converting each part individually.")
-
     filename = Path(pdf_path).stem
     title = re.sub(r'^\d+-', '', filename).strip()
 
+    img_dir = None
+    rel_img_dir = None
+    stage = None
+    if output_path:
+        output_path = Path(output_path)
+        rel_img_dir = f"{output_path.stem}_files"
+        img_dir = output_path.parent / rel_img_dir
+        if images != "none" or render_vector_figures:
+            # Stage next to the output so final names are a same-volume rename.
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            stage = tempfile.TemporaryDirectory(prefix=".pdf_to_md_", dir=output_path.parent)
+
+    try:
+        return _extract_document(
+            doc, pdf_path, filename, title, output_path, img_dir, rel_img_dir,
+            stage.name if stage else None,
+            images, render_vector_figures, vector_figure_dpi, workers,
+        )
+    finally:
+        doc.close()
+        if stage:
+            stage.cleanup()
+
+
+def _extract_document(
+    doc: fitz.Document,
+    pdf_path: str,
+    filename: str,
+    title: str,
+    output_path: Path | None,
+    img_dir: Path | None,
+    rel_img_dir: str | None,
+    stage_dir: str | None,
+    images: str,
+    render_vector_figures: bool,
+    vector_figure_dpi: int,
+    workers: int | None,
+) -> str:
     print(f"[INFO] Analyzing document structure...")
-    size_map = analyze_font_sizes(doc)
+    edge_pages = frozenset(header_footer_sample_pages(len(doc))) if len(doc) >= 3 else frozenset()
+    scanned = _scan_document(doc, pdf_path, {
+        "images": images,
+        "render_vector_figures": render_vector_figures,
+        "vector_figure_dpi": vector_figure_dpi,
+        "stage_dir": stage_dir,
+        "edge_pages": edge_pages,
+    }, workers)
+
+    size_counter = Counter()
+    for page_scan in scanned:
+        size_counter.update(page_scan["sizes"])
+    size_map = _size_map_from_counter(size_counter)
     print(f"   Font size mapping: body={size_map.get('body', 'N/A')}, " +
           f"H1={size_map.get('h1', 'N/A')}, H2={size_map.get('h2', 'N/A')}, H3={size_map.get('h3', 'N/A')}")
 
     print(f"[INFO] Detecting repeated headers/footers...")
-    noise_texts = detect_headers_footers(doc)
+    noise_texts = set()
+    if edge_pages:
+        headers = []
+        footers = []
+        for page_scan in scanned:
+            if page_scan["edges"] is not None:
+                headers.extend(page_scan["edges"][0])
+                footers.extend(page_scan["edges"][1])
+        noise_texts = _noise_texts_from_edges(headers, footers, len(edge_pages), 0.6)
     if noise_texts:
         print(f"   Found {len(noise_texts)} repeated noise texts (will be removed):")
         for t in list(noise_texts)[:3]:
             print(f"     - {t[:30]}...")
 
-    markdown_content = f"# {title}\n\n"
+    parts = [f"# {title}\n\n"]
     seen_image_hashes = set()  # Track seen image hashes for deduplication
-
-    img_dir = None
-    rel_img_dir = None
-    if output_path:
-        output_path = Path(output_path)
-        rel_img_dir = f"{output_path.stem}_files"
-        img_dir = output_path.parent / rel_img_dir
+    safe_filename = filename.replace(" ", "_")
 
     img_count = 0
 
-    for page_num, page in enumerate(doc, 1):
+    for page_num, page_scan in enumerate(scanned, 1):
         if page_num > 1:
             # Add page break marker to help LLM understand context segmentation
-            markdown_content += f"\n\n<!-- Page {page_num} -->\n\n"
+            parts.append(f"\n\n<!-- Page {page_num} -->\n\n")
 
-        try:
-            tabs = page.find_tables()
-        except Exception:
-            tabs = []
-
-        tab_rects = [fitz.Rect(t.bbox) for t in tabs]
+        for message in page_scan["messages"]:
+            print(message)
 
         page_elements = []
 
-        for tab in tabs:
-            page_elements.append({
-                "y0": tab.bbox[1],
-                "type": 2,
-                "content": tab.to_markdown()
-            })
-            print(f"  [OK] Found table: P{page_num}")
-
-        if render_vector_figures:
-            for figure_rect in detect_vector_figure_rects(page, tab_rects):
-                page_elements.append({
-                    "y0": figure_rect.y0,
-                    "type": 3,
-                    "content": figure_rect,
-                })
-                print(f"  [OK] Found vector figure region: P{page_num} {tuple(round(v, 1) for v in figure_rect)}")
-
-        blocks = page.get_text("dict")["blocks"]
-
-        for block in blocks:
-            block_rect = fitz.Rect(block["bbox"])
-
-            # Check if this is table content
-            is_in_table = False
-            for tab_rect in tab_rects:
-                intersect = block_rect & tab_rect
-                if intersect.get_area() > 0.6 * block_rect.get_area():
-                    is_in_table = True
-                    break
-
-            if is_in_table:
-                continue
-
-            if block["type"] == 0:
-                # Check if this is noise text to be filtered (whole block match)
-                block_text_full = "".join([span["text"] for line in block["lines"] for span in line["spans"]]).strip()
-                if block_text_full in noise_texts:
-                    continue
-
-                for line in block["lines"]:
-                    line_text = ""
-                    line_size = 0
-                    line_flags = 0
-                    span_count = 0
-                    is_code_line = False
-
-                    formatted_spans = []
-                    for span in line["spans"]:
-                        span_text = CONTROL_CHARS_RE.sub('', span["text"])
-                        if not span_text.strip():
-                            if span_text:
-                                formatted_spans.append(span_text)
-                            continue
-
-                        span_size = span["size"]
-                        span_flags = span["flags"]
-
-                        line_size = max(line_size, span_size)
-                        line_flags |= span_flags
-                        span_count += 1
-
-                        heading_level = get_heading_level(span_size, size_map, span_text, span_flags)
-
-                        # Detect code font
-                        font_name = span.get("font", "")
-                        if is_monospace_font(font_name):
-                            is_code_line = True
-                            formatted_spans.append(span_text)  # No formatting for code
-                        elif heading_level > 0:
-                            formatted_spans.append(span_text.strip())
+        for el in page_scan["elements"]:
+            if el["type"] == 0:
+                page_elements.extend(_text_line_elements(el, size_map, noise_texts))
+            elif el["type"] == 1:
+                if images == "all":
+                    keep = True
+                else:
+                    # Same order as should_keep_image: only images that pass
+                    # the size filters enter the dedup set.
+                    keep = el["size_ok"]
+                    if keep:
+                        if el["hash"] in seen_image_hashes:
+                            keep = False
                         else:
-                            formatted_spans.append(format_span_text(span_text, span_flags))
-
-                    line_text = ''.join(formatted_spans).strip()
-                    if not line_text:
-                        continue
-
-                    # Secondary check: line-level noise match (sometimes blocks are split)
-                    if line_text in noise_texts:
-                        continue
-
-                    line_text = merge_adjacent_formatting(line_text)
-
-                    heading_level = get_heading_level(line_size, size_map, line_text, line_flags)
-
-                    is_list, list_type, list_content = detect_list_item(line_text)
-
-                    if heading_level > 0:
-                        prefix = '#' * heading_level + ' '
-                        clean_line = re.sub(r'\*+([^*]+)\*+', r'\1', line_text)
-                        final_text = prefix + clean_line
-                    elif is_list:
-                        final_text = list_content
-                    else:
-                        final_text = line_text
-
-                    page_elements.append({
-                        "y0": line["bbox"][1],
-                        "type": 0,
-                        "content": final_text,
-                        "is_heading": heading_level > 0,
-                        "is_list": is_list,
-                        "is_code": is_code_line
-                    })
-
-            elif block["type"] == 1:
-                if images == "none":
-                    pass
-                elif images == "all" or should_keep_image(block, page.rect, seen_image_hashes):
-                    page_elements.append({
-                        "y0": block["bbox"][1],
-                        "type": 1,
-                        "content": block
-                    })
+                            seen_image_hashes.add(el["hash"])
+                            keep = el["shape_ok"]
+                if keep:
+                    page_elements.append(el)
                 else:
-                    w, h = block.get("width", 0), block.get("height", 0)
-                    print(f"  [SKIP] Filtered small/decorative image: {w}x{h}px, {len(block.get('image', b''))} bytes")
+                    print(f"  [SKIP] Filtered small/decorative image: {el['width']}x{el['height']}px, {el['nbytes']} bytes")
+            else:
+                page_elements.append(el)
 
         page_elements.sort(key=lambda x: x["y0"])
 
@@ -877,11 +1124,11 @@ def extract_pdf_to_markdown(
 
         def flush_code_block():
             """Flush accumulated code block."""
-            nonlocal code_block_lines, markdown_content
+            nonlocal code_block_lines
             if code_block_lines:
-                markdown_content += "```\n"
-                markdown_content += "\n".join(code_block_lines) + "\n"
-                markdown_content += "```\n\n"
+                parts.append("```\n")
+                parts.append("\n".join(code_block_lines) + "\n")
+                parts.append("```\n\n")
                 code_block_lines = []
 
         for el in merged_elements:
@@ -893,7 +1140,7 @@ def extract_pdf_to_markdown(
                 if is_code:
                     # Accumulate code lines
                     if prev_was_list:
-                        markdown_content += "\n"
+                        parts.append("\n")
                         prev_was_list = False
                     code_block_lines.append(el["content"])
                     prev_was_code = True
@@ -905,16 +1152,16 @@ def extract_pdf_to_markdown(
 
                     if is_heading:
                         if prev_was_list:
-                            markdown_content += "\n"
-                        markdown_content += el["content"] + "\n\n"
+                            parts.append("\n")
+                        parts.append(el["content"] + "\n\n")
                         prev_was_list = False
                     elif is_list:
-                        markdown_content += el["content"] + "\n"
+                        parts.append(el["content"] + "\n")
                         prev_was_list = True
                     else:
                         if prev_was_list:
-                            markdown_content += "\n"
-                        markdown_content += el["content"] + "\n\n"
+                            parts.append("\n")
+                        parts.append(el["content"] + "\n\n")
                         prev_was_list = False
 
             elif el["type"] == 2:
@@ -922,8 +1169,8 @@ def extract_pdf_to_markdown(
                     flush_code_block()
                     prev_was_code = False
                 if prev_was_list:
-                    markdown_content += "\n"
-                markdown_content += el["content"] + "\n\n"
+                    parts.append("\n")
+                parts.append(el["content"] + "\n\n")
                 prev_was_list = False
 
             elif el["type"] == 1:
@@ -931,21 +1178,16 @@ def extract_pdf_to_markdown(
                     flush_code_block()
                     prev_was_code = False
                 if img_dir:
-                    block = el["content"]
-                    ext = block["ext"]
-                    image_data = block["image"]
-                    safe_filename = filename.replace(" ", "_")
-                    image_name = f"{safe_filename}_p{page_num}_{img_count}.{ext}"
+                    image_name = f"{safe_filename}_p{page_num}_{img_count}.{el['ext']}"
                     image_path = img_dir / image_name
 
                     try:
                         img_dir.mkdir(parents=True, exist_ok=True)
-                        with open(image_path, "wb") as f:
-                            f.write(image_data)
+                        shutil.move(el["path"], image_path)
 
                         if prev_was_list:
-                            markdown_content += "\n"
-                        markdown_content += f"![{image_name}]({rel_img_dir}/{image_name})\n\n"
+                            parts.append("\n")
+                        parts.append(f"![{image_name}]({rel_img_dir}/{image_name})\n\n")
                         img_count += 1
                         prev_was_list = False
                         print(f"  [OK] Extracted image: {image_name}")
@@ -957,24 +1199,18 @@ def extract_pdf_to_markdown(
                     flush_code_block()
                     prev_was_code = False
                 if img_dir:
-                    figure_rect = el["content"]
-                    safe_filename = filename.replace(" ", "_")
                     image_name = f"{safe_filename}_p{page_num}_figure_{img_count}.png"
                     image_path = img_dir / image_name
 
                     try:
+                        if el["error"]:
+                            raise RuntimeError(el["error"])
                         img_dir.mkdir(parents=True, exist_ok=True)
-                        scale = vector_figure_dpi / 72
-                        pix = page.get_pixmap(
-                            matrix=fitz.Matrix(scale, scale),
-                            clip=figure_rect,
-                            alpha=False,
-                        )
-                        pix.save(str(image_path))
+                        shutil.move(el["path"], image_path)
 
                         if prev_was_list:
-                            markdown_content += "\n"
-                        markdown_content += f"![{image_name}]({rel_img_dir}/{image_name})\n\n"
+                            parts.append("\n")
+                        parts.append(f"![{image_name}]({rel_img_dir}/{image_name})\n\n")
                         img_count += 1
                         prev_was_list = False
                         print(f"  [OK] Rendered vector figure: {image_name}")
@@ -985,9 +1221,7 @@ def extract_pdf_to_markdown(
         if prev_was_code:
             flush_code_block()
 
-    doc.close()
-
-    markdown_content = CONTROL_CHARS_RE.sub('', markdown_content)
+    markdown_content = CONTROL_CHARS_RE.sub('', "".join(parts))
     markdown_content = re.sub(r'\n{3,}', '\n\n', markdown_content)
     markdown_content = markdown_content.strip() + "\n"
 
@@ -1006,6 +1240,7 @@ def process_directory(
     images: str = "filtered",
     render_vector_figures: bool = False,
     vector_figure_dpi: int = VECTOR_FIGURE_DPI,
+    workers: int | None = None,
 ) -> None:
     """Convert all PDFs in a directory to Markdown.
 
@@ -1015,6 +1250,7 @@ def process_directory(
         images: Image extraction mode passed through to each file conversion.
         render_vector_figures: Rasterize large vector drawing regions as PNGs.
         vector_figure_dpi: DPI used for rendered vector figure PNGs.
+        workers: Page-scan processes used for each file.
     """
     input_path = Path(input_dir)
 
@@ -1036,6 +1272,7 @@ def process_directory(
             images=images,
             render_vector_figures=render_vector_figures,
             vector_figure_dpi=vector_figure_dpi,
+            workers=workers,
         )
 
 
@@ -1049,6 +1286,7 @@ Examples:
   python pdf_to_md.py book.pdf                    # Convert a single file
   python pdf_to_md.py book.pdf -o output.md      # Specify output file
   python pdf_to_md.py book.pdf --render-vector-figures
+  python pdf_to_md.py book.pdf --workers 4       # Scan pages in 4 processes
   python pdf_to_md.py ./pdfs                      # Convert all PDFs in directory
   python pdf_to_md.py ./pdfs -o ./markdown       # Specify output directory
 
@@ -1081,6 +1319,12 @@ Structure detection features:
         default=VECTOR_FIGURE_DPI,
         help=f'DPI for --render-vector-figures output (default: {VECTOR_FIGURE_DPI})',
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Processes used to scan pages (default: CPU count, max 8; 1 = in-process)',
+    )
 
     args = parser.parse_args()
 
@@ -1094,6 +1338,7 @@ Structure detection features:
             images=args.images,
             render_vector_figures=args.render_vector_figures,
             vector_figure_dpi=args.vector_figure_dpi,
+            workers=args.workers,
         )
     elif input_path.is_dir():
         process_directory(
@@ -1102,6 +1347,7 @@ Structure detection features:
             images=args.images,
             render_vector_figures=args.render_vector_figures,
             vector_figure_dpi=args.vector_figure_dpi,
+            workers=args.workers,
         )
     else:
         print(f"Error: File or directory not found: {args.input}")
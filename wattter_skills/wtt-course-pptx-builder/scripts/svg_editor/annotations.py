@@ -271,6 +271,11 @@ def set_text(root: ET.Element, element_id: str, text: str) -> tuple[bool, Option
     elem = _find_by_id(root, element_id)
     if elem is None:
         return False, 'not-found'
+    return set_element_text(elem, text)
+
+
+def set_element_text(elem: ET.Element, text: str) -> tuple[bool, Optional[str]]:
+    """``set_text`` for an element the caller already holds."""
     for child in elem:
         ctag = child.tag.split('}', 1)[1] if '}' in child.tag else child.tag
         if ctag == 'tspan':
@@ -291,6 +296,11 @@ def set_attributes(
     elem = _find_by_id(root, element_id)
     if elem is None:
         return False, 'not-found'
+    return set_element_attributes(elem, attrs)
+
+
+def set_element_attributes(elem: ET.Element, attrs: dict) -> tuple[bool, Optional[str]]:
+    """``set_attributes`` for an element the caller already holds."""
     for key in attrs:
         if not is_editable_attr(key):
             return False, f'attr-not-allowed:{key}'
@@ -33,7 +33,7 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 
 logger = logging.getLogger('svg_editor')
 
@@ -56,10 +56,11 @@ from annotations import (  # noqa: E402
     parse_annotations,
     promote_tspan_to_text,
     set_annotation,
-    set_attributes,
-    set_text,
+    set_element_attributes,
+    set_element_text,
     strip_unused_temp_ids,
 )
+from slide_watcher import SlideWatcher  # noqa: E402
 from embed_icons import (  # noqa: E402
     parse_use_element,
     resolve_icon_path,
@@ -79,6 +80,10 @@ _SLIDE_CACHE: dict = {}  # path -> (mtime, (content, warnings))
 _LIST_CACHE_LOCK = threading.Lock()
 _LIST_CACHE: dict = {}  # path -> (mtime, annotation_count_on_disk)
 
+# Seconds between keepalive comments on an idle /api/events stream. Each one
+# also counts as activity for the idle-timeout watchdog.
+_EVENT_HEARTBEAT = 15.0
+
 
 def _xml_attr(value: object) -> str:
     """Escape a value for safe insertion into generated preview SVG markup."""
@@ -258,6 +263,12 @@ def _validate_edit_attrs(attrs: dict, existing_attrs: set[str]) -> Optional[str]
 
 _EDIT_LOG_NAME = '.live_edits.jsonl'
 
+_EDIT_FAILURE_LABELS = {
+    'promote': 'Tspan promotion failed',
+    'text': 'Text edit failed',
+    'attrs': 'Attribute edit failed',
+}
+
 
 def _append_edit_log(project_path: Path, record: dict) -> None:
     """Append one applied edit record (old→new) to the project's history.
@@ -272,49 +283,6 @@ def _append_edit_log(project_path: Path, record: dict) -> None:
         logger.warning('edit log append failed: %s', exc)
 
 
-def _find_by_id(root: ET.Element, element_id: str) -> Optional[ET.Element]:
-    for elem in root.iter():
-        if elem.get('id') == element_id:
-            return elem
-    return None
-
-
-def _apply_edit_record(root: ET.Element, record: dict) -> tuple[bool, Optional[str]]:
-    element_id = record.get('element_id')
-    if not isinstance(element_id, str):
-        return False, 'invalid-record'
-    promote = record.get('promote_tspan')
-    if promote:
-        if not isinstance(promote, dict):
-            return False, 'invalid-promote'
-        ok, reason = promote_tspan_to_text(
-            root,
-            element_id,
-            str(promote.get('x') or ''),
-            str(promote.get('y') or ''),
-        )
-        if not ok:
-            return ok, reason
-    if 'text' in record:
-        ok, reason = set_text(root, element_id, str(record.get('text') or ''))
-        if not ok:
-            return ok, reason
-    attrs = record.get('attrs')
-    if attrs:
-        ok, reason = set_attributes(root, element_id, attrs)
-        if not ok:
-            return ok, reason
-    return True, None
-
-
-def _apply_edit_records(root: ET.Element, records: list[dict]) -> tuple[bool, Optional[str]]:
-    for record in records:
-        ok, reason = _apply_edit_record(root, record)
-        if not ok:
-            return ok, reason
-    return True, None
-
-
 def _edit_signature(record: dict) -> tuple:
     """Identity used to coalesce consecutive staged edits.
 
@@ -354,6 +322,182 @@ def _coalesce_into(prev: dict, cur: dict) -> None:
     ]
 
 
+def _render_slide(root: ET.Element) -> tuple[str, list[dict], list[dict], dict[str, str]]:
+    """Serialize a slide tree into the payload parts served by GET /api/slide."""
+    disk_annotations = parse_annotations(root)
+    id_to_tag: dict[str, str] = {}
+    for elem in root.iter():
+        eid = elem.get('id')
+        if eid:
+            tag = elem.tag
+            if '}' in tag:
+                tag = tag.split('}', 1)[1]
+            id_to_tag[eid] = tag
+    content = ET.tostring(root, encoding='unicode', xml_declaration=False)
+    content, warnings = _inline_icons(content)
+    return content, warnings, disk_annotations, id_to_tag
+
+
+def _find_with_grandparent(
+    root: ET.Element, element_id: str,
+) -> tuple[Optional[ET.Element], Optional[ET.Element], Optional[ET.Element]]:
+    """Return (element, parent, grandparent) for the first element with this id."""
+    for grandparent in root.iter():
+        for parent in grandparent:
+            for child in parent:
+                if child.get('id') == element_id:
+                    return child, parent, grandparent
+    return None, None, None
+
+
+class _LiveSlide:
+    """A slide's parsed tree with its staged edits applied in place.
+
+    Built once per slide (temp ids assigned, id index built) and then
+    mutated directly by each staged edit. Every edit pushes the inverse
+    operations that restore the touched elements, so staging and undo cost
+    O(touched elements) instead of a reparse plus a replay of every pending
+    edit. ``mtime`` is the disk state the tree was built from; when the file
+    changes underneath, the caller rebuilds via ``load``.
+    """
+
+    def __init__(self, tree: ET.ElementTree, mtime: float) -> None:
+        self.tree = tree
+        self.root = tree.getroot()
+        self.mtime = mtime
+        # One entry per staged record: inverse ops in application order.
+        self.undo_stack: list[list[tuple]] = []
+        # Cached GET payload for the current state; dropped on every change.
+        self.rendered: Optional[tuple] = None
+        assign_temp_ids(self.root)
+        self._reindex()
+
+    @classmethod
+    def load(
+        cls, svg_file: Path, mtime: float, records: list[dict],
+    ) -> tuple[Optional['_LiveSlide'], Optional[str]]:
+        """Parse *svg_file* and re-apply *records*; returns (slide, error)."""
+        try:
+            tree = ET.parse(str(svg_file))
+        except ET.ParseError as exc:
+            return None, f'Failed to parse SVG: {exc}'
+        slide = cls(tree, mtime)
+        for record in records:
+            ok, reason, _step = slide.apply(record)
+            if not ok:
+                return None, f'Failed to replay pending edits: {reason}'
+        return slide, None
+
+    def _reindex(self) -> None:
+        # First match wins, like a document-order scan for the id.
+        self.index: dict[str, ET.Element] = {}
+        for elem in self.root.iter():
+            eid = elem.get('id')
+            if eid and eid not in self.index:
+                self.index[eid] = elem
+
+    def find(self, element_id: str) -> Optional[ET.Element]:
+        return self.index.get(element_id)
+
+    @staticmethod
+    def _snapshot_children(elem: ET.Element) -> tuple:
+        return (
+            'children', elem, elem.text, list(elem),
+            [(child, child.tail, dict(child.attrib)) for child in elem],
+        )
+
+    def _revert(self, ops: list[tuple]) -> None:
+        reindex = False
+        for op in reversed(ops):
+            kind, elem = op[0], op[1]
+            if kind == 'text':
+                elem.text = op[2]
+            elif kind == 'attrib':
+                elem.attrib.clear()
+                elem.attrib.update(op[2])
+            elif kind == 'children':
+                elem.text = op[2]
+                elem[:] = op[3]
+                for child, tail, attrib in op[4]:
+                    child.tail = tail
+                    child.attrib.clear()
+                    child.attrib.update(attrib)
+                reindex = True
+        if reindex:
+            self._reindex()
+        self.rendered = None
+
+    def apply(
+        self, record: dict, merge: bool = False,
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """Apply one staged record: promotion, then text, then attrs.
+
+        Returns (ok, reason, failed_step) where the step is 'promote',
+        'text' or 'attrs'. On failure every mutation made for this record is
+        rolled back. With ``merge`` the inverse ops join the newest undo
+        entry, matching a record coalesced into its predecessor.
+        """
+        element_id = record.get('element_id')
+        if not isinstance(element_id, str):
+            return False, 'invalid-record', None
+        ops: list[tuple] = []
+
+        def fail(reason: Optional[str], step: str) -> tuple[bool, Optional[str], Optional[str]]:
+            self._revert(ops)
+            return False, reason, step
+
+        promote = record.get('promote_tspan')
+        if promote:
+            if not isinstance(promote, dict):
+                return False, 'invalid-promote', 'promote'
+            _target, text_el, grandparent = _find_with_grandparent(self.root, element_id)
+            if text_el is not None:
+                ops.append(self._snapshot_children(text_el))
+                ops.append(self._snapshot_children(grandparent))
+            ok, reason = promote_tspan_to_text(
+                self.root,
+                element_id,
+                str(promote.get('x') or ''),
+                str(promote.get('y') or ''),
+            )
+            if not ok:
+                return fail(reason, 'promote')
+            self._reindex()
+        target = self.find(element_id)
+        if 'text' in record:
+            if target is None:
+                return fail('not-found', 'text')
+            ops.append(('text', target, target.text))
+            ok, reason = set_element_text(target, str(record.get('text') or ''))
+            if not ok:
+                return fail(reason, 'text')
+        attrs = record.get('attrs')
+        if attrs:
+            if target is None:
+                return fail('not-found', 'attrs')
+            ops.append(('attrib', target, dict(target.attrib)))
+            ok, reason = set_element_attributes(target, attrs)
+            if not ok:
+                return fail(reason, 'attrs')
+
+        if merge and self.undo_stack:
+            self.undo_stack[-1].extend(ops)
+        else:
+            self.undo_stack.append(ops)
+        self.rendered = None
+        return True, None, None
+
+    def undo(self) -> None:
+        """Revert the newest staged record."""
+        if self.undo_stack:
+            self._revert(self.undo_stack.pop())
+
+    def render(self) -> tuple[str, list[dict], list[dict], dict[str, str]]:
+        if self.rendered is None:
+            self.rendered = _render_slide(self.root)
+        return self.rendered
+
+
 def create_app(
     project_dir: str,
     idle_timeout: int = 900,
@@ -379,6 +523,11 @@ def create_app(
     # but are written to svg_output/ only by /api/save-all.
     app.config['PENDING_EDITS'] = {}
 
+    # Per-file _LiveSlide holding the staged edits applied in memory. Guarded
+    # by live_lock together with PENDING_EDITS under Flask's threaded server.
+    app.config['LIVE_SLIDES'] = {}
+    live_lock = threading.RLock()
+
     # Idle timeout: auto-shutdown if no one connects within idle_timeout seconds
     app.config['LAST_REQUEST_TIME'] = time.time()
 
@@ -409,6 +558,9 @@ def create_app(
     watchdog = threading.Thread(target=_idle_watchdog, daemon=True)
     watchdog.start()
 
+    # Started on the first /api/events connection and shared by all of them.
+    slide_watcher = SlideWatcher(svg_dir)
+
     @app.route('/api/shutdown', methods=['POST'])
     def shutdown():
         data = request.get_json(silent=True) or {}
@@ -464,50 +616,95 @@ def create_app(
             return jsonify({'error': 'not found'}), 404
         return send_from_directory(str(assets_dir), filename)
 
+    def _slide_entry(svg_file: Path) -> Optional[dict]:
+        """Slide-list entry for one SVG, or None if it cannot be stat'ed."""
+        path_str = str(svg_file)
+        try:
+            mtime = svg_file.stat().st_mtime
+        except OSError as exc:
+            logger.warning('stat failed: %s: %s', path_str, exc)
+            return None
+
+        ok = True
+        error_msg: Optional[str] = None
+        disk_count = _cache_get(_LIST_CACHE, _LIST_CACHE_LOCK, path_str, mtime)
+        if disk_count is None:
+            try:
+                tree = ET.parse(path_str)
+                disk_count = len(parse_annotations(tree.getroot()))
+            except ET.ParseError as exc:
+                ok = False
+                error_msg = f'XML parse error: {exc}'
+                disk_count = 0
+                logger.warning('slide parse failed: %s: %s', svg_file.name, exc)
+            _cache_put(_LIST_CACHE, _LIST_CACHE_LOCK, path_str, mtime, disk_count)
+
+        mem_count = len(app.config['ANNOTATIONS'].get(svg_file.name, {}))
+        annotation_count = max(disk_count, mem_count)
+
+        return {
+            'name': svg_file.name,
+            'annotated': annotation_count > 0,
+            'annotation_count': annotation_count,
+            'ok': ok,
+            'error': error_msg,
+            'mtime': mtime,
+        }
+
     @app.route('/api/slides')
     def get_slides():
         svg_dir = app.config['SVG_DIR']
         if not svg_dir.exists():
             return jsonify({'slides': []})
 
-        annotations = app.config['ANNOTATIONS']
         slides = []
         for svg_file in sorted(svg_dir.glob('*.svg')):
-            path_str = str(svg_file)
-            try:
-                mtime = svg_file.stat().st_mtime
-            except OSError as exc:
-                logger.warning('stat failed: %s: %s', path_str, exc)
-                continue
-
-            ok = True
-            error_msg: Optional[str] = None
-            disk_count = _cache_get(_LIST_CACHE, _LIST_CACHE_LOCK, path_str, mtime)
-            if disk_count is None:
-                try:
-                    tree = ET.parse(path_str)
-                    disk_count = len(parse_annotations(tree.getroot()))
-                except ET.ParseError as exc:
-                    ok = False
-                    error_msg = f'XML parse error: {exc}'
-                    disk_count = 0
-                    logger.warning('slide parse failed: %s: %s', svg_file.name, exc)
-                _cache_put(_LIST_CACHE, _LIST_CACHE_LOCK, path_str, mtime, disk_count)
-
-            mem_count = len(annotations.get(svg_file.name, {}))
-            annotation_count = max(disk_count, mem_count)
-
-            slides.append({
-                'name': svg_file.name,
-                'annotated': annotation_count > 0,
-                'annotation_count': annotation_count,
-                'ok': ok,
-                'error': error_msg,
-                'mtime': mtime,
-            })
+            entry = _slide_entry(svg_file)
+            if entry is not None:
+                slides.append(entry)
 
         return jsonify({'slides': slides})
 
+    @app.route('/api/events')
+    def slide_events():
+        """Server-sent events replacing the browser's /api/slides polling.
+
+        Each batch of file changes in svg_output/ becomes one ``slides``
+        event carrying the ordered slide names plus list entries for just
+        the changed slides (``removed: true`` for deleted ones). A client
+        that falls too far behind gets ``resync: true`` and reloads the full
+        list. Clients load /api/slides once when the stream opens, so no
+        replay of older changes is needed on reconnect.
+        """
+        slide_watcher.start()
+
+        def stream():
+            version = slide_watcher.version
+            yield 'retry: 2000\n\n'
+            while True:
+                version, names = slide_watcher.wait_for_changes(version, _EVENT_HEARTBEAT)
+                app.config['LAST_REQUEST_TIME'] = time.time()
+                if names is None:
+                    payload: dict = {'resync': True}
+                elif names:
+                    changed = []
+                    for name in sorted(names):
+                        entry = _slide_entry(svg_dir / name) if (svg_dir / name).is_file() else None
+                        changed.append(entry or {'name': name, 'removed': True})
+                    payload = {
+                        'names': [p.name for p in sorted(svg_dir.glob('*.svg'))],
+                        'slides': changed,
+                    }
+                else:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f'event: slides\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n'
+
+        return Response(stream(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        })
+
     def _safe_svg_path(name: str):
         """Validate slide name and return safe path. Returns None if invalid.
 
@@ -521,6 +718,24 @@ def create_app(
             return None
         return svg_file
 
+    def _live_slide(name: str, svg_file: Path, mtime: float):
+        """Return (slide, error) for *name*, building it on first use.
+
+        Call with ``live_lock`` held. A slide whose file changed on disk is
+        rebuilt from the new content with the pending edits re-applied once.
+        """
+        live_slides = app.config['LIVE_SLIDES']
+        slide = live_slides.get(name)
+        if slide is not None and slide.mtime == mtime:
+            return slide, None
+        pending = app.config['PENDING_EDITS'].get(name) or []
+        slide, error = _LiveSlide.load(svg_file, mtime, pending)
+        if slide is None:
+            live_slides.pop(name, None)
+            return None, error
+        live_slides[name] = slide
+        return slide, None
+
     @app.route('/api/slide/<name>')
     def get_slide(name: str):
         svg_file = _safe_svg_path(name)
@@ -536,37 +751,27 @@ def create_app(
             logger.warning('stat failed: %s: %s', path_str, exc)
             return jsonify({'error': f'Failed to stat SVG: {exc}'}), 500
 
-        pending_edits = app.config['PENDING_EDITS'].get(name) or []
-        cached = None if pending_edits else _cache_get(
-            _SLIDE_CACHE, _SLIDE_CACHE_LOCK, path_str, mtime,
-        )
-        if cached is not None:
-            content, warnings, disk_annotations, id_to_tag = cached
-        else:
-            try:
-                tree = ET.parse(path_str)
-                root = tree.getroot()
-            except ET.ParseError as exc:
-                logger.warning('slide parse failed: %s: %s', name, exc)
-                return jsonify({'error': f'Failed to parse SVG: {exc}'}), 500
-
-            assign_temp_ids(root)
-            if pending_edits:
-                ok, reason = _apply_edit_records(root, pending_edits)
-                if not ok:
-                    return jsonify({'error': f'Failed to apply pending edits: {reason}'}), 500
-            disk_annotations = parse_annotations(root)
-            id_to_tag: dict[str, str] = {}
-            for elem in root.iter():
-                eid = elem.get('id')
-                if eid:
-                    tag = elem.tag
-                    if '}' in tag:
-                        tag = tag.split('}', 1)[1]
-                    id_to_tag[eid] = tag
-            content = ET.tostring(root, encoding='unicode', xml_declaration=False)
-            content, warnings = _inline_icons(content)
-            if not pending_edits:
+        with live_lock:
+            undo_depth = len(app.config['PENDING_EDITS'].get(name) or [])
+            if undo_depth:
+                slide, error = _live_slide(name, svg_file, mtime)
+                if slide is None:
+                    return jsonify({'error': f'Failed to apply pending edits: {error}'}), 500
+                content, warnings, disk_annotations, id_to_tag = slide.render()
+        if not undo_depth:
+            cached = _cache_get(_SLIDE_CACHE, _SLIDE_CACHE_LOCK, path_str, mtime)
+            if cached is not None:
+                content, warnings, disk_annotations, id_to_tag = cached
+            else:
+                try:
+                    tree = ET.parse(path_str)
+                    root = tree.getroot()
+                except ET.ParseError as exc:
+                    logger.warning('slide parse failed: %s: %s', name, exc)
+                    return jsonify({'error': f'Failed to parse SVG: {exc}'}), 500
+
+                assign_temp_ids(root)
+                content, warnings, disk_annotations, id_to_tag = _render_slide(root)
                 _cache_put(
                     _SLIDE_CACHE, _SLIDE_CACHE_LOCK, path_str, mtime,
                     (content, warnings, disk_annotations, id_to_tag),
@@ -593,7 +798,7 @@ def create_app(
             'annotations': annotations_list,
             'warnings': warnings,
             'mtime': mtime,
-            'undo_depth': len(pending_edits),
+            'undo_depth': undo_depth,
         })
 
     @app.route('/api/slide/<name>/annotate', methods=['POST'])
@@ -679,79 +884,65 @@ def create_app(
                     return jsonify({'error': f'invalid promote_tspan.{key}'}), 400
 
         try:
-            tree = ET.parse(str(svg_file))
-            root = tree.getroot()
-        except ET.ParseError as exc:
-            return jsonify({'error': f'Failed to parse SVG: {exc}'}), 500
-
-        assign_temp_ids(root)
-        pending = app.config['PENDING_EDITS'].get(name) or []
-        ok, reason = _apply_edit_records(root, pending)
-        if not ok:
-            return jsonify({'error': f'Failed to replay pending edits: {reason}'}), 500
-
-        # Locate the target up front to capture old values before mutating —
-        # these feed the staged record and eventual edit log.
-        target = _find_by_id(root, element_id)
-        if target is None:
-            return jsonify({'error': 'Element not found'}), 404
-        if attrs is not None:
-            attr_err = _validate_edit_attrs(attrs, set(target.attrib.keys()))
-            if attr_err:
-                return jsonify({'error': attr_err}), 400
+            mtime = svg_file.stat().st_mtime
+        except OSError as exc:
+            return jsonify({'error': f'Failed to stat SVG: {exc}'}), 500
 
-        changes = []
-        staged: dict = {'element_id': element_id}
-        if new_text is not None:
-            old_text = target.text or ''
-            ok, reason = set_text(root, element_id, new_text)
-            if not ok:
-                return jsonify({'error': f'Text edit failed: {reason}'}), (
-                    404 if reason == 'not-found' else 400
-                )
-            changes.append({'kind': 'text', 'key': None, 'old': old_text, 'new': new_text})
-            staged['text'] = new_text
-        if attrs:
-            old_attrs = {k: target.get(k) for k in attrs}
-            ok, reason = set_attributes(root, element_id, attrs)
+        with live_lock:
+            slide, error = _live_slide(name, svg_file, mtime)
+            if slide is None:
+                return jsonify({'error': error}), 500
+
+            # Locate the target up front to capture old values before mutating —
+            # these feed the staged record and eventual edit log.
+            target = slide.find(element_id)
+            if target is None:
+                return jsonify({'error': 'Element not found'}), 404
+            if attrs is not None:
+                attr_err = _validate_edit_attrs(attrs, set(target.attrib.keys()))
+                if attr_err:
+                    return jsonify({'error': attr_err}), 400
+
+            changes = []
+            staged: dict = {'element_id': element_id}
+            if new_text is not None:
+                changes.append({'kind': 'text', 'key': None, 'old': target.text or '', 'new': new_text})
+                staged['text'] = new_text
+            if attrs:
+                for k, v in attrs.items():
+                    changes.append({'kind': 'attr', 'key': k, 'old': target.get(k), 'new': v})
+                staged['attrs'] = attrs
+            if promote:
+                tag = target.tag.split('}', 1)[1] if '}' in target.tag else target.tag
+                changes.append({
+                    'kind': 'structure',
+                    'key': 'promote-tspan',
+                    'old': {
+                        'tag': tag,
+                        'x': target.get('x'),
+                        'y': target.get('y'),
+                        'dy': target.get('dy'),
+                        'transform': target.get('transform'),
+                    },
+                    'new': {'tag': 'text', 'x': promote['x'], 'y': promote['y']},
+                })
+                staged['promote_tspan'] = promote
+            staged['changes'] = changes
+
+            pending = app.config['PENDING_EDITS'].setdefault(name, [])
+            # Coalesce a run of edits to the same element+fields into one undo step
+            # so repeated nudges/color tries don't pile up undo entries or log noise.
+            merge = bool(pending) and _edit_signature(pending[-1]) == _edit_signature(staged)
+            ok, reason, step = slide.apply(staged, merge=merge)
             if not ok:
-                return jsonify({'error': f'Attribute edit failed: {reason}'}), (
+                return jsonify({'error': f'{_EDIT_FAILURE_LABELS[step]}: {reason}'}), (
                     404 if reason == 'not-found' else 400
                 )
-            for k, v in attrs.items():
-                changes.append({'kind': 'attr', 'key': k, 'old': old_attrs[k], 'new': v})
-            staged['attrs'] = attrs
-        if promote:
-            tag = target.tag.split('}', 1)[1] if '}' in target.tag else target.tag
-            old_state = {
-                'tag': tag,
-                'x': target.get('x'),
-                'y': target.get('y'),
-                'dy': target.get('dy'),
-                'transform': target.get('transform'),
-            }
-            ok, reason = promote_tspan_to_text(root, element_id, promote['x'], promote['y'])
-            if not ok:
-                return jsonify({'error': f'Tspan promotion failed: {reason}'}), (
-                    404 if reason == 'not-found' else 400
-                )
-            changes.append({
-                'kind': 'structure',
-                'key': 'promote-tspan',
-                'old': old_state,
-                'new': {'tag': 'text', 'x': promote['x'], 'y': promote['y']},
-            })
-            staged['promote_tspan'] = promote
-
-        staged['changes'] = changes
-        pending = app.config['PENDING_EDITS'].setdefault(name, [])
-        # Coalesce a run of edits to the same element+fields into one undo step
-        # so repeated nudges/color tries don't pile up replay work or log noise.
-        if pending and _edit_signature(pending[-1]) == _edit_signature(staged):
-            _coalesce_into(pending[-1], staged)
-        else:
-            pending.append(staged)
-        return jsonify({'status': 'ok', 'undo_depth': len(pending)})
+            if merge:
+                _coalesce_into(pending[-1], staged)
+            else:
+                pending.append(staged)
+            return jsonify({'status': 'ok', 'undo_depth': len(pending)})
 
     @app.route('/api/slide/<name>/undo', methods=['POST'])
     def post_undo(name: str):
@@ -762,14 +953,26 @@ def create_app(
         if not svg_file.exists():
             return jsonify({'error': 'Slide not found'}), 404
 
-        stack = app.config['PENDING_EDITS'].get(name) or []
-        if not stack:
-            return jsonify({'status': 'empty', 'undo_depth': 0})
-        stack.pop()
-        return jsonify({'status': 'ok', 'undo_depth': len(stack)})
+        with live_lock:
+            stack = app.config['PENDING_EDITS'].get(name) or []
+            if not stack:
+                return jsonify({'status': 'empty', 'undo_depth': 0})
+            stack.pop()
+            slide = app.config['LIVE_SLIDES'].get(name)
+            if slide is not None:
+                if len(slide.undo_stack) == len(stack) + 1:
+                    slide.undo()
+                else:
+                    # Out of step with the staged list; rebuild on next use.
+                    del app.config['LIVE_SLIDES'][name]
+            return jsonify({'status': 'ok', 'undo_depth': len(stack)})
 
     @app.route('/api/save-all', methods=['POST'])
     def save_all():
+        with live_lock:
+            return _save_all()
+
+    def _save_all():
         annotations = app.config['ANNOTATIONS']
         pending_edits = app.config['PENDING_EDITS']
         modified = []
@@ -785,17 +988,25 @@ def create_app(
             if svg_file is None or not svg_file.exists():
                 continue
 
-            try:
-                tree = ET.parse(str(svg_file))
-                root = tree.getroot()
-            except ET.ParseError:
-                continue
-
-            assign_temp_ids(root)
+            if edits:
+                # The live slide already holds the edits; it is rebuilt
+                # (edits re-applied) only if the file changed on disk.
+                try:
+                    mtime = svg_file.stat().st_mtime
+                except OSError:
+                    continue
+                slide, error = _live_slide(filename, svg_file, mtime)
+                if slide is None:
+                    return jsonify({'error': f'Failed to apply edits in {filename}: {error}'}), 400
+                tree, root = slide.tree, slide.root
+            else:
+                try:
+                    tree = ET.parse(str(svg_file))
+                    root = tree.getroot()
+                except ET.ParseError:
+                    continue
 
-            ok, reason = _apply_edit_records(root, edits)
-            if not ok:
-                return jsonify({'error': f'Failed to apply edits in {filename}: {reason}'}), 400
+                assign_temp_ids(root)
 
             # Clear all existing annotations from the file before writing current state
             for elem in root.iter():
@@ -824,6 +1035,7 @@ def create_app(
 
         app.config['ANNOTATIONS'] = {}
         app.config['PENDING_EDITS'] = {}
+        app.config['LIVE_SLIDES'] = {}
 
         return jsonify({'status': 'ok', 'files_modified': modified})
 
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+PPT Master - Slide Directory Watcher
+
+Watches ``svg_output/`` for slide changes so the editor server can push
+notifications instead of every open browser polling ``/api/slides``.
+One watcher thread serves all connected clients. On Linux it blocks on
+inotify; elsewhere (or when inotify is unavailable) it falls back to a
+stat-polling loop over the directory.
+
+Usage:
+    (library module — imported by server.py)
+
+Dependencies:
+    None (only uses standard library)
+"""
+
+import collections
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger('svg_editor')
+
+# inotify(7) constants.
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct('iIII')
+
+POLL_INTERVAL = 1.0   # seconds between directory scans in fallback mode
+DEBOUNCE = 0.1        # gather a burst of writes into one notification
+HISTORY_SIZE = 256    # change batches kept for clients that fall behind
+
+
+class SlideWatcher:
+    """Track which ``*.svg`` files in a directory changed, by version number.
+
+    Each batch of changes bumps ``version``. Clients remember the last
+    version they saw and call ``wait_for_changes`` to block until there is a
+    newer one; they receive the set of slide names changed since.
+    """
+
+    def __init__(self, svg_dir: Path, poll_interval: float = POLL_INTERVAL) -> None:
+        self.svg_dir = Path(svg_dir)
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.mode: Optional[str] = None
+        self._history: collections.deque = collections.deque(maxlen=HISTORY_SIZE)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the watcher thread once; later calls are no-ops."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def wait_for_changes(
+        self, since: int, timeout: float,
+    ) -> tuple[int, Optional[set[str]]]:
+        """Block until a version newer than *since* exists or *timeout* passes.
+
+        Returns ``(version, names)``. ``names`` is empty on timeout and
+        ``None`` when *since* is older than the kept history, in which case
+        the caller must resynchronize from a full listing.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.version > since, timeout=timeout)
+            if self.version <= since:
+                return self.version, set()
+            if not self._history or self._history[0][0] > since + 1:
+                return self.version, None
+            names: set[str] = set()
+            for version, batch in self._history:
+                if version > since:
+                    names |= batch
+            return self.version, names
+
+    def _publish(self, names: set[str]) -> None:
+        if not names:
+            return
+        with self._cond:
+            self.version += 1
+            self._history.append((self.version, frozenset(names)))
+            self._cond.notify_all()
+
+    # -- watcher loops ------------------------------------------------------
+
+    def _run(self) -> None:
+        if sys.platform.startswith('linux'):
+            try:
+                self._run_inotify()
+                return
+            except OSError as exc:
+                logger.info('inotify unavailable (%s); polling %s', exc, self.svg_dir)
+        self._run_polling()
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.svg_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.svg'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return snapshot
+
+    def _run_polling(self) -> None:
+        self.mode = 'poll'
+        previous = self._snapshot()
+        while True:
+            time.sleep(self.poll_interval)
+            current = self._snapshot()
+            changed = {
+                name for name in previous.keys() | current.keys()
+                if previous.get(name) != current.get(name)
+            }
+            previous = current
+            self._publish(changed)
+
+    def _run_inotify(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        try:
+            wd = libc.inotify_add_watch(fd, os.fsencode(self.svg_dir), _WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed: {self.svg_dir}')
+            self.mode = 'inotify'
+            while True:
+                select.select([fd], [], [])
+                # Let a burst of writes (e.g. a whole deck being regenerated)
+                # land before reading, so it becomes one notification.
+                time.sleep(DEBOUNCE)
+                names, lost_dir = self._read_inotify(fd)
+                self._publish(names)
+                if lost_dir:
+                    logger.info('watch on %s lost; polling instead', self.svg_dir)
+                    break
+        finally:
+            os.close(fd)
+        self._run_polling()
+
+    @staticmethod
+    def _read_inotify(fd: int) -> tuple[set[str], bool]:
+        names: set[str] = set()
+        lost_dir = False
+        while True:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                raw = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                    lost_dir = True
+                    continue
+                name = os.fsdecode(raw)
+                if name.endswith('.svg'):
+                    names.add(name)
+        return names, lost_dir
@@ -219,6 +219,8 @@
     var slideAnnotations  = {};     // {element_id: annotation_text} for current slide
     var liveMode          = false;
     var slidePollTimer    = null;
+    var slideEvents       = null;   // EventSource on /api/events (live mode)
+    var slideEntries      = {};     // {name: entry} — last /api/slides entry per slide
     var pendingModalAction = "submit";
     var slideMtimes       = {};     // {name: mtime} — last-seen mtime for each slide
     var reloadBannerEl    = null;   // singleton banner element shown when currentSlide mtime drifts
@@ -285,77 +287,10 @@
         return fetch("/api/slides")
             .then(function (res) { return res.json(); })
             .then(function (data) {
-                slideListEl.innerHTML = "";
                 var slides = data.slides || [];
-                slideNames = slides.map(function (s) { return s.name; });
-
-                if (slides.length === 0) {
-                    var empty = document.createElement("div");
-                    empty.className = "slide-list-empty";
-                    empty.textContent = liveMode
-                        ? t("empty_waiting_slides")
-                        : t("empty_no_slides");
-                    slideListEl.appendChild(empty);
-                    if (!currentSlide) {
-                        svgPlaceholder.style.display = "block";
-                        svgPlaceholder.textContent = liveMode
-                            ? t("placeholder_live_ready")
-                            : t("empty_no_slides");
-                        svgContent.style.display = "none";
-                    }
-                    updateNavLabel();
-                    return;
-                }
-
-                var currentExists = false;
-                var currentMtimeChanged = false;
-                slides.forEach(function (s) {
-                    if (s.name === currentSlide) {
-                        currentExists = true;
-                        // Compare against the mtime we recorded when we last rendered this slide.
-                        var lastSeen = slideMtimes[s.name];
-                        if (lastSeen !== undefined && s.mtime && s.mtime !== lastSeen) {
-                            currentMtimeChanged = true;
-                        }
-                    }
-                    // Track every slide's mtime for the next poll (only update non-current here;
-                    // currentSlide's mtime is updated by selectSlide so we can detect drift).
-                    if (s.name !== currentSlide && s.mtime !== undefined) {
-                        slideMtimes[s.name] = s.mtime;
-                    }
-
-                    var item = document.createElement("div");
-                    item.className = "slide-item" + (s.name === currentSlide ? " active" : "");
-                    if (s.ok === false) {
-                        item.className += " slide-error";
-                        item.title = t("slide_error_tooltip") + (s.error || "");
-                    }
-                    item.setAttribute("data-name", s.name);
-
-                    var nameSpan = document.createElement("span");
-                    nameSpan.className = "slide-name";
-                    nameSpan.textContent = s.name;
-                    item.appendChild(nameSpan);
-
-                    if (s.annotation_count > 0) {
-                        var badge = document.createElement("span");
-                        badge.className = "badge";
-                        badge.textContent = s.annotation_count;
-                        item.appendChild(badge);
-                    }
-
-                    item.addEventListener("click", function () {
-                        selectSlide(s.name, item);
-                    });
-                    slideListEl.appendChild(item);
-                });
-
-                if (!currentSlide || !currentExists) {
-                    selectSlide(slides[0].name);
-                } else if (currentMtimeChanged) {
-                    showReloadBanner(currentSlide);
-                }
-                updateNavLabel();
+                slideEntries = {};
+                slides.forEach(function (s) { slideEntries[s.name] = s; });
+                renderSlideList(slides);
             })
             .catch(function (err) {
                 console.error("loadSlides:", err);
@@ -363,6 +298,79 @@
             });
     }
 
+    function renderSlideList(slides) {
+        slideListEl.innerHTML = "";
+        slideNames = slides.map(function (s) { return s.name; });
+
+        if (slides.length === 0) {
+            var empty = document.createElement("div");
+            empty.className = "slide-list-empty";
+            empty.textContent = liveMode
+                ? t("empty_waiting_slides")
+                : t("empty_no_slides");
+            slideListEl.appendChild(empty);
+            if (!currentSlide) {
+                svgPlaceholder.style.display = "block";
+                svgPlaceholder.textContent = liveMode
+                    ? t("placeholder_live_ready")
+                    : t("empty_no_slides");
+                svgContent.style.display = "none";
+            }
+            updateNavLabel();
+            return;
+        }
+
+        var currentExists = false;
+        var currentMtimeChanged = false;
+        slides.forEach(function (s) {
+            if (s.name === currentSlide) {
+                currentExists = true;
+                // Compare against the mtime we recorded when we last rendered this slide.
+                var lastSeen = slideMtimes[s.name];
+                if (lastSeen !== undefined && s.mtime && s.mtime !== lastSeen) {
+                    currentMtimeChanged = true;
+                }
+            }
+            // Track every slide's mtime for the next poll (only update non-current here;
+            // currentSlide's mtime is updated by selectSlide so we can detect drift).
+            if (s.name !== currentSlide && s.mtime !== undefined) {
+                slideMtimes[s.name] = s.mtime;
+            }
+
+            var item = document.createElement("div");
+            item.className = "slide-item" + (s.name === currentSlide ? " active" : "");
+            if (s.ok === false) {
+                item.className += " slide-error";
+                item.title = t("slide_error_tooltip") + (s.error || "");
+            }
+            item.setAttribute("data-name", s.name);
+
+            var nameSpan = document.createElement("span");
+            nameSpan.className = "slide-name";
+            nameSpan.textContent = s.name;
+            item.appendChild(nameSpan);
+
+            if (s.annotation_count > 0) {
+                var badge = document.createElement("span");
+                badge.className = "badge";
+                badge.textContent = s.annotation_count;
+                item.appendChild(badge);
+            }
+
+            item.addEventListener("click", function () {
+                selectSlide(s.name, item);
+            });
+            slideListEl.appendChild(item);
+        });
+
+        if (!currentSlide || !currentExists) {
+            selectSlide(slides[0].name);
+        } else if (currentMtimeChanged) {
+            showReloadBanner(currentSlide);
+        }
+        updateNavLabel();
+    }
+
     // ================================================================
     //  2.  selectSlide  -- GET /api/slide/{name}
     // ================================================================
@@ -1387,6 +1395,10 @@
             modalConfirm.style.display = "none";
             modalCancel.style.display = "none";
             modalMessage.textContent = t("modal_stopping");
+            if (slideEvents) {
+                slideEvents.close();
+                slideEvents = null;
+            }
             fetch("/api/shutdown", {
                 method: "POST",
                 headers: { "Content-Type": "application/json" },
@@ -1540,12 +1552,45 @@
     }
 
     function startSlidePolling() {
-        if (!liveMode || slidePollTimer) return;
+        if (!liveMode || slidePollTimer || slideEvents) return;
+        if (window.EventSource) {
+            startSlideEvents();
+            return;
+        }
         slidePollTimer = window.setInterval(function () {
             loadSlides();
         }, 2000);
     }
 
+    // Live mode: the server pushes a "slides" event per batch of svg_output/
+    // changes with entries for just the changed slides. (Re)connecting loads
+    // the full list once, so nothing missed while disconnected is lost.
+    function startSlideEvents() {
+        slideEvents = new EventSource("/api/events");
+        slideEvents.addEventListener("open", function () {
+            loadSlides();
+        });
+        slideEvents.addEventListener("slides", function (ev) {
+            var data;
+            try { data = JSON.parse(ev.data); } catch (e) { return; }
+            if (data.resync) {
+                loadSlides();
+                return;
+            }
+            (data.slides || []).forEach(function (s) {
+                if (s.removed) delete slideEntries[s.name];
+                else slideEntries[s.name] = s;
+            });
+            var names = data.names || [];
+            var missing = names.some(function (n) { return !slideEntries[n]; });
+            if (missing) {
+                loadSlides();
+                return;
+            }
+            renderSlideList(names.map(function (n) { return slideEntries[n]; }));
+        });
+    }
+
     // ---- Direct-edit undo + save hint --------------------------------
     function updateUndoButton() {
         if (!btnUndo) return;
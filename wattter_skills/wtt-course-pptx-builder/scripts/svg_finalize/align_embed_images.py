@@ -40,24 +40,35 @@ The merged pipeline:
 Bonus: the cropped bitmap is base64-inlined directly without going through
 ``images/cropped/``, so that intermediate directory disappears and stale
 crops can no longer accumulate across re-runs.
+
+Images whose pixels are not transformed (no crop, meet fit, or a slice crop
+that covers the whole bitmap) are embedded from their original bytes without
+a decode / re-encode. Crops and --compress / --max-dimension output are
+cached in a project-level directory keyed by (source content hash, pixel
+crop box, MIME type, compress, max_dimension), so a photo reused across
+slides or re-runs is encoded once.
 """
 
 from __future__ import annotations
 
 import base64
+import hashlib
 import io
+import json
 import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import unquote
 from xml.etree import ElementTree as ET
 
 # Reuse helpers from the previous standalone modules.
-from .crop_images import crop_image_to_size, get_crop_anchor, parse_preserve_aspect_ratio
+from .crop_images import crop_box_for_size, get_crop_anchor, parse_preserve_aspect_ratio
 from .embed_images import _optimize_image_bytes, get_mime_type
 from .fix_image_aspect import calculate_fitted_dimensions
+from .sidecar_media import write_sidecar_media
 
 if TYPE_CHECKING:  # pragma: no cover
     from PIL import Image as PILImage  # noqa: F401
@@ -74,8 +85,20 @@ _PIL_FORMAT_BY_MIME = {
     'image/gif': 'GIF',
     'image/webp': 'WEBP',
 }
+_EXTENSION_BY_MIME = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+}
 _OFFICE_VECTOR_EXTENSIONS = {'.emf', '.wmf'}
 
+# Bump when the encoding of cached entries changes.
+_EMBED_CACHE_FORMAT = 1
+
+# Per-process memo of source files: (path, mtime_ns, size) -> (sha256, mime).
+_SOURCE_INFO: dict[tuple[str, int, int], tuple[str, str]] = {}
+
 
 def _parse_float(val: str | None, default: float = 0.0) -> float:
     """Best-effort float parse, tolerating trailing ``px`` etc."""
@@ -147,22 +170,20 @@ def _normalize_for_save(img: 'PILImage', mime_type: str) -> 'PILImage':
     return img
 
 
-def _encode_pil_to_data_uri(
+def _encode_pil_image(
     img: 'PILImage',
-    src_path: Path,
+    mime_type: str,
     *,
     compress: bool,
     max_dimension: int | None,
     fallback_bytes: bytes | None,
-) -> tuple[str, int] | None:
-    """Serialize *img* to a base64 data URI.
+) -> bytes | None:
+    """Serialize *img* in the format of *mime_type*.
 
-    If the image hasn't been transformed (slice crop or meet fit), prefer
-    re-encoding the original file bytes so we don't risk mutating an
-    already-optimized asset. *fallback_bytes* carries the raw on-disk
-    bytes for that path.
+    *fallback_bytes* carries the raw on-disk bytes when the image has not
+    been transformed; they win when PIL round-tripping an asset that was
+    already well-compressed would inflate it.
     """
-    mime_type = get_mime_type(src_path.name, fallback_bytes)
     pil_format = _PIL_FORMAT_BY_MIME.get(mime_type, 'PNG')
 
     # Encode current PIL image
@@ -180,19 +201,110 @@ def _encode_pil_to_data_uri(
     except (OSError, ValueError):
         return None
 
-    # If caller passed the original bytes and they're smaller (because PIL
-    # round-tripping an asset that was already well-compressed inflates it),
-    # fall back to those.
     chosen = encoded_bytes
     if fallback_bytes and len(fallback_bytes) < len(encoded_bytes):
         chosen = fallback_bytes
 
-    chosen = _optimize_image_bytes(
+    return _optimize_image_bytes(
         chosen, mime_type, compress=compress, max_dimension=max_dimension,
     )
 
-    b64 = base64.b64encode(chosen).decode('ascii')
-    return f'data:{mime_type};base64,{b64}', len(chosen)
+
+def _data_uri(mime_type: str, data: bytes) -> str:
+    return f'data:{mime_type};base64,{base64.b64encode(data).decode("ascii")}'
+
+
+def _source_info(img_path: Path) -> tuple[str, str, bytes | None]:
+    """Return ``(sha256, mime, raw_bytes)`` for a source bitmap.
+
+    Files already hashed by this process (same mtime and size) are not
+    re-read; *raw_bytes* is None in that case. Raises OSError.
+    """
+    stat = img_path.stat()
+    memo_key = (str(img_path), stat.st_mtime_ns, stat.st_size)
+    known = _SOURCE_INFO.get(memo_key)
+    if known is not None:
+        return known[0], known[1], None
+    with open(img_path, 'rb') as fh:
+        raw_bytes = fh.read()
+    info = (hashlib.sha256(raw_bytes).hexdigest(), get_mime_type(img_path.name, raw_bytes))
+    _SOURCE_INFO[memo_key] = info
+    return info[0], info[1], raw_bytes
+
+
+def embed_cache_key(
+    source_digest: str,
+    crop_box: tuple[int, int, int, int] | None,
+    mime_type: str,
+    *,
+    compress: bool,
+    max_dimension: int | None,
+) -> str:
+    """Cache key of one encoded image: its source and every encode option."""
+    payload = json.dumps({
+        'format': _EMBED_CACHE_FORMAT,
+        'source': source_digest,
+        'crop': list(crop_box) if crop_box else None,
+        'mime': mime_type,
+        'compress': compress,
+        'max_dimension': max_dimension,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _atomic_write(target: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(suffix=target.suffix, dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, target)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load_cached_data_uri(cache_dir: Path, key: str) -> str | None:
+    try:
+        return (cache_dir / f'{key}.b64').read_text(encoding='ascii')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _load_cached_bytes(cache_dir: Path, key: str, mime_type: str) -> bytes | None:
+    ext = _EXTENSION_BY_MIME.get(mime_type, 'bin')
+    try:
+        return (cache_dir / f'{key}.{ext}').read_bytes()
+    except OSError:
+        return None
+
+
+def _store_cached_image(cache_dir: Path, key: str, mime_type: str, data: bytes, data_uri: str) -> None:
+    """Store the encoded bytes and their data URI; failures only cost a miss."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        ext = _EXTENSION_BY_MIME.get(mime_type, 'bin')
+        _atomic_write(cache_dir / f'{key}.{ext}', data)
+        _atomic_write(cache_dir / f'{key}.b64', data_uri.encode('ascii'))
+    except OSError:
+        pass
+
+
+def prune_embed_cache(cache_dir: Path, keep: set[str]) -> int:
+    """Delete cache entries whose key is not in *keep*; returns files removed."""
+    removed = 0
+    if not cache_dir.is_dir():
+        return removed
+    for entry in cache_dir.iterdir():
+        if entry.is_file() and entry.stem not in keep:
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
 
 
 def _iter_image_elements(root: ET.Element):
@@ -224,9 +336,16 @@ def _process_one_image(
     compress: bool,
     max_dimension: int | None,
     verbose: bool,
+    cache_dir: Path | None = None,
+    used_cache_keys: set[str] | None = None,
+    sidecar_dir: Path | None = None,
 ) -> tuple[bool, str | None]:
     """Align (slice/meet) and embed a single <image>.
 
+    With *sidecar_dir* (the SVG's directory) the final bitmap is written to
+    its content-addressed ``media/`` store (see sidecar_media) and
+    referenced instead of inlined.
+
     Returns ``(processed, error)`` where *processed* is True iff the image
     was rewritten and *error* is a short message when something went wrong
     (the image is left untouched in that case).
@@ -241,55 +360,51 @@ def _process_one_image(
     if img_path is None:
         return False, f'unresolved href: {href[:60]}'
 
-    try:
-        with open(img_path, 'rb') as fh:
-            raw_bytes = fh.read()
-    except OSError as exc:
-        return False, f'read failed: {exc}'
-
     if img_path.suffix.lower() in _OFFICE_VECTOR_EXTENSIONS:
         if verbose:
             print(f'   [INFO] {img_path.name}: Office vector left external for native PPTX passthrough')
         return False, None
 
-    img = _load_pil_image(img_path)
-    if img is None:
-        return False, 'PIL open failed'
+    try:
+        source_digest, mime_type, raw_bytes = _source_info(img_path)
+    except OSError as exc:
+        return False, f'read failed: {exc}'
 
     box_x = _parse_float(image.get('x'))
     box_y = _parse_float(image.get('y'))
     box_w = _parse_float(image.get('width'))
     box_h = _parse_float(image.get('height'))
-    if box_w <= 0 or box_h <= 0:
-        return False, 'zero-sized box'
 
     par_attr = image.get('preserveAspectRatio') or ''
     par_attr = par_attr.strip()
+    align, mode = parse_preserve_aspect_ratio(par_attr) if par_attr else ('none', 'meet')
+
+    # Only meet / slice need the bitmap size (a header read, no decode);
+    # formats outside _PIL_FORMAT_BY_MIME are always transcoded by PIL.
+    needs_pil = align != 'none' or mime_type not in _PIL_FORMAT_BY_MIME
+    img = _load_pil_image(img_path) if needs_pil else None
+    if needs_pil and img is None:
+        return False, 'PIL open failed'
+    if box_w <= 0 or box_h <= 0:
+        return False, 'zero-sized box'
 
     # ------------------------------------------------------------------
     # Decide the spatial transform
     # ------------------------------------------------------------------
-    final_img: 'PILImage' = img
     new_x, new_y, new_w, new_h = box_x, box_y, box_w, box_h
-    transformed = False  # True iff bitmap content changed (crop happened)
-
-    if not par_attr:
-        # No preserveAspectRatio at all. The previous pipeline's fix-aspect
-        # step assumed "xMidYMid meet" here, which silently re-fit images
-        # that crop-images had already shaped. Treat absence as "leave it
-        # alone": embed bytes, keep box.
-        pass
-    else:
-        align, mode = parse_preserve_aspect_ratio(par_attr)
-        if align == 'none':
-            # Author wants stretch-to-box; preserve geometry, embed bytes.
-            pass
-        elif mode == 'slice':
+    crop_box: tuple[int, int, int, int] | None = None  # set iff bitmap content changes
+
+    # No preserveAspectRatio at all: the previous pipeline's fix-aspect step
+    # assumed "xMidYMid meet" here, which silently re-fit images that
+    # crop-images had already shaped. Treat absence as "leave it alone":
+    # embed bytes, keep box. align == none: the author wants
+    # stretch-to-box; preserve geometry, embed bytes.
+    if align != 'none':
+        if mode == 'slice':
             x_anchor, y_anchor = get_crop_anchor(align)
-            cropped = crop_image_to_size(img, int(box_w), int(box_h),
-                                         x_anchor, y_anchor)
-            final_img = cropped
-            transformed = True
+            box = crop_box_for_size(img.size, int(box_w), int(box_h), x_anchor, y_anchor)
+            if box != (0, 0, img.size[0], img.size[1]):
+                crop_box = box
         else:  # meet (or any other mode → treat as meet)
             new_w_calc, new_h_calc, off_x, off_y = calculate_fitted_dimensions(
                 img.size[0], img.size[1], box_w, box_h, mode='meet',
@@ -302,18 +417,70 @@ def _process_one_image(
     # ------------------------------------------------------------------
     # Encode and rewrite
     # ------------------------------------------------------------------
-    encoded = _encode_pil_to_data_uri(
-        final_img,
-        img_path,
-        compress=compress,
-        max_dimension=max_dimension,
-        fallback_bytes=raw_bytes if not transformed else None,
+    passthrough = (
+        crop_box is None and mime_type in _PIL_FORMAT_BY_MIME
+        and not compress and not max_dimension
     )
-    if encoded is None:
-        return False, 'encode failed'
-    data_uri, _ = encoded
+    ext = _EXTENSION_BY_MIME.get(mime_type)
+    if ext is None:
+        sidecar_dir = None  # only formats PowerPoint takes natively go sidecar
+    try:
+        if passthrough and sidecar_dir is not None:
+            # Untransformed: the original file is the blob.
+            new_href = write_sidecar_media(sidecar_dir, source_digest, ext, source=img_path)
+        elif passthrough:
+            # Untransformed: the original bytes are embedded as-is.
+            if raw_bytes is None:
+                raw_bytes = img_path.read_bytes()
+            new_href = _data_uri(mime_type, raw_bytes)
+        else:
+            key = embed_cache_key(
+                source_digest, crop_box, mime_type,
+                compress=compress, max_dimension=max_dimension,
+            )
+            if used_cache_keys is not None:
+                used_cache_keys.add(key)
+            new_href = None
+            if cache_dir and sidecar_dir is not None:
+                cached = _load_cached_bytes(cache_dir, key, mime_type)
+                if cached is not None:
+                    new_href = write_sidecar_media(
+                        sidecar_dir, hashlib.sha256(cached).hexdigest(), ext, data=cached,
+                    )
+            elif cache_dir:
+                new_href = _load_cached_data_uri(cache_dir, key)
+            if new_href is None:
+                if raw_bytes is None:
+                    raw_bytes = img_path.read_bytes()
+                if crop_box is not None:
+                    encoded = _encode_pil_image(
+                        img.crop(crop_box), mime_type,
+                        compress=compress, max_dimension=max_dimension, fallback_bytes=None,
+                    )
+                elif mime_type in _PIL_FORMAT_BY_MIME:
+                    encoded = _optimize_image_bytes(
+                        raw_bytes, mime_type, compress=compress, max_dimension=max_dimension,
+                    )
+                else:
+                    encoded = _encode_pil_image(
+                        img, mime_type,
+                        compress=compress, max_dimension=max_dimension, fallback_bytes=raw_bytes,
+                    )
+                if encoded is None:
+                    return False, 'encode failed'
+                data_uri = _data_uri(mime_type, encoded)
+                if cache_dir:
+                    _store_cached_image(cache_dir, key, mime_type, encoded, data_uri)
+                if sidecar_dir is not None:
+                    new_href = write_sidecar_media(
+                        sidecar_dir, hashlib.sha256(encoded).hexdigest(), ext, data=encoded,
+                    )
+                else:
+                    new_href = data_uri
+    except OSError as exc:
+        return False, f'read failed: {exc}'
 
-    _set_href(image, data_uri)
+    _set_href(image, new_href)
     image.set('x', _format_number(new_x))
     image.set('y', _format_number(new_y))
     image.set('width', _format_number(new_w))
@@ -322,22 +489,16 @@ def _process_one_image(
         del image.attrib['preserveAspectRatio']
 
     if verbose:
-        suffix = ' (cropped)' if transformed else ''
+        suffix = ' (cropped)' if crop_box is not None else ''
         print(f'   [OK] {img_path.name}{suffix}')
     return True, None
 
 
-def count_office_vector_refs_in_svg(svg_path: str | Path) -> int:
-    """Count local EMF/WMF image refs that the embed pass intentionally skips."""
-    svg_path = Path(svg_path)
-    svg_dir = svg_path.parent.resolve()
-    try:
-        tree = ET.parse(svg_path)
-    except ET.ParseError:
-        return 0
+def count_office_vector_refs_in_tree(root: ET.Element, svg_dir: Path) -> int:
+    """Count local EMF/WMF image refs in an already-parsed SVG tree."""
     count = 0
     seen: set[int] = set()
-    for image in _iter_image_elements(tree.getroot()):
+    for image in _iter_image_elements(root):
         ident = id(image)
         if ident in seen:
             continue
@@ -351,33 +512,38 @@ def count_office_vector_refs_in_svg(svg_path: str | Path) -> int:
     return count
 
 
-def align_and_embed_images_in_svg(
-    svg_path: str | Path,
+def count_office_vector_refs_in_svg(svg_path: str | Path) -> int:
+    """Count local EMF/WMF image refs that the embed pass intentionally skips."""
+    svg_path = Path(svg_path)
+    try:
+        tree = ET.parse(svg_path)
+    except ET.ParseError:
+        return 0
+    return count_office_vector_refs_in_tree(tree.getroot(), svg_path.parent.resolve())
+
+
+def align_and_embed_images_in_tree(
+    root: ET.Element,
+    svg_dir: Path,
     *,
     dry_run: bool = False,
     verbose: bool = False,
     compress: bool = False,
     max_dimension: int | None = None,
+    svg_name: str = '',
+    cache_dir: Path | None = None,
+    used_cache_keys: set[str] | None = None,
+    sidecar_media: bool = False,
 ) -> tuple[int, int]:
-    """Run the merged align + embed pass on a single SVG file.
+    """Run the merged align + embed pass on an already-parsed SVG tree.
 
+    *svg_dir* is the directory relative hrefs resolve against. The tree is
+    modified in place. *cache_dir* enables the encoded-image cache; the keys
+    of the entries this tree needs are added to *used_cache_keys*. With
+    *sidecar_media* bitmaps go to ``svg_dir/media/<sha256>.<ext>`` instead
+    of being base64-inlined.
     Returns ``(processed_count, error_count)``.
     """
-    svg_path = Path(svg_path)
-    svg_dir = svg_path.parent.resolve()
-
-    # Register namespaces for clean serialization
-    ET.register_namespace('', SVG_NS)
-    ET.register_namespace('xlink', XLINK_NS)
-
-    try:
-        tree = ET.parse(svg_path)
-    except ET.ParseError as exc:
-        if verbose:
-            print(f'  [ERROR] {svg_path.name}: parse failed ({exc})')
-        return (0, 1)
-    root = tree.getroot()
-
     # Avoid double-iteration if an element matches both namespaced and
     # bare-tag iteration paths.
     seen: set[int] = set()
@@ -397,13 +563,51 @@ def align_and_embed_images_in_svg(
         ok, err = _process_one_image(
             image, svg_dir,
             compress=compress, max_dimension=max_dimension, verbose=verbose,
+            cache_dir=cache_dir, used_cache_keys=used_cache_keys,
+            sidecar_dir=svg_dir if sidecar_media else None,
         )
         if ok:
             processed += 1
         elif err:
             errors += 1
             if verbose:
-                print(f'   [WARN] {svg_path.name}: {err}')
+                print(f'   [WARN] {svg_name}: {err}')
+
+    return (processed, errors)
+
+
+def align_and_embed_images_in_svg(
+    svg_path: str | Path,
+    *,
+    dry_run: bool = False,
+    verbose: bool = False,
+    compress: bool = False,
+    max_dimension: int | None = None,
+) -> tuple[int, int]:
+    """Run the merged align + embed pass on a single SVG file.
+
+    Returns ``(processed_count, error_count)``.
+    """
+    svg_path = Path(svg_path)
+    svg_dir = svg_path.parent.resolve()
+
+    # Register namespaces for clean serialization
+    ET.register_namespace('', SVG_NS)
+    ET.register_namespace('xlink', XLINK_NS)
+
+    try:
+        tree = ET.parse(svg_path)
+    except ET.ParseError as exc:
+        if verbose:
+            print(f'  [ERROR] {svg_path.name}: parse failed ({exc})')
+        return (0, 1)
+
+    processed, errors = align_and_embed_images_in_tree(
+        tree.getroot(), svg_dir,
+        dry_run=dry_run, verbose=verbose,
+        compress=compress, max_dimension=max_dimension,
+        svg_name=svg_path.name,
+    )
 
     if processed > 0 and not dry_run:
         tree.write(svg_path, encoding='utf-8', xml_declaration=False)
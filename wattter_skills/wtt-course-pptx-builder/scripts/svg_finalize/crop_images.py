@@ -99,7 +99,19 @@ def crop_image_to_size(
     Returns:
         Cropped PIL Image object (preserving original resolution)
     """
-    img_width, img_height = img.size
+    # Crop only, no scaling
+    return img.crop(crop_box_for_size(img.size, target_width, target_height, x_anchor, y_anchor))
+
+
+def crop_box_for_size(
+    image_size: tuple[int, int],
+    target_width: int,
+    target_height: int,
+    x_anchor: float = 0.5,
+    y_anchor: float = 0.5,
+) -> tuple[int, int, int, int]:
+    """Return the (left, top, right, bottom) box crop_image_to_size cuts out."""
+    img_width, img_height = image_size
     
     # Calculate target aspect ratio
     target_ratio = target_width / target_height
@@ -124,8 +136,7 @@ def crop_image_to_size(
     right = left + crop_width
     bottom = top + crop_height
     
-    # Crop only, no scaling
-    return img.crop((left, top, right, bottom))
+    return (left, top, right, bottom)
 
 
 def process_svg_images(
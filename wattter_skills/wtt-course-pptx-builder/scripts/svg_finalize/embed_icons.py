@@ -44,6 +44,7 @@ import os
 import re
 import sys
 import argparse
+import functools
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
@@ -62,6 +63,9 @@ ICON_BASE_SIZES = {
 }
 DEFAULT_ICON_BASE_SIZE = 24
 
+# Match <use data-icon="xxx" ... /> elements
+_USE_PATTERN = re.compile(r'<use\s+[^>]*data-icon="[^"]*"[^>]*/>')
+
 
 def _get_viewbox_size(content: str) -> float:
     """Extract the width from viewBox attribute (assumed square). Returns 0 if not found."""
@@ -144,14 +148,33 @@ def extract_paths_from_icon(icon_path: Path, target_color: str = '#000000') -> t
         style: 'fill' or 'stroke'
         base_size: detected from viewBox
     """
-    if not icon_path.exists():
+    try:
+        stat = icon_path.stat()
+    except OSError:
         return [], 'fill', 16
 
-    content = icon_path.read_text(encoding='utf-8')
-    style = _detect_icon_style(content)
-    base_size = _get_viewbox_size(content) or 16
-    elements = _extract_shape_elements(content, target_color)
-    return elements, style, base_size
+    elements, style, base_size = _load_icon_record(
+        str(icon_path), stat.st_mtime_ns, stat.st_size,
+    )
+    return list(elements), style, base_size
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_icon_record(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, ...], str, float]:
+    """
+    Read and parse one icon file, memoized per process.
+
+    Icon-heavy decks reference the same dozen icons hundreds of times; the
+    extracted elements are color-independent (the outer <g> carries color),
+    so one record serves every use. mtime/size are part of the key so an
+    edited icon is re-read by long-running callers such as the live editor.
+    """
+    content = Path(path).read_text(encoding='utf-8')
+    return (
+        tuple(_extract_shape_elements(content, '')),
+        _detect_icon_style(content),
+        _get_viewbox_size(content) or 16,
+    )
 
 
 def parse_use_element(use_match: str) -> dict[str, str | float]:
@@ -224,6 +247,27 @@ def resolve_icon_color(attrs: dict[str, str | float], style: str) -> str:
     return '#000000'
 
 
+def icon_group_transform(attrs: dict[str, str | float], base_size: float) -> str:
+    """Return the transform placing an icon's <g> at the use element's box."""
+    x = attrs.get('x', 0)
+    y = attrs.get('y', 0)
+    width = attrs.get('width', base_size)
+    height = attrs.get('height', base_size)
+
+    scale_x = width / base_size
+    scale_y = height / base_size
+
+    if attrs.get('transform'):
+        # This transform is authoritative: the editor computes it from the
+        # expanded <g>, so composing it with x/y would apply placement twice.
+        return str(attrs['transform'])
+    if abs(scale_x - 1) < 1e-6 and abs(scale_y - 1) < 1e-6:
+        return f'translate({x}, {y})'
+    if abs(scale_x - scale_y) < 1e-6:
+        return f'translate({x}, {y}) scale({scale_x})'
+    return f'translate({x}, {y}) scale({scale_x}, {scale_y})'
+
+
 def generate_icon_group(attrs: dict[str, str | float], elements: list[str], style: str, base_size: float) -> str:
     """
     Generate the icon's <g> element.
@@ -237,26 +281,9 @@ def generate_icon_group(attrs: dict[str, str | float], elements: list[str], styl
     Returns:
         Complete <g> element string
     """
-    x = attrs.get('x', 0)
-    y = attrs.get('y', 0)
-    width = attrs.get('width', base_size)
-    height = attrs.get('height', base_size)
     color = resolve_icon_color(attrs, style)
     icon_name = attrs.get('icon', 'unknown')
-
-    scale_x = width / base_size
-    scale_y = height / base_size
-
-    if attrs.get('transform'):
-        # This transform is authoritative: the editor computes it from the
-        # expanded <g>, so composing it with x/y would apply placement twice.
-        transform = str(attrs['transform'])
-    elif abs(scale_x - 1) < 1e-6 and abs(scale_y - 1) < 1e-6:
-        transform = f'translate({x}, {y})'
-    elif abs(scale_x - scale_y) < 1e-6:
-        transform = f'translate({x}, {y}) scale({scale_x})'
-    else:
-        transform = f'translate({x}, {y}) scale({scale_x}, {scale_y})'
+    transform = icon_group_transform(attrs, base_size)
 
     elements_str = '\n    '.join(elements)
 
@@ -275,37 +302,31 @@ def generate_icon_group(attrs: dict[str, str | float], elements: list[str], styl
   </g>'''
 
 
-def process_svg_file(svg_path: Path, icons_dir: Path, dry_run: bool = False, verbose: bool = False) -> int:
+def embed_icons_in_content(
+    content: str,
+    icons_dir: Path,
+    svg_name: str = '',
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> tuple[str, int]:
     """
-    Process a single SVG file, replacing all icon placeholders.
+    Replace all icon placeholders in SVG source text.
 
     Args:
-        svg_path: SVG file path
+        content: SVG source text
         icons_dir: Icon directory path
+        svg_name: File name used in warnings
         dry_run: Whether to only preview without modifying
         verbose: Whether to show detailed information
 
     Returns:
-        Number of icons replaced
+        (new content, number of icons replaced)
     """
-    if not svg_path.exists():
-        print(f"[ERROR] File not found: {svg_path}")
-        return 0
-    
-    content = svg_path.read_text(encoding='utf-8')
-    
-    # Match <use data-icon="xxx" ... /> elements
-    use_pattern = r'<use\s+[^>]*data-icon="[^"]*"[^>]*/>'
-    matches = list(re.finditer(use_pattern, content))
-    
-    if not matches:
-        if verbose:
-            print(f"[SKIP] No icon placeholders: {svg_path}")
-        return 0
-    
+    matches = list(_USE_PATTERN.finditer(content))
+
     replaced_count = 0
     new_content = content
-    
+
     # Replace from back to front to avoid position offset
     for match in reversed(matches):
         use_str = match.group(0)
@@ -320,7 +341,7 @@ def process_svg_file(svg_path: Path, icons_dir: Path, dry_run: bool = False, ver
         color = resolve_icon_color(attrs, style)
         
         if not elements:
-            print(f"[WARN] Icon not found: {icon_name} (in {svg_path.name})")
+            print(f"[WARN] Icon not found: {icon_name} (in {svg_name})")
             continue
         
         replacement = generate_icon_group(attrs, elements, style, base_size)
@@ -331,7 +352,38 @@ def process_svg_file(svg_path: Path, icons_dir: Path, dry_run: bool = False, ver
         
         new_content = new_content[:match.start()] + replacement + new_content[match.end():]
         replaced_count += 1
+
+    return new_content, replaced_count
+
+
+def process_svg_file(svg_path: Path, icons_dir: Path, dry_run: bool = False, verbose: bool = False) -> int:
+    """
+    Process a single SVG file, replacing all icon placeholders.
+
+    Args:
+        svg_path: SVG file path
+        icons_dir: Icon directory path
+        dry_run: Whether to only preview without modifying
+        verbose: Whether to show detailed information
+
+    Returns:
+        Number of icons replaced
+    """
+    if not svg_path.exists():
+        print(f"[ERROR] File not found: {svg_path}")
+        return 0
+    
+    content = svg_path.read_text(encoding='utf-8')
     
+    if not _USE_PATTERN.search(content):
+        if verbose:
+            print(f"[SKIP] No icon placeholders: {svg_path}")
+        return 0
+
+    new_content, replaced_count = embed_icons_in_content(
+        content, icons_dir, svg_path.name, dry_run=dry_run, verbose=verbose,
+    )
+
     if not dry_run and replaced_count > 0:
         svg_path.write_text(new_content, encoding='utf-8')
     
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""PPT Master — content-addressed sidecar media for finalized SVGs.
+
+With ``finalize_svg.py --sidecar-media`` the align-images step writes each
+final bitmap once to ``svg_final/media/<sha256>.<ext>`` and points the
+``<image>`` href at it instead of inlining a base64 data URI. Consumers:
+
+  1. svg_to_pptx native conversion reads the blob directly and reuses the
+     digest in the file name as the package media name, so the bytes are
+     never base64-decoded or re-hashed.
+  2. svg_to_pptx legacy / snapshot packaging inlines the blobs again with
+     ``inline_sidecar_media``, because an SVG embedded in a pptx cannot
+     follow relative URIs.
+
+Blobs are immutable: the name is the SHA-256 of the content, so a blob that
+already exists is never rewritten.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+SIDECAR_MEDIA_DIR = 'media'
+
+_MIME_BY_EXTENSION = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+}
+_SIDECAR_HREF_RE = re.compile(
+    rf'^{SIDECAR_MEDIA_DIR}/([0-9a-f]{{64}})\.({"|".join(_MIME_BY_EXTENSION)})$'
+)
+_IMAGE_HREF_ATTR_RE = re.compile(
+    rf'''(\s(?:xlink:)?href\s*=\s*)(["']){SIDECAR_MEDIA_DIR}/([0-9a-f]{{64}})\.([a-z]+)\2'''
+)
+
+
+def sidecar_href(digest: str, ext: str) -> str:
+    """Href of a sidecar blob, relative to the SVG that references it."""
+    return f'{SIDECAR_MEDIA_DIR}/{digest}.{ext.lstrip(".")}'
+
+
+def sidecar_digest(href: str) -> str | None:
+    """SHA-256 encoded in a sidecar href, or None for any other href."""
+    match = _SIDECAR_HREF_RE.match(href)
+    return match.group(1) if match else None
+
+
+def write_sidecar_media(
+    svg_dir: Path,
+    digest: str,
+    ext: str,
+    *,
+    data: bytes | None = None,
+    source: Path | None = None,
+) -> str:
+    """Store one blob under ``svg_dir/media`` and return its href.
+
+    The content comes from *data* or is copied from *source*.
+    """
+    href = sidecar_href(digest, ext)
+    target = svg_dir / href
+    if target.is_file():
+        return href
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(suffix=target.suffix, dir=str(target.parent))
+    try:
+        if data is not None:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        else:
+            os.close(fd)
+            shutil.copyfile(source, tmp_name)
+        os.replace(tmp_name, target)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return href
+
+
+def inline_sidecar_media(svg_text: str, svg_dir: Path) -> str:
+    """Replace sidecar hrefs in *svg_text* with base64 data URIs.
+
+    Blobs missing on disk are left as references.
+    """
+    def _inline(match: re.Match) -> str:
+        prefix, quote, digest, ext = match.groups()
+        mime = _MIME_BY_EXTENSION.get(ext)
+        blob = svg_dir / sidecar_href(digest, ext)
+        if mime is None or not blob.is_file():
+            return match.group(0)
+        payload = base64.b64encode(blob.read_bytes()).decode('ascii')
+        return f'{prefix}{quote}data:{mime};base64,{payload}{quote}'
+
+    return _IMAGE_HREF_ATTR_RE.sub(_inline, svg_text)
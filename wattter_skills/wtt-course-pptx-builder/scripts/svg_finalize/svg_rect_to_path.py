@@ -81,31 +81,13 @@ def parse_float(val: str, default: float = 0.0) -> float:
         return default
 
 
-def process_svg(content: str, verbose: bool = False) -> Tuple[str, int]:
+def convert_rounded_rects(root: ET.Element, verbose: bool = False) -> int:
     """
-    Process SVG content, converting rounded rectangles to paths.
-    Returns (processed content, conversion count).
+    Convert rounded rectangles to paths in an already-parsed SVG tree.
+    Modifies the tree in place and returns the conversion count.
     """
     converted_count = 0
     
-    # Save original XML declaration
-    xml_declaration = ''
-    if content.strip().startswith('<?xml'):
-        match = re.match(r'(<\?xml[^?]*\?>)', content)
-        if match:
-            xml_declaration = match.group(1) + '\n'
-    
-    # Register SVG namespaces
-    ET.register_namespace('', 'http://www.w3.org/2000/svg')
-    ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
-    
-    try:
-        root = ET.fromstring(content)
-    except ET.ParseError as e:
-        if verbose:
-            print(f"    XML parse error: {e}")
-        return content, 0
-    
     # Get default namespace
     ns = ''
     if root.tag.startswith('{'):
@@ -165,6 +147,33 @@ def process_svg(content: str, verbose: bool = False) -> Tuple[str, int]:
     
     # Process all elements
     process_element(root)
+    return converted_count
+
+
+def process_svg(content: str, verbose: bool = False) -> Tuple[str, int]:
+    """
+    Process SVG content, converting rounded rectangles to paths.
+    Returns (processed content, conversion count).
+    """
+    # Save original XML declaration
+    xml_declaration = ''
+    if content.strip().startswith('<?xml'):
+        match = re.match(r'(<\?xml[^?]*\?>)', content)
+        if match:
+            xml_declaration = match.group(1) + '\n'
+    
+    # Register SVG namespaces
+    ET.register_namespace('', 'http://www.w3.org/2000/svg')
+    ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
+    
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        if verbose:
+            print(f"    XML parse error: {e}")
+        return content, 0
+    
+    converted_count = convert_rounded_rects(root, verbose=verbose)
     
     # Convert back to string
     result = ET.tostring(root, encoding='unicode')
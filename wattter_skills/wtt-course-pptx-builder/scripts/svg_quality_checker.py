@@ -11,11 +11,16 @@ Usage:
 """
 
 import sys
+import os
 import re
 import json
-import html
+import hashlib
+import functools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Dict, Tuple
 from collections import defaultdict
 from xml.etree import ElementTree as ET
 
@@ -62,6 +67,104 @@ RAMP_MAX_RATIO = 5.0
 POSTER_SIZE_MODES = {'showcase'}
 POSTER_SIZE_STYLES = {'zine'}
 
+# Per-file result cache (<project>/.cache/svg_quality/). Bump when the shape
+# of a cached result changes.
+_CACHE_FORMAT = 1
+_IMAGE_SIZES_FILE = 'image_sizes.json'
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+# Sources whose behaviour feeds a per-file result.
+_CHECKER_SOURCES = ('svg_quality_checker.py', 'update_spec.py', 'project_utils.py', 'config.py')
+
+
+# Image pixel sizes shared by every SVG checked in this process:
+# resolved path -> [mtime_ns, size, width, height] (width/height None when
+# the image is unreadable). Seeded from and saved to the result cache.
+_image_sizes: Dict[str, list] = {}
+_image_sizes_dirty: set = set()
+
+
+def _image_size(img_path: Path) -> Tuple[int, int] | None:
+    """Pixel size of an image; None when PIL is missing or the file is unreadable."""
+    try:
+        st = img_path.stat()
+    except OSError:
+        return None
+    key = str(img_path)
+    entry = _image_sizes.get(key)
+    if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            return None  # PIL not available, skip resolution check
+        try:
+            with PILImage.open(img_path) as img:
+                width, height = img.size
+        except Exception:
+            width = height = None
+        entry = [st.st_mtime_ns, st.st_size, width, height]
+        _image_sizes[key] = entry
+        _image_sizes_dirty.add(key)
+    if entry[2] is None:
+        return None
+    return entry[2], entry[3]
+
+
+def _take_new_image_sizes() -> Dict[str, list]:
+    """Image sizes measured since the last call (to send back to the parent)."""
+    new_sizes = {key: _image_sizes[key] for key in _image_sizes_dirty}
+    _image_sizes_dirty.clear()
+    return new_sizes
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _checker_fingerprint() -> str:
+    """Hash of the checker sources; any code change invalidates cached results."""
+    h = hashlib.sha256()
+    for name in _CHECKER_SOURCES:
+        src = _SCRIPTS_DIR / name
+        if src.is_file():
+            h.update(name.encode('utf-8'))
+            h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def _atomic_write(target: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(suffix=target.suffix, dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, target)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# Process-pool worker state: one checker per worker process, so spec_lock and
+# image_sources.json parses are shared by every file the worker checks.
+_worker_checker = None
+
+
+def _init_worker(template_mode: bool, image_sizes: Dict[str, list]) -> None:
+    global _worker_checker
+    _worker_checker = SVGQualityChecker(template_mode=template_mode, workers=1)
+    _image_sizes.update(image_sizes)
+
+
+def _run_checks_in_worker(svg_file: str, expected_format: str | None):
+    result = _worker_checker._run_checks(Path(svg_file), expected_format)
+    return result, _take_new_image_sizes()
+
 
 def _design_spec_is_brand(spec_path: Path) -> bool:
     """Return True when a design_spec.md frontmatter declares ``kind: brand``.
@@ -171,6 +274,176 @@ def _parse_placeholders_fallback(block: str) -> Dict[str, Tuple[str, ...]]:
     return out
 
 
+XLINK_NS = "http://www.w3.org/1999/xlink"
+_XLINK_HREF = f'{{{XLINK_NS}}}href'
+
+# Presentation attributes recorded as facts for the spec_lock drift rule.
+_PAINT_ATTRS = ('fill', 'stroke', 'stop-color')
+
+
+def _local_name(name: str) -> str:
+    """Strip the ``{namespace}`` prefix ElementTree puts on tags / attributes."""
+    return name.rsplit('}', 1)[-1]
+
+
+def _image_refs(images: Iterable[ET.Element], svg_dir: Path) -> List[Tuple[ET.Element, str, Path]]:
+    """``<image>`` file references: (element, href, path resolved from *svg_dir*).
+
+    ``href`` wins over ``xlink:href``; data URIs are skipped and each href is
+    listed once, at its first element.
+    """
+    refs = []
+    seen = set()
+    for elem in images:
+        href = next((value for value in (elem.get('href'), elem.get(_XLINK_HREF))
+                     if value and not value.startswith('data:')), None)
+        if href and href not in seen:
+            seen.add(href)
+            refs.append((elem, href, (svg_dir / href).resolve()))
+    return refs
+
+
+@dataclass
+class SvgIndex:
+    """Facts about one SVG, collected while it is parsed.
+
+    The document is parsed once; every per-file rule reads this index instead
+    of re-scanning the source text, so adding a rule adds a lookup rather
+    than another pass over the file.
+    """
+
+    path: Path
+    root: ET.Element | None = None
+    # local tag name (case kept) -> elements, in document order
+    elements: Dict[str, List[ET.Element]] = field(default_factory=lambda: defaultdict(list))
+    # attribute name as ElementTree reports it -> (element, value), in document order
+    attributes: Dict[str, List[Tuple[ET.Element, str]]] = field(
+        default_factory=lambda: defaultdict(list))
+    ids: set = field(default_factory=set)
+    # parsed style="" declarations: (element, {property: value})
+    styles: List[Tuple[ET.Element, Dict[str, str]]] = field(default_factory=list)
+    # raw CSS: style="" values and <style> element text
+    css: List[str] = field(default_factory=list)
+    # fill / stroke / stop-color attribute values, font-family stacks and
+    # font-size values as written on elements
+    colors: List[str] = field(default_factory=list)
+    font_stacks: List[str] = field(default_factory=list)
+    font_sizes: List[str] = field(default_factory=list)
+    processing_instructions: List[str] = field(default_factory=list)
+    tags_lower: set = field(default_factory=set)
+    # <text> elements with no child elements, and their text
+    plain_texts: List[str] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, path: Path, content: str) -> 'SvgIndex':
+        """Parse *content*; raises ``ET.ParseError`` when it is not well-formed."""
+        index = cls(path)
+        parser = ET.XMLParser(target=_SvgIndexBuilder(index))
+        parser.feed(content)
+        index.root = parser.close()
+        index.tags_lower = {tag.lower() for tag in index.elements}
+        return index
+
+    def has_tag(self, name: str) -> bool:
+        """Case-insensitive element presence (``name`` in lower case)."""
+        return name in self.tags_lower
+
+    def values(self, attr: str) -> List[str]:
+        return [value for _elem, value in self.attributes.get(attr, ())]
+
+    def hrefs(self) -> List[str]:
+        return self.values('href') + self.values(_XLINK_HREF)
+
+    def image_refs(self) -> List[Tuple[ET.Element, str, Path]]:
+        return _image_refs(self.elements.get('image', ()), self.path.parent)
+
+    @functools.cached_property
+    def text(self) -> str:
+        """All character data, whitespace-collapsed (what a viewer can read)."""
+        return re.sub(r'\s+', ' ', ' '.join(self.root.itertext()))
+
+    def _add_element(self, elem: ET.Element) -> None:
+        self.elements[_local_name(elem.tag)].append(elem)
+        for name, value in elem.attrib.items():
+            self.attributes[name].append((elem, value))
+            if name == 'id':
+                self.ids.add(value)
+            elif name == 'style':
+                self.css.append(value)
+                self.styles.append((elem, _parse_style(value)))
+            elif name in _PAINT_ATTRS:
+                self.colors.append(value)
+            elif name == 'font-family':
+                self.font_stacks.append(value)
+            elif name == 'font-size':
+                self.font_sizes.append(value)
+
+    def _close_element(self, elem: ET.Element) -> None:
+        name = _local_name(elem.tag)
+        if name == 'text':
+            if len(elem) == 0 and elem.text:
+                self.plain_texts.append(elem.text)
+        elif name.lower() == 'style' and elem.text:
+            self.css.append(elem.text)
+
+
+def _parse_style(style: str) -> Dict[str, str]:
+    declarations = {}
+    for declaration in style.split(';'):
+        prop, sep, value = declaration.partition(':')
+        if sep:
+            declarations[prop.strip().lower()] = value.strip()
+    return declarations
+
+
+class _SvgIndexBuilder(ET.TreeBuilder):
+    """Tree builder that fills an SvgIndex as the parser emits elements."""
+
+    def __init__(self, index: SvgIndex):
+        super().__init__()
+        self._index = index
+
+    def start(self, tag, attrs):
+        elem = super().start(tag, attrs)
+        self._index._add_element(elem)
+        return elem
+
+    def end(self, tag):
+        elem = super().end(tag)
+        self._index._close_element(elem)
+        return elem
+
+    def pi(self, target, text=None):
+        self._index.processing_instructions.append(target)
+
+
+@dataclass(frozen=True)
+class QualityRule:
+    """A per-file check, called as ``check(checker, index, result, expected_format)``.
+
+    Rules append to ``result['errors']`` / ``result['warnings']`` /
+    ``result['info']`` and run in registration order after the document has
+    parsed. ``project_only`` rules need project files (spec_lock.md,
+    image_sources.json) and are skipped in template mode.
+    """
+
+    name: str
+    check: Callable[..., None]
+    project_only: bool = False
+
+
+QUALITY_RULES: List[QualityRule] = []
+
+
+def quality_rule(name: str, *, project_only: bool = False):
+    """Register a per-file rule (decorator). Plug-ins register the same way
+    before checks run; the order of registration is the order of findings."""
+    def decorator(func):
+        QUALITY_RULES.append(QualityRule(name, func, project_only))
+        return func
+    return decorator
+
+
 class SVGQualityChecker:
     """SVG quality checker"""
 
@@ -192,8 +465,19 @@ class SVGQualityChecker:
         "04_ending": (),  # ending pages legitimately use varied vocabularies
     }
 
-    def __init__(self, *, template_mode: bool = False):
+    def __init__(self, *, template_mode: bool = False,
+                 workers: int | None = None, use_cache: bool = True):
+        """
+        Args:
+            template_mode: Validate a template directory instead of a project
+            workers: Process-pool size for check_directory; None picks
+                min(cpu, files, 8), <=1 is sequential
+            use_cache: Reuse per-file results of unchanged SVGs from
+                <project>/.cache/svg_quality
+        """
         self.template_mode = template_mode
+        self.workers = workers
+        self.use_cache = use_cache
         self.results = []
         self.summary = {
             'total': 0,
@@ -212,6 +496,7 @@ class SVGQualityChecker:
         }
         self._lock_seen = False  # True once we locate at least one spec_lock.md
         self._source_manifest_cache: Dict[Path, Dict] = {}
+        self._dependency_digests: Dict[Path, str] = {}
         # Template-mode aggregation (populated by check_directory when
         # template_mode=True). Each entry is (severity, kind, message) where
         # severity is 'error' or 'warning'. Printed in print_summary.
@@ -229,11 +514,21 @@ class SVGQualityChecker:
         Returns:
             Check result dictionary
         """
-        svg_path = Path(svg_file)
+        result = self._run_checks(Path(svg_file), expected_format)
+        if result['exists']:
+            self._record_result(result)
+        return result
+
+    def _run_checks(self, svg_path: Path, expected_format: str = None) -> Dict:
+        """Run every per-file check without touching run-wide statistics.
 
+        The result depends only on the file and its inputs, so this can run in
+        a worker process and its result can be cached; ``_record_result``
+        folds it into the summary.
+        """
         if not svg_path.exists():
             return {
-                'file': str(svg_file),
+                'file': str(svg_path),
                 'exists': False,
                 'errors': ['File does not exist'],
                 'warnings': [],
@@ -254,44 +549,15 @@ class SVGQualityChecker:
             with open(svg_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # 0. Check XML well-formedness — every other check assumes the file
-            # is valid XML.  Bail early on failure so the regex-based checks
-            # below don't produce misleading errors on a broken document.
-            if self._check_xml_well_formed(content, result):
-                # 1. Check viewBox
-                self._check_viewbox(content, result, expected_format)
-
-                # 2. Check forbidden elements
-                self._check_forbidden_elements(content, result)
-
-                # 3. Check fonts
-                self._check_fonts(content, result)
-
-                # 4. Check width/height consistency with viewBox
-                self._check_dimensions(content, result)
-
-                # 5. Check text wrapping methods
-                self._check_text_elements(content, result)
-
-                # 6. Check image references (file existence and resolution)
-                self._check_image_references(content, svg_path, result)
-
-                # 7. Check object-level animation anchor quality.
-                self._check_animation_group_ids(content, result)
-
-                # 7b. Check <pattern> elements declare a PPTX preset.
-                self._check_pattern_fills(content, result)
-
-                # 8. Check spec_lock drift (colors / font-family / font-size).
-                #    Templates do not ship a spec_lock.md, so skip in template
-                #    mode to avoid noise.
-                if not self.template_mode:
-                    self._check_spec_lock_drift(content, svg_path, result)
-
-                # 9. Check web-sourced image attribution. Templates don't carry
-                #    image_sources.json; skip in template mode.
-                if not self.template_mode:
-                    self._check_sourced_image_attribution(content, svg_path, result)
+            # Parse once into an SvgIndex. Well-formedness comes first — every
+            # rule assumes a valid document, so a broken file reports only the
+            # XML error instead of misleading follow-up findings.
+            index = self._parse_index(svg_path, content, result)
+            if index is not None:
+                for rule in QUALITY_RULES:
+                    if rule.project_only and self.template_mode:
+                        continue
+                    rule.check(self, index, result, expected_format)
 
             # Determine pass/fail
             result['passed'] = len(result['errors']) == 0
@@ -300,7 +566,10 @@ class SVGQualityChecker:
             result['errors'].append(f"Failed to read file: {e}")
             result['passed'] = False
 
-        # Update statistics
+        return result
+
+    def _record_result(self, result: Dict) -> None:
+        """Fold one per-file result into the run-wide summary and drift tables."""
         self.summary['total'] += 1
         if result['passed']:
             if result['warnings']:
@@ -314,11 +583,18 @@ class SVGQualityChecker:
         for error in result['errors']:
             self.issue_types[self._categorize_issue(error)] += 1
 
+        # spec_lock drift values (present only when a lock was found)
+        drift = result.get('spec_lock_drift')
+        if drift is not None:
+            self._lock_seen = True
+            for category, values in drift.items():
+                for value in values:
+                    self._drift_summary[category][value].add(result['file'])
+
         self.results.append(result)
-        return result
 
-    def _check_xml_well_formed(self, content: str, result: Dict) -> bool:
-        """Check that the SVG content parses as well-formed XML.
+    def _parse_index(self, svg_path: Path, content: str, result: Dict) -> SvgIndex | None:
+        """Parse the SVG into an SvgIndex, checking it is well-formed XML.
 
         SVG is strict XML.  AI-generated decks frequently produce content that
         looks fine in HTML5-tolerant previews but fails strict XML parsing —
@@ -327,11 +603,10 @@ class SVGQualityChecker:
         cannot be exported to PPTX, so we surface them here as a hard error
         before any downstream check looks at them.
 
-        Returns True when the document is well-formed; False otherwise.
+        Returns the index, or None when the document is not well-formed.
         """
         try:
-            ET.fromstring(content)
-            return True
+            return SvgIndex.parse(svg_path, content)
         except ET.ParseError as e:
             result['errors'].append(
                 f"Invalid XML: {e} — SVG must be well-formed XML. "
@@ -339,17 +614,17 @@ class SVGQualityChecker:
                 f"escape XML reserved chars as &amp; &lt; &gt; &quot; &apos; "
                 f"(see references/shared-standards.md §1)."
             )
-            return False
+            return None
 
-    def _check_viewbox(self, content: str, result: Dict, expected_format: str = None):
+    @quality_rule('viewbox')
+    def _check_viewbox(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check viewBox attribute"""
-        viewbox_match = re.search(r'viewBox="([^"]+)"', content)
+        viewbox = index.root.get('viewBox')
 
-        if not viewbox_match:
+        if not viewbox:
             result['errors'].append("Missing viewBox attribute")
             return
 
-        viewbox = viewbox_match.group(1)
         result['info']['viewbox'] = viewbox
 
         # Check format
@@ -364,9 +639,10 @@ class SVGQualityChecker:
                     f"viewBox mismatch: expected '{expected_viewbox}', got '{viewbox}'"
                 )
 
-    def _check_forbidden_elements(self, content: str, result: Dict):
+    @quality_rule('forbidden_elements')
+    def _check_forbidden_elements(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check forbidden elements (blocklist)"""
-        content_lower = content.lower()
+        css_lower = '\n'.join(index.css).lower()
 
         # ============================================================
         # Forbidden elements blocklist - PPT incompatible
@@ -376,99 +652,106 @@ class SVGQualityChecker:
         # clipPath is allowed on <image> elements and on pptx_to_svg-generated
         # nested crop <svg data-pptx-crop="1"> wrappers. Both map back to
         # DrawingML picture geometry in the native converter.
-        if '<clippath' in content_lower:
+        if index.has_tag('clippath'):
             # clip-path on non-image elements → error
-            clip_on_non_image = re.search(
-                r'<(?!image\b)(?!svg\b[^>]*\bdata-pptx-crop\s*=\s*["\']1["\'])\w+[^>]*\bclip-path\s*=',
-                content,
-                re.IGNORECASE,
-            )
-            if clip_on_non_image:
+            for elem, _value in index.attributes.get('clip-path', ()):
+                tag = _local_name(elem.tag).lower()
+                if tag == 'image' or (tag == 'svg' and elem.get('data-pptx-crop') == '1'):
+                    continue
                 result['errors'].append(
                     "clip-path is only allowed on <image> elements or "
                     "pptx_to_svg crop wrappers — for shapes, draw the target "
                     "shape directly instead of clipping")
+                break
             # Check that every clip-path reference has a matching <clipPath> def
-            clip_refs = re.findall(r'clip-path\s*=\s*["\']url\(#([^)]+)\)', content)
-            for ref_id in clip_refs:
-                if f'id="{ref_id}"' not in content and f"id='{ref_id}'" not in content:
+            for value in index.values('clip-path'):
+                ref = re.match(r'url\(#([^)]+)\)', value)
+                if ref and ref.group(1) not in index.ids:
+                    ref_id = ref.group(1)
                     result['errors'].append(
                         f"clip-path references #{ref_id} but no matching "
                         f"<clipPath id=\"{ref_id}\"> definition found")
-        if '<mask' in content_lower:
+        if index.has_tag('mask'):
             result['errors'].append("Detected forbidden <mask> element (PPT does not support SVG masks)")
 
         # Style system
-        if '<style' in content_lower:
+        if index.has_tag('style'):
             result['errors'].append("Detected forbidden <style> element (use inline attributes instead)")
-        if re.search(r'\bclass\s*=', content):
+        if 'class' in index.attributes:
             result['errors'].append("Detected forbidden class attribute (use inline styles instead)")
         # id attribute: only report error when <style> also exists (id is harmful only with CSS selectors)
         # id inside <defs> for linearGradient/filter etc. is required, Inkscape also auto-adds id to elements,
         # standalone id attributes have no impact on PPT export
-        if '<style' in content_lower and re.search(r'\bid\s*=', content):
+        if index.has_tag('style') and index.ids:
             result['errors'].append(
                 "Detected id attribute used with <style> (CSS selectors forbidden, use inline styles instead)"
             )
-        if re.search(r'<\?xml-stylesheet\b', content_lower):
+        if any(pi.lower() == 'xml-stylesheet' for pi in index.processing_instructions):
             result['errors'].append("Detected forbidden xml-stylesheet (external CSS references forbidden)")
-        if re.search(r'<link[^>]*rel\s*=\s*["\']stylesheet["\']', content_lower):
+        if any(_local_name(elem.tag).lower() == 'link' and value.lower() == 'stylesheet'
+               for elem, value in index.attributes.get('rel', ())):
             result['errors'].append("Detected forbidden <link rel=\"stylesheet\"> (external CSS references forbidden)")
-        if re.search(r'@import\s+', content_lower):
+        if re.search(r'@import\s+', css_lower):
             result['errors'].append("Detected forbidden @import (external CSS references forbidden)")
 
         # Structure / nesting
-        if '<foreignobject' in content_lower:
+        if index.has_tag('foreignobject'):
             result['errors'].append(
                 "Detected forbidden <foreignObject> element (use <tspan> for manual line breaks)")
-        has_symbol = '<symbol' in content_lower
-        has_use = re.search(r'<use\b', content_lower) is not None
-        if has_symbol and has_use:
+        if index.has_tag('symbol') and index.has_tag('use'):
             result['errors'].append("Detected forbidden <symbol> + <use> complex usage (use basic shapes or simple <use> instead)")
         # marker-start / marker-end are conditionally allowed (see shared-standards.md §1.1).
         # The converter maps qualifying <marker> defs to native DrawingML <a:headEnd>/<a:tailEnd>.
         # We only warn when a marker is used without an obvious <defs> definition in the same file.
-        if re.search(r'\bmarker-(?:start|end)\s*=\s*["\']url\(#([^)]+)\)', content_lower):
-            if '<marker' not in content_lower:
+        marker_refs = index.values('marker-start') + index.values('marker-end')
+        if any(re.match(r'url\(#[^)]+\)', value.lower()) for value in marker_refs):
+            if not index.has_tag('marker'):
                 result['errors'].append(
                     "Detected marker-start/marker-end referencing a marker id, "
                     "but no <marker> element found in the file")
 
         # Text / fonts
-        if '<textpath' in content_lower:
+        if index.has_tag('textpath'):
             result['errors'].append("Detected forbidden <textPath> element (path text is incompatible with PPT)")
-        if '@font-face' in content_lower:
+        if '@font-face' in css_lower:
             result['errors'].append("Detected forbidden @font-face (use system font stack)")
 
         # Animation / interaction
-        if re.search(r'<animate', content_lower):
+        if any(tag.startswith('animate') for tag in index.tags_lower):
             result['errors'].append("Detected forbidden SMIL animation element <animate*> (SVG animations are not exported)")
-        if re.search(r'<set\b', content_lower):
+        if index.has_tag('set'):
             result['errors'].append("Detected forbidden SMIL animation element <set> (SVG animations are not exported)")
-        if '<script' in content_lower:
+        if index.has_tag('script'):
             result['errors'].append("Detected forbidden <script> element (scripts and event handlers forbidden)")
-        if re.search(r'\bon\w+\s*=', content):  # onclick, onload etc.
+        if any(re.match(r'on\w', _local_name(name)) for name in index.attributes):  # onclick, onload etc.
             result['errors'].append("Detected forbidden event attributes (e.g., onclick, onload)")
 
         # Other discouraged elements
-        if '<iframe' in content_lower:
+        if index.has_tag('iframe'):
             result['errors'].append("Detected <iframe> element (should not appear in SVG)")
-        if re.search(r'rgba\s*\(', content_lower):
+        if re.search(r'rgba\s*\(', css_lower) or any(
+                re.search(r'rgba\s*\(', value, re.IGNORECASE)
+                for values in index.attributes.values() for _elem, value in values
+                if '(' in value):
             result['errors'].append("Detected forbidden rgba() color (use fill-opacity/stroke-opacity instead)")
-        if re.search(r'<g[^>]*\sopacity\s*=', content_lower):
+        opacity_tags = {_local_name(elem.tag).lower() for elem, _value in index.attributes.get('opacity', ())}
+        if 'g' in opacity_tags:
             result['errors'].append("Detected forbidden <g opacity> (set opacity on each child element individually)")
-        if re.search(r'<image[^>]*\sopacity\s*=', content_lower):
+        if 'image' in opacity_tags:
             result['errors'].append("Detected forbidden <image opacity> (use overlay mask approach)")
 
-    def _check_fonts(self, content: str, result: Dict):
+    @quality_rule('fonts')
+    def _check_fonts(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check font usage.
 
         PPTX stores a single `typeface` per run with no runtime fallback, so every
         stack must END with a cross-platform pre-installed family. See
         strategist.md §g "PPT-safe font discipline".
         """
-        font_matches = re.findall(
-            r'font-family[:\s]*["\']([^"\']+)["\']', content, re.IGNORECASE)
+        font_matches = [
+            match for css in index.css
+            for match in re.findall(r'font-family[:\s]*["\']([^"\']+)["\']', css, re.IGNORECASE)
+        ]
 
         if not font_matches:
             return
@@ -508,14 +791,13 @@ class SVGQualityChecker:
                 )
                 break
 
-    def _check_dimensions(self, content: str, result: Dict):
+    @quality_rule('dimensions')
+    def _check_dimensions(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check width/height consistency with viewBox"""
-        width_match = re.search(r'width="(\d+)"', content)
-        height_match = re.search(r'height="(\d+)"', content)
+        width = index.root.get('width', '')
+        height = index.root.get('height', '')
 
-        if width_match and height_match:
-            width = width_match.group(1)
-            height = height_match.group(1)
+        if width.isdigit() and height.isdigit():
             result['info']['dimensions'] = f"{width}x{height}"
 
             # Check consistency with viewBox
@@ -529,59 +811,37 @@ class SVGQualityChecker:
                             f"({vb_width}x{vb_height})"
                         )
 
-    def _check_text_elements(self, content: str, result: Dict):
+    @quality_rule('text_elements')
+    def _check_text_elements(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check text elements and wrapping methods"""
         # Count text and tspan elements
-        text_count = content.count('<text')
-        tspan_count = content.count('<tspan')
+        text_count = sum(len(elems) for tag, elems in index.elements.items()
+                         if tag.startswith('text'))
+        tspan_count = sum(len(elems) for tag, elems in index.elements.items()
+                          if tag.startswith('tspan'))
 
         result['info']['text_elements'] = text_count
         result['info']['tspan_elements'] = tspan_count
 
         # Check for overly long single-line text (may need wrapping)
-        text_matches = re.findall(r'<text[^>]*>([^<]{100,})</text>', content)
-        if text_matches:
+        long_texts = [text for text in index.plain_texts if len(text) >= 100]
+        if long_texts:
             result['warnings'].append(
-                f"Detected {len(text_matches)} potentially overly long single-line text(s) (consider using tspan for wrapping)"
+                f"Detected {len(long_texts)} potentially overly long single-line text(s) (consider using tspan for wrapping)"
             )
 
-    def _check_image_references(self, content: str, svg_path: Path, result: Dict):
+    @quality_rule('image_references')
+    def _check_image_references(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Check image file existence and resolution vs display size."""
-        # Find all <image ...> elements (capture the full tag)
-        img_tag_pattern = re.compile(r'<image\b([^>]*)/?>', re.IGNORECASE)
-
-        svg_dir = svg_path.parent
-        checked = set()
-
-        for tag_match in img_tag_pattern.finditer(content):
-            attrs = tag_match.group(1)
-
-            # Extract href (prefer href over xlink:href)
-            href_match = (
-                re.search(r'\bhref="(?!data:)([^"]+)"', attrs) or
-                re.search(r'\bxlink:href="(?!data:)([^"]+)"', attrs)
-            )
-            if not href_match:
-                continue
-
-            href = href_match.group(1)
-            if href in checked:
-                continue
-            checked.add(href)
-
-            # Resolve path relative to SVG file directory
-            img_path = (svg_dir / href).resolve()
-
+        for elem, href, img_path in index.image_refs():
             if not img_path.exists():
                 result['errors'].append(
                     f"Image file not found: {href} (resolved to {img_path})")
                 continue
 
             # Check resolution vs display size
-            w_match = re.search(r'\bwidth="([^"]+)"', attrs)
-            h_match = re.search(r'\bheight="([^"]+)"', attrs)
-            display_w_str = w_match.group(1) if w_match else None
-            display_h_str = h_match.group(1) if h_match else None
+            display_w_str = elem.get('width')
+            display_h_str = elem.get('height')
             if not display_w_str or not display_h_str:
                 continue
 
@@ -591,40 +851,32 @@ class SVGQualityChecker:
             except (ValueError, TypeError):
                 continue
 
-            try:
-                from PIL import Image as PILImage
-                with PILImage.open(img_path) as img:
-                    actual_w, actual_h = img.size
-
-                if actual_w < display_w or actual_h < display_h:
-                    result['warnings'].append(
-                        f"Image {href} is {actual_w}x{actual_h} but displayed at "
-                        f"{int(display_w)}x{int(display_h)} — may appear blurry")
-                elif actual_w > display_w * 4 and actual_h > display_h * 4:
-                    result['warnings'].append(
-                        f"Image {href} is {actual_w}x{actual_h} but displayed at "
-                        f"{int(display_w)}x{int(display_h)} — consider downsizing "
-                        f"to reduce file size")
-            except ImportError:
-                pass  # PIL not available, skip resolution check
-            except Exception:
-                pass  # Image unreadable, skip resolution check
+            actual_size = _image_size(img_path)
+            if actual_size is None:
+                continue  # PIL not available or image unreadable
+            actual_w, actual_h = actual_size
 
-    def _check_animation_group_ids(self, content: str, result: Dict):
-        """Warn when visible top-level groups cannot be customized."""
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError:
-            return
+            if actual_w < display_w or actual_h < display_h:
+                result['warnings'].append(
+                    f"Image {href} is {actual_w}x{actual_h} but displayed at "
+                    f"{int(display_w)}x{int(display_h)} — may appear blurry")
+            elif actual_w > display_w * 4 and actual_h > display_h * 4:
+                result['warnings'].append(
+                    f"Image {href} is {actual_w}x{actual_h} but displayed at "
+                    f"{int(display_w)}x{int(display_h)} — consider downsizing "
+                    f"to reduce file size")
 
+    @quality_rule('animation_group_ids')
+    def _check_animation_group_ids(self, index: SvgIndex, result: Dict, expected_format: str = None):
+        """Warn when visible top-level groups cannot be customized."""
         non_visual = {'defs', 'title', 'desc', 'metadata', 'style'}
-        for index, child in enumerate(list(root), start=1):
+        for position, child in enumerate(index.root, start=1):
             tag = child.tag.split('}', 1)[-1]
             if tag in non_visual:
                 continue
             if tag == 'g' and not child.get('id'):
                 result['warnings'].append(
-                    f"Top-level visible <g> #{index} has no id; "
+                    f"Top-level visible <g> #{position} has no id; "
                     "object-level animation config cannot reference it"
                 )
 
@@ -644,7 +896,8 @@ class SVGQualityChecker:
         'divot', 'shingle',
     })
 
-    def _check_pattern_fills(self, content: str, result: Dict):
+    @quality_rule('pattern_fills')
+    def _check_pattern_fills(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Audit <pattern> defs that drive PPTX <a:pattFill> output.
 
         svg_to_pptx maps <pattern fill> to native <a:pattFill prst="...">. The
@@ -662,12 +915,9 @@ class SVGQualityChecker:
            value) is the canonical mistake; the only grids are `smGrid` /
            `lgGrid` / `dotGrid`.
         """
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError:
-            return
-
-        for pattern in root.iter(f'{{{SVG_NS}}}pattern'):
+        for pattern in index.elements.get('pattern', ()):
+            if pattern.tag != f'{{{SVG_NS}}}pattern':
+                continue
             pat_id = pattern.get('id', '<unnamed>')
             prst = pattern.get('data-pptx-pattern')
             if not prst:
@@ -699,31 +949,36 @@ class SVGQualityChecker:
         """
         if _parse_spec_lock is None:
             return None
+        candidate = self._find_spec_lock(svg_path)
+        if candidate is None:
+            return None
+        if candidate not in self._lock_cache:
+            try:
+                data = _parse_spec_lock(candidate)
+            except Exception:
+                data = None
+            self._lock_cache[candidate] = data
+        return self._lock_cache[candidate]
+
+    @staticmethod
+    def _find_spec_lock(svg_path: Path) -> Path | None:
         for candidate in (svg_path.parent / 'spec_lock.md',
                           svg_path.parent.parent / 'spec_lock.md'):
-            if candidate in self._lock_cache:
-                return self._lock_cache[candidate]
             if candidate.exists():
-                try:
-                    data = _parse_spec_lock(candidate)
-                except Exception:
-                    data = None
-                self._lock_cache[candidate] = data
-                if data is not None:
-                    self._lock_seen = True
-                return data
+                return candidate
         return None
 
-    def _check_spec_lock_drift(self, content: str, svg_path: Path, result: Dict):
+    @quality_rule('spec_lock_drift', project_only=True)
+    def _check_spec_lock_drift(self, index: SvgIndex, result: Dict, expected_format: str = None):
         """Detect values used in the SVG that fall outside spec_lock.md.
 
         Covers colors (fill / stroke / stop-color), font-family, and font-size.
         Emits per-file warnings summarising the drift counts; exact drifting
-        values are accumulated in self._drift_summary for the end-of-run
+        values are stored in result['spec_lock_drift'] for the end-of-run
         aggregation. When spec_lock.md is missing, silently skip (consistent
         with executor-base.md §2.1's 'missing lock → warn and proceed' policy).
         """
-        lock = self._get_spec_lock(svg_path)
+        lock = self._get_spec_lock(index.path)
         if lock is None:
             return
 
@@ -765,22 +1020,17 @@ class SVGQualityChecker:
                 except (ValueError, TypeError):
                     body_px = None
 
-        # Scan SVG for used values
+        # Values used in the SVG (each distinct value is judged once)
         color_drifts = set()
-        for attr in ('fill', 'stroke', 'stop-color'):
-            pattern = re.compile(rf'\b{attr}\s*=\s*["\'](#[0-9A-Fa-f]{{3,8}})["\']')
-            for m in pattern.finditer(content):
-                val = m.group(1).upper()
-                if val not in allowed_colors:
-                    color_drifts.add(val)
+        for value in set(index.colors):
+            if HEX_VALUE_RE.fullmatch(value) and value.upper() not in allowed_colors:
+                color_drifts.add(value.upper())
 
         font_drifts = set()
-        # Capture to the matching delimiter (group 1) so a double-quoted stack
-        # containing single-quoted family names is not truncated at the inner quote.
-        for m in re.finditer(r'font-family\s*=\s*(["\'])(.*?)\1', content):
-            val = m.group(2).strip()
-            if allowed_fonts and self._normalize_font_stack(val) not in allowed_fonts:
-                font_drifts.add(val)
+        if allowed_fonts:
+            for value in {stack.strip() for stack in index.font_stacks}:
+                if self._normalize_font_stack(value) not in allowed_fonts:
+                    font_drifts.add(value)
 
         # Poster / showcase contexts use unbounded hero type — drop the ceiling.
         mode = (lock.get('mode', {}).get('mode') or '').strip().lower()
@@ -789,8 +1039,8 @@ class SVGQualityChecker:
                      else RAMP_MAX_RATIO)
 
         size_drifts = set()
-        for m in re.finditer(r'font-size\s*=\s*["\']([^"\']+)["\']', content):
-            val = self._normalize_size(m.group(1))
+        for value in set(index.font_sizes):
+            val = self._normalize_size(value)
             if not allowed_sizes or val in allowed_sizes:
                 continue
             # Intermediate values are allowed when they sit inside the ramp
@@ -804,14 +1054,12 @@ class SVGQualityChecker:
                     pass
             size_drifts.add(val)
 
-        # Record in run-wide aggregation
-        fname = svg_path.name
-        for v in color_drifts:
-            self._drift_summary['colors'][v].add(fname)
-        for v in font_drifts:
-            self._drift_summary['fonts'][v].add(fname)
-        for v in size_drifts:
-            self._drift_summary['sizes'][v].add(fname)
+        # Exact values for the run-wide aggregation (see _record_result)
+        result['spec_lock_drift'] = {
+            'colors': sorted(color_drifts),
+            'fonts': sorted(font_drifts),
+            'sizes': sorted(size_drifts),
+        }
 
         # Per-file warning (one condensed line; details live in summary)
         parts = []
@@ -853,7 +1101,9 @@ class SVGQualityChecker:
         self._source_manifest_cache[manifest_path] = payload
         return payload
 
-    def _check_sourced_image_attribution(self, content: str, svg_path: Path, result: Dict):
+    @quality_rule('sourced_image_attribution', project_only=True)
+    def _check_sourced_image_attribution(self, index: SvgIndex, result: Dict,
+                                         expected_format: str = None):
         """Require visible credit text for attribution-required web images.
 
         image_search.py records the legal tier in images/image_sources.json;
@@ -861,14 +1111,13 @@ class SVGQualityChecker:
         prevents a quality-first CC BY / CC BY-SA image from silently reaching
         export without attribution.
         """
-        manifest = self._load_image_sources_manifest(svg_path)
+        manifest = self._load_image_sources_manifest(index.path)
         items = manifest.get('items') or []
         if not items:
             return
 
-        text_content = html.unescape(re.sub(r'<[^>]+>', ' ', content))
-        text_content = re.sub(r'\s+', ' ', text_content)
-        svg_stem = svg_path.stem
+        hrefs = index.hrefs()
+        svg_stem = index.path.stem
 
         for item in items:
             if not item.get('attribution_required') and item.get('license_tier') != 'attribution-required':
@@ -876,14 +1125,14 @@ class SVGQualityChecker:
 
             filename = Path(str(item.get('filename') or '')).name
             slide = str(item.get('slide') or '').strip()
-            referenced = bool(filename and filename in content)
+            referenced = bool(filename and any(filename in href for href in hrefs))
             same_slide = bool(slide and slide == svg_stem)
             if not referenced and not same_slide:
                 continue
 
             license_name = str(item.get('license_name') or '').upper()
             license_token = 'CC BY-SA' if 'BY-SA' in license_name else 'CC BY'
-            has_credit = license_token in text_content.upper()
+            has_credit = license_token in index.text.upper()
             if not has_credit:
                 result['errors'].append(
                     f"Missing inline attribution for sourced image {filename or '(unknown)'} "
@@ -957,7 +1206,9 @@ class SVGQualityChecker:
                 )
                 return self.results
 
-        # Find all SVG files
+        # Find all SVG files. Per-file results are cached for project
+        # directories only; template directories live inside the skill.
+        cache_dir = None
         if dir_path.is_file():
             svg_files = [dir_path]
         else:
@@ -969,6 +1220,9 @@ class SVGQualityChecker:
                     'svg_output' if (
                         dir_path / 'svg_output').exists() else dir_path
                 svg_files = sorted(svg_output.glob('*.svg'))
+                if self.use_cache:
+                    project_path = dir_path if svg_output != dir_path else dir_path.parent
+                    cache_dir = project_path / '.cache' / 'svg_quality' / svg_output.name
 
         if not svg_files:
             print(f"[WARN] No SVG files found")
@@ -976,8 +1230,8 @@ class SVGQualityChecker:
 
         print(f"\n[SCAN] Checking {len(svg_files)} SVG file(s)...\n")
 
-        for svg_file in svg_files:
-            result = self.check_file(str(svg_file), expected_format)
+        for result in self._check_files(svg_files, expected_format, cache_dir):
+            self._record_result(result)
             self._print_result(result)
 
         if self.template_mode and dir_path.is_dir():
@@ -987,6 +1241,152 @@ class SVGQualityChecker:
 
         return self.results
 
+    def _check_files(self, svg_files: List[Path], expected_format: str | None,
+                     cache_dir: Path | None) -> List[Dict]:
+        """Per-file results in file order: cached ones reused, the rest checked
+        sequentially or in a process pool."""
+        results: List[Dict | None] = [None] * len(svg_files)
+        keys: List[str | None] = [None] * len(svg_files)
+        if cache_dir is not None:
+            self._load_image_sizes(cache_dir.parent)
+            for i, svg_file in enumerate(svg_files):
+                keys[i] = self._result_cache_key(svg_file, expected_format)
+                results[i] = self._load_cached_result(cache_dir, keys[i])
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < len(svg_files):
+            print(f"[CACHE] {len(svg_files) - len(pending)} unchanged file(s) reused, "
+                  f"{len(pending)} to check\n")
+
+        workers = self.workers
+        if workers is None:
+            workers = min(os.cpu_count() or 2, len(pending), 8)
+        if workers <= 1 or len(pending) <= 2:
+            for i in pending:
+                results[i] = self._run_checks(svg_files[i], expected_format)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.template_mode, dict(_image_sizes)),
+            ) as pool:
+                outcomes = pool.map(
+                    _run_checks_in_worker,
+                    [str(svg_files[i]) for i in pending],
+                    [expected_format] * len(pending),
+                )
+                for i, (result, new_sizes) in zip(pending, outcomes):
+                    results[i] = result
+                    _image_sizes.update(new_sizes)
+                    _image_sizes_dirty.update(new_sizes)
+
+        if cache_dir is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                for i in pending:
+                    if keys[i] is not None:
+                        _atomic_write(cache_dir / f'{keys[i]}.json',
+                                      json.dumps(results[i], ensure_ascii=False).encode('utf-8'))
+                self._prune_result_cache(cache_dir, {key for key in keys if key})
+                self._save_image_sizes(cache_dir.parent)
+            except OSError as e:
+                print(f"[WARN] Could not update result cache {cache_dir}: {e}")
+        return results
+
+    def _dependency_digest(self, path: Path | None) -> str | None:
+        if path is None:
+            return None
+        if path not in self._dependency_digests:
+            try:
+                self._dependency_digests[path] = _file_digest(path)
+            except OSError:
+                self._dependency_digests[path] = 'unreadable'
+        return self._dependency_digests[path]
+
+    def _result_cache_key(self, svg_path: Path, expected_format: str | None) -> str | None:
+        """Cache key: SVG content + spec_lock + checker version + the other
+        inputs of a per-file result (image files, image_sources.json, options)."""
+        try:
+            svg_bytes = svg_path.read_bytes()
+        except OSError:
+            return None
+        # The same references the image rule reads (see _image_refs), so
+        # quoting, entities and xlink:href cannot hide an image from the key.
+        # A plain parse is enough for that; without "image" in the bytes there
+        # is no <image> element to find. A file that does not parse only
+        # reports the XML error, which depends on its bytes alone.
+        refs = []
+        if b'image' in svg_bytes:
+            try:
+                root = ET.fromstring(svg_bytes)
+                refs = _image_refs((elem for elem in root.iter()
+                                    if _local_name(elem.tag) == 'image'), svg_path.parent)
+            except ET.ParseError:
+                pass
+        images = []
+        for _elem, href, img_path in refs:
+            # Existence and pixel size are what the checks read; stat
+            # changes whenever either can.
+            try:
+                st = img_path.stat()
+                images.append(f'{href}:{st.st_mtime_ns}:{st.st_size}')
+            except OSError:
+                images.append(f'{href}:missing')
+
+        h = hashlib.sha256(svg_bytes)
+        h.update(json.dumps({
+            'format': _CACHE_FORMAT,
+            'checker': _checker_fingerprint(),
+            'spec_lock': self._dependency_digest(self._find_spec_lock(svg_path)),
+            'image_sources': self._dependency_digest(self._find_image_sources_manifest(svg_path)),
+            'images': images,
+            'path': [str(svg_path), str(svg_path.resolve())],
+            'expected_format': expected_format,
+            'template_mode': self.template_mode,
+        }, sort_keys=True).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def _load_cached_result(cache_dir: Path, key: str | None) -> Dict | None:
+        if key is None:
+            return None
+        try:
+            return json.loads((cache_dir / f'{key}.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _prune_result_cache(cache_dir: Path, keep: set) -> None:
+        """Drop results of SVGs that no longer exist in this form."""
+        for entry in cache_dir.glob('*.json'):
+            if entry.stem not in keep:
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _load_image_sizes(cache_root: Path) -> None:
+        try:
+            stored = json.loads((cache_root / _IMAGE_SIZES_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        for key, entry in stored.items():
+            _image_sizes.setdefault(key, entry)
+
+    @staticmethod
+    def _save_image_sizes(cache_root: Path) -> None:
+        """Merge newly measured image sizes into the project's size table."""
+        if not _image_sizes_dirty:
+            return
+        try:
+            stored = json.loads((cache_root / _IMAGE_SIZES_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            stored = {}
+        stored.update(_take_new_image_sizes())
+        stored = {key: entry for key, entry in stored.items() if os.path.exists(key)}
+        _atomic_write(cache_root / _IMAGE_SIZES_FILE,
+                      json.dumps(stored, sort_keys=True).encode('utf-8'))
+
     def _check_animation_config_contract(self, dir_path: Path) -> None:
         """Project-level animations.json reference checks."""
         if _load_animation_config is None or _validate_animation_config is None:
@@ -1448,6 +1848,9 @@ def print_usage() -> None:
     print("                                  glob *.svg directly, skip spec_lock checks,")
     print("                                  enforce roster ↔ design_spec.md Page Roster consistency,")
     print("                                  and emit advisory placeholder-convention warnings.")
+    print("  --workers <n>                 Parallel workers (default: min(cpu, files, 8); 1 = sequential)")
+    print("  --no-cache                    Re-check every file; do not read or write")
+    print("                                  <project>/.cache/svg_quality")
 
 
 def main() -> None:
@@ -1466,7 +1869,20 @@ def main() -> None:
         sys.exit(1)
 
     template_mode = '--template-mode' in sys.argv
-    checker = SVGQualityChecker(template_mode=template_mode)
+    workers = None
+    if '--workers' in sys.argv:
+        idx = sys.argv.index('--workers')
+        if idx + 1 < len(sys.argv):
+            try:
+                workers = int(sys.argv[idx + 1])
+            except ValueError:
+                print(f"[ERROR] --workers expects an integer, got: {sys.argv[idx + 1]}")
+                sys.exit(1)
+    checker = SVGQualityChecker(
+        template_mode=template_mode,
+        workers=workers,
+        use_cache='--no-cache' not in sys.argv,
+    )
 
     # Parse arguments
     target = sys.argv[1]
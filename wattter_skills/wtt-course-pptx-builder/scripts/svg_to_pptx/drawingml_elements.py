@@ -6,6 +6,8 @@ import io
 import math
 import re
 import base64
+import sys
+from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -28,6 +30,10 @@ from .drawingml_paths import (
     PathCommand, parse_svg_path, svg_path_to_absolute,
     normalize_path_commands, path_commands_to_drawingml,
 )
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from svg_finalize.sidecar_media import sidecar_digest  # noqa: E402
 
 
 def _wrap_shape(
@@ -1079,6 +1085,7 @@ def convert_text(elem: ET.Element, ctx: ConvertContext) -> ShapeResult | None:
                     ''.join(r['text'] for r in line_runs),
                     font_size,
                     font_weight,
+                    font_family_str,
                 )
             )
             soft_break = child.get('data-paragraph-soft-break') == '1'
@@ -1136,7 +1143,7 @@ def convert_text(elem: ET.Element, ctx: ConvertContext) -> ShapeResult | None:
             + font_size * 1.5
         )
     else:
-        text_width = estimate_text_width(full_text, font_size, font_weight) * 1.05
+        text_width = estimate_text_width(full_text, font_size, font_weight, font_family_str) * 1.05
         text_height = font_size * 1.5
     padding = font_size * 0.1
 
@@ -1696,8 +1703,14 @@ def convert_image(elem: ET.Element, ctx: ConvertContext) -> ShapeResult | None:
             img_format = 'jpg'
         img_data = img_path.read_bytes()
 
-    img_idx = len(ctx.media_files) + 1
-    img_filename = f's{ctx.slide_num}_img{img_idx}.{img_format}'
+    digest = sidecar_digest(href)
+    if digest:
+        # Content-addressed sidecar blob: its name already is the hash the
+        # package dedups media by.
+        img_filename = f's{ctx.slide_num}_{digest}.{img_format}'
+    else:
+        img_idx = len(ctx.media_files) + 1
+        img_filename = f's{ctx.slide_num}_img{img_idx}.{img_format}'
     ctx.media_files[img_filename] = img_data
 
     r_id = ctx.next_rel_id()
@@ -1897,8 +1910,14 @@ def convert_nested_svg(elem: ET.Element, ctx: ConvertContext) -> ShapeResult | N
             img_format = 'jpg'
         img_data = img_path.read_bytes()
 
-    img_idx = len(ctx.media_files) + 1
-    img_filename = f's{ctx.slide_num}_img{img_idx}.{img_format}'
+    digest = sidecar_digest(href)
+    if digest:
+        # Content-addressed sidecar blob: its name already is the hash the
+        # package dedups media by.
+        img_filename = f's{ctx.slide_num}_{digest}.{img_format}'
+    else:
+        img_idx = len(ctx.media_files) + 1
+        img_filename = f's{ctx.slide_num}_img{img_idx}.{img_format}'
     ctx.media_files[img_filename] = img_data
 
     r_id = ctx.next_rel_id()
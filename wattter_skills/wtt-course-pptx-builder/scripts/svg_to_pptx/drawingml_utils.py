@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
 import math
+import sys
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
 from .drawingml_context import AffineMatrix, ConvertContext, IDENTITY_MATRIX
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from text_metrics import text_width  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -441,30 +449,33 @@ def is_cjk_char(ch: str) -> bool:
             0x20000 <= cp <= 0x2A6DF)
 
 
-def estimate_text_width(text: str, font_size: float, font_weight: str = '400') -> float:
-    """Estimate text width in SVG pixels."""
-    width = 0.0
-    for ch in text:
-        if is_cjk_char(ch):
-            width += font_size
-        elif ch == ' ':
-            width += font_size * 0.3
-        elif ch in 'mMwWOQ%':
-            width += font_size * 0.75
-        elif ch in 'iIlj!|':
-            width += font_size * 0.3
-        elif ch.isdigit():
-            # digits are tabular (uniform ~0.55em) in most UI fonts, including
-            # '1' — classing it with 'il|' under-sizes the box and makes
-            # renderers that ignore wrap="none" (LibreOffice) wrap the line
-            width += font_size * 0.55
-        else:
-            width += font_size * 0.55
+def estimate_text_width(
+    text: str,
+    font_size: float,
+    font_weight: str = '400',
+    font_family: str | None = None,
+) -> float:
+    """Estimate text width in SVG pixels.
+
+    Uses the installed fonts of the ``font_family`` stack when available (see
+    text_metrics); otherwise the character-class heuristic, with bold
+    weights widening the whole string by 5%.
+    """
+    bold = font_weight in ('bold', '600', '700', '800', '900')
+    return text_width(text, font_size, font_family, bold, bold_cjk=True)
+
+
+# Media read from a content-addressed sidecar store are named
+# s<slide>_<sha256>.<ext>, so their digest never has to be recomputed.
+_HASHED_MEDIA_NAME_RE = re.compile(r'^s\d+_([0-9a-f]{64})\.[A-Za-z0-9]+$')
 
-    if font_weight in ('bold', '600', '700', '800', '900'):
-        width *= 1.05
 
-    return width
+def media_digest(media_name: str, data: bytes) -> str:
+    """SHA-256 of a slide media file, taken from its name when it carries one."""
+    match = _HASHED_MEDIA_NAME_RE.match(media_name)
+    if match:
+        return match.group(1)
+    return hashlib.sha256(data).hexdigest()
 
 
 def _xml_escape(text: str) -> str:
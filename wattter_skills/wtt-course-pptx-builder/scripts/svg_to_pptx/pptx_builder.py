@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import hashlib
+import io
 import json
 import mimetypes
 import os
 import re
-import posixpath
 import shutil
+import sys
 import tempfile
-import zipfile
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,7 +19,6 @@ from xml.sax.saxutils import escape
 from pptx import Presentation
 from pptx.util import Emu
 
-from .drawingml_converter import convert_svg_to_slide_shapes
 from .pptx_dimensions import (
     CANVAS_FORMATS,
     get_slide_dimensions, get_pixel_dimensions,
@@ -45,11 +43,19 @@ from .pptx_narration import (
     next_shape_id,
     probe_audio_duration,
 )
+from .drawingml_utils import media_digest
+from .pptx_native_cache import convert_svg_to_slide_shapes_cached, prune_native_cache
+from .pptx_package import PptxPackage
 from .pptx_slide_xml import (
     ANIMATIONS_AVAILABLE, TRANSITIONS,
     create_slide_xml_with_svg, create_slide_rels_xml,
 )
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from svg_finalize.sidecar_media import inline_sidecar_media  # noqa: E402
+
 # Re-import create_transition_xml only if available
 try:
     from pptx_animations import (
@@ -63,31 +69,6 @@ except ImportError:
     pick_animation_effect = None
 
 
-def _append_relationship(
-    rels_path: Path,
-    rel_type: str,
-    target: str,
-) -> str:
-    """Append a relationship entry with the next available rId."""
-    with open(rels_path, 'r', encoding='utf-8') as f:
-        rels_content = f.read()
-
-    rid_numbers = [int(match) for match in re.findall(r'Id="rId(\d+)"', rels_content)]
-    next_rid = f'rId{max(rid_numbers, default=0) + 1}'
-    rel_xml = (
-        f'  <Relationship Id="{next_rid}" '
-        f'Type="{rel_type}" Target="{target}"/>'
-    )
-    rels_content = rels_content.replace(
-        '</Relationships>', rel_xml + '\n</Relationships>',
-    )
-
-    with open(rels_path, 'w', encoding='utf-8') as f:
-        f.write(rels_content)
-
-    return next_rid
-
-
 def _add_default_content_type(content_types: str, extension: str, content_type: str) -> str:
     """Add a Default content type if it is not already present."""
     ext = extension.lstrip(".")
@@ -242,21 +223,21 @@ def _build_sequence_targets(
 
 def _prerender_legacy_pngs(
     svg_files: list[Path],
-    media_dir: Path,
+    png_dir: Path,
     pixel_width: int,
     pixel_height: int,
     cache_dir: Path | None,
     workers: int,
     verbose: bool,
 ) -> dict[int, bool]:
-    """Render every SVG→PNG into media_dir in parallel.
+    """Render every SVG→PNG into png_dir in parallel.
 
     Returns {1-based slide index: success}. Falls back to sequential when
     workers<=1 or len(svg_files)<=2.
     """
     results: dict[int, bool] = {}
     targets: list[tuple[int, Path, Path]] = [
-        (i, svg, media_dir / f'image{i}.png')
+        (i, svg, png_dir / f'image{i}.png')
         for i, svg in enumerate(svg_files, 1)
     ]
 
@@ -295,38 +276,68 @@ def _prerender_legacy_pngs(
     return results
 
 
-_REL_TARGET_RE = re.compile(r'<Relationship\b[^/]*?/>', re.DOTALL)
-_TARGET_ATTR_RE = re.compile(r'Target="([^"]+)"')
-_TARGET_MODE_EXT_RE = re.compile(r'TargetMode="External"')
+def _convert_native_slide(
+    svg_path: Path,
+    slide_num: int,
+    merge_paragraphs: bool,
+    with_trace: bool,
+    pixel_size: tuple[int, int],
+    native_cache_dir: Path | None,
+) -> tuple[
+    str, dict[str, bytes], list[dict[str, str]], list[tuple[int, str]],
+    list[dict[str, Any]], str | None,
+]:
+    """Worker: convert one SVG to DrawingML. Module-level so it pickles.
+
+    Returns the four ``convert_svg_to_slide_shapes`` outputs plus the slide's
+    trace entries (empty when *with_trace* is False) and its native cache key.
+    """
+    trace: list[dict[str, Any]] | None = [] if with_trace else None
+    (slide_xml, media_files, rel_entries, anim_targets), cache_key = (
+        convert_svg_to_slide_shapes_cached(
+            svg_path, slide_num, merge_paragraphs, pixel_size,
+            cache_dir=native_cache_dir, trace_out=trace,
+        )
+    )
+    return slide_xml, media_files, rel_entries, anim_targets, trace or [], cache_key
 
 
-def _verify_internal_rels_targets(extract_dir: Path) -> list[str]:
-    """Return a list of dangling internal Targets across every .rels in the package.
+def _preconvert_native_slides(
+    svg_files: list[Path],
+    merge_paragraphs: bool,
+    with_trace: bool,
+    pixel_size: tuple[int, int],
+    native_cache_dir: Path | None,
+    workers: int,
+    verbose: bool,
+) -> dict[int, Any]:
+    """Convert every SVG to DrawingML across a process pool.
 
-    Each entry is formatted as "<rels-path> -> <missing-target>". An empty list
-    means every internal Target resolves to a real file in the package.
+    Returns {1-based slide index: worker result or the raised exception}.
+    Results are collected out of order; the caller merges them in slide order
+    so media dedup names and the mixed-animation offset stay deterministic.
     """
-    problems: list[str] = []
-    for rels_path in extract_dir.rglob('*.rels'):
-        rels_rel = rels_path.relative_to(extract_dir).as_posix()
-        # `_rels/foo.xml.rels` lives one level below its referent's directory;
-        # Targets resolve relative to the parent of that `_rels` folder.
-        base_dir = posixpath.dirname(posixpath.dirname(rels_rel))
-        content = rels_path.read_text(encoding='utf-8')
-        for match in _REL_TARGET_RE.finditer(content):
-            element = match.group(0)
-            if _TARGET_MODE_EXT_RE.search(element):
-                continue
-            target_match = _TARGET_ATTR_RE.search(element)
-            if not target_match:
-                continue
-            target = target_match.group(1)
-            if target.startswith(('http://', 'https://', 'mailto:')):
-                continue
-            resolved = posixpath.normpath(posixpath.join(base_dir, target)) if base_dir else posixpath.normpath(target)
-            if not (extract_dir / resolved).exists():
-                problems.append(f'{rels_rel} -> {resolved}')
-    return problems
+    results: dict[int, Any] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        future_map = {
+            pool.submit(
+                _convert_native_slide, svg, i, merge_paragraphs, with_trace,
+                pixel_size, native_cache_dir,
+            ): (i, svg)
+            for i, svg in enumerate(svg_files, 1)
+        }
+        done = 0
+        for future in as_completed(future_map):
+            i, svg = future_map[future]
+            try:
+                results[i] = future.result()
+            except Exception as exc:
+                results[i] = exc
+            done += 1
+            if verbose:
+                tag = 'failed' if isinstance(results[i], Exception) else 'ok'
+                print(f"  [Convert {done}/{len(svg_files)}] {svg.name} - {tag}")
+    return results
 
 
 def _presentation_format(width: float, height: float) -> str:
@@ -347,7 +358,7 @@ def _presentation_format(width: float, height: float) -> str:
 
 
 def _stamp_docprops(
-    extract_dir: Path,
+    package: PptxPackage,
     slide_count: int,
     pres_format: str,
     meta: dict[str, Any] | None = None,
@@ -372,9 +383,9 @@ def _stamp_docprops(
 
     now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    core_path = extract_dir / 'docProps' / 'core.xml'
-    if core_path.exists():
-        core_path.write_text(
+    if 'docProps/core.xml' in package:
+        package.write(
+            'docProps/core.xml',
             "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
             '<cp:coreProperties '
             'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
@@ -395,12 +406,10 @@ def _stamp_docprops(
             f'<cp:category>{escape(field("category"))}</cp:category>'
             f'<cp:contentStatus>{escape(field("contentStatus"))}</cp:contentStatus>'
             '</cp:coreProperties>',
-            encoding='utf-8',
         )
 
-    app_path = extract_dir / 'docProps' / 'app.xml'
-    if app_path.exists():
-        app = app_path.read_text(encoding='utf-8')
+    if 'docProps/app.xml' in package:
+        app = package.read_text('docProps/app.xml')
         app = re.sub(r'<Slides>.*?</Slides>', f'<Slides>{slide_count}</Slides>', app)
         app = re.sub(
             r'<Company>.*?</Company>',
@@ -422,7 +431,7 @@ def _stamp_docprops(
             f'<PresentationFormat>{escape(pres_format)}</PresentationFormat>',
             app,
         )
-        app_path.write_text(app, encoding='utf-8')
+        package.write('docProps/app.xml', app)
 
 
 def create_pptx_with_native_svg(
@@ -447,6 +456,7 @@ def create_pptx_with_native_svg(
     use_narration_timings: bool = False,
     narration_padding: float = 0.5,
     cache_dir: Path | None = None,
+    native_cache_dir: Path | None = None,
     workers: int | None = None,
     merge_paragraphs: bool = True,
     conversion_trace_path: Path | None = None,
@@ -478,6 +488,12 @@ def create_pptx_with_native_svg(
         narration_audio: Optional dict mapping SVG stem to narration audio file.
         use_narration_timings: Whether to set slide auto-advance from audio duration.
         narration_padding: Extra seconds added after each narration before advancing.
+        cache_dir: Cache directory for compat-mode SVG→PNG renders.
+        native_cache_dir: Persistent cache directory for native slide
+            conversion results. Entries not used by a successful export are
+            pruned afterwards.
+        workers: Process-pool size for native slide conversion and PNG
+            pre-rendering. None picks min(cpu, pages, 8); <=1 is sequential.
         conversion_trace_path: Optional JSON path for native conversion diagnostics.
 
     Returns:
@@ -555,29 +571,42 @@ def create_pptx_with_native_svg(
         for _ in svg_files:
             prs.slides.add_slide(blank_layout)
 
-        base_pptx = temp_dir / 'base.pptx'
-        prs.save(str(base_pptx))
+        # Hold the base deck's parts in memory; slides, rels and media are
+        # written into the package and streamed to the output zip once.
+        base_pptx = io.BytesIO()
+        prs.save(base_pptx)
+        package = PptxPackage.from_bytes(base_pptx.getvalue())
 
-        # Extract PPTX
-        extract_dir = temp_dir / 'pptx_content'
-        with zipfile.ZipFile(base_pptx, 'r') as zf:
-            zf.extractall(extract_dir)
+        # Compat-mode PNG renders land on disk (the workers write files) and
+        # are streamed into the package from here.
+        png_dir = temp_dir / 'png'
+        png_dir.mkdir()
 
-        media_dir = extract_dir / 'ppt' / 'media'
-        media_dir.mkdir(exist_ok=True)
+        if workers is None:
+            resolved_workers = min(os.cpu_count() or 2, len(svg_files), 8)
+        else:
+            resolved_workers = max(0, workers)
+
+        native_results: dict[int, Any] | None = None
+        if use_native_shapes and resolved_workers > 1 and len(svg_files) > 2:
+            if verbose:
+                print(f"  Converting slides (parallel x{resolved_workers})")
+            native_results = _preconvert_native_slides(
+                svg_files, merge_paragraphs, conversion_trace_path is not None,
+                (pixel_width, pixel_height), native_cache_dir,
+                resolved_workers, verbose,
+            )
+            if verbose:
+                print()
 
         prerender_results: dict[int, bool] | None = None
         if not use_native_shapes and use_compat_mode and PNG_RENDERER is not None:
-            if workers is None:
-                resolved_workers = min(os.cpu_count() or 2, len(svg_files), 8)
-            else:
-                resolved_workers = max(0, workers)
             if verbose:
                 cache_label = str(cache_dir) if cache_dir else 'disabled'
                 mode = f'parallel x{resolved_workers}' if resolved_workers > 1 else 'sequential'
                 print(f"  Pre-rendering PNGs ({mode}, cache: {cache_label})")
             prerender_results = _prerender_legacy_pngs(
-                svg_files, media_dir, pixel_width, pixel_height,
+                svg_files, png_dir, pixel_width, pixel_height,
                 cache_dir, resolved_workers, verbose,
             )
             if verbose:
@@ -591,6 +620,7 @@ def create_pptx_with_native_svg(
         narration_slides_created: set[int] = set()
         audio_exts_used: set[str] = set()
         mixed_animation_offset = 0
+        native_cache_keys: set[str] = set()
         conversion_trace: list[dict[str, Any]] | None = [] if conversion_trace_path else None
 
         for i, svg_path in enumerate(svg_files, 1):
@@ -600,13 +630,27 @@ def create_pptx_with_native_svg(
                 # ---- Native shapes mode ----
                 if use_native_shapes:
                     slide_cfg = _slide_config(animation_config, svg_path.stem)
-                    slide_xml, media_files_dict, rel_entries, anim_targets = (
-                        convert_svg_to_slide_shapes(
-                            svg_path, slide_num=slide_num, verbose=verbose,
-                            merge_paragraphs=merge_paragraphs,
-                            trace_out=conversion_trace,
+                    if native_results is not None:
+                        result = native_results.pop(slide_num)
+                        if isinstance(result, Exception):
+                            raise result
+                        (
+                            slide_xml, media_files_dict, rel_entries, anim_targets,
+                            trace, cache_key,
+                        ) = result
+                        if conversion_trace is not None:
+                            conversion_trace.extend(trace)
+                    else:
+                        (slide_xml, media_files_dict, rel_entries, anim_targets), cache_key = (
+                            convert_svg_to_slide_shapes_cached(
+                                svg_path, slide_num, merge_paragraphs,
+                                (pixel_width, pixel_height),
+                                cache_dir=native_cache_dir, verbose=verbose,
+                                trace_out=conversion_trace,
+                            )
                         )
-                    )
+                    if cache_key:
+                        native_cache_keys.add(cache_key)
                     slide_transition, slide_transition_duration, slide_auto_advance = (
                         _slide_transition_settings(
                             slide_cfg,
@@ -668,24 +712,22 @@ def create_pptx_with_native_svg(
                             timing_xml + '\n</p:sld>',
                         )
 
-                    # Write slide XML
-                    slide_xml_path = extract_dir / 'ppt' / 'slides' / f'slide{slide_num}.xml'
-                    with open(slide_xml_path, 'w', encoding='utf-8') as f:
-                        f.write(slide_xml)
+                    slide_part = f'ppt/slides/slide{slide_num}.xml'
+                    rels_part = f'ppt/slides/_rels/slide{slide_num}.xml.rels'
+                    package.write(slide_part, slide_xml)
 
                     # Write media files
                     media_name_map: dict[str, str] = {}
                     for media_name, media_data in media_files_dict.items():
                         ext = media_name.rsplit('.', 1)[-1].lower()
-                        media_hash = hashlib.sha256(media_data).hexdigest()
+                        media_hash = media_digest(media_name, media_data)
                         cache_key = (ext, media_hash)
                         cached_name = media_cache.get(cache_key)
 
                         if cached_name is None:
                             cached_name = f'image_{media_hash[:16]}.{ext}'
                             media_cache[cache_key] = cached_name
-                            with open(media_dir / cached_name, 'wb') as f:
-                                f.write(media_data)
+                            package.write(f'ppt/media/{cached_name}', media_data)
 
                         media_name_map[media_name] = cached_name
 
@@ -699,10 +741,6 @@ def create_pptx_with_native_svg(
                             rel['target'] = f'../media/{mapped_name}'
 
                     # Build relationships XML
-                    rels_dir = extract_dir / 'ppt' / 'slides' / '_rels'
-                    rels_dir.mkdir(exist_ok=True)
-                    rels_path = rels_dir / f'slide{slide_num}.xml.rels'
-
                     extra_rels = ''
                     for rel in rel_entries:
                         extra_rels += (
@@ -714,8 +752,7 @@ def create_pptx_with_native_svg(
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" Target="../slideLayouts/slideLayout1.xml"/>{extra_rels}
 </Relationships>'''
-                    with open(rels_path, 'w', encoding='utf-8') as f:
-                        f.write(rels_xml)
+                    package.write(rels_part, rels_xml)
 
                     # Track image formats for Content_Types
                     for media_name in media_name_map.values():
@@ -741,19 +778,27 @@ def create_pptx_with_native_svg(
                     png_rid = 'rId2'
                     svg_rid = 'rId3' if use_compat_mode else 'rId2'
 
-                    shutil.copy(svg_path, media_dir / svg_filename)
+                    svg_text = svg_path.read_text(encoding='utf-8')
+                    inlined = inline_sidecar_media(svg_text, svg_path.parent)
+                    if inlined != svg_text:
+                        # Embedded SVGs cannot follow relative URIs into
+                        # svg_final/media/; inline the sidecar blobs again.
+                        package.write(f'ppt/media/{svg_filename}', inlined)
+                    else:
+                        package.write_file(f'ppt/media/{svg_filename}', svg_path)
 
                     slide_has_png = False
                     if use_compat_mode:
+                        png_path = png_dir / png_filename
                         if prerender_results is not None:
                             png_success = prerender_results.get(i, False)
                         else:
-                            png_path = media_dir / png_filename
                             png_success = convert_svg_to_png(
                                 svg_path, png_path,
                                 width=pixel_width, height=pixel_height,
                             )
                         if png_success:
+                            package.write_file(f'ppt/media/{png_filename}', png_path)
                             slide_has_png = True
                             has_any_image = True
                             image_exts_used.add('png')
@@ -762,7 +807,8 @@ def create_pptx_with_native_svg(
                                 print(f"  [{i}/{len(svg_files)}] {svg_path.name} - PNG generation failed, using pure SVG")
                             svg_rid = 'rId2'
 
-                    slide_xml_path = extract_dir / 'ppt' / 'slides' / f'slide{slide_num}.xml'
+                    slide_part = f'ppt/slides/slide{slide_num}.xml'
+                    rels_part = f'ppt/slides/_rels/slide{slide_num}.xml.rels'
                     slide_xml = create_slide_xml_with_svg(
                         slide_num,
                         png_rid=png_rid, svg_rid=svg_rid,
@@ -772,19 +818,14 @@ def create_pptx_with_native_svg(
                         auto_advance=slide_auto_advance,
                         use_compat_mode=(use_compat_mode and slide_has_png),
                     )
-                    with open(slide_xml_path, 'w', encoding='utf-8') as f:
-                        f.write(slide_xml)
+                    package.write(slide_part, slide_xml)
 
-                    rels_dir = extract_dir / 'ppt' / 'slides' / '_rels'
-                    rels_dir.mkdir(exist_ok=True)
-                    rels_path = rels_dir / f'slide{slide_num}.xml.rels'
                     rels_xml = create_slide_rels_xml(
                         png_rid=png_rid, png_filename=png_filename,
                         svg_rid=svg_rid, svg_filename=svg_filename,
                         use_compat_mode=(use_compat_mode and slide_has_png),
                     )
-                    with open(rels_path, 'w', encoding='utf-8') as f:
-                        f.write(rels_xml)
+                    package.write(rels_part, rels_xml)
 
                 # --- Process notes (shared between native and legacy mode) ---
                 notes_content = ''
@@ -793,23 +834,17 @@ def create_pptx_with_native_svg(
                     notes_content = notes.get(svg_stem, '') if notes else ''
                     notes_text = markdown_to_plain_text(notes_content) if notes_content else ''
                     if notes_text:
-                        notes_slides_dir = extract_dir / 'ppt' / 'notesSlides'
-                        notes_slides_dir.mkdir(exist_ok=True)
-
-                        notes_xml_path = notes_slides_dir / f'notesSlide{slide_num}.xml'
-                        notes_xml = create_notes_slide_xml(slide_num, notes_text)
-                        with open(notes_xml_path, 'w', encoding='utf-8') as f:
-                            f.write(notes_xml)
-
-                        notes_rels_dir = notes_slides_dir / '_rels'
-                        notes_rels_dir.mkdir(exist_ok=True)
-                        notes_rels_path = notes_rels_dir / f'notesSlide{slide_num}.xml.rels'
-                        notes_rels_xml = create_notes_slide_rels_xml(slide_num)
-                        with open(notes_rels_path, 'w', encoding='utf-8') as f:
-                            f.write(notes_rels_xml)
-
-                        _append_relationship(
-                            rels_path,
+                        package.write(
+                            f'ppt/notesSlides/notesSlide{slide_num}.xml',
+                            create_notes_slide_xml(slide_num, notes_text),
+                        )
+                        package.write(
+                            f'ppt/notesSlides/_rels/notesSlide{slide_num}.xml.rels',
+                            create_notes_slide_rels_xml(slide_num),
+                        )
+
+                        package.append_relationship(
+                            rels_part,
                             'http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide',
                             f'../notesSlides/notesSlide{slide_num}.xml',
                         )
@@ -819,38 +854,34 @@ def create_pptx_with_native_svg(
                 svg_stem = svg_path.stem
                 audio_path = narration_audio.get(svg_stem) if narration_audio else None
                 if audio_path:
-                    slide_xml_path = extract_dir / 'ppt' / 'slides' / f'slide{slide_num}.xml'
-                    rels_path = extract_dir / 'ppt' / 'slides' / '_rels' / f'slide{slide_num}.xml.rels'
-
                     ext = audio_path.suffix.lower()
                     media_name = f'narration{slide_num}{ext}'
-                    shutil.copy2(audio_path, media_dir / media_name)
+                    package.write_file(f'ppt/media/{media_name}', audio_path)
                     audio_exts_used.add(ext)
 
                     poster_name = 'narration_poster.png'
-                    poster_path = media_dir / poster_name
-                    if not poster_path.exists():
-                        poster_path.write_bytes(TRANSPARENT_PNG_BYTES)
+                    if f'ppt/media/{poster_name}' not in package:
+                        package.write(f'ppt/media/{poster_name}', TRANSPARENT_PNG_BYTES)
                     has_any_image = True
                     image_exts_used.add('png')
 
-                    media_rid = _append_relationship(
-                        rels_path,
+                    media_rid = package.append_relationship(
+                        rels_part,
                         MEDIA_REL_TYPE,
                         f'../media/{media_name}',
                     )
-                    audio_rid = _append_relationship(
-                        rels_path,
+                    audio_rid = package.append_relationship(
+                        rels_part,
                         AUDIO_REL_TYPE,
                         f'../media/{media_name}',
                     )
-                    poster_rid = _append_relationship(
-                        rels_path,
+                    poster_rid = package.append_relationship(
+                        rels_part,
                         IMAGE_REL_TYPE,
                         f'../media/{poster_name}',
                     )
 
-                    slide_xml = slide_xml_path.read_text(encoding='utf-8')
+                    slide_xml = package.read_text(slide_part)
                     narration_shape_id = next_shape_id(slide_xml)
                     slide_xml = inject_narration(
                         slide_xml,
@@ -873,7 +904,7 @@ def create_pptx_with_native_svg(
                             transition_duration=slide_transition_duration,
                             transition_effect=slide_transition or 'fade',
                         )
-                    slide_xml_path.write_text(slide_xml, encoding='utf-8')
+                    package.write(slide_part, slide_xml)
                     narration_slides_created.add(slide_num)
 
                 if verbose:
@@ -897,9 +928,7 @@ def create_pptx_with_native_svg(
                     raise
 
         # Update [Content_Types].xml
-        content_types_path = extract_dir / '[Content_Types].xml'
-        with open(content_types_path, 'r', encoding='utf-8') as f:
-            content_types = f.read()
+        content_types = package.read_text('[Content_Types].xml')
 
         types_to_add: list[str] = []
         if not use_native_shapes:
@@ -915,8 +944,6 @@ def create_pptx_with_native_svg(
             content_types = content_types.replace(
                 '</Types>', '\n'.join(types_to_add) + '\n</Types>',
             )
-            with open(content_types_path, 'w', encoding='utf-8') as f:
-                f.write(content_types)
 
         if audio_exts_used:
             for ext in sorted(audio_exts_used):
@@ -925,8 +952,6 @@ def create_pptx_with_native_svg(
                     content_types = _add_default_content_type(content_types, ext, content_type)
             if 'Extension="png"' not in content_types:
                 content_types = _add_default_content_type(content_types, 'png', 'image/png')
-            with open(content_types_path, 'w', encoding='utf-8') as f:
-                f.write(content_types)
 
         # Add notesSlides content types
         if enable_notes and notes_slides_created:
@@ -937,10 +962,10 @@ def create_pptx_with_native_svg(
                 )
                 if override not in content_types:
                     content_types = content_types.replace('</Types>', override + '\n</Types>')
-            with open(content_types_path, 'w', encoding='utf-8') as f:
-                f.write(content_types)
 
-        rels_problems = _verify_internal_rels_targets(extract_dir)
+        package.write('[Content_Types].xml', content_types)
+
+        rels_problems = package.dangling_rels_targets()
         if rels_problems:
             details = '\n'.join(f'  - {p}' for p in rels_problems)
             raise RuntimeError(
@@ -952,18 +977,21 @@ def create_pptx_with_native_svg(
         # author, 2013 dates, "generated using python-pptx", Slides=0) with
         # accurate, tool-neutral document properties.
         pres_format = _presentation_format(width_emu, height_emu)
-        _stamp_docprops(extract_dir, len(svg_files), pres_format, doc_metadata)
+        _stamp_docprops(package, len(svg_files), pres_format, doc_metadata)
 
-        # Repackage PPTX to a temporary file first. The public output path is
-        # replaced only after every slide and relationship has succeeded.
+        # Stream the package to a temporary file first. The public output path
+        # is replaced only after every slide and relationship has succeeded.
         temp_output_path = temp_dir / 'result.pptx'
-        with zipfile.ZipFile(temp_output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file_path in extract_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(extract_dir)
-                    zf.write(file_path, arcname)
+        package.save(temp_output_path)
         shutil.move(str(temp_output_path), str(output_path))
 
+        # Keep the native cache scoped to the current deck. Skipped when a
+        # trace bypassed the cache, so a debugging run doesn't wipe it.
+        if (use_native_shapes and native_cache_dir is not None
+                and conversion_trace is None
+                and success_count == len(svg_files)):
+            prune_native_cache(native_cache_dir, native_cache_keys)
+
         if conversion_trace_path and conversion_trace is not None:
             conversion_trace_path.parent.mkdir(parents=True, exist_ok=True)
             payload = {
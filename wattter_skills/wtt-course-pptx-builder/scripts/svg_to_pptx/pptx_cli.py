@@ -231,12 +231,20 @@ Recorded narration:
                              'hash + size + renderer; safe across renderer switches. '
                              'Removed automatically after a successful export.')
     parser.add_argument('--no-cache', action='store_true',
-                        help='Disable the SVG→PNG cache for this run (still parallel).')
+                        help='Disable the SVG→PNG and native conversion caches for '
+                             'this run (still parallel).')
     parser.add_argument('--keep-cache', action='store_true',
                         help='Keep the SVG→PNG cache directory after export '
                              '(default: removed on success to keep project clean).')
+    parser.add_argument('--native-cache-dir', type=str, default=None,
+                        help='Persistent cache for native DrawingML slide conversion '
+                             '(default: <project>/.cache/native). Key covers SVG content, '
+                             'converter version, options and referenced images/icons, so '
+                             're-exports only reconvert edited slides. Kept across runs; '
+                             'entries unused by the last successful export are pruned.')
     parser.add_argument('--workers', type=int, default=None,
-                        help='Parallel workers for SVG→PNG pre-rendering. '
+                        help='Parallel workers for native slide conversion and '
+                             'SVG→PNG pre-rendering. '
                              'Default: min(cpu, pages, 8). Set 1 for sequential.')
 
     args = parser.parse_args()
@@ -484,6 +492,15 @@ Recorded narration:
     else:
         cache_dir = project_path / '.cache' / 'svg_png'
 
+    if args.no_cache:
+        native_cache_dir: Path | None = None
+    elif args.native_cache_dir:
+        native_cache_dir = Path(args.native_cache_dir)
+        if not native_cache_dir.is_absolute():
+            native_cache_dir = project_path / native_cache_dir
+    else:
+        native_cache_dir = project_path / '.cache' / 'native'
+
     # svg_files is per-product (native vs legacy may now read different
     # directories); everything else is shared.
     # Optional per-project document properties. Absent file → factual fields
@@ -543,6 +560,7 @@ Recorded narration:
             output_path=native_path,
             use_native_shapes=True,
             svg_files=native_files,
+            native_cache_dir=native_cache_dir,
             conversion_trace_path=(
                 native_path.with_name(native_path.name + '.trace.json')
                 if args.conversion_trace else None
@@ -0,0 +1,296 @@
+"""Persistent content-addressed cache for native DrawingML slide conversion.
+
+``convert_svg_to_slide_shapes`` is the dominant cost of a native export and is
+a pure function of its inputs: the SVG bytes, the converter source, the
+conversion options, the fonts used to measure text, and the files the SVG
+pulls in (external ``<image>`` hrefs and ``<use data-icon>`` icons). The cache key hashes all of them, so an
+edited slide, an edited picture or an upgraded converter misses naturally
+while every untouched slide is served from disk.
+
+Layout under ``cache_dir``::
+
+    <key>.json           slide XML, rel entries, anim targets, media manifest
+    media/<sha256>.<ext> media blobs, shared by every entry that uses them
+
+Media names embed the slide number (``s{n}_img{k}.ext``); entries store them
+slide-independently so a slide that moves in the deck still hits.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .drawingml_converter import convert_svg_to_slide_shapes
+from .drawingml_utils import media_digest
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+from svg_finalize.sidecar_media import sidecar_digest  # noqa: E402
+from text_metrics import fonts_fingerprint  # noqa: E402
+
+_CACHE_FORMAT = 1
+
+_ICONS_DIR = _SCRIPTS_DIR.parent / 'templates' / 'icons'
+
+_IMAGE_TAG_RE = re.compile(r'<image\b[^>]*>', re.DOTALL)
+_HREF_RE = re.compile(r'''\b(?:xlink:)?href\s*=\s*(["'])(.*?)\1''', re.DOTALL)
+_DATA_ICON_RE = re.compile(r'''\bdata-icon\s*=\s*(["'])(.*?)\1''')
+_SLIDE_MEDIA_RE = re.compile(r'^s\d+_(.+)$')
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _converter_fingerprint() -> str:
+    """Hash of the converter sources; any code change invalidates the cache."""
+    h = hashlib.sha256()
+    sources = sorted(Path(__file__).resolve().parent.glob('*.py'))
+    sources.append(_SCRIPTS_DIR / 'svg_finalize' / 'embed_icons.py')
+    sources.append(_SCRIPTS_DIR / 'text_metrics.py')
+    for src in sources:
+        if src.is_file():
+            h.update(src.name.encode('utf-8'))
+            h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def _dependency_tokens(svg_path: Path, svg_text: str) -> list[str]:
+    """Content hashes of every external file the conversion will read."""
+    tokens: list[str] = []
+    svg_dir = svg_path.parent
+    for tag in _IMAGE_TAG_RE.finditer(svg_text):
+        for _quote, href in _HREF_RE.findall(tag.group(0)):
+            if not href or href.startswith(('data:', '#')):
+                continue
+            if sidecar_digest(href):
+                # Content-addressed: the name already pins the bytes.
+                exists = (svg_dir / href).is_file()
+                tokens.append(f'image:{href}:{"sidecar" if exists else "missing"}')
+                continue
+            # Mirror drawingml_elements.convert_image resolution order.
+            img_path = svg_dir / href
+            if not img_path.exists():
+                img_path = svg_dir.parent / href
+            digest = _file_digest(img_path) if img_path.is_file() else 'missing'
+            tokens.append(f'image:{href}:{digest}')
+
+    icon_names = sorted({name for _quote, name in _DATA_ICON_RE.findall(svg_text)})
+    if icon_names and _ICONS_DIR.exists():
+        from .use_expander import _import_embed_icons
+        embed_icons = _import_embed_icons()
+        for name in icon_names:
+            icon_path, _base_size = embed_icons.resolve_icon_path(name, _ICONS_DIR)
+            digest = _file_digest(icon_path) if icon_path.is_file() else 'missing'
+            tokens.append(f'icon:{name}:{digest}')
+    return tokens
+
+
+def native_cache_key(
+    svg_path: Path,
+    merge_paragraphs: bool,
+    pixel_size: tuple[int, int],
+) -> str:
+    """Cache key: SVG content + converter version + options + dependencies."""
+    svg_bytes = svg_path.read_bytes()
+    h = hashlib.sha256()
+    h.update(svg_bytes)
+    h.update(json.dumps({
+        'format': _CACHE_FORMAT,
+        'converter': _converter_fingerprint(),
+        'fonts': fonts_fingerprint(),
+        'merge_paragraphs': merge_paragraphs,
+        'canvas': list(pixel_size),
+        'deps': _dependency_tokens(svg_path, svg_bytes.decode('utf-8', errors='replace')),
+    }, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _atomic_write(target: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(suffix=target.suffix, dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, target)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load(
+    cache_dir: Path,
+    key: str,
+    slide_num: int,
+) -> tuple[str, dict[str, bytes], list[dict[str, str]], list[tuple[int, str]]] | None:
+    entry_path = cache_dir / f'{key}.json'
+    if not entry_path.is_file():
+        return None
+    try:
+        entry = json.loads(entry_path.read_text(encoding='utf-8'))
+        if entry.get('format') != _CACHE_FORMAT:
+            return None
+        media_files: dict[str, bytes] = {}
+        for item in entry['media']:
+            blob = cache_dir / 'media' / f"{item['sha256']}.{item['ext']}"
+            media_files[f"s{slide_num}_{item['name']}"] = blob.read_bytes()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    rel_entries: list[dict[str, str]] = []
+    for rel in entry['rel_entries']:
+        rel = dict(rel)
+        media_name = rel.pop('media', None)
+        if media_name:
+            rel['target'] = f'../media/s{slide_num}_{media_name}'
+        rel_entries.append(rel)
+    anim_targets = [(int(sid), str(svg_id)) for sid, svg_id in entry['anim_targets']]
+    return entry['slide_xml'], media_files, rel_entries, anim_targets
+
+
+def _store(
+    cache_dir: Path,
+    key: str,
+    slide_xml: str,
+    media_files: dict[str, bytes],
+    rel_entries: list[dict[str, str]],
+    anim_targets: list[tuple[int, str]],
+) -> None:
+    media_dir = cache_dir / 'media'
+    media_dir.mkdir(parents=True, exist_ok=True)
+
+    local_names: dict[str, str] = {}
+    media_manifest: list[dict[str, str]] = []
+    for name, data in media_files.items():
+        match = _SLIDE_MEDIA_RE.match(name)
+        local = match.group(1) if match else name
+        local_names[name] = local
+        ext = name.rsplit('.', 1)[-1].lower()
+        digest = media_digest(name, data)
+        blob = media_dir / f'{digest}.{ext}'
+        if not blob.is_file():
+            _atomic_write(blob, data)
+        media_manifest.append({'name': local, 'sha256': digest, 'ext': ext})
+
+    stored_rels: list[dict[str, str]] = []
+    for rel in rel_entries:
+        rel = dict(rel)
+        target = rel.get('target', '')
+        if target.startswith('../media/'):
+            media_name = target.split('../media/', 1)[1]
+            if media_name in local_names:
+                del rel['target']
+                rel['media'] = local_names[media_name]
+        stored_rels.append(rel)
+
+    entry = {
+        'format': _CACHE_FORMAT,
+        'slide_xml': slide_xml,
+        'rel_entries': stored_rels,
+        'anim_targets': [list(target) for target in anim_targets],
+        'media': media_manifest,
+    }
+    _atomic_write(
+        cache_dir / f'{key}.json',
+        json.dumps(entry, ensure_ascii=False).encode('utf-8'),
+    )
+
+
+def convert_svg_to_slide_shapes_cached(
+    svg_path: Path,
+    slide_num: int,
+    merge_paragraphs: bool,
+    pixel_size: tuple[int, int],
+    cache_dir: Path | None = None,
+    verbose: bool = False,
+    trace_out: list[dict[str, Any]] | None = None,
+) -> tuple[tuple[str, dict[str, bytes], list[dict[str, str]], list[tuple[int, str]]], str | None]:
+    """Cache-aware ``convert_svg_to_slide_shapes``.
+
+    Returns ``(conversion_result, cache_key)``; the key is None when caching
+    is disabled or the SVG could not be hashed. The cache is bypassed when a
+    conversion trace is requested, since the trace records live conversion
+    decisions. Failures are never cached.
+    """
+    if cache_dir is None or trace_out is not None:
+        return convert_svg_to_slide_shapes(
+            svg_path, slide_num=slide_num, verbose=verbose,
+            merge_paragraphs=merge_paragraphs, trace_out=trace_out,
+        ), None
+
+    try:
+        key = native_cache_key(svg_path, merge_paragraphs, pixel_size)
+    except OSError as e:
+        print(f"  Warning: Failed to hash SVG ({svg_path.name}): {e}")
+        return convert_svg_to_slide_shapes(
+            svg_path, slide_num=slide_num, verbose=verbose,
+            merge_paragraphs=merge_paragraphs,
+        ), None
+
+    cached = _load(cache_dir, key, slide_num)
+    if cached is not None:
+        return cached, key
+
+    result = convert_svg_to_slide_shapes(
+        svg_path, slide_num=slide_num, verbose=verbose,
+        merge_paragraphs=merge_paragraphs,
+    )
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _store(cache_dir, key, *result)
+    except OSError as e:
+        print(f"  Warning: Native cache write failed ({svg_path.name}): {e}")
+    return result, key
+
+
+def prune_native_cache(cache_dir: Path, keep_keys: set[str]) -> int:
+    """Drop entries and media blobs not used by *keep_keys*.
+
+    Called after a successful export so the cache tracks the current deck
+    instead of growing with every edit. Returns the number of files removed.
+    """
+    if not cache_dir.is_dir():
+        return 0
+    removed = 0
+    live_blobs: set[str] = set()
+    for entry_path in cache_dir.glob('*.json'):
+        if entry_path.stem in keep_keys:
+            try:
+                entry = json.loads(entry_path.read_text(encoding='utf-8'))
+                live_blobs.update(
+                    f"{item['sha256']}.{item['ext']}" for item in entry.get('media', [])
+                )
+                continue
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        try:
+            entry_path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    media_dir = cache_dir / 'media'
+    if media_dir.is_dir():
+        for blob in media_dir.iterdir():
+            if blob.name not in live_blobs:
+                try:
+                    blob.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
@@ -0,0 +1,138 @@
+"""In-memory OOXML package writer for PPTX assembly.
+
+Parts live in a dict keyed by their zip name. A part is either bytes held in
+memory or a ``Path`` to a file that is streamed into the zip on save, so large
+media (narration audio, pre-rendered PNGs) is never read into memory or
+copied through a temp directory. Relationship validation runs against the
+dict, and already-compressed media is stored rather than deflated a second
+time.
+"""
+
+from __future__ import annotations
+
+import io
+import posixpath
+import re
+import shutil
+import zipfile
+from pathlib import Path
+
+# Extensions whose payload is already compressed; deflating them again costs
+# CPU and usually grows the entry.
+_STORED_EXTENSIONS = frozenset({
+    'png', 'jpg', 'jpeg', 'gif', 'webp',
+    'mp3', 'm4a', 'aac', 'mp4', 'm4v', 'mov', 'ogg', 'opus', 'wma',
+    'zip', 'xlsx', 'docx', 'pptx',
+})
+
+_STREAM_CHUNK = 1024 * 1024
+
+_REL_ELEMENT_RE = re.compile(r'<Relationship\b[^/]*?/>', re.DOTALL)
+_TARGET_ATTR_RE = re.compile(r'Target="([^"]+)"')
+_TARGET_MODE_EXT_RE = re.compile(r'TargetMode="External"')
+_RID_RE = re.compile(r'Id="rId(\d+)"')
+
+
+def _compress_type(name: str) -> int:
+    ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+    return zipfile.ZIP_STORED if ext in _STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+class PptxPackage:
+    """Mutable set of package parts, written to a zip in a single pass."""
+
+    def __init__(self, parts: dict[str, bytes | Path] | None = None) -> None:
+        self.parts: dict[str, bytes | Path] = dict(parts or {})
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PptxPackage':
+        """Load every part of an existing package (e.g. a python-pptx base deck)."""
+        with zipfile.ZipFile(io.BytesIO(data), 'r') as zf:
+            return cls({
+                info.filename: zf.read(info)
+                for info in zf.infolist()
+                if not info.is_dir()
+            })
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.parts
+
+    def read(self, name: str) -> bytes:
+        part = self.parts[name]
+        return part.read_bytes() if isinstance(part, Path) else part
+
+    def read_text(self, name: str) -> str:
+        return self.read(name).decode('utf-8')
+
+    def write(self, name: str, data: bytes | str) -> None:
+        self.parts[name] = data.encode('utf-8') if isinstance(data, str) else data
+
+    def write_file(self, name: str, path: Path) -> None:
+        """Register an on-disk file as a part; it is streamed in on ``save``."""
+        self.parts[name] = Path(path)
+
+    def append_relationship(self, rels_name: str, rel_type: str, target: str) -> str:
+        """Append a relationship entry with the next available rId."""
+        rels_content = self.read_text(rels_name)
+        rid_numbers = [int(match) for match in _RID_RE.findall(rels_content)]
+        next_rid = f'rId{max(rid_numbers, default=0) + 1}'
+        rel_xml = (
+            f'  <Relationship Id="{next_rid}" '
+            f'Type="{rel_type}" Target="{target}"/>'
+        )
+        self.write(rels_name, rels_content.replace(
+            '</Relationships>', rel_xml + '\n</Relationships>',
+        ))
+        return next_rid
+
+    def dangling_rels_targets(self) -> list[str]:
+        """Return every internal relationship Target that names no part.
+
+        Each entry is formatted as "<rels-part> -> <missing-target>". An empty
+        list means every internal Target resolves to a part in the package.
+        """
+        problems: list[str] = []
+        for rels_name in sorted(self.parts):
+            if not rels_name.endswith('.rels'):
+                continue
+            # `_rels/foo.xml.rels` lives one level below its referent's
+            # directory; Targets resolve relative to the parent of `_rels`.
+            base_dir = posixpath.dirname(posixpath.dirname(rels_name))
+            for match in _REL_ELEMENT_RE.finditer(self.read_text(rels_name)):
+                element = match.group(0)
+                if _TARGET_MODE_EXT_RE.search(element):
+                    continue
+                target_match = _TARGET_ATTR_RE.search(element)
+                if not target_match:
+                    continue
+                target = target_match.group(1)
+                if target.startswith(('http://', 'https://', 'mailto:')):
+                    continue
+                if target.startswith('/'):
+                    resolved = posixpath.normpath(target.lstrip('/'))
+                elif base_dir:
+                    resolved = posixpath.normpath(posixpath.join(base_dir, target))
+                else:
+                    resolved = posixpath.normpath(target)
+                if resolved not in self.parts:
+                    problems.append(f'{rels_name} -> {resolved}')
+        return problems
+
+    def save(self, output_path: Path) -> None:
+        """Stream every part into a new zip at *output_path*.
+
+        ``[Content_Types].xml`` is written first, as Office expects.
+        """
+        names = sorted(self.parts, key=lambda n: (n != '[Content_Types].xml', n))
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name in names:
+                part = self.parts[name]
+                compress_type = _compress_type(name)
+                if isinstance(part, Path):
+                    info = zipfile.ZipInfo.from_file(part, name)
+                    info.compress_type = compress_type
+                    force_zip64 = info.file_size > zipfile.ZIP64_LIMIT
+                    with open(part, 'rb') as src, zf.open(info, 'w', force_zip64=force_zip64) as dst:
+                        shutil.copyfileobj(src, dst, _STREAM_CHUNK)
+                else:
+                    zf.writestr(name, part, compress_type=compress_type)
@@ -20,6 +20,8 @@ behaviourally aligned.
 
 from __future__ import annotations
 
+import copy
+import functools
 import sys
 from pathlib import Path
 from xml.etree import ElementTree as ET
@@ -27,6 +29,8 @@ from xml.etree import ElementTree as ET
 
 SVG_NS = 'http://www.w3.org/2000/svg'
 
+_TRANSFORM_SLOT = 'translate(0, 0)'
+
 
 def _import_embed_icons():
     """Lazy import so svg_to_pptx doesn't hard-require svg_finalize at import time."""
@@ -67,8 +71,25 @@ def _build_replacement_g(
     if not elements:
         return None
 
-    g_xml = embed_icons_mod.generate_icon_group(attrs, elements, style, base_size)
+    # Placement is the only per-use part of the group; parse the coloured
+    # group once with a placeholder transform and stamp the real one on a copy.
+    g_xml = embed_icons_mod.generate_icon_group(
+        {**attrs, 'transform': _TRANSFORM_SLOT}, elements, style, base_size,
+    )
+    group = _parse_icon_group(g_xml)
+    if group is None:
+        return None
+    group = copy.deepcopy(group)
+    group.set('transform', embed_icons_mod.icon_group_transform(attrs, base_size))
+    return group
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_icon_group(g_xml: str) -> ET.Element | None:
+    """Parse an expanded icon group, memoized per icon / colour / stroke.
 
+    The cached subtree is shared; callers must deep-copy it before use.
+    """
     # Wrap with a namespaced root so the parsed subtree carries the SVG
     # namespace through to every primitive (path/circle/...).
     wrapped = f'<svg xmlns="{SVG_NS}">{g_xml}</svg>'
@@ -8,10 +8,11 @@ documented command paths keep working:
     python3 scripts/template_fill_pptx.py scaffold slide_library.json -o fill_plan.json
     python3 scripts/template_fill_pptx.py check-plan slide_library.json fill_plan.json
     python3 scripts/template_fill_pptx.py apply <deck.pptx> fill_plan.json -o output.pptx
+    python3 scripts/template_fill_pptx.py apply-batch <deck.pptx> plans/*.json -o exports/
 
 Implementation lives in the template_fill_pptx/ package (ooxml, analyzer,
 scaffolder, checker, text_fill, table_fill, chart_fill, transitions, notes,
-package, applier, cli).
+package, zip_parts, applier, batch, cli).
 """
 
 import sys
@@ -3,15 +3,18 @@
 Direct OOXML editing (no SVG round-trip): select source slides, replace
 text / table / chart content from a fill plan, and write a new .pptx that keeps
 the original PowerPoint design. Four stages mirror the CLI subcommands:
-analyze -> scaffold -> check-plan -> apply.
+analyze -> scaffold -> check-plan -> apply; apply-batch fills many plans from
+one loaded template.
 
-Public entry: analyze_pptx(), scaffold_plan(), check_plan(), apply_plan(), main().
+Public entry: analyze_pptx(), scaffold_plan(), check_plan(), apply_plan(),
+apply_plans(), main().
 """
 
 from __future__ import annotations
 
 from .analyzer import analyze_pptx
 from .applier import apply_plan
+from .batch import apply_plans
 from .checker import check_plan, print_check_report
 from .cli import main
 from .scaffolder import scaffold_plan
@@ -22,5 +25,6 @@ __all__ = [
     "check_plan",
     "print_check_report",
     "apply_plan",
+    "apply_plans",
     "main",
 ]
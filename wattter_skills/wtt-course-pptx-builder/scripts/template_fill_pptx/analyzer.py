@@ -110,10 +110,23 @@ def _font_size_px(container: ET.Element) -> float | None:
     return round(max(sizes), 2)
 
 
+def _font_family(container: ET.Element) -> str | None:
+    faces: list[str] = []
+    for tag in ("latin", "ea"):
+        for node in container.findall(f".//a:rPr/a:{tag}", NS) + container.findall(f".//a:defRPr/a:{tag}", NS):
+            typeface = node.attrib.get("typeface", "")
+            # Theme references (+mn-lt, +mj-ea) need the theme part; skip them.
+            if typeface and not typeface.startswith("+") and typeface not in faces:
+                faces.append(typeface)
+                break
+    return ", ".join(faces) or None
+
+
 def _text_metrics(container: ET.Element, paragraph_count: int) -> dict[str, Any]:
     font_size_px = _font_size_px(container)
     return {
         "font_size_px": font_size_px,
+        "font_family": _font_family(container),
         "paragraph_count": paragraph_count,
     }
 
@@ -6,7 +6,9 @@ and rebuilds the presentation slide list, relationships, and content types.
 
 from __future__ import annotations
 
+import os
 import zipfile
+from collections.abc import MutableMapping
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -18,7 +20,7 @@ from .chart_fill import (
 )
 from .clone import _make_part_allocator, deep_clone_slide_private_parts
 from .notes import _find_notes_master_target, _slide_rels_with_notes
-from .ooxml import NS, REL_NS, SLIDE_REL_TYPE, _parse_slide_refs, _qn, _xml_bytes
+from .ooxml import NS, REL_NS, SLIDE_REL_TYPE, SlideRef, _parse_slide_refs, _qn, _xml_bytes
 from .package import (
     _add_notes_override,
     _add_slide_override,
@@ -37,6 +39,45 @@ from .transitions import (
     _resolve_slide_transition,
     _set_slide_transition,
 )
+from .zip_parts import PartCache, ZipParts
+
+# Inflated template parts kept between the fills of one TemplateSource.
+PART_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class TemplateSource:
+    """A source deck opened and indexed once, ready to fill any number of plans.
+
+    Holds the open zip, the slide index and the notes-master lookup; source
+    parts read by one fill stay cached for the next (up to ``cache_max_bytes``,
+    least recently used first out), so a batch pays for template parsing once
+    instead of once per plan.
+    """
+
+    def __init__(self, pptx_path: Path, cache_max_bytes: int = PART_CACHE_MAX_BYTES) -> None:
+        self.path = pptx_path
+        self._zf = zipfile.ZipFile(pptx_path)
+        self._cache = PartCache(cache_max_bytes)
+        try:
+            self.slide_refs = {slide.index: slide for slide in _parse_slide_refs(self._zf)}
+            self.notes_master_target = _find_notes_master_target(self.parts())
+        except BaseException:
+            self._zf.close()
+            raise
+
+    def parts(self) -> ZipParts:
+        """A fresh, unmodified view of the template's parts."""
+        return ZipParts(self._zf, self._cache)
+
+    def close(self) -> None:
+        self._zf.close()
+        self._cache = PartCache(0)
+
+    def __enter__(self) -> TemplateSource:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def apply_plan(
@@ -48,14 +89,81 @@ def apply_plan(
     transition_duration: float = DEFAULT_TRANSITION_DURATION,
 ) -> None:
     """Create a filled PPTX by cloning selected source slides and replacing text."""
+    plan_slides = _plan_slides(plan)
+    # Untouched parts are streamed from the source while the output is
+    # written, so build it beside the target and swap it in once the source is
+    # closed; this also keeps ``output_path == pptx_path`` safe.
+    with TemplateSource(pptx_path) as template:
+        tmp_path = _write_filled_temp(
+            template,
+            plan_slides,
+            output_path,
+            transition=transition,
+            transition_duration=transition_duration,
+        )
+    _replace_from_temp(tmp_path, output_path)
+
+
+def _plan_slides(plan: dict[str, Any]) -> list[Any]:
     plan_slides = plan.get("slides")
     if not isinstance(plan_slides, list) or not plan_slides:
         raise RuntimeError("Plan must contain a non-empty 'slides' list")
+    return plan_slides
+
+
+def _write_filled_temp(
+    template: TemplateSource,
+    plan_slides: list[Any],
+    output_path: Path,
+    *,
+    transition: str | None,
+    transition_duration: float,
+) -> Path:
+    """Fill ``plan_slides`` from ``template`` into a temp file beside ``output_path``."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        entries = template.parts()
+        _fill_entries(
+            entries,
+            template.slide_refs,
+            plan_slides,
+            notes_master_target=template.notes_master_target,
+            transition=transition,
+            transition_duration=transition_duration,
+        )
+        entries.write(tmp_path)
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+    return tmp_path
+
+
+def _replace_from_temp(tmp_path: Path, output_path: Path) -> None:
+    try:
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
 
-    with zipfile.ZipFile(pptx_path) as zf:
-        entries = {info.filename: zf.read(info.filename) for info in zf.infolist() if not info.is_dir()}
-        slide_refs = {slide.index: slide for slide in _parse_slide_refs(zf)}
-    notes_master_target = _find_notes_master_target(entries)
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _fill_entries(
+    entries: MutableMapping[str, bytes],
+    slide_refs: dict[int, SlideRef],
+    plan_slides: list[Any],
+    *,
+    notes_master_target: str | None,
+    transition: str | None,
+    transition_duration: float,
+) -> None:
+    """Rebuild the package parts in ``entries`` to hold the planned slides."""
 
     pres_root = ET.fromstring(entries["ppt/presentation.xml"])
     pres_rels_root = ET.fromstring(entries["ppt/_rels/presentation.xml.rels"])
@@ -171,8 +279,3 @@ def apply_plan(
     entries["ppt/_rels/presentation.xml.rels"] = _xml_bytes(pres_rels_root)
     _prune_unreferenced_parts(entries, content_root)
     entries["[Content_Types].xml"] = _xml_bytes(content_root)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as out:
-        for name, data in entries.items():
-            out.writestr(name, data)
@@ -0,0 +1,116 @@
+"""apply-batch: fill many plans against one template, across worker processes.
+
+A release typically renders dozens of decks (one per course module) from the
+same template. Running ``apply`` once per deck re-pays interpreter start-up,
+template indexing and part inflation every time; here each worker process
+opens and indexes the template once (``TemplateSource``) and then fills every
+plan it is handed from that shared state.
+
+Workers open their own handle on the template rather than inheriting the
+parent's: a zip file object shared across forked processes would share one
+file offset.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .applier import TemplateSource, _plan_slides, _replace_from_temp, _write_filled_temp
+from .transitions import DEFAULT_TRANSITION, DEFAULT_TRANSITION_DURATION
+
+_worker_template: TemplateSource | None = None
+
+
+def _fill_one(
+    template: TemplateSource,
+    plan: dict[str, Any],
+    output_path: Path,
+    transition: str | None,
+    transition_duration: float,
+) -> str | None:
+    """Fill one plan; return an error message instead of raising.
+
+    Plans are hand-written JSON, so a wrongly shaped one fails anywhere in
+    the filler (a slide that is a string, a missing key); whatever it raises
+    is reported for this job alone.
+    """
+    try:
+        tmp_path = _write_filled_temp(
+            template,
+            _plan_slides(plan),
+            output_path,
+            transition=transition,
+            transition_duration=transition_duration,
+        )
+        _replace_from_temp(tmp_path, output_path)
+    except (RuntimeError, OSError) as exc:
+        return str(exc)
+    except Exception as exc:
+        return f"Malformed plan ({type(exc).__name__}: {exc})"
+    return None
+
+
+def _init_worker(pptx_path: Path) -> None:
+    global _worker_template
+    _worker_template = TemplateSource(pptx_path)
+
+
+def _fill_in_worker(
+    plan: dict[str, Any],
+    output_path: Path,
+    transition: str | None,
+    transition_duration: float,
+) -> str | None:
+    assert _worker_template is not None
+    return _fill_one(_worker_template, plan, output_path, transition, transition_duration)
+
+
+def apply_plans(
+    pptx_path: Path,
+    jobs: list[tuple[dict[str, Any], Path]],
+    *,
+    transition: str | None = DEFAULT_TRANSITION,
+    transition_duration: float = DEFAULT_TRANSITION_DURATION,
+    workers: int | None = None,
+) -> list[str | None]:
+    """Fill each ``(plan, output_path)`` job from the template at ``pptx_path``.
+
+    Returns one entry per job, in order: ``None`` on success, otherwise the
+    error message for that plan (one bad plan does not stop the batch).
+    ``workers`` defaults to ``min(cpu_count, len(jobs), 8)``; ``workers<=1``
+    or two jobs or fewer run in this process.
+    """
+    template_path = pptx_path.resolve()
+    seen: set[Path] = set()
+    for _plan, output_path in jobs:
+        resolved = output_path.resolve()
+        if resolved == template_path:
+            raise RuntimeError(f"Batch output would overwrite the template: {output_path}")
+        if resolved in seen:
+            raise RuntimeError(f"Two plans in the batch write the same output: {output_path}")
+        seen.add(resolved)
+
+    if workers is None:
+        workers = min(os.cpu_count() or 2, len(jobs), 8)
+    # Opening here also surfaces an unreadable template as one clear error
+    # rather than a broken pool.
+    with TemplateSource(pptx_path) as template:
+        if workers <= 1 or len(jobs) <= 2:
+            return [
+                _fill_one(template, plan, output_path, transition, transition_duration)
+                for plan, output_path in jobs
+            ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pptx_path,),
+    ) as pool:
+        futures = [
+            pool.submit(_fill_in_worker, plan, output_path, transition, transition_duration)
+            for plan, output_path in jobs
+        ]
+        return [future.result() for future in futures]
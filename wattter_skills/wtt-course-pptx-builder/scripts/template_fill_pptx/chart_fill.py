@@ -11,6 +11,7 @@ from __future__ import annotations
 import io
 import re
 import zipfile
+from collections.abc import MutableMapping
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -46,7 +47,7 @@ def _chart_key_maps(slide_root: ET.Element, source_slide: int) -> dict[str, dict
     return maps
 
 
-def _max_chart_part_number(entries: dict[str, bytes]) -> int:
+def _max_chart_part_number(entries: MutableMapping[str, bytes]) -> int:
     max_number = 0
     pattern = re.compile(r"^ppt/charts/chart(\d+)\.xml$")
     for name in entries:
@@ -56,7 +57,7 @@ def _max_chart_part_number(entries: dict[str, bytes]) -> int:
     return max_number
 
 
-def _max_embedding_part_number(entries: dict[str, bytes]) -> int:
+def _max_embedding_part_number(entries: MutableMapping[str, bytes]) -> int:
     max_number = 0
     pattern = re.compile(r"^ppt/embeddings/templateFillChart(\d+)\.xlsx$")
     for name in entries:
@@ -281,7 +282,7 @@ def _find_chart_workbook_rel(chart_rels_root: ET.Element) -> ET.Element | None:
 
 
 def _clone_and_update_chart_part(
-    entries: dict[str, bytes],
+    entries: MutableMapping[str, bytes],
     content_root: ET.Element,
     *,
     source_chart_part: str,
@@ -318,7 +319,7 @@ def _clone_and_update_chart_part(
 def _apply_chart_edits_to_slide_package(
     slide_root: ET.Element,
     rels_root: ET.Element,
-    entries: dict[str, bytes],
+    entries: MutableMapping[str, bytes],
     content_root: ET.Element,
     *,
     source_slide: int,
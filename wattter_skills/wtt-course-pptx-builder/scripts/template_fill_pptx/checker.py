@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import unicodedata
+import sys
+from pathlib import Path
 from typing import Any
 
 from .selectors import (
@@ -12,6 +13,15 @@ from .selectors import (
     _table_selectors,
 )
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from text_metrics import text_width  # noqa: E402
+
+# One visual-width unit is half an em: a CJK glyph is 2 units, an average
+# Latin letter about 1.
+UNIT_EM = 0.5
+
 
 def _slot_lookup(library: dict[str, Any]) -> dict[tuple[int, str], dict[str, Any]]:
     lookup: dict[tuple[int, str], dict[str, Any]] = {}
@@ -55,25 +65,17 @@ def _chart_lookup(library: dict[str, Any]) -> dict[tuple[int, str], dict[str, An
     return lookup
 
 
-def _visual_width(text: str) -> float:
-    """Estimate rendered text width in Latin-character units.
+def _visual_width(text: str, font_family: str | None = None) -> float:
+    """Estimate rendered text width in half-em units.
 
     ``len(text)`` is too crude for mixed CJK / Latin decks: Chinese characters
     generally consume about twice the horizontal space of ASCII letters, while
-    punctuation and digits are narrower. The checker only needs a conservative
-    fit signal, so use Unicode East Asian Width instead of a font-specific
-    renderer.
+    punctuation and digits are narrower. Widths come from text_metrics, which
+    uses the slot's installed fonts when available and the shared
+    character-class heuristic otherwise. Whitespace is ignored so alignment
+    spaces do not count against capacity.
     """
-    width = 0.0
-    for char in "".join(text.split()):
-        east_asian_width = unicodedata.east_asian_width(char)
-        if east_asian_width in {"F", "W"}:
-            width += 2.0
-        elif east_asian_width == "A":
-            width += 1.5
-        else:
-            width += 1.0
-    return width
+    return text_width("".join(text.split()), 1.0, font_family) / UNIT_EM
 
 
 def _display_width(value: float) -> int | float:
@@ -114,7 +116,7 @@ def _geometry_capacity_width(
     max_lines = max(int(height / line_height), old_paragraphs, new_paragraphs, 1)
     horizontal_padding = 24 if width >= 180 else 12
     usable_width = max(width - horizontal_padding, width * 0.72, 1)
-    latin_units_per_line = usable_width / max(font_size_px * 0.52, 1)
+    latin_units_per_line = usable_width / max(font_size_px * UNIT_EM, 1)
     capacity = latin_units_per_line * max_lines
 
     if role == "label_candidate":
@@ -249,8 +251,9 @@ def check_plan(library: dict[str, Any], plan: dict[str, Any]) -> dict[str, Any]:
                 continue
 
             old_text = str(slot.get("text") or "")
-            old_width = _visual_width(old_text)
-            new_width = _visual_width(text)
+            font_family = (slot.get("text_metrics") or {}).get("font_family")
+            old_width = _visual_width(old_text, font_family)
+            new_width = _visual_width(text, font_family)
             old_paragraphs = int(slot.get("paragraph_count") or 1)
             new_paragraphs = max(len([line for line in text.splitlines() if line.strip()]), 1)
             status, message = _fit_status(
@@ -1,4 +1,4 @@
-"""Command-line interface: analyze / scaffold / check-plan / apply subcommands."""
+"""Command-line interface: analyze / scaffold / check-plan / apply / apply-batch subcommands."""
 
 from __future__ import annotations
 
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from .analyzer import analyze_pptx
 from .applier import apply_plan
+from .batch import apply_plans
 from .checker import check_plan, print_check_report
 from .ooxml import _load_json, _write_json
 from .scaffolder import scaffold_plan
@@ -37,15 +38,47 @@ def _parse_slide_list(value: str | None) -> list[int] | None:
     return slides
 
 
-def _timestamped_pptx_path(path: Path) -> Path:
+def _timestamped_pptx_path(path: Path, timestamp: str | None = None) -> Path:
     if path.suffix.lower() != ".pptx":
         return path
     if re.search(r"_\d{8}_\d{6}$", path.stem):
         return path
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     return path.with_name(f"{path.stem}_{timestamp}{path.suffix}")
 
 
+def _run_apply_batch(args: argparse.Namespace) -> int:
+    pptx_path = Path(args.pptx_file).expanduser().resolve()
+    if not pptx_path.exists():
+        print(f"Error: file does not exist: {pptx_path}", file=sys.stderr)
+        return 1
+    output_dir = Path(args.output_dir).expanduser().resolve()
+    # One timestamp for the whole batch keeps a release's decks together.
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = []
+    for plan_arg in args.plan_json:
+        plan_path = Path(plan_arg).expanduser().resolve()
+        output_path = _timestamped_pptx_path(output_dir / f"{plan_path.stem}.pptx", timestamp)
+        jobs.append((_load_json(plan_path), output_path))
+
+    errors = apply_plans(
+        pptx_path,
+        jobs,
+        transition=args.transition,
+        transition_duration=args.transition_duration,
+        workers=args.workers,
+    )
+    failed = 0
+    for plan_arg, (_plan, output_path), error in zip(args.plan_json, jobs, errors):
+        if error is None:
+            print(f"Template-filled PPTX -> {output_path}", file=sys.stderr)
+        else:
+            failed += 1
+            print(f"Error: {plan_arg}: {error}", file=sys.stderr)
+    print(f"Filled {len(jobs) - failed}/{len(jobs)} plans", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Analyze and fill native PPTX templates without converting slides to SVG.",
@@ -87,7 +120,36 @@ def build_parser() -> argparse.ArgumentParser:
             "automatically unless the stem already ends with one."
         ),
     )
-    apply.add_argument(
+    _add_transition_arguments(apply)
+
+    batch = subparsers.add_parser(
+        "apply-batch",
+        help="Apply many fill plans to one template, loading the template once",
+    )
+    batch.add_argument("pptx_file", help="Source PPTX file")
+    batch.add_argument("plan_json", nargs="+", help="Fill plan JSON files (one output deck each)")
+    batch.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        help=(
+            "Directory for the filled decks. Each is named after its plan, "
+            "e.g. module1.json -> module1_YYYYMMDD_HHMMSS.pptx."
+        ),
+    )
+    _add_transition_arguments(batch)
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: min(CPU count, plans, 8)); 1 runs sequentially.",
+    )
+
+    return parser
+
+
+def _add_transition_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
         "--transition",
         choices=sorted(TRANSITIONS) + ["none", KEEP_TRANSITION],
         default=DEFAULT_TRANSITION,
@@ -98,15 +160,13 @@ def build_parser() -> argparse.ArgumentParser:
             "or 'keep' to preserve each source slide's existing transition."
         ),
     )
-    apply.add_argument(
+    subparser.add_argument(
         "--transition-duration",
         type=float,
         default=DEFAULT_TRANSITION_DURATION,
         help="Transition duration in seconds (default: 0.5).",
     )
 
-    return parser
-
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
@@ -156,6 +216,9 @@ def main(argv: list[str] | None = None) -> int:
             )
             print(f"Template-filled PPTX -> {output_path}", file=sys.stderr)
             return 0
+
+        if args.command == "apply-batch":
+            return _run_apply_batch(args)
     except RuntimeError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
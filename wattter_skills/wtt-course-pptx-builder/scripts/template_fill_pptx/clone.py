@@ -29,6 +29,7 @@ both relationship types are skipped here.
 from __future__ import annotations
 
 import posixpath
+from collections.abc import MutableMapping
 from typing import Callable
 from xml.etree import ElementTree as ET
 
@@ -58,7 +59,7 @@ SHARED_REL_TYPES = frozenset(
 SKIPPED_REL_TYPES = frozenset({CHART_REL_TYPE, NOTES_SLIDE_REL_TYPE, SLIDE_REL_TYPE})
 
 
-def _make_part_allocator(entries: dict[str, bytes]) -> Callable[[str], str]:
+def _make_part_allocator(entries: MutableMapping[str, bytes]) -> Callable[[str], str]:
     """Return a function that mints a fresh part name beside a source part.
 
     Names keep the source extension (so a content-type ``Default`` still covers
@@ -101,7 +102,7 @@ def _clone_part_private_deps(
     rels_root: ET.Element,
     *,
     owner_part: str,
-    entries: dict[str, bytes],
+    entries: MutableMapping[str, bytes],
     content_root: ET.Element,
     allocate: Callable[[str], str],
     cloned: dict[str, str],
@@ -156,7 +157,7 @@ def deep_clone_slide_private_parts(
     slide_rels_root: ET.Element,
     *,
     new_slide_part: str,
-    entries: dict[str, bytes],
+    entries: MutableMapping[str, bytes],
     content_root: ET.Element,
     allocate: Callable[[str], str],
 ) -> None:
@@ -8,6 +8,7 @@ renderer so embedded notes also feed ``notes_to_audio.py``.
 from __future__ import annotations
 
 import posixpath
+from collections.abc import MutableMapping
 from xml.etree import ElementTree as ET
 
 from svg_to_pptx.pptx_notes import create_notes_slide_xml, markdown_to_plain_text
@@ -16,16 +17,16 @@ from .ooxml import NOTES_SLIDE_REL_TYPE, REL_NS, SLIDE_REL_TYPE, _qn, _xml_bytes
 from .package import _empty_relationships_root, _max_numeric_rid
 
 
-def _find_notes_master_target(entries: dict[str, bytes]) -> str | None:
+def _find_notes_master_target(entries: MutableMapping[str, bytes]) -> str | None:
     notes_master_rel_type = (
         "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesMaster"
     )
 
-    for name, data in entries.items():
+    for name in entries:
         if not name.startswith("ppt/notesSlides/_rels/notesSlide") or not name.endswith(".xml.rels"):
             continue
         try:
-            root = ET.fromstring(data)
+            root = ET.fromstring(entries[name])
         except ET.ParseError:
             continue
         for rel in root.findall(_qn(REL_NS, "Relationship")):
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import posixpath
 import re
+from collections.abc import MutableMapping
 from xml.etree import ElementTree as ET
 
 from .ooxml import (
@@ -63,7 +64,7 @@ def _relative_target(from_part: str, to_part: str) -> str:
     return posixpath.relpath(to_part, posixpath.dirname(from_part))
 
 
-def _max_slide_part_number(entries: dict[str, bytes]) -> int:
+def _max_slide_part_number(entries: MutableMapping[str, bytes]) -> int:
     max_number = 0
     pattern = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
     for name in entries:
@@ -94,7 +95,7 @@ def _max_slide_id(sld_id_lst: ET.Element) -> int:
 
 
 def _enqueue_rel_targets(
-    entries: dict[str, bytes],
+    entries: MutableMapping[str, bytes],
     rels_part: str,
     base_part: str,
     queue: list[str],
@@ -114,7 +115,7 @@ def _enqueue_rel_targets(
             queue.append(_normalize_part(target, base_part or "x"))
 
 
-def _reachable_parts(entries: dict[str, bytes]) -> set[str]:
+def _reachable_parts(entries: MutableMapping[str, bytes]) -> set[str]:
     """Parts reachable from the package root by following relationships."""
     keep: set[str] = set()
     queue: list[str] = []
@@ -128,7 +129,7 @@ def _reachable_parts(entries: dict[str, bytes]) -> set[str]:
     return keep
 
 
-def _prune_unreferenced_parts(entries: dict[str, bytes], content_root: ET.Element) -> None:
+def _prune_unreferenced_parts(entries: MutableMapping[str, bytes], content_root: ET.Element) -> None:
     """Drop parts not reachable from the package root through relationships.
 
     After cloning only the planned slides, the original slide / notesSlide /
@@ -0,0 +1,194 @@
+"""apply: zip-backed part map that streams untouched parts straight through.
+
+Templates are often hundreds of MB of video and photo media while a fill only
+rewrites a handful of XML parts. ``ZipParts`` presents the source package as a
+``name -> bytes`` mapping: reading an untouched part inflates it on demand and
+keeps nothing, writing or deleting a part records the change in memory. On
+``write`` every untouched part is copied as its raw compressed bytes (no
+inflate / deflate round-trip), so time and peak memory scale with the parts
+the plan actually modifies rather than with the template size.
+
+Part order matches the former eager ``dict`` of entries: source order, with
+parts added by the fill appended in the order they were first written.
+
+Several ``ZipParts`` over the same open zip may share a bounded ``PartCache``
+of inflated source parts, so a batch fill reads a template part once while
+it stays within the cache budget.
+"""
+
+from __future__ import annotations
+
+import copy
+import struct
+import zipfile
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+
+_COPY_CHUNK = 1024 * 1024
+_DATA_DESCRIPTOR_FLAG = 0x08
+_ZIP64_EXTRA_ID = 0x0001
+
+# Local file header (APPNOTE 4.3.7): signature, versions, flags, method,
+# time, date, CRC, sizes, then the file name and extra field lengths.
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class PartCache:
+    """Inflated source parts, least recently used evicted past ``max_bytes``.
+
+    Shared by every ``ZipParts`` of one template, so a batch re-reads a part
+    only after it has been pushed out; a part larger than the whole budget
+    is never kept.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._parts: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, name: str) -> bytes | None:
+        data = self._parts.get(name)
+        if data is not None:
+            self._parts.move_to_end(name)
+        return data
+
+    def __setitem__(self, name: str, data: bytes) -> None:
+        old = self._parts.pop(name, None)
+        if old is not None:
+            self.size -= len(old)
+        if len(data) > self.max_bytes:
+            return
+        self._parts[name] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _name, evicted = self._parts.popitem(last=False)
+            self.size -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+
+class ZipParts(MutableMapping[str, bytes]):
+    """Mutable view of a zip package's parts; the source zip must stay open."""
+
+    def __init__(self, zf: zipfile.ZipFile, cache: PartCache | None = None) -> None:
+        self._zf = zf
+        self._cache = cache
+        self._source = {info.filename: info for info in zf.infolist() if not info.is_dir()}
+        self._names: dict[str, None] = dict.fromkeys(self._source)
+        self._modified: dict[str, bytes] = {}
+
+    def __getitem__(self, name: str) -> bytes:
+        if name in self._modified:
+            return self._modified[name]
+        if name not in self._names:
+            raise KeyError(name)
+        if self._cache is None:
+            return self._zf.read(self._source[name])
+        data = self._cache.get(name)
+        if data is None:
+            data = self._zf.read(self._source[name])
+            self._cache[name] = data
+        return data
+
+    def __setitem__(self, name: str, data: bytes) -> None:
+        self._modified[name] = data
+        self._names.setdefault(name)
+
+    def __delitem__(self, name: str) -> None:
+        del self._names[name]
+        self._modified.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def write(self, output_path: Path) -> None:
+        """Write the package: modified parts deflated, the rest copied raw.
+
+        Where this ``zipfile`` lacks the hooks the raw copy needs, untouched
+        parts are re-added through ``writestr`` with their original method.
+        """
+        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as out:
+            raw_copy = _supports_raw_copy(out)
+            for name in self._names:
+                if name in self._modified:
+                    out.writestr(name, self._modified[name])
+                elif raw_copy:
+                    _copy_raw_entry(self._zf, self._source[name], out)
+                else:
+                    info = self._source[name]
+                    entry = copy.copy(info)
+                    entry.extra = _strip_zip64_extra(info.extra)
+                    out.writestr(entry, self._zf.read(info))
+
+
+def _supports_raw_copy(out: zipfile.ZipFile) -> bool:
+    """Whether ``out`` has the (undocumented) members ``_copy_raw_entry`` drives.
+
+    ``ZipInfo.FileHeader`` builds the local header and ``start_dir`` /
+    ``_didModify`` make ``close`` write the central directory after the
+    appended entries; none of them is public API.
+    """
+    return (
+        callable(getattr(zipfile.ZipInfo, "FileHeader", None))
+        and isinstance(getattr(out, "start_dir", None), int)
+        and hasattr(out, "_didModify")
+        and isinstance(getattr(out, "filelist", None), list)
+        and isinstance(getattr(out, "NameToInfo", None), dict)
+    )
+
+
+def _copy_raw_entry(src: zipfile.ZipFile, info: zipfile.ZipInfo, out: zipfile.ZipFile) -> None:
+    """Append ``info``'s compressed payload from ``src`` to ``out`` verbatim.
+
+    ``zipfile`` has no public raw-copy API, so this writes the local header
+    itself and registers the entry for the central directory the same way
+    ``ZipFile.write`` does. CRC and sizes come from the source entry, which
+    ``ZipFile.read`` has already verified for every part the fill looked at.
+    """
+    fp = src.fp
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    *_fields, name_length, extra_length = _LOCAL_HEADER.unpack(header)
+    fp.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+    entry = copy.copy(info)
+    # Sizes and CRC go into the local header, so no trailing data descriptor;
+    # a stale zip64 extra is dropped and re-added by FileHeader when needed.
+    entry.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+    entry.extra = _strip_zip64_extra(info.extra)
+    entry.header_offset = out.fp.tell()
+    out.fp.write(entry.FileHeader())
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = fp.read(min(_COPY_CHUNK, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        out.fp.write(chunk)
+        remaining -= len(chunk)
+    out.filelist.append(entry)
+    out.NameToInfo[entry.filename] = entry
+    out.start_dir = out.fp.tell()
+    out._didModify = True
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """``extra`` without its zip64 record(s); other records are kept as is."""
+    kept = bytearray()
+    pos = 0
+    while pos + 4 <= len(extra):
+        record_id, size = struct.unpack_from("<HH", extra, pos)
+        if record_id != _ZIP64_EXTRA_ID:
+            kept += extra[pos:pos + 4 + size]
+        pos += 4 + size
+    return bytes(kept)
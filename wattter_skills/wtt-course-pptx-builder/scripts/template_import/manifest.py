@@ -31,6 +31,8 @@ from pathlib import Path, PurePosixPath
 from typing import Any
 from xml.etree import ElementTree as ET
 
+from pptx_to_svg.media_store import MediaStore, copy_media_stream
+
 
 NS = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
@@ -439,7 +441,20 @@ def write_summary(output_path: Path, manifest: dict[str, Any]) -> None:
     output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def build_manifest(pptx_path: Path, output_dir: Path) -> dict[str, Any]:
+def build_manifest(
+    pptx_path: Path,
+    output_dir: Path,
+    *,
+    media_store_dir: Path | None = None,
+    media_hardlink: bool = False,
+) -> dict[str, Any]:
+    """Extract assets into ``output_dir/assets`` and return the manifest.
+
+    With ``media_store_dir``, assets are reflinked or copied from that
+    content-addressed store (see ``pptx_to_svg.media_store``);
+    ``media_hardlink`` additionally allows hardlinks to the stored blobs.
+    """
+    store = MediaStore(media_store_dir, hardlink=media_hardlink) if media_store_dir else None
     with zipfile.ZipFile(pptx_path, "r") as zf:
         presentation_root = load_xml_from_zip(zf, "ppt/presentation.xml")
         if presentation_root is None:
@@ -513,9 +528,11 @@ def build_manifest(pptx_path: Path, output_dir: Path) -> dict[str, Any]:
             while destination.exists():
                 destination = asset_dir / f"{stem}_{counter}{suffix}"
                 counter += 1
-            with zf.open(info.filename) as src, open(destination, "wb") as dst:
-                shutil.copyfileobj(src, dst)
+            with zf.open(info.filename) as src:
+                copy_media_stream(src, destination, store)
             copied_assets[info.filename] = destination.name
+        if store is not None:
+            store.prune()
 
         slide_records: list[SlideRecord] = []
         asset_usage: Counter[str] = Counter()
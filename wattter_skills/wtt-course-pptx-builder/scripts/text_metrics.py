@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+PPT Master - Text Metrics
+
+One text-measurement engine for every tool that sizes or wraps text:
+svg_to_pptx (text-box sizing), pptx_to_svg (line wrapping) and
+template_fill_pptx (fit checks).
+
+Widths come from the real advance-width tables of locally installed TTF / OTF
+/ TTC fonts when the requested family is available, and from the character
+class heuristic the converters have always used otherwise (CJK 1em, space
+0.3em, wide Latin 0.75em, narrow Latin 0.3em, everything else 0.55em). A
+font-family value is treated like a CSS stack: each character is measured
+with the first listed font that has a glyph for it, so a Latin face plus an
+East Asian face measure mixed text the way renderers draw it.
+
+Fonts are located through an index of family names (including localized
+names such as 微软雅黑) kept in ~/.ppt-master/cache/font_index.json and
+refreshed only for font files that changed. A font's cmap + hmtx tables are
+read once per process into a flat per-code-point array.
+
+Wrapping uses prefix sums of per-character widths: the width of any slice is
+one subtraction and the longest slice that fits is a binary search, so
+breaking a long paragraph into lines is linear in its length.
+
+Environment:
+    TEXT_METRICS_FONTS  "off" to always use the heuristic (reproducible
+                        output across machines), or extra font directories
+                        separated by os.pathsep
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+
+FONT_INDEX_PATH = Path.home() / ".ppt-master" / "cache" / "font_index.json"
+FONT_SUFFIXES = frozenset({".ttf", ".otf", ".ttc", ".otc"})
+_FONT_INDEX_VERSION = 2
+
+# Synthetic bold when no bold face is available: Latin glyphs widen a little,
+# CJK glyphs keep their em advance in common PPT fonts.
+SYNTHETIC_BOLD_FACTOR = 1.05
+
+GENERIC_FAMILIES = frozenset({
+    "serif", "sans-serif", "monospace", "cursive", "fantasy", "system-ui",
+    "ui-serif", "ui-sans-serif", "ui-monospace", "-apple-system",
+    "blinkmacsystemfont",
+})
+
+_MISSING = -1
+
+
+# ---------------------------------------------------------------------------
+# Heuristic advances
+# ---------------------------------------------------------------------------
+
+def is_cjk(ch: str) -> bool:
+    """Check if a character is CJK (Chinese/Japanese/Korean) or full-width."""
+    cp = ord(ch)
+    return (0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF or
+            0x2E80 <= cp <= 0x2EFF or 0x3000 <= cp <= 0x303F or
+            0xFF00 <= cp <= 0xFFEF or 0xF900 <= cp <= 0xFAFF or
+            0x20000 <= cp <= 0x2A6DF)
+
+
+def heuristic_advance(ch: str) -> float:
+    """Approximate advance of one character, in em."""
+    if is_cjk(ch):
+        return 1.0  # CJK is approximately 1em per glyph
+    if ch == ' ':
+        return 0.3
+    if ch in 'mMwWOQ%':
+        return 0.75
+    if ch in 'iIlj!|':
+        return 0.3
+    # digits are tabular (uniform ~0.55em) in most UI fonts, including '1' —
+    # classing it with 'il|' under-sizes boxes and makes renderers that
+    # ignore wrap="none" (LibreOffice) wrap the line
+    return 0.55
+
+
+# ---------------------------------------------------------------------------
+# Font files
+# ---------------------------------------------------------------------------
+
+class FontAdvances:
+    """Advance widths of one font face, indexed by code point."""
+
+    def __init__(self, units_per_em: int, bmp: array, astral: dict[int, int]):
+        self.units_per_em = units_per_em
+        self._bmp = bmp
+        self._astral = astral
+
+    def advance(self, ch: str) -> float | None:
+        """Advance of ``ch`` in em, or None when the font has no glyph."""
+        cp = ord(ch)
+        units = self._bmp[cp] if cp < 0x10000 else self._astral.get(cp, _MISSING)
+        if units == _MISSING:
+            return None
+        return units / self.units_per_em
+
+
+def _sfnt_tables(data: bytes, offset: int) -> dict[bytes, tuple[int, int]]:
+    num_tables = struct.unpack_from(">H", data, offset + 4)[0]
+    tables = {}
+    for i in range(num_tables):
+        tag, _checksum, table_offset, length = struct.unpack_from(">4sIII", data, offset + 12 + 16 * i)
+        tables[tag] = (table_offset, length)
+    return tables
+
+
+def _face_offsets(data: bytes) -> list[int]:
+    if data[:4] == b"ttcf":
+        count = struct.unpack_from(">I", data, 8)[0]
+        return list(struct.unpack_from(f">{count}I", data, 12))
+    return [0]
+
+
+def _decode_name(platform_id: int, raw: bytes) -> str | None:
+    try:
+        if platform_id in (0, 3):
+            return raw.decode("utf-16-be")
+        if platform_id == 1:
+            return raw.decode("mac_roman")
+    except UnicodeDecodeError:
+        return None
+    return None
+
+
+def _face_info(data: bytes, offset: int) -> dict | None:
+    """Family names, subfamily, weight and style bits of the face at ``offset``."""
+    tables = _sfnt_tables(data, offset)
+    if b"name" not in tables or b"hmtx" not in tables or b"cmap" not in tables:
+        return None
+    name_offset, _ = tables[b"name"]
+    _fmt, count, string_offset = struct.unpack_from(">HHH", data, name_offset)
+    families: list[str] = []
+    subfamilies: dict[int, str] = {}
+    for i in range(count):
+        platform_id, _enc, _lang, name_id, length, str_off = struct.unpack_from(
+            ">HHHHHH", data, name_offset + 6 + 12 * i
+        )
+        if name_id not in (1, 2, 16, 17):
+            continue
+        start = name_offset + string_offset + str_off
+        name = _decode_name(platform_id, data[start:start + length])
+        if not name:
+            continue
+        if name_id in (2, 17):
+            subfamilies.setdefault(name_id, name)
+        elif name not in families:
+            families.append(name)
+    # The typographic subfamily (17) names the real style ("Light Italic");
+    # the legacy one (2) squeezes it into Regular / Bold / Italic.
+    subfamily = subfamilies.get(17) or subfamilies.get(2, "")
+
+    bold = italic = False
+    weight = None
+    if b"OS/2" in tables:
+        os2_offset = tables[b"OS/2"][0]
+        weight = struct.unpack_from(">H", data, os2_offset + 4)[0]
+        fs_selection = struct.unpack_from(">H", data, os2_offset + 62)[0]
+        bold = bool(fs_selection & 0x20)
+        italic = bool(fs_selection & 0x01)
+    elif b"head" in tables:
+        mac_style = struct.unpack_from(">H", data, tables[b"head"][0] + 44)[0]
+        bold = bool(mac_style & 0x01)
+        italic = bool(mac_style & 0x02)
+    italic = italic or any(word in subfamily.lower() for word in ("italic", "oblique"))
+    if not weight:
+        weight = 700 if bold else 400
+    return {"families": families, "subfamily": subfamily, "weight": weight,
+            "bold": bold, "italic": italic}
+
+
+def _cmap_groups(data: bytes, cmap_offset: int):
+    """Yield (first_code, last_code, glyph_for(code)) spans of the best cmap."""
+    num_subtables = struct.unpack_from(">H", data, cmap_offset + 2)[0]
+    candidates = {}
+    for i in range(num_subtables):
+        platform_id, encoding_id, sub_offset = struct.unpack_from(">HHI", data, cmap_offset + 4 + 8 * i)
+        fmt = struct.unpack_from(">H", data, cmap_offset + sub_offset)[0]
+        candidates[(platform_id, encoding_id, fmt)] = cmap_offset + sub_offset
+    for key in ((3, 10, 12), (0, 4, 12), (0, 6, 12), (3, 1, 4), (0, 3, 4), (0, 4, 4), (0, 1, 4), (0, 0, 4)):
+        if key in candidates:
+            fmt, sub = key[2], candidates[key]
+            break
+    else:
+        return
+
+    if fmt == 12:
+        num_groups = struct.unpack_from(">I", data, sub + 12)[0]
+        for i in range(num_groups):
+            start, end, start_gid = struct.unpack_from(">III", data, sub + 16 + 12 * i)
+            yield start, end, lambda code, base=start_gid - start: code + base
+        return
+
+    seg_count = struct.unpack_from(">H", data, sub + 6)[0] // 2
+    ends_at = sub + 14
+    starts_at = ends_at + 2 * seg_count + 2
+    deltas_at = starts_at + 2 * seg_count
+    range_offsets_at = deltas_at + 2 * seg_count
+    ends = struct.unpack_from(f">{seg_count}H", data, ends_at)
+    starts = struct.unpack_from(f">{seg_count}H", data, starts_at)
+    deltas = struct.unpack_from(f">{seg_count}h", data, deltas_at)
+    range_offsets = struct.unpack_from(f">{seg_count}H", data, range_offsets_at)
+    for seg in range(seg_count):
+        start, end, delta, range_offset = starts[seg], ends[seg], deltas[seg], range_offsets[seg]
+        if start == 0xFFFF:
+            continue
+        if range_offset == 0:
+            yield start, end, lambda code, d=delta: (code + d) & 0xFFFF
+        else:
+            base = range_offsets_at + 2 * seg + range_offset
+
+            def glyph(code, base=base, start=start, delta=delta):
+                gid = struct.unpack_from(">H", data, base + 2 * (code - start))[0]
+                return (gid + delta) & 0xFFFF if gid else 0
+
+            yield start, end, glyph
+
+
+def _load_advances(path: str, face_index: int) -> FontAdvances | None:
+    try:
+        data = Path(path).read_bytes()
+        offset = _face_offsets(data)[face_index]
+        tables = _sfnt_tables(data, offset)
+        units_per_em = struct.unpack_from(">H", data, tables[b"head"][0] + 18)[0] or 1000
+        num_h_metrics = struct.unpack_from(">H", data, tables[b"hhea"][0] + 34)[0]
+        hmtx = struct.unpack_from(f">{2 * num_h_metrics}H", data, tables[b"hmtx"][0])
+        widths = hmtx[0::2]
+
+        bmp = array("i", [_MISSING]) * 0x10000
+        astral: dict[int, int] = {}
+        last_width = widths[-1]
+        for start, end, glyph_for in _cmap_groups(data, tables[b"cmap"][0]):
+            for code in range(start, end + 1):
+                gid = glyph_for(code)
+                if not gid:
+                    continue
+                width = widths[gid] if gid < num_h_metrics else last_width
+                if code < 0x10000:
+                    bmp[code] = width
+                else:
+                    astral[code] = width
+    except (OSError, KeyError, IndexError, struct.error):
+        return None
+    return FontAdvances(units_per_em, bmp, astral)
+
+
+# ---------------------------------------------------------------------------
+# Font index
+# ---------------------------------------------------------------------------
+
+def _font_dirs() -> list[Path]:
+    dirs: list[Path] = []
+    extra = os.environ.get("TEXT_METRICS_FONTS", "").strip()
+    if extra:
+        dirs.extend(Path(p).expanduser() for p in extra.split(os.pathsep) if p)
+    home = Path.home()
+    if sys.platform == "darwin":
+        dirs += [home / "Library" / "Fonts", Path("/Library/Fonts"), Path("/System/Library/Fonts")]
+    elif sys.platform == "win32":
+        windir = Path(os.environ.get("WINDIR", r"C:\Windows"))
+        dirs += [windir / "Fonts"]
+        local = os.environ.get("LOCALAPPDATA")
+        if local:
+            dirs.append(Path(local) / "Microsoft" / "Windows" / "Fonts")
+    else:
+        dirs += [home / ".fonts", home / ".local" / "share" / "fonts",
+                 Path("/usr/share/fonts"), Path("/usr/local/share/fonts")]
+    return [d for d in dirs if d.is_dir()]
+
+
+def _scan_font_files() -> dict[str, tuple[float, int]]:
+    found: dict[str, tuple[float, int]] = {}
+    for root_dir in _font_dirs():
+        for dirpath, _dirnames, filenames in os.walk(root_dir):
+            for filename in filenames:
+                if Path(filename).suffix.lower() not in FONT_SUFFIXES:
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found[path] = (stat.st_mtime, stat.st_size)
+    return found
+
+
+def _read_index_cache() -> dict:
+    try:
+        cached = json.loads(FONT_INDEX_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cached.get("version") != _FONT_INDEX_VERSION:
+        return {}
+    return cached.get("files", {})
+
+
+def _write_index_cache(files: dict) -> None:
+    tmp_path = FONT_INDEX_PATH.with_name(f".{FONT_INDEX_PATH.name}.{os.getpid()}.tmp")
+    try:
+        FONT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({"version": _FONT_INDEX_VERSION, "files": files}), encoding="utf-8")
+        os.replace(tmp_path, FONT_INDEX_PATH)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _font_files() -> dict[str, dict]:
+    """Installed font files with their faces, refreshing only changed files."""
+    cached = _read_index_cache()
+    files: dict[str, dict] = {}
+    changed = False
+    for path, (mtime, size) in _scan_font_files().items():
+        entry = cached.get(path)
+        if entry is None or entry.get("mtime") != mtime or entry.get("size") != size:
+            faces = []
+            try:
+                data = Path(path).read_bytes()
+                for face_index, offset in enumerate(_face_offsets(data)):
+                    info = _face_info(data, offset)
+                    if info is not None:
+                        info["index"] = face_index
+                        faces.append(info)
+            except (OSError, struct.error, IndexError):
+                pass
+            entry = {"mtime": mtime, "size": size, "faces": faces}
+            changed = True
+        files[path] = entry
+    if changed or len(files) != len(cached):
+        _write_index_cache(files)
+    return files
+
+
+def _weight_rank(weight: int, target: int) -> tuple[int, bool]:
+    """Sort key for the face nearest ``target``; heavier wins a tie, as in CSS."""
+    return abs(weight - target), weight < target
+
+
+@lru_cache(maxsize=1)
+def _font_index() -> dict[str, dict[str, tuple[str, int]]]:
+    """casefolded family -> {"regular" / "bold": (path, face index)}.
+
+    A typographic family (name ID 16) spans every weight from Thin to Black;
+    "regular" is the upright face nearest weight 400 and "bold" the one
+    nearest 700 among faces of weight 600 and up.
+    """
+    files = _font_files()
+    candidates: dict[str, list[tuple[int, str, int]]] = {}
+    for path in sorted(files):
+        for face in files[path]["faces"]:
+            if face.get("italic"):
+                continue
+            weight = face.get("weight") or (700 if face.get("bold") else 400)
+            for family in face.get("families", []):
+                candidates.setdefault(family.casefold(), []).append((weight, path, face["index"]))
+
+    index: dict[str, dict[str, tuple[str, int]]] = {}
+    for family, faces in candidates.items():
+        # min() keeps the first of equal ranks, i.e. the first path in sort order.
+        _weight, path, face_index = min(faces, key=lambda f: _weight_rank(f[0], 400))
+        styles = {"regular": (path, face_index)}
+        heavy = [f for f in faces if f[0] >= 600]
+        if heavy:
+            _weight, path, face_index = min(heavy, key=lambda f: _weight_rank(f[0], 700))
+            styles["bold"] = (path, face_index)
+        index[family] = styles
+    return index
+
+
+def _fonts_enabled() -> bool:
+    return os.environ.get("TEXT_METRICS_FONTS", "").strip().lower() not in {"off", "0", "false", "no"}
+
+
+@lru_cache(maxsize=1)
+def fonts_fingerprint() -> str:
+    """Token that changes when the fonts used for measurement change.
+
+    Lets callers that cache measured layouts invalidate them when fonts are
+    installed, removed, or switched off.
+    """
+    if not _fonts_enabled():
+        return "heuristic"
+    digest = hashlib.sha256()
+    for path, entry in sorted(_font_files().items()):
+        digest.update(f"{path}\0{entry.get('mtime')}\0{entry.get('size')}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def font_advances(family: str, bold: bool = False) -> tuple[FontAdvances, bool] | None:
+    """Advance table for one installed family, and whether it is a real bold face.
+
+    A bold request falls back to the regular face (synthetic bold); None when
+    the family is not installed or font lookup is disabled.
+    """
+    if not _fonts_enabled() or family.casefold() in GENERIC_FAMILIES:
+        return None
+    faces = _font_index().get(family.casefold())
+    if not faces:
+        return None
+    if bold and "bold" in faces:
+        advances = _load_advances(*faces["bold"])
+        if advances is not None:
+            return advances, True
+    face = faces.get("regular") or faces.get("bold")
+    advances = _load_advances(*face)
+    if advances is None:
+        return None
+    return advances, face == faces.get("bold")
+
+
+def parse_family_stack(font_family: str | None) -> tuple[str, ...]:
+    """Split a CSS font-family value into bare family names."""
+    if not font_family:
+        return ()
+    names = []
+    for part in font_family.replace("&quot;", '"').split(","):
+        name = part.strip().strip("'\"").strip()
+        if name:
+            names.append(name)
+    return tuple(names)
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=256)
+def _stack_fonts(stack: tuple[str, ...], bold: bool) -> tuple[tuple[FontAdvances, bool], ...]:
+    return tuple(f for f in (font_advances(name, bold) for name in stack) if f is not None)
+
+
+@lru_cache(maxsize=256)
+def _advance_table(stack: tuple[str, ...], bold: bool, bold_cjk: bool) -> dict[str, tuple[float, bool]]:
+    """Per-stack memo: character -> (advance in em, apply synthetic bold)."""
+    return {}
+
+
+def _resolve_advance(ch: str, fonts, bold: bool, bold_cjk: bool) -> tuple[float, bool]:
+    for advances, is_bold_face in fonts:
+        em = advances.advance(ch)
+        if em is not None:
+            return em, bold and not is_bold_face and (bold_cjk or not is_cjk(ch))
+    return heuristic_advance(ch), bold and (bold_cjk or not is_cjk(ch))
+
+
+def char_widths(
+    text: str,
+    font_size: float,
+    font_family: str | None = None,
+    bold: bool = False,
+    *,
+    bold_cjk: bool = False,
+) -> list[float]:
+    """Advance of every character of ``text`` in pixels at ``font_size``.
+
+    Each character uses the first font of the ``font_family`` stack that has
+    a glyph for it, else the heuristic. ``bold`` selects the bold face when
+    one is installed, otherwise widens non-CJK characters by
+    SYNTHETIC_BOLD_FACTOR (CJK too with ``bold_cjk``, for callers that size
+    boxes generously).
+    """
+    stack = parse_family_stack(font_family)
+    table = _advance_table(stack, bold, bold_cjk)
+    fonts = None
+    widths = []
+    for ch in text:
+        entry = table.get(ch)
+        if entry is None:
+            if fonts is None:
+                fonts = _stack_fonts(stack, bold)
+            entry = table[ch] = _resolve_advance(ch, fonts, bold, bold_cjk)
+        w = font_size * entry[0]
+        if entry[1]:
+            w *= SYNTHETIC_BOLD_FACTOR
+        widths.append(w)
+    return widths
+
+
+def text_width(
+    text: str,
+    font_size: float,
+    font_family: str | None = None,
+    bold: bool = False,
+    *,
+    bold_cjk: bool = False,
+) -> float:
+    """Rendered width of ``text`` in pixels (see char_widths)."""
+    return sum(char_widths(text, font_size, font_family, bold, bold_cjk=bold_cjk))
+
+
+_FIT_EPSILON = 1e-9
+
+
+class MeasuredText:
+    """Prefix sums of a string's character widths, for slicing and wrapping."""
+
+    def __init__(self, text: str, widths: list[float]):
+        self.text = text
+        self.prefix = list(accumulate(widths, initial=0.0))
+
+    def width(self, start: int, end: int) -> float:
+        return self.prefix[end] - self.prefix[start]
+
+    def fit(self, start: int, max_width: float) -> int:
+        """Largest ``end`` such that text[start:end] fits in ``max_width``.
+
+        Prefix differences round differently from a running total, so a line
+        that fills ``max_width`` exactly may come out a hair over; the
+        tolerance keeps it on the line.
+        """
+        limit = self.prefix[start] + max_width + _FIT_EPSILON
+        end = bisect_right(self.prefix, limit, lo=start) - 1
+        return max(end, start)
+
+
+def measure(
+    text: str,
+    font_size: float,
+    font_family: str | None = None,
+    bold: bool = False,
+) -> MeasuredText:
+    return MeasuredText(text, char_widths(text, font_size, font_family, bold))
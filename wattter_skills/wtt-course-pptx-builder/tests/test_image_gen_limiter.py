@@ -0,0 +1,35 @@
+import contextlib
+import io
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from image_gen import _AimdLimiter  # noqa: E402
+
+
+class AimdLimiterTest(unittest.TestCase):
+    def rate_limit(self, limiter: _AimdLimiter) -> str:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            limiter.on_rate_limit(time.monotonic())
+        return out.getvalue()
+
+    def test_halves_and_reports(self) -> None:
+        limiter = _AimdLimiter(4, cooldown=0)
+        self.assertIn("concurrency 4 → 2", self.rate_limit(limiter))
+        self.assertEqual(limiter.limit, 2)
+
+    def test_quiet_at_the_floor(self) -> None:
+        limiter = _AimdLimiter(1, cooldown=0)
+        self.assertEqual(self.rate_limit(limiter), "")
+        self.assertEqual(limiter.limit, 1)
+        self.assertGreater(limiter.resume_at, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
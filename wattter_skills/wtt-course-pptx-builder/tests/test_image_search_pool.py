@@ -0,0 +1,61 @@
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import image_search  # noqa: E402
+from image_sources.provider_common import AssetCandidate, ImageSearchRequest  # noqa: E402
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is an optional dependency
+    Image = None
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, content_type: str) -> None:
+        self.content = content
+        self.headers = {"Content-Type": content_type}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class CandidatePoolTest(unittest.TestCase):
+    def test_winner_is_written_without_reencoding(self) -> None:
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 1000), "teal").save(buffer, format="JPEG", quality=71)
+        served = buffer.getvalue()
+        session = mock.Mock()
+        session.get.return_value = FakeResponse(served, "image/jpeg")
+        # The URL claims PNG; the bytes are JPEG.
+        candidate = AssetCandidate(provider="fake", title="teal",
+                                   download_url="https://example.org/teal.png")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = Path(tmp) / "cover.jpg"
+            with mock.patch.object(image_search, "get_http_session", return_value=session), \
+                    mock.patch.object(image_search, "_search_providers", return_value=[[candidate]]), \
+                    mock.patch.object(image_search, "score_candidate", return_value=1.0), \
+                    contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                chosen, _provider, _stage = image_search.search_and_download(
+                    ["fake"], ImageSearchRequest(query="teal"),
+                    output_path=output_path, strict_no_attribution=False,
+                )
+
+            self.assertIs(chosen, candidate)
+            cand_path = Path(tmp) / "candidates" / "cover" / "candidate_01.jpg"
+            self.assertEqual(cand_path.read_bytes(), served)
+            self.assertEqual(output_path.read_bytes(), served)
+            self.assertEqual(session.get.call_count, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from pptx_to_svg.converter import ConvertOptions  # noqa: E402
+from pptx_to_svg.media_store import (  # noqa: E402
+    MediaStore,
+    copy_media_stream,
+    media_digest,
+    write_media,
+)
+
+
+class MediaStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.store = MediaStore(self.root / "store", max_bytes=1024 * 1024)
+
+    def test_library_default_has_no_store(self) -> None:
+        self.assertIsNone(ConvertOptions().media_store_dir)
+
+    def test_editing_one_output_leaves_store_and_other_outputs_alone(self) -> None:
+        blob = b"\x89PNG logo bytes"
+        first = self.root / "project_a" / "logo.png"
+        second = self.root / "project_b" / "logo.png"
+        first.parent.mkdir()
+        second.parent.mkdir()
+        write_media(first, blob, self.store)
+        copy_media_stream(io.BytesIO(blob), second, self.store)
+
+        with open(first, "r+b") as fh:
+            fh.write(b"EDITED")
+
+        self.assertEqual(second.read_bytes(), blob)
+        # Without reflink support here nothing goes through the store at all.
+        blob_path = self.store.blob_path(media_digest(blob), ".png")
+        if blob_path.exists():
+            self.assertEqual(blob_path.read_bytes(), blob)
+
+    def test_stored_stream_is_reused_without_writing(self) -> None:
+        blob = b"stored media" * 100
+        path = self.store.put_stream(io.BytesIO(blob), ".png")
+        inode = path.stat().st_ino
+
+        with mock.patch("builtins.open", side_effect=AssertionError("wrote a file")):
+            self.assertEqual(self.store.put_stream(io.BytesIO(blob), ".png"), path)
+            self.assertEqual(self.store.put_bytes(blob, ".png"), path)
+        self.assertEqual(path.stat().st_ino, inode)
+        self.assertEqual([p.name for p in self.store.root.iterdir()], [path.name])
+
+    def test_truncated_blob_is_rewritten(self) -> None:
+        blob = b"original media"
+        path = self.store.put_bytes(blob, ".png")
+        path.write_bytes(blob[:4])
+
+        self.assertEqual(self.store.put_stream(io.BytesIO(blob), ".png"), path)
+        self.assertEqual(path.read_bytes(), blob)
+
+    def test_without_sharing_media_is_written_directly(self) -> None:
+        target = self.root / "out" / "photo.jpg"
+        target.parent.mkdir()
+        with mock.patch.object(MediaStore, "shares_into", return_value=False):
+            copy_media_stream(io.BytesIO(b"jpeg bytes"), target, self.store)
+            write_media(target.with_name("logo.png"), b"png bytes", self.store)
+
+        self.assertEqual(target.read_bytes(), b"jpeg bytes")
+        self.assertEqual(target.with_name("logo.png").read_bytes(), b"png bytes")
+        self.assertFalse(self.store.root.exists())
+
+    def test_failed_link_falls_back_to_a_direct_copy(self) -> None:
+        store = MediaStore(self.root / "store", hardlink=True, max_bytes=1024 * 1024)
+        target = self.root / "out" / "photo.jpg"
+        target.parent.mkdir()
+
+        def broken_link(blob_path: Path, link_target: Path) -> None:
+            link_target.write_bytes(b"partial")
+            raise OSError("blob pruned underneath us")
+
+        self.assertTrue(store.shares_into(target.parent))
+        with mock.patch.object(store, "link", side_effect=broken_link):
+            copy_media_stream(io.BytesIO(b"jpeg bytes"), target, store)
+            write_media(target.with_name("logo.png"), b"png bytes", store)
+
+        self.assertEqual(target.read_bytes(), b"jpeg bytes")
+        self.assertEqual(target.with_name("logo.png").read_bytes(), b"png bytes")
+
+    def test_hardlinked_store_shares_the_blob(self) -> None:
+        store = MediaStore(self.root / "store", hardlink=True, max_bytes=1024 * 1024)
+        target = self.root / "out" / "photo.jpg"
+        target.parent.mkdir()
+        copy_media_stream(io.BytesIO(b"jpeg bytes"), target, store)
+
+        blob_path = store.blob_path(media_digest(b"jpeg bytes"), ".jpg")
+        self.assertTrue(os.path.samefile(target, blob_path))
+
+    def test_prune_evicts_least_recently_used(self) -> None:
+        store = MediaStore(self.root / "capped", max_bytes=250)
+        paths = [store.put_bytes(bytes([n]) * 100, ".bin") for n in range(3)]
+        for age, path in zip((300, 200, 100), paths):
+            os.utime(path, (path.stat().st_atime, path.stat().st_mtime - age))
+
+        store.prune()
+
+        self.assertEqual([path.exists() for path in paths], [False, True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from pptx_to_svg.converter import ConvertOptions, convert_pptx_to_svg  # noqa: E402
+
+try:
+    from pptx import Presentation
+except ImportError:  # python-pptx is an optional dependency
+    Presentation = None
+
+
+def build_deck(path: Path, slide_count: int) -> None:
+    prs = Presentation()
+    layout = prs.slide_layouts[5]
+    for number in range(1, slide_count + 1):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {number}"
+    prs.save(str(path))
+
+
+def corrupt_part(path: Path, part_name: str) -> None:
+    """Rewrite the zip with ``part_name`` replaced by malformed XML."""
+    with zipfile.ZipFile(path) as src:
+        members = [(info, src.read(info)) for info in src.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info, data in members:
+            if info.filename == part_name:
+                data = b"<p:sld><p:cSld>"
+            dst.writestr(info, data)
+
+
+@unittest.skipIf(Presentation is None, "python-pptx is not installed")
+class BrokenSlideTests(unittest.TestCase):
+    def convert(self, workers: int):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        root = Path(temporary.name)
+        deck = root / "deck.pptx"
+        build_deck(deck, 4)
+        corrupt_part(deck, "ppt/slides/slide2.xml")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            result = convert_pptx_to_svg(
+                deck,
+                root / "out",
+                ConvertOptions(inheritance_mode="flat", workers=workers),
+            )
+        return root / "out", result, stderr.getvalue()
+
+    def test_malformed_slide_is_skipped_and_rest_convert(self):
+        out, result, stderr = self.convert(workers=1)
+        self.assertEqual([art.index for art in result.slides], [1, 3, 4])
+        self.assertIn("skipping slide 2", stderr)
+        written = sorted(p.name for p in (out / "svg").glob("*.svg"))
+        self.assertEqual(written, ["slide_01.svg", "slide_03.svg", "slide_04.svg"])
+
+    def test_malformed_slide_is_skipped_in_process_pool(self):
+        _out, result, _stderr = self.convert(workers=2)
+        self.assertEqual([art.index for art in result.slides], [1, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
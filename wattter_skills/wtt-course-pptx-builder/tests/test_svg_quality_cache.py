@@ -0,0 +1,74 @@
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from svg_quality_checker import SVGQualityChecker  # noqa: E402
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is an optional dependency
+    Image = None
+
+SVG_TEMPLATE = """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
+     viewBox="0 0 1280 720" width="1280" height="720">
+  <rect width="1280" height="720" fill="#FFFFFF"/>
+  {image}
+</svg>
+"""
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class ResultCacheImageTest(unittest.TestCase):
+    def run_checker(self, project: Path) -> dict:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = SVGQualityChecker(workers=1).check_directory(str(project))
+        self.assertEqual(len(results), 1)
+        return results[0]
+
+    def test_image_created_between_cached_runs_is_rechecked(self) -> None:
+        cases = {
+            "single-quoted href": ("pic.png", "<image href='../images/pic.png' width=\"40\" height=\"40\"/>"),
+            "escaped xlink:href": ("a&b.png", '<image xlink:href="../images/a&amp;b.png" width="40" height="40"/>'),
+        }
+        for label, (filename, image) in cases.items():
+            with self.subTest(label), tempfile.TemporaryDirectory() as tmp:
+                project = Path(tmp)
+                (project / "svg_output").mkdir()
+                (project / "images").mkdir()
+                (project / "svg_output" / "slide_01.svg").write_text(
+                    SVG_TEMPLATE.format(image=image), encoding="utf-8")
+
+                first = self.run_checker(project)
+                self.assertTrue(any("Image file not found" in e for e in first["errors"]))
+
+                Image.new("RGB", (80, 80), "red").save(project / "images" / filename)
+                second = self.run_checker(project)
+                self.assertFalse(any("Image file not found" in e for e in second["errors"]))
+
+    def test_image_edited_between_cached_runs_is_rechecked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / "svg_output").mkdir()
+            (project / "images").mkdir()
+            (project / "svg_output" / "slide_01.svg").write_text(SVG_TEMPLATE.format(
+                image='<image href="../images/pic.png" width="40" height="40"/>'), encoding="utf-8")
+            picture = project / "images" / "pic.png"
+
+            Image.new("RGB", (20, 20), "red").save(picture)
+            first = self.run_checker(project)
+            self.assertTrue(any("may appear blurry" in w for w in first["warnings"]))
+
+            Image.new("RGB", (80, 80), "blue").save(picture)
+            second = self.run_checker(project)
+            self.assertFalse(any("pic.png" in w for w in second["warnings"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from template_fill_pptx.batch import apply_plans  # noqa: E402
+
+try:
+    from pptx import Presentation
+except ImportError:  # python-pptx is an optional dependency
+    Presentation = None
+
+
+@unittest.skipIf(Presentation is None, "python-pptx is not installed")
+class ApplyBatchTest(unittest.TestCase):
+    def test_malformed_plan_fails_only_its_own_job(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            template = root / "template.pptx"
+            prs = Presentation()
+            prs.slides.add_slide(prs.slide_layouts[5]).shapes.title.text = "Source"
+            prs.save(str(template))
+
+            jobs = [
+                ({"slides": [{"source_slide": 1}]}, root / "good_a.pptx"),
+                ({"slides": ["not an object"]}, root / "bad.pptx"),
+                ({"slides": [{"source_slide": 1}]}, root / "good_b.pptx"),
+            ]
+            for workers in (1, 2):
+                with self.subTest(workers=workers):
+                    errors = apply_plans(template, jobs, workers=workers)
+
+                    self.assertIsNone(errors[0])
+                    self.assertIn("Malformed plan", errors[1])
+                    self.assertIsNone(errors[2])
+                    self.assertTrue((root / "good_a.pptx").exists())
+                    self.assertTrue((root / "good_b.pptx").exists())
+                    self.assertFalse((root / "bad.pptx").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
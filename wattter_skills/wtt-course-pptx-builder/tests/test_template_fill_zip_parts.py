@@ -0,0 +1,104 @@
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from template_fill_pptx import zip_parts  # noqa: E402
+from template_fill_pptx.zip_parts import PartCache, ZipParts  # noqa: E402
+
+
+class ZipPartsWriteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.source = self.root / "source.pptx"
+        with zipfile.ZipFile(self.source, "w") as zf:
+            zf.writestr("[Content_Types].xml", b"<Types/>" * 50, zipfile.ZIP_DEFLATED)
+            zf.writestr("ppt/slides/slide1.xml", b"<p:sld/>" * 50, zipfile.ZIP_DEFLATED)
+            zf.writestr("ppt/media/image1.png", bytes(range(256)) * 40, zipfile.ZIP_STORED)
+
+    def fill(self, output: Path) -> None:
+        with zipfile.ZipFile(self.source) as zf:
+            parts = ZipParts(zf)
+            parts["ppt/slides/slide1.xml"] = b"<p:sld>filled</p:sld>"
+            parts["ppt/slides/slide2.xml"] = b"<p:sld>new</p:sld>"
+            parts.write(output)
+
+    def assert_filled(self, output: Path) -> None:
+        with zipfile.ZipFile(self.source) as src, zipfile.ZipFile(output) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.namelist(), [
+                "[Content_Types].xml", "ppt/slides/slide1.xml",
+                "ppt/media/image1.png", "ppt/slides/slide2.xml",
+            ])
+            self.assertEqual(out.read("ppt/slides/slide1.xml"), b"<p:sld>filled</p:sld>")
+            for name in ("[Content_Types].xml", "ppt/media/image1.png"):
+                self.assertEqual(out.read(name), src.read(name))
+                self.assertEqual(out.getinfo(name).compress_type, src.getinfo(name).compress_type)
+
+    def test_untouched_parts_are_copied_raw(self) -> None:
+        output = self.root / "raw.pptx"
+        with mock.patch.object(zip_parts, "_copy_raw_entry", wraps=zip_parts._copy_raw_entry) as raw:
+            self.fill(output)
+        self.assertEqual(raw.call_count, 2)
+        self.assert_filled(output)
+
+    def test_falls_back_to_writestr_without_zipfile_hooks(self) -> None:
+        output = self.root / "fallback.pptx"
+        with mock.patch.object(zip_parts, "_supports_raw_copy", return_value=False), \
+                mock.patch.object(zip_parts, "_copy_raw_entry", side_effect=AssertionError("raw copy")):
+            self.fill(output)
+        self.assert_filled(output)
+
+    def test_hook_check_rejects_a_zipfile_without_them(self) -> None:
+        with zipfile.ZipFile(self.root / "probe.zip", "w") as out:
+            self.assertTrue(zip_parts._supports_raw_copy(out))
+            with mock.patch.object(zipfile.ZipInfo, "FileHeader", None):
+                self.assertFalse(zip_parts._supports_raw_copy(out))
+
+
+class PartCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used_past_budget(self) -> None:
+        cache = PartCache(max_bytes=25)
+        cache["a"] = b"a" * 10
+        cache["b"] = b"b" * 10
+        self.assertEqual(cache.get("a"), b"a" * 10)
+        cache["c"] = b"c" * 10
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.size, 20)
+
+    def test_part_larger_than_budget_is_not_kept(self) -> None:
+        cache = PartCache(max_bytes=8)
+        cache["small"] = b"1234"
+        cache["video"] = b"x" * 100
+        self.assertIsNone(cache.get("video"))
+        self.assertEqual(len(cache), 1)
+
+    def test_zip_parts_reads_stay_within_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "deck.pptx"
+            with zipfile.ZipFile(path, "w") as zf:
+                for n in range(10):
+                    zf.writestr(f"ppt/slides/slide{n}.xml", bytes([n]) * 100)
+            cache = PartCache(max_bytes=300)
+            with zipfile.ZipFile(path) as zf:
+                for _round in range(2):
+                    parts = ZipParts(zf, cache)
+                    for name in parts:
+                        self.assertEqual(len(parts[name]), 100)
+            self.assertLessEqual(cache.size, 300)
+            self.assertEqual(len(cache), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import text_metrics  # noqa: E402
+from text_metrics import MeasuredText  # noqa: E402
+
+
+def build_face(names: dict[int, str], weight: int, fs_selection: int) -> bytes:
+    """Minimal sfnt with the tables the font index reads (name, OS/2)."""
+    encoded = [(name_id, text.encode("utf-16-be")) for name_id, text in sorted(names.items())]
+    records = b""
+    strings = b""
+    for name_id, raw in encoded:
+        records += struct.pack(">HHHHHH", 3, 1, 0x409, name_id, len(raw), len(strings))
+        strings += raw
+    name = struct.pack(">HHH", 0, len(encoded), 6 + 12 * len(encoded)) + records + strings
+    os2 = bytearray(78)
+    struct.pack_into(">H", os2, 4, weight)
+    struct.pack_into(">H", os2, 62, fs_selection)
+    tables = {b"OS/2": bytes(os2), b"cmap": b"\0" * 4, b"hmtx": b"\0" * 4, b"name": name}
+
+    offset = 12 + 16 * len(tables)
+    directory = struct.pack(">IHHHH", 0x00010000, len(tables), 0, 0, 0)
+    body = b""
+    for tag, table in tables.items():
+        directory += struct.pack(">4sIII", tag, 0, offset + len(body), len(table))
+        body += table + b"\0" * (-len(table) % 4)
+    return directory + body
+
+
+class MeasuredTextFitTest(unittest.TestCase):
+    def test_line_filling_max_width_exactly_fits(self) -> None:
+        widths = [0.2, 0.3, 6.65, 13.3]
+        text = MeasuredText("abcd", widths)
+        # 0.3 + 6.65 + 13.3 as a running total is exactly 20.25, but
+        # prefix[4] - prefix[1] rounds to slightly more.
+        self.assertEqual(text.fit(1, 0.3 + 6.65 + 13.3), 4)
+
+    def test_fit_stops_before_overflowing_char(self) -> None:
+        text = MeasuredText("abcd", [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(text.fit(0, 5.99), 2)
+        self.assertEqual(text.fit(2, 0.5), 2)
+
+
+class FontIndexWeightTest(unittest.TestCase):
+    # (file, subfamily, usWeightClass, fsSelection): every weight of one
+    # typographic family; only Regular and Bold carry the legacy style bits.
+    LATO = [
+        ("Lato-Black.ttf", "Black", 900, 0x00),
+        ("Lato-Bold.ttf", "Bold", 700, 0x20),
+        ("Lato-BoldItalic.ttf", "Bold Italic", 700, 0x21),
+        ("Lato-Hairline.ttf", "Hairline", 100, 0x00),
+        ("Lato-Light.ttf", "Light", 300, 0x00),
+        ("Lato-LightItalic.ttf", "Light Italic", 300, 0x00),
+        ("Lato-Medium.ttf", "Medium", 500, 0x00),
+        ("Lato-Regular.ttf", "Regular", 400, 0x40),
+    ]
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.font_dir = Path(tmp.name) / "fonts"
+        self.font_dir.mkdir()
+        patches = [
+            mock.patch.object(text_metrics, "_font_dirs", return_value=[self.font_dir]),
+            mock.patch.object(text_metrics, "FONT_INDEX_PATH", Path(tmp.name) / "font_index.json"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.clear_caches()
+        self.addCleanup(self.clear_caches)
+
+    @staticmethod
+    def clear_caches() -> None:
+        text_metrics._font_files.cache_clear()
+        text_metrics._font_index.cache_clear()
+
+    def install(self, faces) -> None:
+        for filename, subfamily, weight, fs_selection in faces:
+            legacy_family = "Lato" if subfamily in {"Regular", "Bold", "Bold Italic"} else f"Lato {subfamily}"
+            names = {1: legacy_family, 2: "Regular", 16: "Lato", 17: subfamily}
+            (self.font_dir / filename).write_bytes(build_face(names, weight, fs_selection))
+
+    def picked(self, family: str) -> dict[str, str]:
+        faces = text_metrics._font_index()[family.casefold()]
+        return {style: Path(path).name for style, (path, _index) in faces.items()}
+
+    def test_regular_and_bold_are_nearest_400_and_700(self) -> None:
+        self.install(self.LATO)
+        self.assertEqual(self.picked("Lato"), {"regular": "Lato-Regular.ttf", "bold": "Lato-Bold.ttf"})
+        self.assertEqual(self.picked("Lato Light"), {"regular": "Lato-Light.ttf"})
+
+    def test_nearest_weight_without_an_exact_match(self) -> None:
+        self.install([face for face in self.LATO if face[2] not in (400, 700)])
+        self.assertEqual(self.picked("Lato"), {"regular": "Lato-Medium.ttf", "bold": "Lato-Black.ttf"})
+
+    def test_face_info_reads_weight_and_subfamily(self) -> None:
+        data = build_face({1: "Lato Light", 2: "Italic", 16: "Lato", 17: "Light Italic"}, 300, 0x00)
+        info = text_metrics._face_info(data, 0)
+        self.assertEqual(info["weight"], 300)
+        self.assertEqual(info["subfamily"], "Light Italic")
+        self.assertTrue(info["italic"])
+        self.assertEqual(info["families"], ["Lato Light", "Lato"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,9 +19,13 @@ except ImportError:
 
 import argparse
 from modules.base import LoginRequiredError
+from keyword_matcher import KeywordMatcher
+from store import CollectionStore, PlatformStore
+
+INVESTMENT_KEYWORDS = ["股票", "A股", "美股", "港股", "基金", "行情", "大盘", "指数", "板块", "涨停", "跌停", "抄底", "加仓", "减仓", "牛市", "熊市", "多头", "空头", "趋势", "回调", "反弹", "突破", "支撑", "压力", "估值", "财报", "利好", "利空", "主力", "资金流向", "北向", "南向", "成交量", "K线", "均线", "MACD", "RSI", "纳指", "道指", "标普", "创业板", "科创板"]
 
 class InfoCollector:
-    def __init__(self, config_path, template_override=None, keyword=None, target_modules=None, headless_override=None):
+    def __init__(self, config_path, template_override=None, keyword=None, target_modules=None, headless_override=None, concurrency_override=None, incremental_override=None):
         self.skill_dir = Path(__file__).parent.parent
         self.load_config(config_path)
         self.project_dir = Path(config_path).parent.absolute()
@@ -30,9 +34,13 @@ class InfoCollector:
         self.keyword = keyword
         self.target_modules = target_modules
         self.headless_override = headless_override
+        self.concurrency_override = concurrency_override
+        self.incremental_override = incremental_override
         self.user_data_dir = self.get_user_data_dir()
         self.context = None
         self.playwright = None
+        self.store = None
+        self.last_run_at = None
 
     def load_config(self, path):
         if not os.path.exists(path):
@@ -71,6 +79,122 @@ class InfoCollector:
             await self.playwright.stop()
             self.playwright = None
 
+    def current_headless(self):
+        if self.headless_override is not None:
+            return self.headless_override
+        return self.config.get('global', {}).get('browser', {}).get('headless', True)
+
+    def store_config(self):
+        return self.config.get('global', {}).get('store') or {}
+
+    def is_incremental(self):
+        """Incremental runs skip already-collected items; needs the store."""
+        if self.incremental_override is not None:
+            return self.incremental_override
+        return bool(self.store_config().get('incremental', False))
+
+    def open_store(self):
+        """Open the cross-run item store (global.store), unless disabled."""
+        store_conf = self.store_config()
+        if not store_conf.get('enabled', True):
+            return None
+        store_path = Path(store_conf.get('path', 'data/collected.sqlite'))
+        if not store_path.is_absolute():
+            store_path = self.project_dir / store_path
+        return CollectionStore(store_path)
+
+    def get_concurrency(self):
+        """Modules run at once; CLI override first, then global.concurrency (default 1)."""
+        if self.concurrency_override is not None:
+            return max(1, self.concurrency_override)
+        return max(1, int(self.config.get('global', {}).get('concurrency', 1)))
+
+    async def run_module(self, module_key, collected_data):
+        """Run one module on its own page; re-raises LoginRequiredError when headless."""
+        global_conf = self.config.get('global', {})
+        module_conf = self.config.get('modules', {})[module_key].copy()
+        current_headless = self.current_headless()
+
+        # Inject system info
+        module_conf['_system'] = dict(module_conf.get('_system') or {})
+        module_conf['_system']['headless'] = current_headless
+        module_conf['_system']['min_interval'] = module_conf.get(
+            'min_interval', global_conf.get('min_interval', 0))
+
+        # Inject runtime keyword for xiaohongshu
+        if module_key == 'xiaohongshu' and self.keyword:
+            print(f"ℹ️  Injecting runtime keyword: {self.keyword}")
+            module_conf['keywords'] = [self.keyword]
+
+        try:
+            # Import module dynamically
+            module_pkg = f"modules.{module_key}"
+            module_lib = importlib.import_module(module_pkg)
+
+            # Get class
+            class_name = f"{module_key.capitalize()}Module"
+            if hasattr(module_lib, class_name):
+                ModuleClass = getattr(module_lib, class_name)
+                platform_store = None
+                if self.store and self.is_incremental():
+                    stop_after_seen = self.store_config().get('stop_after_seen', 3)
+                    platform_store = PlatformStore(self.store, module_key, stop_after_seen)
+                module_instance = ModuleClass(self.context, module_conf, store=platform_store)
+
+                print(f"\n--- Running Module: {module_instance.name} ---")
+                items = await module_instance.run()
+                if self.store:
+                    new_count = self.store.record(module_key, items)
+                    print(f"[Store] {module_key}: {new_count} new of {len(items)} items")
+                collected_data[module_key] = items
+            else:
+                print(f"Error: Class {class_name} not found in {module_pkg}")
+
+        except ImportError:
+            print(f"Error: Module {module_key} implementation not found.")
+        except LoginRequiredError:
+            if current_headless:
+                print(f"⚠️  [System] Login required for {module_key}. Switching to HEADFUL mode...")
+                raise # Re-raise to trigger outer loop
+            else:
+                print(f"❌ [System] Login required for {module_key} but already in headful mode. Please login manually.")
+                # If the module raised LoginRequiredError, it implies it already tried to wait or detected failure.
+                # So we skip this module.
+                print(f"Skipping module {module_key} due to login failure.")
+                collected_data[module_key] = []
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error running module {module_key}: {e}")
+
+    async def run_modules_concurrently(self, modules_to_run, collected_data, concurrency):
+        """Run pending modules in separate pages, at most `concurrency` at a time.
+
+        The first LoginRequiredError cancels the modules still running (their
+        pages die with the browser restart anyway) and is re-raised; modules
+        that already finished keep their results.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_limited(module_key):
+            async with semaphore:
+                await self.run_module(module_key, collected_data)
+
+        tasks = [
+            asyncio.create_task(run_limited(module_key))
+            for module_key in modules_to_run
+            if module_key not in collected_data
+        ]
+        if not tasks:
+            return
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+
     async def run_modules(self):
         collected_data = {}
         modules_config = self.config.get('modules', {})
@@ -88,7 +212,13 @@ class InfoCollector:
             # Run all enabled modules
             modules_to_run = [k for k, v in modules_config.items() if v.get('enabled', False)]
 
-        print(f"Plan to run modules: {modules_to_run}")
+        concurrency = self.get_concurrency()
+        if self.store:
+            self.store.start_run(modules_to_run)
+            self.last_run_at = self.store.last_run_at()
+            if self.is_incremental():
+                print(f"Incremental mode: collecting items new since {self.last_run_at or 'the first run'}")
+        print(f"Plan to run modules: {modules_to_run} (concurrency: {concurrency})")
 
         max_retries = 1
         retry_count = 0
@@ -98,82 +228,28 @@ class InfoCollector:
                 if not self.playwright:
                     await self.init_browser()
 
-                for i, module_key in enumerate(modules_to_run):
-                    if module_key in collected_data:
-                        continue
-
-                    module_conf = modules_config[module_key].copy()
-                    
-                    # Determine current headless state
-                    current_headless = True
-                    if self.headless_override is not None:
-                        current_headless = self.headless_override
-                    else:
-                        current_headless = self.config.get('global', {}).get('browser', {}).get('headless', True)
-                    
-                    # Inject system info
-                    if '_system' not in module_conf:
-                        module_conf['_system'] = {}
-                    module_conf['_system']['headless'] = current_headless
-
-                    # Inject runtime keyword for xiaohongshu
-                    if module_key == 'xiaohongshu' and self.keyword:
-                        print(f"ℹ️  Injecting runtime keyword: {self.keyword}")
-                        module_conf['keywords'] = [self.keyword]
-
-                    try:
-                        # Import module dynamically
-                        module_pkg = f"modules.{module_key}"
-                        module_lib = importlib.import_module(module_pkg)
-                        
-                        # Get class
-                        class_name = f"{module_key.capitalize()}Module"
-                        if hasattr(module_lib, class_name):
-                            ModuleClass = getattr(module_lib, class_name)
-                            module_instance = ModuleClass(self.context, module_conf)
-                            
-                            print(f"\n--- Running Module: {module_instance.name} ---")
-                            items = await module_instance.run()
-                            collected_data[module_key] = items
-                            
-                            # Add delay between modules if not the last one
-                            if i < len(modules_to_run) - 1:
-                                print("Waiting before next module...")
-                                await asyncio.sleep(2)
-                        else:
-                            print(f"Error: Class {class_name} not found in {module_pkg}")
-
-                    except ImportError:
-                        print(f"Error: Module {module_key} implementation not found.")
-                    except LoginRequiredError:
-                        # Check current headless state
-                        current_headless = True
-                        if self.headless_override is not None:
-                            current_headless = self.headless_override
-                        else:
-                            current_headless = self.config.get('global', {}).get('browser', {}).get('headless', True)
-
-                        if current_headless:
-                            print(f"⚠️  [System] Login required for {module_key}. Switching to HEADFUL mode...")
-                            await self.close_browser()
-                            self.headless_override = False # Force headful
-                            raise # Re-raise to trigger outer loop
-                        else:
-                            print(f"❌ [System] Login required for {module_key} but already in headful mode. Please login manually.")
-                            # We can wait here or just fail. 
-                            # If the module raised LoginRequiredError, it implies it already tried to wait or detected failure.
-                            # So we skip this module or fail.
-                            print(f"Skipping module {module_key} due to login failure.")
-                            collected_data[module_key] = []
-                    except Exception as e:
-                        print(f"Error running module {module_key}: {e}")
-                
+                # After a login restart the browser is headful and the user logs
+                # in by hand, one site at a time: finish the run sequentially.
+                if concurrency > 1 and retry_count == 0:
+                    await self.run_modules_concurrently(modules_to_run, collected_data, concurrency)
+                else:
+                    pending = [k for k in modules_to_run if k not in collected_data]
+                    for i, module_key in enumerate(pending):
+                        await self.run_module(module_key, collected_data)
+
+                        # Add delay between modules if not the last one
+                        if i < len(pending) - 1:
+                            print("Waiting before next module...")
+                            await asyncio.sleep(2)
+
                 # If we finish the loop, break
                 break
 
             except LoginRequiredError:
+                await self.close_browser()
+                self.headless_override = False # Force headful
                 retry_count += 1
-                if retry_count > max_restarts:
+                if retry_count > max_retries:
                     print("❌ [System] Max restarts reached. Aborting.")
                     break
                 print("🔄 Restarting browser session...")
@@ -182,7 +258,8 @@ class InfoCollector:
                 print(f"❌ [System] Unexpected error in run loop: {e}")
                 break
 
-        return collected_data
+        # Report modules in plan order regardless of completion order
+        return {k: collected_data[k] for k in modules_to_run if k in collected_data}
 
     def analyze_data(self, data):
         """
@@ -193,27 +270,32 @@ class InfoCollector:
             'investment_signals': []
         }
         
-        all_text = ""
-        investment_keywords = ["股票", "A股", "美股", "港股", "基金", "行情", "大盘", "指数", "板块", "涨停", "跌停", "抄底", "加仓", "减仓", "牛市", "熊市", "多头", "空头", "趋势", "回调", "反弹", "突破", "支撑", "压力", "估值", "财报", "利好", "利空", "主力", "资金流向", "北向", "南向", "成交量", "K线", "均线", "MACD", "RSI", "纳指", "道指", "标普", "创业板", "科创板"]
+        texts = []
+        investment_keywords = self.config.get('global', {}).get('investment_keywords') or INVESTMENT_KEYWORDS
+        matcher = KeywordMatcher(investment_keywords)
 
         # 1. Aggregate text and filter investment signals
         for module, items in data.items():
             for item in items:
                 content = item.get('content', '')
-                all_text += content + "\n"
+                texts.append(content)
                 
-                # Check for investment keywords
-                matched_keywords = [k for k in investment_keywords if k in content]
-                if matched_keywords:
+                # Check for investment keywords (one scan for the whole list)
+                keyword_counts = matcher.counts(content)
+                if keyword_counts:
+                    matched_keywords = [kw for kw in matcher.keywords if kw in keyword_counts]
                     # Simple scoring: count of keywords
                     score = len(matched_keywords)
                     analysis_result['investment_signals'].append({
                         'item': item,
                         'score': score,
                         'matched_keywords': matched_keywords,
+                        'keyword_counts': dict(keyword_counts),
                         'source_module': module
                     })
 
+        all_text = "\n".join(texts) + "\n" if texts else ""
+
         # Sort investment signals by relevance (score)
         analysis_result['investment_signals'].sort(key=lambda x: x['score'], reverse=True)
 
@@ -268,13 +350,17 @@ class InfoCollector:
 
         # Calculate total count
         total_items = sum(len(items) for items in data.values())
+        new_items = sum(1 for items in data.values() for item in items if item.get('is_new'))
 
         template = Template(template_str)
         report = template.render(
             generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             data=data,
             analysis=analysis,
-            total_items=total_items
+            total_items=total_items,
+            new_items=new_items if self.store else None,
+            incremental=bool(self.store) and self.is_incremental(),
+            last_run_at=self.last_run_at
         )
         
         print("\n" + "="*50)
@@ -303,12 +389,17 @@ class InfoCollector:
         print(f"\nReport saved to: {output_file}")
 
     async def run(self):
+        self.store = self.open_store()
         await self.init_browser()
         
         try:
             data = await self.run_modules()
+            if self.store:
+                self.store.finish_run(sum(1 for items in data.values() for item in items if item.get('is_new')))
             self.generate_report(data)
         finally:
+            if self.store:
+                self.store.close()
             if self.context:
                 await self.context.close()
             if self.playwright:
@@ -352,6 +443,8 @@ if __name__ == "__main__":
     parser.add_argument('--template', type=str, help='Path to custom template file')
     parser.add_argument('--keyword', '-k', type=str, help='Search keyword for Xiaohongshu')
     parser.add_argument('--modules', nargs='+', help='Specific modules to run (e.g. weibo xiaohongshu)')
+    parser.add_argument('--incremental', action='store_true', default=None, help='Only collect items new since earlier runs, stopping scrolls at already-collected items')
+    parser.add_argument('--concurrency', type=int, help='Modules to run at once, each in its own tab (default: global.concurrency or 1)')
     
     # Headless mode control
     group = parser.add_mutually_exclusive_group()
@@ -399,6 +492,8 @@ if __name__ == "__main__":
         template_override=args.template, 
         keyword=args.keyword, 
         target_modules=args.modules,
-        headless_override=headless_override
+        headless_override=headless_override,
+        concurrency_override=args.concurrency,
+        incremental_override=args.incremental
     )
     asyncio.run(collector.run())
@@ -0,0 +1,96 @@
+"""
+Multi-keyword matcher for large keyword lists.
+
+All keywords are merged into one character trie. A compiled character class
+of the keywords' first characters lets the regex engine skip, at C speed, to
+the positions where a keyword can start; only those positions walk the trie.
+One scan therefore finds every keyword, and the cost grows with text length
+and candidate positions instead of text length x keyword count.
+
+Matching follows substring semantics (`keyword in text`): occurrences may
+overlap, and an empty keyword matches every text. `matched` and `search`
+honour that; `counts` reports occurrences, which an empty keyword has none of
+at any position, so it never appears there.
+
+The same file ships with wtt-info-collector and wtt-trend-radar; keep the
+copies identical.
+"""
+
+import re
+from collections import Counter
+
+_END = ''  # trie key marking "a keyword ends here" (never a real character)
+
+
+class KeywordMatcher:
+    def __init__(self, keywords, ignore_case=False):
+        """
+        :param keywords: iterable of keyword strings; duplicates are matched once
+        :param ignore_case: compare case-insensitively (keywords are reported as given)
+        """
+        self.ignore_case = ignore_case
+        self.keywords = list(dict.fromkeys(keywords))
+        self._empty = [kw for kw in self.keywords if not kw]
+
+        trie = {}
+        for kw in self.keywords:
+            if not kw:
+                continue
+            node = trie
+            for ch in self._fold(kw):
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, []).append(kw)
+        self._trie = trie
+        starts = ''.join(sorted(trie))
+        self._starts = re.compile('[' + re.escape(starts) + ']') if starts else None
+        self._order = {kw: i for i, kw in enumerate(self.keywords)}
+
+    def _fold(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def finditer(self, text):
+        """Yield (start, keyword) for every occurrence, ordered by start position."""
+        if self._starts is None:
+            return
+        text = self._fold(text)
+        trie = self._trie
+        n = len(text)
+        # The regex engine skips to characters that can begin a keyword;
+        # only those positions walk the trie.
+        for m in self._starts.finditer(text):
+            start = m.start()
+            node = trie[text[start]]
+            i = start + 1
+            while True:
+                if _END in node:
+                    for kw in node[_END]:
+                        yield start, kw
+                if i == n:
+                    break
+                node = node.get(text[i])
+                if node is None:
+                    break
+                i += 1
+
+    def counts(self, text):
+        """Occurrences per non-empty keyword (only keywords that occur).
+
+        Empty keywords are left out (see the module docstring); use `matched`
+        for substring membership.
+        """
+        return Counter(kw for _, kw in self.finditer(text))
+
+    def matched(self, text):
+        """Distinct keywords found in text, in keyword-list order."""
+        found = set(self._empty)
+        for _, kw in self.finditer(text):
+            found.add(kw)
+        return sorted(found, key=self._order.__getitem__)
+
+    def search(self, text):
+        """True when any keyword occurs in text."""
+        if self._empty:
+            return True
+        for _ in self.finditer(text):
+            return True
+        return False
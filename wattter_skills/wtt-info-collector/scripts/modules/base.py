@@ -1,10 +1,36 @@
 from abc import ABC, abstractmethod
 import asyncio
+import time
 
 class LoginRequiredError(Exception):
     """Raised when authentication is required but not detected."""
     pass
 
+class SeenFeed:
+    """
+    Incremental-collection state for one scrolled feed.
+    skip(item) is True for items an earlier run already collected; once
+    `stop_after_seen` of them appear in a row (tolerating pinned posts),
+    `exhausted` tells a newest-first feed to stop scrolling.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.streak = 0
+
+    def skip(self, item):
+        if self.store is None:
+            return False
+        if self.store.is_known(item):
+            self.streak += 1
+            return True
+        self.streak = 0
+        return False
+
+    @property
+    def exhausted(self):
+        return self.store is not None and self.streak >= self.store.stop_after_seen
+
 class BaseModule(ABC):
     # Common JS helper functions for parsing numbers and text
     JS_PARSERS = """
@@ -19,14 +45,17 @@ class BaseModule(ABC):
     };
     """
 
-    def __init__(self, context, config):
+    def __init__(self, context, config, store=None):
         """
         Initialize the module.
         :param context: Playwright browser context
         :param config: Module specific configuration
+        :param store: PlatformStore of previously collected items (incremental mode only)
         """
         self.context = context
         self.config = config
+        self.store = store
+        self._last_navigation = None
 
     @abstractmethod
     async def run(self):
@@ -44,6 +73,23 @@ class BaseModule(ABC):
         """
         pass
 
+    def seen_feed(self):
+        """Start tracking already-collected items for one feed (see SeenFeed)."""
+        return SeenFeed(self.store)
+
+    async def goto(self, page, url, **kwargs):
+        """
+        Navigate like page.goto, at most once per `min_interval` seconds for this module.
+        Modules share one browser when run concurrently, so each site is paced on its own.
+        """
+        min_interval = self.config.get('_system', {}).get('min_interval', 0) or 0
+        if min_interval > 0 and self._last_navigation is not None:
+            wait = self._last_navigation + min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self._last_navigation = time.monotonic()
+        return await page.goto(url, **kwargs)
+
     async def smart_scroll(self, page, max_scrolls=1):
         """
         Scroll the page to trigger infinite loading.
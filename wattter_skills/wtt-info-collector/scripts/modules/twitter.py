@@ -37,7 +37,7 @@ class TwitterModule(BaseModule):
 
     async def check_login(self, page):
         print("[Twitter] Checking login status...")
-        await page.goto("https://x.com/home")
+        await self.goto(page, "https://x.com/home")
         try:
             await page.wait_for_load_state('networkidle', timeout=10000)
         except:
@@ -84,7 +84,7 @@ class TwitterModule(BaseModule):
         if list_url_override:
             print(f"[Twitter] Navigating to configured list: {list_url_override}")
             try:
-                await page.goto(list_url_override)
+                await self.goto(page, list_url_override)
                 await page.wait_for_load_state('networkidle')
                 await asyncio.sleep(2)
                 print("✅ [Twitter] Opened list.")
@@ -99,7 +99,7 @@ class TwitterModule(BaseModule):
         try:
             # Try to find the Lists link. It might be under "More" or directly visible.
             # Direct URL is safer: https://x.com/i/lists
-            await page.goto("https://x.com/i/lists")
+            await self.goto(page, "https://x.com/i/lists")
             await page.wait_for_load_state('networkidle')
             await asyncio.sleep(2)
 
@@ -141,6 +141,7 @@ class TwitterModule(BaseModule):
         
         # Scroll and collect
         no_new_data_count = 0
+        feed = self.seen_feed()
         
         while len(items) < limit and no_new_data_count < 5:
             # Use evaluate to execute JS for efficient parsing, referencing x-tweet-feed logic
@@ -235,12 +236,14 @@ class TwitterModule(BaseModule):
             new_items_found = False
             
             for item in new_items:
-                if len(items) >= limit:
+                if len(items) >= limit or feed.exhausted:
                     break
                     
                 if item['link'] not in collected_ids:
-                    items.append(item)
                     collected_ids.add(item['link'])
+                    if feed.skip(item):
+                        continue
+                    items.append(item)
                     new_items_found = True
                     print(f"   Collected: {item['content'][:30].replace('\\n', ' ')}... (L:{item['stats']['like']}, V:{item['stats']['view']})")
             
@@ -248,6 +251,10 @@ class TwitterModule(BaseModule):
                 no_new_data_count = 0
             else:
                 no_new_data_count += 1
+
+            if feed.exhausted:
+                print("[Twitter] Reached tweets collected in an earlier run. Stopping.")
+                break
             
             # Optimized Scrolling: Scroll to bottom
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -28,7 +28,7 @@ class WeiboModule(BaseModule):
 
     async def check_login(self, page):
         print("[Weibo] Checking login status...")
-        await page.goto("https://weibo.com")
+        await self.goto(page, "https://weibo.com")
         # await page.wait_for_load_state('networkidle')
         await page.wait_for_load_state('domcontentloaded')
         await asyncio.sleep(5)
@@ -69,7 +69,7 @@ class WeiboModule(BaseModule):
         limit = target.get('limit', 5)
         
         print(f"[Weibo] Scraping {name} ({url})...")
-        await page.goto(url)
+        await self.goto(page, url)
         await page.wait_for_load_state('domcontentloaded')
         await asyncio.sleep(5) # Wait for initial render
         
@@ -88,6 +88,7 @@ class WeiboModule(BaseModule):
         items = []
         collected_ids = set()
         no_new_data_count = 0
+        feed = self.seen_feed()
 
         while len(items) < limit and no_new_data_count < 3:
             # Execute JS to scrape items
@@ -183,7 +184,7 @@ class WeiboModule(BaseModule):
             
             new_items_found = False
             for item in new_items:
-                if len(items) >= limit:
+                if len(items) >= limit or feed.exhausted:
                     break
                 
                 # Deduplicate by link (if available) or content hash
@@ -191,6 +192,8 @@ class WeiboModule(BaseModule):
                 
                 if unique_key not in collected_ids:
                     collected_ids.add(unique_key)
+                    if feed.skip(item):
+                        continue
                     items.append(item)
                     new_items_found = True
                     print(f"   Collected: {item['content'][:30].replace('\\n', ' ')}...")
@@ -199,6 +202,10 @@ class WeiboModule(BaseModule):
                 no_new_data_count = 0
             else:
                 no_new_data_count += 1
+
+            if feed.exhausted:
+                print(f"[Weibo] Reached posts of {name} collected in an earlier run. Stopping.")
+                break
             
             # Scroll
             await self.smart_scroll(page)
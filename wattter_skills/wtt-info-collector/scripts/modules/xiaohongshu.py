@@ -36,7 +36,7 @@ class XiaohongshuModule(BaseModule):
 
     async def check_login(self, page):
         print("[Xiaohongshu] Checking login status...")
-        await page.goto("https://www.xiaohongshu.com")
+        await self.goto(page, "https://www.xiaohongshu.com")
         try:
             await page.wait_for_load_state('domcontentloaded', timeout=10000)
         except:
@@ -106,7 +106,7 @@ class XiaohongshuModule(BaseModule):
                 # Reusing 'page' is fine as we are done with search results.
                 
                 print(f"[Xiaohongshu] Visiting {'note' if visiting_note else 'author'}: {target_url}...")
-                await page.goto(target_url)
+                await self.goto(page, target_url)
                 await page.wait_for_load_state('domcontentloaded')
                 await asyncio.sleep(random.uniform(1, 2))
                 
@@ -155,7 +155,7 @@ class XiaohongshuModule(BaseModule):
         
         # Use direct URL for stability
         url = f"https://www.xiaohongshu.com/search_result?keyword={keyword}&source=web_search_result_notes"
-        await page.goto(url)
+        await self.goto(page, url)
         await page.wait_for_load_state('networkidle')
         await asyncio.sleep(3)
 
@@ -173,6 +173,9 @@ class XiaohongshuModule(BaseModule):
         
         # Infinite scroll loop until we have enough items
         no_new_data_count = 0
+        # Search results are not newest-first, so known notes are skipped
+        # (sparing their profile visits) but never end the scroll early.
+        feed = self.seen_feed()
         while len(items) < limit and no_new_data_count < 3:
             
             # Execute JS for efficient scraping
@@ -253,6 +256,8 @@ class XiaohongshuModule(BaseModule):
                     
                 if item['link'] not in visited_urls:
                     visited_urls.add(item['link'])
+                    if feed.skip(item):
+                        continue
                     items.append(item)
                     current_batch_added += 1
             
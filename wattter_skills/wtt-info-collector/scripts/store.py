@@ -0,0 +1,143 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+# Local record of every item collected so far, shared by all runs of a project.
+#
+# Items are keyed per platform by their platform id when the module provides
+# one, otherwise by a hash of the link (query string dropped: Xiaohongshu adds
+# per-session tokens) or, failing that, of the text. Modules consult the store
+# to stop scrolling once they reach items an earlier run already collected;
+# the collector records every run's items and marks which ones are new.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    platform TEXT NOT NULL,
+    key TEXT NOT NULL,
+    link TEXT,
+    payload TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    first_run INTEGER NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (platform, key)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    modules TEXT NOT NULL,
+    new_items INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def item_key(item):
+    """Stable identity of a collected item within its platform."""
+    item_id = item.get('id')
+    if item_id:
+        return f"id:{item_id}"
+    link = item.get('link')
+    if link:
+        parts = urlsplit(link)
+        normalized = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+        return "url:" + hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+    text = item.get('content') or item.get('title') or ''
+    return "text:" + hashlib.sha1(text.strip().encode('utf-8')).hexdigest()
+
+
+class CollectionStore:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(_SCHEMA)
+        self.run_id = None
+
+    def close(self):
+        self.conn.close()
+
+    def start_run(self, modules):
+        cur = self.conn.execute(
+            "INSERT INTO runs (started_at, modules) VALUES (?, ?)",
+            (_now(), json.dumps(modules)),
+        )
+        self.conn.commit()
+        self.run_id = cur.lastrowid
+        return self.run_id
+
+    def last_run_at(self):
+        """Start time of the latest finished run before the current one, or None."""
+        row = self.conn.execute(
+            "SELECT started_at FROM runs WHERE finished_at IS NOT NULL AND id != ? "
+            "ORDER BY id DESC LIMIT 1",
+            (self.run_id or -1,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_known(self, platform, item):
+        """True when an earlier run already collected `item`."""
+        row = self.conn.execute(
+            "SELECT first_run FROM items WHERE platform = ? AND key = ?",
+            (platform, item_key(item)),
+        ).fetchone()
+        return row is not None and row[0] != self.run_id
+
+    def record(self, platform, items):
+        """Store a module's items; flags each with `is_new` and `first_seen`."""
+        now = _now()
+        new_count = 0
+        for item in items:
+            key = item_key(item)
+            row = self.conn.execute(
+                "SELECT first_seen, first_run FROM items WHERE platform = ? AND key = ?",
+                (platform, key),
+            ).fetchone()
+            payload = json.dumps(item, ensure_ascii=False, default=str)
+            if row is None:
+                self.conn.execute(
+                    "INSERT INTO items (platform, key, link, payload, first_seen, last_seen, first_run) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (platform, key, item.get('link'), payload, now, now, self.run_id or 0),
+                )
+                item['first_seen'] = now
+                item['is_new'] = True
+            else:
+                self.conn.execute(
+                    "UPDATE items SET payload = ?, last_seen = ?, seen_count = seen_count + 1 "
+                    "WHERE platform = ? AND key = ?",
+                    (payload, now, platform, key),
+                )
+                item['first_seen'] = row[0]
+                item['is_new'] = row[1] == self.run_id
+            new_count += item['is_new']
+        self.conn.commit()
+        return new_count
+
+    def finish_run(self, new_items):
+        if self.run_id is None:
+            return
+        self.conn.execute(
+            "UPDATE runs SET finished_at = ?, new_items = ? WHERE id = ?",
+            (_now(), new_items, self.run_id),
+        )
+        self.conn.commit()
+
+
+class PlatformStore:
+    """The view of a CollectionStore a module sees: its own platform only."""
+
+    def __init__(self, store, platform, stop_after_seen):
+        self.store = store
+        self.platform = platform
+        self.stop_after_seen = stop_after_seen
+
+    def is_known(self, item):
+        return self.store.is_known(self.platform, item)
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
@@ -10,6 +10,8 @@ from typing import List, Dict, Any
 from collections import Counter
 from playwright.async_api import async_playwright
 
+from keyword_matcher import KeywordMatcher
+
 # 路径配置
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_PATH = os.path.join(BASE_DIR, "config", "config.yaml")
@@ -111,9 +113,11 @@ def filter_trends(trends: List[Dict[str, Any]], keywords: List[str], max_hours:
     """
     now = datetime.datetime.now()
     
-    must_include = [kw[1:].lower() for kw in keywords if kw.startswith("+")]
-    must_exclude = [kw[1:].lower() for kw in keywords if kw.startswith("!")]
-    regular = [kw.lower() for kw in keywords if not kw.startswith("+") and not kw.startswith("!")]
+    must_include = {kw[1:] for kw in keywords if kw.startswith("+")}
+    must_exclude = {kw[1:] for kw in keywords if kw.startswith("!")}
+    regular = {kw for kw in keywords if not kw.startswith("+") and not kw.startswith("!")}
+    # 所有关键词编译成一个匹配器，每个标题只扫描一遍（不区分大小写）
+    matcher = KeywordMatcher([kw[1:] if kw[:1] in ("+", "!") else kw for kw in keywords], ignore_case=True)
     
     filtered = []
     for item in trends:
@@ -140,19 +144,20 @@ def filter_trends(trends: List[Dict[str, Any]], keywords: List[str], max_hours:
                 pass
 
         # 2. 关键词筛选
-        title = item.get("title", item.get("text", item.get("name", ""))).lower()
+        title = item.get("title", item.get("text", item.get("name", "")))
+        found = set(matcher.matched(title))
         
         # 检查排除词
-        if any(ex in title for ex in must_exclude):
+        if found & must_exclude:
             continue
             
         # 检查必须包含词
-        if must_include and not all(inc in title for inc in must_include):
+        if not must_include <= found:
             continue
             
         # 检查普通词
         if regular:
-            if any(reg in title for reg in regular):
+            if found & regular:
                 filtered.append(item)
         else:
             filtered.append(item)